@@ -94,9 +94,11 @@ GridPath keeps track of scenario validation and run status. The scenario
 status is recorded in the :code:`scenarios` table (in the
 :code:`validation_status_id` and :code:`run_status_id` columns) and an
 additional detail can be found in the :code:`status_` tables. Currently,
-this includes a single table: the :code:`status_validation` table, which
+this includes the :code:`status_validation` table, which
 contains information about errors encountered during validation for each
-scenario that has been validated.
+scenario that has been validated, and the :code:`status_telemetry` table,
+which contains the timing and memory usage of each phase of scenario runs
+made with the :code:`--telemetry` flag.
 
 **********************
 The :code:`ui_` Tables
@@ -13,19 +13,24 @@
 # limitations under the License.
 
 import os.path
+import pathlib
 import sqlite3
 import sys
 import time
 import traceback
 
 
-def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
+def connect_to_database(
+    db_path="../db/io.db", timeout=5, detect_types=0, read_only=False
+):
     """
     :param db_path: str, the path to the database, relative to the
         current working directory, defaults to "../db/io.db"
     :param timeout: int, number of seconds the connection should wait for the
         database lock to go away before raising an exception, defaults to 5
     :param detect_types: int, type detection parameter, defaults to 0
+    :param read_only: boolean, whether to open the database in read-only
+        mode, defaults to False
     :return: the sqlite3 database connection object
 
     Connect to a database and return the connection object.
@@ -37,7 +42,15 @@ def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
             "specify a different database file?".format(os.path.abspath(db_path))
         )
 
-    conn = sqlite3.connect(db_path, timeout=timeout, detect_types=detect_types)
+    if read_only:
+        conn = sqlite3.connect(
+            "{}?mode=ro".format(pathlib.Path(os.path.abspath(db_path)).as_uri()),
+            timeout=timeout,
+            detect_types=detect_types,
+            uri=True,
+        )
+    else:
+        conn = sqlite3.connect(db_path, timeout=timeout, detect_types=detect_types)
 
     # Enforce foreign keys (default = not enforced)
     conn.execute("PRAGMA foreign_keys=ON;")
@@ -109,6 +122,58 @@ def spin_on_database_lock(
             break
 
 
+def spin_on_database_lock_transaction(
+    conn, cursor, statements, max_attempts=61, interval=10, quiet=True
+):
+    """
+    :param conn: the connection object
+    :param cursor: the cursor object
+    :param statements: list of (SQL statement, data) tuples; each statement
+        is executed once with its data
+    :param max_attempts: how long to wait for the database lock to be
+        released; the default is 600 seconds, but that can be overridden
+    :param interval: how frequently to poll the database for whether
+        the lock has been released; the default is 10 seconds, but that can
+        be overridden
+    :param quiet: boolean; set to False to see the SQL queries
+
+    Like spin_on_database_lock, but execute several statements in a single
+    transaction, i.e. commit only once all of them have been executed. If
+    the database is locked, the transaction is rolled back and retried.
+    """
+    for i in range(0, max_attempts):
+        if i > 0:
+            print("...retrying (attempt {} of {})...".format(i, max_attempts))
+        try:
+            for sql, data in statements:
+                if not quiet:
+                    print(sql)
+                cursor.execute(sql, data)
+            conn.commit()
+        except sqlite3.OperationalError as e:
+            conn.rollback()
+            if "locked" in str(e):
+                print(
+                    "Database is locked, sleeping for {} seconds, "
+                    "then retrying.".format(interval)
+                )
+                if i == max_attempts:
+                    print(
+                        "Database still locked after {} seconds. "
+                        "Exiting.".format(max_attempts * interval)
+                    )
+                    sys.exit(1)
+                else:
+                    time.sleep(interval)
+            else:
+                print("Error while running the following query:\n", sql)
+                traceback.print_exc()
+                sys.exit()
+        # Do this if exception not caught
+        else:
+            break
+
+
 def spin_on_database_lock_generic(
     command,
     max_attempts=61,
@@ -191,6 +191,28 @@ CREATE TABLE status_validation
     FOREIGN KEY (scenario_id) REFERENCES scenarios (scenario_id)
 );
 
+-- Telemetry
+-- Timing and memory usage of the pipeline phases; imported from the
+-- scenario's logs/telemetry.jsonl file when running with --telemetry
+DROP TABLE IF EXISTS status_telemetry;
+CREATE TABLE status_telemetry
+(
+    scenario_id       INTEGER,
+    subproblem_id     INTEGER,
+    stage_id          INTEGER,
+    process           VARCHAR(64),
+    phase             VARCHAR(64),
+    gridpath_module   VARCHAR(128),
+    db_table          VARCHAR(64),
+    pid               INTEGER,
+    wall_time_s       FLOAT,
+    cpu_time_s        FLOAT,
+    peak_rss_mb       FLOAT,
+    peak_rss_delta_mb FLOAT,
+    time_stamp        TEXT, -- ISO8601 String
+    FOREIGN KEY (scenario_id) REFERENCES scenarios (scenario_id)
+);
+
 -- Scenario results: objective function, solver status
 DROP TABLE IF EXISTS results_scenario;
 CREATE TABLE results_scenario
@@ -204,6 +226,44 @@ CREATE TABLE results_scenario
     FOREIGN KEY (scenario_id) REFERENCES scenarios (scenario_id)
 );
 
+-- Problem size: variables, constraints, and nonzeros by Pyomo component
+-- (and the GridPath module that added it); imported from the
+-- model_size_components.csv results file when running with
+-- --model_size_report
+DROP TABLE IF EXISTS results_model_size;
+CREATE TABLE results_model_size
+(
+    scenario_id     INTEGER,
+    subproblem_id   INTEGER,
+    stage_id        INTEGER,
+    gridpath_module VARCHAR(128),
+    component       VARCHAR(128),
+    component_type  VARCHAR(32),
+    index_set       VARCHAR(128),
+    index_set_size  INTEGER,
+    n_indices       INTEGER,
+    n_continuous    INTEGER,
+    n_binary        INTEGER,
+    n_integer       INTEGER,
+    n_fixed         INTEGER,
+    n_constraints   INTEGER,
+    n_nonzeros      INTEGER,
+    PRIMARY KEY (scenario_id, subproblem_id, stage_id, component),
+    FOREIGN KEY (scenario_id) REFERENCES scenarios (scenario_id)
+);
+
+-- Scenario results aggregates: when the results aggregates (e.g.
+-- results_system_load_zone_period) were last built by process_results
+-- The row is deleted along with the other results when results are
+-- re-imported, so cached results queries can be invalidated
+DROP TABLE IF EXISTS results_scenario_aggregates;
+CREATE TABLE results_scenario_aggregates
+(
+    scenario_id          INTEGER PRIMARY KEY,
+    aggregates_timestamp TEXT,
+    FOREIGN KEY (scenario_id) REFERENCES scenarios (scenario_id)
+);
+
 
 -------------------------------------------------------------------------------
 ---- SUBSCENARIOS AND INPUTS -----
@@ -4338,6 +4398,10 @@ CREATE TABLE results_project_dispatch_by_technology
                  technology)
 );
 
+-- For queries by load zone over a range of timepoints (e.g. dispatch plots)
+CREATE INDEX results_project_dispatch_by_technology_load_zone_timepoint_idx
+    ON results_project_dispatch_by_technology (scenario_id, load_zone, stage_id, timepoint);
+
 DROP TABLE IF EXISTS results_project_dispatch_by_technology_period;
 CREATE TABLE results_project_dispatch_by_technology_period
 (
@@ -4714,6 +4778,30 @@ CREATE TABLE results_system_load_zone_timepoint
     PRIMARY KEY (scenario_id, subproblem_id, stage_id, load_zone, timepoint)
 );
 
+-- For queries by load zone over a range of timepoints (e.g. dispatch plots)
+CREATE INDEX results_system_load_zone_timepoint_load_zone_timepoint_idx
+    ON results_system_load_zone_timepoint (scenario_id, load_zone, stage_id, timepoint);
+
+-- Aggregated by process_results from results_system_load_zone_timepoint
+DROP TABLE IF EXISTS results_system_load_zone_period;
+CREATE TABLE results_system_load_zone_period
+(
+    scenario_id              INTEGER,
+    subproblem_id            INTEGER,
+    stage_id                 INTEGER,
+    load_zone                VARCHAR(32),
+    period                   INTEGER,
+    spinup_or_lookahead      INTEGER,
+    static_load_mwh          FLOAT,
+    total_power_mwh          FLOAT,
+    net_imports_mwh          FLOAT,
+    net_market_purchases_mwh FLOAT,
+    overgeneration_mwh       FLOAT,
+    unserved_energy_mwh      FLOAT,
+    PRIMARY KEY (scenario_id, subproblem_id, stage_id, load_zone, period,
+                 spinup_or_lookahead)
+);
+
 DROP TABLE IF EXISTS results_system_market_participation;
 CREATE TABLE results_system_market_participation
 (
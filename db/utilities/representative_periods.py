@@ -0,0 +1,792 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Create a temporal subscenario with representative periods (e.g. days) from a
+temporal subscenario in the database with the full chronology (e.g. the
+8760 hours of each period).
+
+The horizons of the *--balancing_type* of the full temporal subscenario
+(e.g. 'day') are clustered separately in each period based on the load
+profiles of the *--load_scenario_id* and the capacity factor profiles of the
+*--variable_generator_profile_scenario_id*. Each profile is scaled to the
+0-1 range before clustering so that load zones and projects carry equal
+weight. The horizons can be clustered with k-medoids or with hierarchical
+(Ward) clustering; in both cases, the representative of each cluster is the
+medoid horizon, i.e. an actual horizon of the full temporal subscenario, so
+the representative timepoints keep their IDs and the existing load and
+variable generator profiles can be used with the new temporal subscenario
+as they are.
+
+The timepoint weights of each representative horizon are scaled so that it
+represents all hours of the horizons in its cluster. Horizons of other
+balancing types (e.g. 'year') are kept with the representative timepoints
+they include, so they link the representative horizons in the order of the
+representative horizons themselves.
+
+Note that this is a limitation for storage and other constraints that
+carry state across the horizons of a longer balancing type (e.g. a 'year'
+horizon with a 'linked' boundary): a horizon includes each timepoint once,
+so the longer horizon can't follow the ordered list of original horizons,
+each mapped to its representative horizon (e.g. 365 days drawn from 12
+representative days), and the state is carried only from each
+representative horizon to the next representative horizon in the
+chronology. Inter-day storage dynamics are therefore not represented; the
+sequence of representative horizons is reported in
+representative_periods_map.csv.
+
+The subscenario is written to a
+"<output_temporal_scenario_id>_<output_name>" directory in the format used
+by *gridpath_load_csvs*, with two additional files: the map of each horizon
+to its representative horizon (representative_periods_map.csv) and the
+clustering error of each profile (clustering_error.csv). The clustering
+error reports the root-mean-square error (in units of the profile's range)
+of the profiles reconstructed from the representative horizons and the
+error in the total energy of each profile.
+
+>>> gridpath_representative_periods --database PATH/TO/DB
+    --temporal_scenario_id 1 --load_scenario_id 1
+    --variable_generator_profile_scenario_id 1 --n_representative_periods 12
+    --output_temporal_scenario_id 100 --output_name 12_rep_days
+    --output_directory PATH/TO/CSVS/temporal
+"""
+
+from argparse import ArgumentParser
+import os.path
+import sys
+
+import numpy as np
+import pandas as pd
+
+from db.common_functions import connect_to_database
+
+STRUCTURE_COLUMNS = [
+    "subproblem_id",
+    "stage_id",
+    "timepoint",
+    "period",
+    "number_of_hours_in_timepoint",
+    "timepoint_weight",
+    "previous_stage_timepoint_map",
+    "spinup_or_lookahead",
+    "linked_timepoint",
+    "month",
+    "hour_of_day",
+    "timestamp",
+]
+
+CLUSTERING_METHODS = ["kmedoids", "hierarchical"]
+
+
+def parse_arguments(args):
+    """
+    :param args: the script arguments specified by the user
+    :return: the parsed known argument values (<class 'argparse.Namespace'>
+    Python object)
+
+    Parse the known arguments.
+    """
+    parser = ArgumentParser(add_help=True)
+
+    parser.add_argument(
+        "--database",
+        default="../io.db",
+        help="The database file path relative to the current "
+        "working directory. Defaults to ../io.db ",
+    )
+    parser.add_argument(
+        "--temporal_scenario_id",
+        required=True,
+        type=int,
+        help="The temporal subscenario with the full chronology.",
+    )
+    parser.add_argument(
+        "--load_scenario_id",
+        type=int,
+        help="The load subscenario with the load profiles to cluster on.",
+    )
+    parser.add_argument(
+        "--variable_generator_profile_scenario_id",
+        type=int,
+        help="The variable generator profile subscenario with the capacity "
+        "factor profiles to cluster on.",
+    )
+    parser.add_argument(
+        "--balancing_type",
+        default="day",
+        help="The balancing type of the horizons to cluster. Defaults to 'day'.",
+    )
+    parser.add_argument(
+        "--n_representative_periods",
+        required=True,
+        type=int,
+        help="The number of representative horizons in each period.",
+    )
+    parser.add_argument(
+        "--method",
+        default="kmedoids",
+        choices=CLUSTERING_METHODS,
+        help="The clustering method. Defaults to 'kmedoids'.",
+    )
+    parser.add_argument(
+        "--output_temporal_scenario_id",
+        required=True,
+        type=int,
+        help="The ID of the temporal subscenario to create.",
+    )
+    parser.add_argument(
+        "--output_name",
+        required=True,
+        help="The name of the temporal subscenario to create.",
+    )
+    parser.add_argument(
+        "--output_directory",
+        default=".",
+        help="The directory in which to create the temporal subscenario "
+        "directory (usually the 'temporal' directory of the CSV data). "
+        "Defaults to the current working directory.",
+    )
+    parser.add_argument(
+        "--quiet", default=False, action="store_true", help="Don't print output."
+    )
+
+    parsed_arguments = parser.parse_known_args(args=args)[0]
+
+    return parsed_arguments
+
+
+def get_temporal_inputs(conn, temporal_scenario_id, balancing_type):
+    """
+    :param conn: database connection
+    :param temporal_scenario_id: the full temporal subscenario
+    :param balancing_type: the balancing type of the horizons to cluster
+    :return: the timepoints, horizon timepoints, horizons, periods, and
+        superperiods data frames
+
+    The temporal subscenario must have a single subproblem and stage.
+    """
+    timepoints_df = pd.read_sql(
+        """
+        SELECT {}
+        FROM inputs_temporal
+        WHERE temporal_scenario_id = ?
+        ORDER BY subproblem_id, stage_id, timepoint;
+        """.format(
+            ", ".join(STRUCTURE_COLUMNS)
+        ),
+        conn,
+        params=(temporal_scenario_id,),
+    )
+    if timepoints_df.empty:
+        raise ValueError(
+            "Temporal scenario {} has no timepoints.".format(temporal_scenario_id)
+        )
+    if len(timepoints_df[["subproblem_id", "stage_id"]].drop_duplicates()) > 1:
+        raise ValueError(
+            "Representative periods can only be created from temporal "
+            "scenarios with a single subproblem and stage."
+        )
+
+    horizon_timepoints_df = pd.read_sql(
+        """
+        SELECT balancing_type_horizon, horizon, timepoint
+        FROM inputs_temporal_horizon_timepoints
+        WHERE temporal_scenario_id = ?
+        ORDER BY balancing_type_horizon, horizon, timepoint;
+        """,
+        conn,
+        params=(temporal_scenario_id,),
+    )
+    if balancing_type not in set(horizon_timepoints_df["balancing_type_horizon"]):
+        raise ValueError(
+            "Temporal scenario {} has no horizons of balancing type "
+            "'{}'.".format(temporal_scenario_id, balancing_type)
+        )
+
+    horizons_df = pd.read_sql(
+        """
+        SELECT subproblem_id, balancing_type_horizon, horizon, boundary
+        FROM inputs_temporal_horizons
+        WHERE temporal_scenario_id = ?
+        ORDER BY balancing_type_horizon, horizon;
+        """,
+        conn,
+        params=(temporal_scenario_id,),
+    )
+
+    periods_df = pd.read_sql(
+        """
+        SELECT period, discount_factor, period_start_year, period_end_year
+        FROM inputs_temporal_periods
+        WHERE temporal_scenario_id = ?
+        ORDER BY period;
+        """,
+        conn,
+        params=(temporal_scenario_id,),
+    )
+
+    superperiods_df = pd.read_sql(
+        """
+        SELECT superperiod, period
+        FROM inputs_temporal_superperiods
+        WHERE temporal_scenario_id = ?
+        ORDER BY superperiod, period;
+        """,
+        conn,
+        params=(temporal_scenario_id,),
+    )
+
+    return (
+        timepoints_df,
+        horizon_timepoints_df,
+        horizons_df,
+        periods_df,
+        superperiods_df,
+    )
+
+
+def get_profiles(conn, load_scenario_id, variable_generator_profile_scenario_id):
+    """
+    :param conn: database connection
+    :param load_scenario_id: the load subscenario (or None)
+    :param variable_generator_profile_scenario_id: the variable generator
+        profile subscenario (or None)
+    :return: data frame of the profiles with a (profile type, name) column
+        for each load zone and variable generator and a row for each timepoint
+    """
+    profiles = []
+    if load_scenario_id is not None:
+        load_df = pd.read_sql(
+            """
+            SELECT load_zone, timepoint, load_mw
+            FROM inputs_system_load
+            WHERE load_scenario_id = ?
+            AND stage_id = 1;
+            """,
+            conn,
+            params=(load_scenario_id,),
+        )
+        profiles.append(
+            load_df.pivot(index="timepoint", columns="load_zone", values="load_mw")
+        )
+        profiles[-1].columns = [("load_zone", z) for z in profiles[-1].columns]
+    if variable_generator_profile_scenario_id is not None:
+        var_df = pd.read_sql(
+            """
+            SELECT project, timepoint, cap_factor
+            FROM inputs_project_variable_generator_profiles
+            WHERE variable_generator_profile_scenario_id = ?
+            AND stage_id = 1;
+            """,
+            conn,
+            params=(variable_generator_profile_scenario_id,),
+        )
+        profiles.append(
+            var_df.pivot(index="timepoint", columns="project", values="cap_factor")
+        )
+        profiles[-1].columns = [("project", p) for p in profiles[-1].columns]
+
+    if not profiles:
+        raise ValueError(
+            "Specify a load_scenario_id and/or a "
+            "variable_generator_profile_scenario_id to cluster on."
+        )
+
+    return pd.concat(profiles, axis=1)
+
+
+def select_profiles(profiles_df, timepoints):
+    """
+    :param profiles_df: data frame of the profiles by timepoint
+    :param timepoints: list of the timepoints of the temporal subscenario
+    :return: data frame of the profiles with data for the timepoints
+
+    Profile subscenarios can have data for the timepoints of several
+    temporal subscenarios, so only the profiles with data for these
+    timepoints are used; these must have data for all of them.
+    """
+    profiles_df = profiles_df.reindex(timepoints).dropna(axis=1, how="all")
+    if profiles_df.empty:
+        raise ValueError("No profiles found for the temporal scenario timepoints.")
+    incomplete_profiles = profiles_df.columns[profiles_df.isna().any()]
+    if len(incomplete_profiles) > 0:
+        raise ValueError(
+            "Profiles are missing for some timepoints of the temporal "
+            "scenario: {}".format(list(incomplete_profiles))
+        )
+
+    return profiles_df
+
+
+def get_horizon_features(profiles_df, horizon_tmps):
+    """
+    :param profiles_df: data frame of the profiles by timepoint
+    :param horizon_tmps: list of the list of timepoints of each horizon
+    :return: 3-dimensional array of the profiles (horizon, timepoint in
+        horizon, profile), with each profile scaled to the 0-1 range
+
+    All horizons must have the same number of timepoints.
+    """
+    n_tmps = set(len(tmps) for tmps in horizon_tmps)
+    if len(n_tmps) > 1:
+        raise ValueError(
+            "All horizons to cluster must have the same number of timepoints."
+        )
+    values = profiles_df.loc[[t for tmps in horizon_tmps for t in tmps]].values
+    value_range = values.max(axis=0) - values.min(axis=0)
+    value_range[value_range == 0] = 1
+    scaled_values = (values - values.min(axis=0)) / value_range
+
+    return scaled_values.reshape(len(horizon_tmps), n_tmps.pop(), values.shape[1])
+
+
+def get_distances(features):
+    """
+    :param features: 2-dimensional array of the features of each horizon
+    :return: matrix of the Euclidean distances between horizons
+    """
+    squared_norms = (features**2).sum(axis=1)
+    squared_distances = (
+        squared_norms[:, None] + squared_norms[None, :] - 2 * features @ features.T
+    )
+    return np.sqrt(np.maximum(squared_distances, 0))
+
+
+def get_medoid(distances, members):
+    """
+    :param distances: matrix of the distances between horizons
+    :param members: array of the indices of the horizons in a cluster
+    :return: the index of the horizon with the smallest total distance to
+        the other horizons in the cluster
+    """
+    return members[np.argmin(distances[np.ix_(members, members)].sum(axis=1))]
+
+
+def cluster_kmedoids(distances, n_clusters, max_iterations=100):
+    """
+    :param distances: matrix of the distances between horizons
+    :param n_clusters: the number of clusters
+    :param max_iterations: the maximum number of assignment/update iterations
+    :return: array of the medoid of each horizon's cluster
+
+    Greedily select initial medoids that most reduce the total distance of
+    the horizons to their closest medoid, then alternate between assigning
+    horizons to their closest medoid and updating the medoids until the
+    medoids don't change.
+    """
+    n = distances.shape[0]
+    medoids = [int(np.argmin(distances.sum(axis=1)))]
+    closest = distances[:, medoids[0]].copy()
+    while len(medoids) < n_clusters:
+        gains = np.maximum(closest[:, None] - distances, 0).sum(axis=0)
+        gains[medoids] = -1
+        medoids.append(int(np.argmax(gains)))
+        closest = np.minimum(closest, distances[:, medoids[-1]])
+
+    medoids = np.array(medoids)
+    for _ in range(max_iterations):
+        labels = np.argmin(distances[:, medoids], axis=1)
+        new_medoids = np.array(
+            [
+                get_medoid(distances, np.flatnonzero(labels == c))
+                for c in range(len(medoids))
+            ]
+        )
+        if np.array_equal(new_medoids, medoids):
+            break
+        medoids = new_medoids
+
+    return medoids[np.argmin(distances[:, medoids], axis=1)]
+
+
+def cluster_hierarchical(features, distances, n_clusters):
+    """
+    :param features: 2-dimensional array of the features of each horizon
+    :param distances: matrix of the distances between horizons
+    :param n_clusters: the number of clusters
+    :return: array of the medoid of each horizon's cluster
+
+    Agglomerative clustering with Ward's linkage, i.e. merge the clusters
+    that least increase the total within-cluster variance until there are
+    n_clusters clusters.
+    """
+    n = features.shape[0]
+    clusters = {i: [i] for i in range(n)}
+    centroids = {i: features[i] for i in range(n)}
+    while len(clusters) > n_clusters:
+        ids = list(clusters.keys())
+        sizes = np.array([len(clusters[i]) for i in ids])
+        centers = np.array([centroids[i] for i in ids])
+        squared_norms = (centers**2).sum(axis=1)
+        squared_distances = np.maximum(
+            squared_norms[:, None] + squared_norms[None, :] - 2 * centers @ centers.T,
+            0,
+        )
+        costs = sizes[:, None] * sizes[None, :] / (
+            sizes[:, None] + sizes[None, :]
+        ) * squared_distances + np.diag(np.full(len(ids), np.inf))
+        a, b = np.unravel_index(np.argmin(costs), costs.shape)
+        i, j = ids[a], ids[b]
+        centroids[i] = (sizes[a] * centroids[i] + sizes[b] * centroids[j]) / (
+            sizes[a] + sizes[b]
+        )
+        clusters[i] += clusters.pop(j)
+        del centroids[j]
+
+    assignment = np.zeros(n, dtype=int)
+    for members in clusters.values():
+        members = np.array(members)
+        assignment[members] = get_medoid(distances, members)
+
+    return assignment
+
+
+def cluster_horizons(features, n_clusters, method):
+    """
+    :param features: 3-dimensional array of the profiles of each horizon
+    :param n_clusters: the number of clusters
+    :param method: 'kmedoids' or 'hierarchical'
+    :return: array of the index of the representative horizon of each
+        horizon
+    """
+    features = features.reshape(features.shape[0], -1)
+    n_clusters = min(n_clusters, features.shape[0])
+    distances = get_distances(features)
+    if method == "kmedoids":
+        return cluster_kmedoids(distances=distances, n_clusters=n_clusters)
+    elif method == "hierarchical":
+        return cluster_hierarchical(
+            features=features, distances=distances, n_clusters=n_clusters
+        )
+    else:
+        raise ValueError(
+            "Unknown clustering method '{}'. Use one of {}.".format(
+                method, CLUSTERING_METHODS
+            )
+        )
+
+
+def get_clustering_error(profiles_df, horizon_tmps, horizon_hours, assignment):
+    """
+    :param profiles_df: data frame of the profiles by timepoint
+    :param horizon_tmps: list of the list of timepoints of each horizon
+    :param horizon_hours: array of the hours represented by each horizon
+    :param assignment: array of the index of the representative horizon of
+        each horizon
+    :return: data frame with the normalized root-mean-square error and the
+        relative error in total energy of each profile
+    """
+    original = np.array([profiles_df.loc[tmps].values for tmps in horizon_tmps])
+    reconstructed = original[assignment]
+    value_range = original.max(axis=(0, 1)) - original.min(axis=(0, 1))
+    value_range[value_range == 0] = 1
+
+    weights = horizon_hours / horizon_hours.sum()
+    squared_errors = ((original - reconstructed) ** 2).mean(axis=1)
+    nrmse = np.sqrt((weights[:, None] * squared_errors).sum(axis=0)) / value_range
+
+    original_energy = (horizon_hours[:, None] * original.mean(axis=1)).sum(axis=0)
+    reconstructed_energy = (horizon_hours[:, None] * reconstructed.mean(axis=1)).sum(
+        axis=0
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        energy_error = np.where(
+            original_energy != 0,
+            (reconstructed_energy - original_energy) / original_energy,
+            0,
+        )
+
+    return pd.DataFrame(
+        {
+            "profile_type": [c[0] for c in profiles_df.columns],
+            "profile": [c[1] for c in profiles_df.columns],
+            "nrmse": nrmse,
+            "energy_error_fraction": energy_error,
+        }
+    )
+
+
+def create_representative_periods(
+    timepoints_df,
+    horizon_timepoints_df,
+    horizons_df,
+    profiles_df,
+    balancing_type,
+    n_representative_periods,
+    method,
+):
+    """
+    :param timepoints_df: data frame of the full temporal subscenario's
+        timepoints
+    :param horizon_timepoints_df: data frame of the full temporal
+        subscenario's horizon timepoints
+    :param horizons_df: data frame of the full temporal subscenario's
+        horizons
+    :param profiles_df: data frame of the profiles by timepoint
+    :param balancing_type: the balancing type of the horizons to cluster
+    :param n_representative_periods: the number of representative horizons
+        in each period
+    :param method: the clustering method
+    :return: the structure, horizon params, horizon timepoints, map, and
+        clustering error data frames of the representative temporal
+        subscenario
+    """
+    tmps_df = timepoints_df.set_index("timepoint")
+    profiles_df = select_profiles(
+        profiles_df=profiles_df, timepoints=timepoints_df["timepoint"].tolist()
+    )
+    tmp_hours = tmps_df["timepoint_weight"] * tmps_df["number_of_hours_in_timepoint"]
+
+    bt_df = horizon_timepoints_df[
+        horizon_timepoints_df["balancing_type_horizon"] == balancing_type
+    ]
+    bt_df = bt_df.assign(period=bt_df["timepoint"].map(tmps_df["period"]))
+
+    weights = dict()
+    map_rows = []
+    error_dfs = []
+    for period, period_df in bt_df.groupby("period", sort=True):
+        horizons = sorted(period_df["horizon"].unique())
+        horizon_tmps = [
+            sorted(period_df.loc[period_df["horizon"] == h, "timepoint"])
+            for h in horizons
+        ]
+        horizon_hours = np.array([tmp_hours.loc[tmps].sum() for tmps in horizon_tmps])
+
+        features = get_horizon_features(
+            profiles_df=profiles_df, horizon_tmps=horizon_tmps
+        )
+        assignment = cluster_horizons(
+            features=features, n_clusters=n_representative_periods, method=method
+        )
+
+        for rep in sorted(set(assignment)):
+            scale = horizon_hours[assignment == rep].sum() / horizon_hours[rep]
+            for tmp in horizon_tmps[rep]:
+                weights[tmp] = tmps_df.loc[tmp, "timepoint_weight"] * scale
+        for h, rep in zip(horizons, assignment):
+            map_rows.append([period, balancing_type, h, horizons[rep]])
+
+        error_df = get_clustering_error(
+            profiles_df=profiles_df,
+            horizon_tmps=horizon_tmps,
+            horizon_hours=horizon_hours,
+            assignment=assignment,
+        )
+        error_df.insert(0, "period", period)
+        error_dfs.append(error_df)
+
+    # Structure
+    structure_df = timepoints_df[timepoints_df["timepoint"].isin(weights.keys())].copy()
+    structure_df["timepoint_weight"] = structure_df["timepoint"].map(weights)
+
+    # Horizons: keep the horizons with representative timepoints, with a
+    # range of timepoints for each consecutive run of representative
+    # timepoints in the horizon; horizons include each timepoint once, so
+    # the longer horizons link the representative horizons themselves rather
+    # than the sequence of original horizons (see the module docstring)
+    all_tmps = timepoints_df["timepoint"].tolist()
+    position = {tmp: i for i, tmp in enumerate(all_tmps)}
+    rep_hor_tmps_df = horizon_timepoints_df[
+        horizon_timepoints_df["timepoint"].isin(weights.keys())
+    ]
+    horizon_timepoints_rows = []
+    for (bt, h), hor_df in rep_hor_tmps_df.groupby(
+        ["balancing_type_horizon", "horizon"], sort=True
+    ):
+        tmps = sorted(hor_df["timepoint"], key=lambda t: position[t])
+        start = tmps[0]
+        for prev_tmp, tmp in zip(tmps, tmps[1:] + [None]):
+            if tmp is None or position[tmp] != position[prev_tmp] + 1:
+                horizon_timepoints_rows.append([1, 1, bt, h, start, prev_tmp])
+                start = tmp
+    horizon_timepoints_out_df = pd.DataFrame(
+        horizon_timepoints_rows,
+        columns=[
+            "subproblem_id",
+            "stage_id",
+            "balancing_type_horizon",
+            "horizon",
+            "tmp_start",
+            "tmp_end",
+        ],
+    )
+
+    kept_horizons = set(
+        zip(
+            horizon_timepoints_out_df["balancing_type_horizon"],
+            horizon_timepoints_out_df["horizon"],
+        )
+    )
+    horizon_params_df = horizons_df[
+        [
+            (bt, h) in kept_horizons
+            for bt, h in zip(
+                horizons_df["balancing_type_horizon"], horizons_df["horizon"]
+            )
+        ]
+    ].assign(subproblem_id=1)
+
+    map_df = pd.DataFrame(
+        map_rows,
+        columns=[
+            "period",
+            "balancing_type_horizon",
+            "horizon",
+            "representative_horizon",
+        ],
+    )
+
+    return (
+        structure_df.assign(subproblem_id=1, stage_id=1),
+        horizon_params_df,
+        horizon_timepoints_out_df,
+        map_df,
+        pd.concat(error_dfs, ignore_index=True),
+    )
+
+
+def write_temporal_subscenario(
+    output_directory,
+    output_temporal_scenario_id,
+    output_name,
+    description,
+    structure_df,
+    horizon_params_df,
+    horizon_timepoints_df,
+    periods_df,
+    superperiods_df,
+    map_df,
+    error_df,
+):
+    """
+    Write the temporal subscenario CSVs.
+
+    :return: the path of the temporal subscenario directory
+    """
+    subscenario_directory = os.path.join(
+        output_directory, "{}_{}".format(output_temporal_scenario_id, output_name)
+    )
+    if not os.path.exists(subscenario_directory):
+        os.makedirs(subscenario_directory)
+
+    with open(os.path.join(subscenario_directory, "description.txt"), "w") as f:
+        f.write(description)
+
+    structure_df[STRUCTURE_COLUMNS].to_csv(
+        os.path.join(subscenario_directory, "structure.csv"), index=False
+    )
+    horizon_params_df[
+        ["subproblem_id", "balancing_type_horizon", "horizon", "boundary"]
+    ].to_csv(os.path.join(subscenario_directory, "horizon_params.csv"), index=False)
+    horizon_timepoints_df.to_csv(
+        os.path.join(subscenario_directory, "horizon_timepoints.csv"), index=False
+    )
+    periods_df.to_csv(
+        os.path.join(subscenario_directory, "period_params.csv"), index=False
+    )
+    superperiods_df.to_csv(
+        os.path.join(subscenario_directory, "superperiods.csv"),
+        index=False,
+    )
+    map_df.to_csv(
+        os.path.join(subscenario_directory, "representative_periods_map.csv"),
+        index=False,
+    )
+    error_df.to_csv(
+        os.path.join(subscenario_directory, "clustering_error.csv"), index=False
+    )
+
+    return subscenario_directory
+
+
+def main(args=None):
+    """
+
+    :return:
+    """
+    if args is None:
+        args = sys.argv[1:]
+    parsed_args = parse_arguments(args=args)
+
+    conn = connect_to_database(db_path=parsed_args.database)
+    (
+        timepoints_df,
+        horizon_timepoints_df,
+        horizons_df,
+        periods_df,
+        superperiods_df,
+    ) = get_temporal_inputs(
+        conn=conn,
+        temporal_scenario_id=parsed_args.temporal_scenario_id,
+        balancing_type=parsed_args.balancing_type,
+    )
+    profiles_df = get_profiles(
+        conn=conn,
+        load_scenario_id=parsed_args.load_scenario_id,
+        variable_generator_profile_scenario_id=(
+            parsed_args.variable_generator_profile_scenario_id
+        ),
+    )
+    conn.close()
+
+    (
+        structure_df,
+        horizon_params_df,
+        horizon_timepoints_out_df,
+        map_df,
+        error_df,
+    ) = create_representative_periods(
+        timepoints_df=timepoints_df,
+        horizon_timepoints_df=horizon_timepoints_df,
+        horizons_df=horizons_df,
+        profiles_df=profiles_df,
+        balancing_type=parsed_args.balancing_type,
+        n_representative_periods=parsed_args.n_representative_periods,
+        method=parsed_args.method,
+    )
+
+    subscenario_directory = write_temporal_subscenario(
+        output_directory=parsed_args.output_directory,
+        output_temporal_scenario_id=parsed_args.output_temporal_scenario_id,
+        output_name=parsed_args.output_name,
+        description="{} representative {} horizons per period ({}) of "
+        "temporal scenario {}".format(
+            parsed_args.n_representative_periods,
+            parsed_args.balancing_type,
+            parsed_args.method,
+            parsed_args.temporal_scenario_id,
+        ),
+        structure_df=structure_df,
+        horizon_params_df=horizon_params_df,
+        horizon_timepoints_df=horizon_timepoints_out_df,
+        periods_df=periods_df,
+        superperiods_df=superperiods_df,
+        map_df=map_df,
+        error_df=error_df,
+    )
+
+    if not parsed_args.quiet:
+        print("Wrote temporal subscenario to {}".format(subscenario_directory))
+        print(
+            "Clustering error (mean across profiles): NRMSE {:.4f}, "
+            "energy error {:.4%}".format(
+                error_df["nrmse"].mean(),
+                error_df["energy_error_fraction"].abs().mean(),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
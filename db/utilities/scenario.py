@@ -25,7 +25,6 @@ the database, specify the scenario name with the *--scenario* flag and use the
 
 from argparse import ArgumentParser
 import os.path
-import pandas as pd
 import sys
 import warnings
 
@@ -394,6 +393,8 @@ def main(args=None):
                     delete_scenario(conn=db_conn, scenario_id=sid)
     # If '--delete' not specified, try to load data
     else:
+        import pandas as pd
+
         # Read in the CSV as dataframe
         csv_to_df = pd.read_csv(scenarios_csv)
 
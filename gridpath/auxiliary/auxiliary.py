@@ -18,7 +18,6 @@ Various auxiliary functions used in other modules
 
 from importlib import import_module
 import os.path
-import pandas as pd
 import traceback
 
 
@@ -28,6 +27,8 @@ def get_required_subtype_modules(
     """
     Get a list of unique types from projects.tab.
     """
+    import pandas as pd
+
     df = pd.read_csv(
         os.path.join(
             scenario_directory,
@@ -126,6 +127,54 @@ def subset_init_by_set_membership(mod, superset, index, membership_set):
     )
 
 
+def get_zone_tmp_index(mod, members, zone_param=None, elements_by_zone=None):
+    """
+    Index the members of a set by zone and timepoint.
+
+    :param mod: the model instance
+    :param members: name of the set (or of a component indexed by the set)
+        whose members are tuples with the project or transmission line
+        first and the timepoint (or period) last, e.g. "PRJ_OPR_TMPS"
+    :param zone_param: name of the param with the zone of each project or
+        transmission line, e.g. "load_zone"
+    :param elements_by_zone: name of the set indexed by zone with the
+        projects or transmission lines in each zone, e.g.
+        "CRBN_PRJS_BY_CARBON_CAP_ZONE"; use instead of *zone_param* when
+        projects can be in more than one zone
+    :return: dictionary of the members in each (zone, timepoint)
+
+    Aggregation rules indexed by zone and timepoint can look up the
+    members to sum over in the index instead of filtering all members on
+    their zone, which gets slow in models with many zones. The index is
+    built once per instance and shared by all rules that aggregate the
+    same members by the same zones.
+    """
+    key = (members, zone_param, elements_by_zone)
+    if "_zone_tmp_indices" not in mod.__dict__:
+        mod._zone_tmp_indices = dict()
+    if key in mod._zone_tmp_indices:
+        return mod._zone_tmp_indices[key]
+
+    index = dict()
+    if zone_param is not None:
+        zone = getattr(mod, zone_param)
+        for member in getattr(mod, members):
+            index.setdefault((zone[member[0]], member[-1]), []).append(member)
+    else:
+        members_by_element = dict()
+        for member in getattr(mod, members):
+            members_by_element.setdefault(member[0], []).append(member)
+        by_zone = getattr(mod, elements_by_zone)
+        for z in by_zone.index_set():
+            for element in by_zone[z]:
+                for member in members_by_element.get(element, []):
+                    index.setdefault((z, member[-1]), []).append(member)
+
+    mod._zone_tmp_indices[key] = index
+
+    return index
+
+
 def check_list_has_single_item(l, error_msg):
     if len(l) > 1:
         raise ValueError(error_msg)
@@ -175,12 +224,32 @@ def cursor_to_df(cursor):
     :param cursor: cursor object with query result
     :return:
     """
+    import pandas as pd
+
     df = pd.DataFrame(
         data=cursor.fetchall(), columns=[s[0] for s in cursor.description]
     )
     return df
 
 
+def get_constraint_duals(instance, constraint_name):
+    """
+    :param instance: the solved problem instance with a 'dual' suffix
+    :param constraint_name: str; the name of the constraint component
+    :return: dictionary of the dual by constraint index; the dual is None if
+        the solver did not return one for the index (e.g. when solving MIPs)
+
+    Get the duals of all indices of a constraint in a single pass over the
+    constraint rather than looking up the dual suffix for each index
+    separately when writing results.
+    """
+    dual_suffix = instance.dual
+    return {
+        idx: dual_suffix.get(constraint_data)
+        for idx, constraint_data in getattr(instance, constraint_name).items()
+    }
+
+
 def check_for_integer_subdirectories(main_directory):
     """
     :param main_directory: directory where we'll look for subdirectories
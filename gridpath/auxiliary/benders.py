@@ -0,0 +1,928 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benders decomposition of capacity-expansion problems.
+
+The capacity-type modules record the names of their investment-decision
+variables (e.g. *GenNewLin_Build_MW*, *TxNewLin_Build_MW*) in the
+*capacity_variables* dynamic component. Once the problem instance has been
+compiled, its constraints are split into the constraints that include only
+investment variables, which stay in the master problem, and the operational
+constraints. The operational constraints are separated into independent
+blocks (constraints that share no variables other than the investment
+variables), and the blocks are grouped into operational subproblems, by
+default one per period.
+
+Before iterating, each subproblem is solved with the investment variables
+constrained only by their bounds, which gives a lower bound on its cost for
+the master problem. Each iteration, the master problem is solved and its
+investment decisions are passed to the subproblems, which are solved in
+parallel worker processes with the investment variables fixed via
+'linking' constraints. The duals of the linking constraints are then used
+to add an optimality cut per subproblem to the master problem. If a
+subproblem is infeasible for the investment decisions (e.g. a policy target
+can't be met without new build), a feasibility cut is added instead, based
+on the duals of a version of the subproblem with slack variables on all
+constraints. Iterations stop when the gap between the lower bound (the
+master objective) and the upper bound (the master investment costs plus the
+subproblem costs) is within the requested tolerance. The best solution
+found is then loaded into the instance, including the constraint duals, so
+results can be exported as usual. Note that the duals of the operational
+constraints are those of the subproblems, in which the investment is fixed,
+so prices may not include the capacity-scarcity component of the duals of
+the monolithic problem.
+
+The subproblems are sent to the workers as compact arrays of bounds and
+coefficients (in compressed sparse row format) and the worker processes
+build and solve their own Pyomo models, so the memory of the largest solve
+is that of the largest subproblem rather than that of the full problem. The
+full problem instance is still compiled once in the main process, as the
+results are exported from it; on top of the instance, the main process
+keeps only the coefficient arrays and the duals of the best iteration, as
+the operational variable values of the best iteration are loaded into the
+instance as soon as they are found.
+
+The problem must be linear and the operational variables must be
+continuous (e.g. binary commitment is not supported); the investment
+variables in the master problem can be integer.
+"""
+
+from array import array
+import math
+from multiprocessing import get_context, current_process
+
+from pyomo.core.expr.current import identify_variables, LinearExpression
+from pyomo.environ import (
+    Binary,
+    Block,
+    ConcreteModel,
+    Constraint,
+    ConstraintList,
+    Expression,
+    Integers,
+    maximize,
+    minimize,
+    NonNegativeReals,
+    Objective,
+    SolverFactory,
+    SolverStatus,
+    Suffix,
+    TerminationCondition,
+    Var,
+    value,
+)
+from pyomo.repn import generate_standard_repn
+
+from gridpath.auxiliary.dynamic_components import capacity_variables
+
+
+SUBPROBLEM_GROUPINGS = ["period", "block"]
+
+
+class BendersDecomposition(object):
+    """
+    The master-problem and subproblem components of a decomposed problem
+    instance.
+    """
+
+    def __init__(self):
+        # 1 if the original objective is minimized and -1 if it is
+        # maximized; the decomposition always minimizes
+        self.sign = 1
+        self.objective = None
+        # Master problem
+        self.master_constraints = list()
+        self.master_variables = list()
+        self.master_cost_terms = list()
+        self.master_cost_constant = 0
+        # Operational constraints (to deactivate while solving the master)
+        self.operational_constraints = list()
+        # Subproblems (one dictionary per subproblem with its name, Pyomo
+        # variables and constraints, and its picklable coefficient data)
+        self.subproblems = list()
+
+
+def get_capacity_variable_ids(instance, dynamic_components):
+    """
+    :param instance: the compiled problem instance
+    :param dynamic_components: the populated dynamic components class
+    :return: the ids of the investment-decision variable data objects
+    """
+    return set(
+        id(v)
+        for var_name in getattr(dynamic_components, capacity_variables)
+        for v in getattr(instance, var_name).values()
+    )
+
+
+def to_array(values):
+    """
+    :param values: iterable of numbers or None
+    :return: array of doubles with NaN for None
+    """
+    return array("d", (float("nan") if x is None else x for x in values))
+
+
+def from_array(x):
+    """
+    :param x: an array element
+    :return: the element or None if it is NaN
+    """
+    return None if math.isnan(x) else x
+
+
+def find_root(parents, i):
+    """
+    :param parents: the union-find parent dictionary
+    :param i: the element
+    :return: the root of the element's set (compressing the path)
+    """
+    root = i
+    while parents[root] != root:
+        root = parents[root]
+    while parents[i] != root:
+        parents[i], i = root, parents[i]
+    return root
+
+
+def get_linear_repn(expr, description):
+    """
+    :param expr: a Pyomo expression
+    :param description: the name of the component (for the error message)
+    :return: the standard representation of the expression
+
+    Only linear expressions can be decomposed.
+    """
+    repn = generate_standard_repn(expr, compute_values=True, quadratic=False)
+    if not repn.is_linear():
+        raise ValueError(
+            "Benders decomposition requires a linear problem. {} is "
+            "nonlinear.".format(description)
+        )
+    return repn
+
+
+def get_block_periods(instance, variables, var_indices):
+    """
+    :param instance: the compiled problem instance
+    :param variables: the operational variables of a block
+    :param var_indices: dictionary of the variable indices by variable id
+    :return: tuple of the periods the block's variables are indexed by
+
+    The periods are determined from the timepoints in the variable indices
+    or, if no variable is indexed by timepoint, from the periods in the
+    variable indices.
+    """
+    elements = set(
+        i
+        for v in variables
+        for i in (
+            var_indices[id(v)]
+            if isinstance(var_indices[id(v)], tuple)
+            else (var_indices[id(v)],)
+        )
+    )
+    tmp_periods = set(instance.period[i] for i in elements if i in instance.TMPS)
+    if tmp_periods:
+        return tuple(sorted(tmp_periods))
+    return tuple(sorted(i for i in elements if i in instance.PERIODS))
+
+
+def decompose_problem(instance, dynamic_components, grouping="period"):
+    """
+    :param instance: the compiled problem instance
+    :param dynamic_components: the populated dynamic components class
+    :param grouping: "period" to group the independent operational blocks
+        by period or "block" to solve each block as its own subproblem
+    :return: a BendersDecomposition object
+
+    Separate the constraints and objective-function terms of the instance
+    into the master problem and the operational subproblems.
+    """
+    if grouping not in SUBPROBLEM_GROUPINGS:
+        raise ValueError(
+            "Unknown Benders subproblem grouping '{}'. Options are: {}.".format(
+                grouping, ", ".join(SUBPROBLEM_GROUPINGS)
+            )
+        )
+
+    decomposition = BendersDecomposition()
+    capacity_var_ids = get_capacity_variable_ids(instance, dynamic_components)
+
+    # Split the constraints and find the independent operational blocks by
+    # joining the operational variables that share a constraint
+    parents = dict()
+    variables = dict()
+    constraint_roots = list()
+    for c in instance.component_data_objects(Constraint, active=True):
+        # Constraints without finite bounds (e.g. limits that default to
+        # infinity) can't bind and would only link the blocks
+        if not c.has_lb() and not c.has_ub():
+            decomposition.operational_constraints.append(c)
+            continue
+        opr_vars = [
+            v
+            for v in identify_variables(c.body, include_fixed=False)
+            if id(v) not in capacity_var_ids
+        ]
+        if not opr_vars:
+            decomposition.master_constraints.append(c)
+            continue
+        for v in opr_vars:
+            if id(v) not in parents:
+                parents[id(v)] = id(v)
+                variables[id(v)] = v
+        root = find_root(parents, id(opr_vars[0]))
+        for v in opr_vars[1:]:
+            other_root = find_root(parents, id(v))
+            if other_root != root:
+                parents[other_root] = root
+        constraint_roots.append((c, id(opr_vars[0])))
+
+    block_constraints = dict()
+    for c, var_id in constraint_roots:
+        block_constraints.setdefault(find_root(parents, var_id), list()).append(c)
+        decomposition.operational_constraints.append(c)
+    block_variables = dict()
+    for var_id, v in variables.items():
+        block_variables.setdefault(find_root(parents, var_id), list()).append(v)
+
+    # Group the blocks into subproblems
+    if grouping == "period":
+        var_indices = {
+            id(v): idx
+            for var in instance.component_objects(Var)
+            for idx, v in var.items()
+        }
+    groups = dict()
+    for root in block_constraints.keys():
+        if grouping == "period":
+            key = get_block_periods(instance, block_variables[root], var_indices)
+        else:
+            key = root
+        groups.setdefault(key, list()).append(root)
+
+    # Split the objective function
+    objectives = list(instance.component_data_objects(Objective, active=True))
+    if len(objectives) != 1:
+        raise ValueError(
+            "Benders decomposition requires a single active objective function."
+        )
+    decomposition.objective = objectives[0]
+    decomposition.sign = -1 if decomposition.objective.sense == maximize else 1
+    obj_repn = get_linear_repn(
+        decomposition.objective.expr, decomposition.objective.name
+    )
+    opr_obj_coefs = dict()
+    for v, coef in zip(obj_repn.linear_vars, obj_repn.linear_coefs):
+        if id(v) in parents:
+            opr_obj_coefs[id(v)] = opr_obj_coefs.get(id(v), 0) + coef
+        else:
+            decomposition.master_cost_terms.append((v, decomposition.sign * coef))
+    decomposition.master_cost_constant = decomposition.sign * obj_repn.constant
+
+    # Variables in the master problem
+    master_var_ids = set()
+    for c in decomposition.master_constraints:
+        for v in identify_variables(c.body, include_fixed=False):
+            if id(v) not in master_var_ids:
+                master_var_ids.add(id(v))
+                decomposition.master_variables.append(v)
+    for v, _ in decomposition.master_cost_terms:
+        if id(v) not in master_var_ids:
+            master_var_ids.add(id(v))
+            decomposition.master_variables.append(v)
+
+    # Create the subproblems
+    keys = sorted(groups.keys()) if grouping == "period" else list(groups.keys())
+    for n, key in enumerate(keys):
+        if grouping == "period":
+            name = "_".join(str(p) for p in key) if key else "other"
+        else:
+            name = str(n + 1)
+        decomposition.subproblems.append(
+            create_subproblem(
+                name=name,
+                constraints=[
+                    c for root in groups[key] for c in block_constraints[root]
+                ],
+                variables=[v for root in groups[key] for v in block_variables[root]],
+                capacity_var_ids=capacity_var_ids,
+                objective_coefficients=opr_obj_coefs,
+                sign=decomposition.sign,
+            )
+        )
+
+    # The investment variables linked to the subproblems are part of the
+    # master problem via the optimality cuts
+    for sp in decomposition.subproblems:
+        for v in sp["linking_variables"]:
+            if id(v) not in master_var_ids:
+                master_var_ids.add(id(v))
+                decomposition.master_variables.append(v)
+
+    return decomposition
+
+
+def create_subproblem(
+    name,
+    constraints,
+    variables,
+    capacity_var_ids,
+    objective_coefficients,
+    sign,
+    allow_integer=False,
+):
+    """
+    :param name: the subproblem name
+    :param constraints: the operational constraints in the subproblem
+    :param variables: the operational variables in the subproblem
+    :param capacity_var_ids: the ids of the investment variables
+    :param objective_coefficients: dictionary of the objective-function
+        coefficients of the operational variables by variable id
+    :param sign: 1 if the original objective is minimized, -1 otherwise
+    :param allow_integer: whether the operational variables can be integer
+        (the subproblem duals are then not used for cuts)
+    :return: dictionary with the subproblem's Pyomo components and data
+
+    The subproblem data are arrays of bounds (NaN if there is no bound)
+    and of the constraint coefficients in compressed sparse row format, so
+    they take little memory and can be sent to the worker processes
+    cheaply. Variables are referenced by position: the operational
+    variables first, followed by the linking (investment) variables.
+    """
+    var_position = dict()
+    integer_vars = list()
+    for v in variables:
+        if v.is_integer() or v.is_binary():
+            if not allow_integer:
+                raise ValueError(
+                    "Benders decomposition requires linear operational "
+                    "subproblems, but {} is an integer variable.".format(v.name)
+                )
+            integer_vars.append((len(var_position), v.is_binary()))
+        var_position[id(v)] = len(var_position)
+    n_vars = len(var_position)
+
+    # Linking variables are numbered after the operational variables
+    linking_variables = list()
+    linking_position = dict()
+    row_lbs = array("d")
+    row_ubs = array("d")
+    row_starts = array("q", [0])
+    positions = array("q")
+    coefs = array("d")
+    for c in constraints:
+        repn = get_linear_repn(c.body, c.name)
+        for v in repn.linear_vars:
+            if id(v) in capacity_var_ids:
+                if id(v) not in linking_position:
+                    linking_position[id(v)] = n_vars + len(linking_variables)
+                    linking_variables.append(v)
+                positions.append(linking_position[id(v)])
+            else:
+                positions.append(var_position[id(v)])
+        coefs.extend(repn.linear_coefs)
+        row_starts.append(len(positions))
+        row_lbs.append(value(c.lower) - repn.constant if c.has_lb() else float("nan"))
+        row_ubs.append(value(c.upper) - repn.constant if c.has_ub() else float("nan"))
+
+    objective_variables = [v for v in variables if id(v) in objective_coefficients]
+
+    return {
+        "name": name,
+        "variables": variables,
+        "constraints": constraints,
+        "linking_variables": linking_variables,
+        "data": {
+            "var_lbs": to_array(v.lb for v in variables),
+            "var_ubs": to_array(v.ub for v in variables),
+            "integer_vars": integer_vars,
+            "linking_lbs": to_array(v.lb for v in linking_variables),
+            "linking_ubs": to_array(v.ub for v in linking_variables),
+            "row_lbs": row_lbs,
+            "row_ubs": row_ubs,
+            "row_starts": row_starts,
+            "positions": positions,
+            "coefs": coefs,
+            "objective_positions": array(
+                "q", (var_position[id(v)] for v in objective_variables)
+            ),
+            "objective_coefs": array(
+                "d",
+                (sign * objective_coefficients[id(v)] for v in objective_variables),
+            ),
+        },
+    }
+
+
+def solve_subproblem(pool_datum):
+    """
+    :param pool_datum: list of the subproblem data, the values of the
+        linking variables, whether to solve the feasibility problem, and the
+        solver name, executable, and options
+    :return: dictionary with the termination condition, objective function
+        value, duals of the linking constraints, and the primal and dual
+        solution of the subproblem (as arrays with NaN for missing values)
+
+    Build and solve the subproblem model. This is run in the worker
+    processes. If no linking-variable values are given, the linking
+    variables are only constrained by their bounds and the objective
+    function value is a lower bound on the subproblem cost. The feasibility
+    problem adds slack variables to all constraints and minimizes their
+    sum instead of the cost.
+    """
+    [
+        data,
+        linking_values,
+        feasibility,
+        solver_name,
+        solver_executable,
+        solver_options,
+    ] = pool_datum
+    n_vars = len(data["var_lbs"])
+    n_linking = len(data["linking_lbs"])
+
+    m = ConcreteModel()
+    m.X = Var(
+        range(n_vars),
+        bounds=lambda mod, i: (
+            from_array(data["var_lbs"][i]),
+            from_array(data["var_ubs"][i]),
+        ),
+    )
+    for i, is_binary in data["integer_vars"]:
+        m.X[i].domain = Binary if is_binary else Integers
+    m.Y = Var(
+        range(n_linking),
+        bounds=lambda mod, j: (
+            from_array(data["linking_lbs"][j]),
+            from_array(data["linking_ubs"][j]),
+        ),
+    )
+    all_vars = [m.X[i] for i in range(n_vars)] + [m.Y[j] for j in range(n_linking)]
+
+    rows = range(len(data["row_lbs"]))
+    if feasibility:
+        m.Slack_Plus = Var(rows, within=NonNegativeReals)
+        m.Slack_Minus = Var(rows, within=NonNegativeReals)
+
+    def row_rule(mod, r):
+        start, end = data["row_starts"][r], data["row_starts"][r + 1]
+        lb, ub = from_array(data["row_lbs"][r]), from_array(data["row_ubs"][r])
+        expr = LinearExpression(
+            constant=0,
+            linear_coefs=list(data["coefs"][start:end]),
+            linear_vars=[all_vars[p] for p in data["positions"][start:end]],
+        )
+        if feasibility:
+            expr = expr + mod.Slack_Plus[r] - mod.Slack_Minus[r]
+        if lb is not None and lb == ub:
+            return expr == lb
+        return lb, expr, ub
+
+    m.Rows = Constraint(rows, rule=row_rule)
+
+    m.Linking_Constraint = Constraint(
+        range(n_linking),
+        rule=lambda mod, j: (
+            Constraint.Skip if linking_values is None else mod.Y[j] == linking_values[j]
+        ),
+    )
+
+    if feasibility:
+        m.Cost = Objective(
+            expr=sum(m.Slack_Plus[r] + m.Slack_Minus[r] for r in rows),
+            sense=minimize,
+        )
+    else:
+        m.Cost = Objective(
+            expr=LinearExpression(
+                constant=0,
+                linear_coefs=list(data["objective_coefs"]),
+                linear_vars=[m.X[i] for i in data["objective_positions"]],
+            ),
+            sense=minimize,
+        )
+    m.dual = Suffix(direction=Suffix.IMPORT)
+
+    if solver_executable is not None:
+        optimizer = SolverFactory(solver_name, executable=solver_executable)
+    else:
+        optimizer = SolverFactory(solver_name)
+    for opt in solver_options.keys():
+        optimizer.options[opt] = solver_options[opt]
+    results = optimizer.solve(m, load_solutions=False)
+
+    termination_condition = results.solver.termination_condition
+    if termination_condition != TerminationCondition.optimal:
+        return {"termination_condition": termination_condition}
+
+    m.solutions.load_from(results)
+
+    return {
+        "termination_condition": termination_condition,
+        "objective": value(m.Cost),
+        "linking_duals": [
+            m.dual.get(m.Linking_Constraint[j], 0) if linking_values is not None else 0
+            for j in range(n_linking)
+        ],
+        "values": to_array(m.X[i].value for i in range(n_vars)),
+        "duals": to_array(m.dual.get(m.Rows[r]) for r in rows),
+    }
+
+
+def load_subproblem_values(subproblem, values):
+    """
+    :param subproblem: the subproblem dictionary
+    :param values: the array of the values of the subproblem variables
+
+    Set the values of the subproblem's variables in the instance.
+    """
+    for v, val in zip(subproblem["variables"], values):
+        v.set_value(from_array(val), skip_validation=True)
+
+
+def load_subproblem_duals(instance, subproblem, duals, sign):
+    """
+    :param instance: the compiled problem instance
+    :param subproblem: the subproblem dictionary
+    :param duals: the array of the duals of the subproblem constraints
+    :param sign: 1 if the original objective is minimized, -1 otherwise
+
+    Set the duals of the subproblem's constraints in the instance. The
+    subproblems minimize, so the duals are converted back to the sense of
+    the original objective.
+    """
+    for c, dual in zip(subproblem["constraints"], duals):
+        if not math.isnan(dual):
+            instance.dual[c] = sign * dual
+
+
+def get_linking_values(linking_variables):
+    """
+    :param linking_variables: the investment variables linked to a
+        subproblem
+    :return: list of the variable values
+
+    Investment variables that are not (yet) in the master problem have no
+    value; they are set to zero or their lower bound.
+    """
+    linking_values = list()
+    for v in linking_variables:
+        if v.value is None:
+            v.set_value(v.lb if v.lb is not None else 0, skip_validation=True)
+        linking_values.append(v.value)
+    return linking_values
+
+
+def get_cut_expression(subproblem, result, linking_values):
+    """
+    :param subproblem: the subproblem dictionary
+    :param result: the subproblem results
+    :param linking_values: the values of the linking variables the
+        subproblem was solved with
+    :return: the first-order approximation of the subproblem objective
+        function in the investment variables
+    """
+    return result["objective"] + sum(
+        dual * (v - linking_values[j])
+        for j, (v, dual) in enumerate(
+            zip(subproblem["linking_variables"], result["linking_duals"])
+        )
+        if dual
+    )
+
+
+def add_master_problem_components(instance, decomposition, cost_lower_bounds):
+    """
+    :param instance: the compiled problem instance
+    :param decomposition: the BendersDecomposition object
+    :param cost_lower_bounds: list of the lower bounds on the subproblem
+        costs (None if unbounded)
+
+    Deactivate the operational constraints and the objective function, and
+    add the cost estimates of the subproblems, the optimality cuts, and the
+    master objective function to the instance.
+    """
+    for c in decomposition.operational_constraints:
+        c.deactivate()
+    decomposition.objective.deactivate()
+
+    instance.Benders_Master = Block()
+    master = instance.Benders_Master
+    subproblems = list(range(len(decomposition.subproblems)))
+    master.Subproblem_Cost_Estimate = Var(
+        subproblems,
+        bounds=lambda mod, s: (cost_lower_bounds[s], None),
+    )
+    master.Optimality_Cuts = ConstraintList()
+    master.Feasibility_Cuts = ConstraintList()
+    master.Investment_Cost = Expression(
+        expr=LinearExpression(
+            constant=decomposition.master_cost_constant,
+            linear_coefs=[coef for _, coef in decomposition.master_cost_terms],
+            linear_vars=[v for v, _ in decomposition.master_cost_terms],
+        )
+    )
+    master.Master_Objective = Objective(
+        expr=master.Investment_Cost
+        + sum(master.Subproblem_Cost_Estimate[s] for s in subproblems),
+        sense=minimize,
+    )
+
+
+def remove_master_problem_components(instance, decomposition):
+    """
+    :param instance: the compiled problem instance
+    :param decomposition: the BendersDecomposition object
+
+    Restore the original problem.
+    """
+    if instance.component("Benders_Master") is None:
+        return
+    instance.del_component(instance.Benders_Master)
+    for c in decomposition.operational_constraints:
+        c.activate()
+    decomposition.objective.activate()
+
+
+def solve_benders(
+    instance,
+    dynamic_components,
+    solver_name,
+    solver_options,
+    solver_executable=None,
+    grouping="period",
+    gap=0.0001,
+    max_iterations=50,
+    n_parallel_subproblems=1,
+    tee=False,
+    quiet=False,
+):
+    """
+    :param instance: the compiled problem instance
+    :param dynamic_components: the populated dynamic components class
+    :param solver_name: the name of the solver
+    :param solver_options: dictionary of solver options
+    :param solver_executable: path to the solver executable (optional)
+    :param grouping: how to group the operational blocks into subproblems
+    :param gap: the relative gap between the upper and lower bound at
+        which to stop iterating
+    :param max_iterations: the maximum number of iterations
+    :param n_parallel_subproblems: the number of worker processes that
+        solve the subproblems
+    :param tee: whether to print the master-problem solver output
+    :param quiet: whether to print the iteration progress
+    :return: the solver status and termination condition
+
+    Solve the problem instance with Benders decomposition and load the
+    best solution found into the instance.
+    """
+    decomposition = decompose_problem(
+        instance=instance, dynamic_components=dynamic_components, grouping=grouping
+    )
+    if not quiet:
+        print(
+            "Benders decomposition: {} master constraints, {} operational "
+            "subproblems".format(
+                len(decomposition.master_constraints), len(decomposition.subproblems)
+            )
+        )
+
+    if solver_executable is not None:
+        optimizer = SolverFactory(solver_name, executable=solver_executable)
+    else:
+        optimizer = SolverFactory(solver_name)
+    for opt in solver_options.keys():
+        optimizer.options[opt] = solver_options[opt]
+
+    # Worker processes can't have children, so solve the subproblems
+    # sequentially if we are already in a pool (e.g. --n_parallel_solve)
+    if n_parallel_subproblems > 1 and not current_process().daemon:
+        pool = get_context("spawn").Pool(n_parallel_subproblems)
+        solve_map = pool.map
+    else:
+        pool = None
+        solve_map = map
+
+    def solve_subproblems(subproblems, linking_values, feasibility=False):
+        return list(
+            solve_map(
+                solve_subproblem,
+                [
+                    [
+                        decomposition.subproblems[s]["data"],
+                        linking_values[s],
+                        feasibility,
+                        solver_name,
+                        solver_executable,
+                        solver_options,
+                    ]
+                    for s in subproblems
+                ],
+            )
+        )
+
+    subproblems = list(range(len(decomposition.subproblems)))
+
+    status = SolverStatus.ok
+    termination_condition = TerminationCondition.maxIterations
+    best = None
+    upper_bound = float("inf")
+    try:
+        # Bound the subproblem cost estimates in the master problem, which
+        # would otherwise be unbounded in the first iterations; if a
+        # subproblem is infeasible for any investment decision, so is the
+        # problem
+        bound_results = solve_subproblems(subproblems, [None] * len(subproblems))
+        for s, r in enumerate(bound_results):
+            if r["termination_condition"] in [
+                TerminationCondition.infeasible,
+                TerminationCondition.infeasibleOrUnbounded,
+            ]:
+                if not quiet:
+                    print(
+                        "Benders subproblem {} is infeasible.".format(
+                            decomposition.subproblems[s]["name"]
+                        )
+                    )
+                return SolverStatus.warning, TerminationCondition.infeasible
+        cost_lower_bounds = [
+            r["objective"]
+            if r["termination_condition"] == TerminationCondition.optimal
+            else None
+            for r in bound_results
+        ]
+
+        add_master_problem_components(
+            instance=instance,
+            decomposition=decomposition,
+            cost_lower_bounds=cost_lower_bounds,
+        )
+        master = instance.Benders_Master
+
+        for iteration in range(1, max_iterations + 1):
+            # Master problem
+            results = optimizer.solve(instance, tee=tee)
+            if results.solver.termination_condition != TerminationCondition.optimal:
+                status = results.solver.status
+                termination_condition = results.solver.termination_condition
+                if not quiet:
+                    print(
+                        "Benders master problem terminated with condition "
+                        "{}.".format(termination_condition)
+                    )
+                break
+            lower_bound = value(master.Master_Objective)
+            investment_cost = value(master.Investment_Cost)
+
+            # Subproblems
+            linking_values = [
+                get_linking_values(sp["linking_variables"])
+                for sp in decomposition.subproblems
+            ]
+            sp_results = solve_subproblems(subproblems, linking_values)
+
+            # Feasibility cuts
+            infeasible = [
+                s
+                for s in subproblems
+                if sp_results[s]["termination_condition"]
+                in [
+                    TerminationCondition.infeasible,
+                    TerminationCondition.infeasibleOrUnbounded,
+                ]
+            ]
+            # Subproblems whose feasibility problem could not be solved have
+            # no cut, so they end the loop below
+            cut_subproblems = []
+            if infeasible:
+                for s, r in zip(
+                    infeasible,
+                    solve_subproblems(infeasible, linking_values, feasibility=True),
+                ):
+                    if r["termination_condition"] != TerminationCondition.optimal:
+                        sp_results[s] = r
+                        break
+                    cut_subproblems.append(s)
+                    master.Feasibility_Cuts.add(
+                        get_cut_expression(
+                            decomposition.subproblems[s], r, linking_values[s]
+                        )
+                        <= 0
+                    )
+                if not quiet:
+                    print(
+                        "Benders iteration {}: lower bound {:.6g}, {} infeasible "
+                        "subproblem(s)".format(iteration, lower_bound, len(infeasible))
+                    )
+
+            not_optimal = [
+                (decomposition.subproblems[s]["name"], r["termination_condition"])
+                for s, r in enumerate(sp_results)
+                if s not in cut_subproblems
+                and r["termination_condition"] != TerminationCondition.optimal
+            ]
+            if not_optimal:
+                status = SolverStatus.warning
+                termination_condition = not_optimal[0][1]
+                if not quiet:
+                    print(
+                        "Benders subproblem {} terminated with condition "
+                        "{}.".format(*not_optimal[0])
+                    )
+                break
+            if infeasible:
+                continue
+
+            # Bounds; the operational variables are not in the master
+            # problem, so the values of the best iteration are loaded into
+            # the instance right away rather than kept
+            candidate = investment_cost + sum(r["objective"] for r in sp_results)
+            if candidate < upper_bound:
+                upper_bound = candidate
+                best = {
+                    "master_values": [v.value for v in decomposition.master_variables],
+                    "master_duals": [
+                        instance.dual.get(c) for c in decomposition.master_constraints
+                    ],
+                    "subproblem_duals": [r["duals"] for r in sp_results],
+                }
+                for sp, r in zip(decomposition.subproblems, sp_results):
+                    load_subproblem_values(subproblem=sp, values=r["values"])
+            relative_gap = max(
+                (upper_bound - lower_bound) / max(abs(upper_bound), 1e-10), 0
+            )
+            if not quiet:
+                print(
+                    "Benders iteration {}: lower bound {:.6g}, upper bound {:.6g}, "
+                    "gap {:.4%}".format(
+                        iteration, lower_bound, upper_bound, relative_gap
+                    )
+                )
+            if relative_gap <= gap:
+                termination_condition = TerminationCondition.optimal
+                break
+
+            # Optimality cuts
+            for s, r in enumerate(sp_results):
+                master.Optimality_Cuts.add(
+                    master.Subproblem_Cost_Estimate[s]
+                    >= get_cut_expression(
+                        decomposition.subproblems[s], r, linking_values[s]
+                    )
+                )
+    finally:
+        if pool is not None:
+            pool.close()
+        remove_master_problem_components(instance=instance, decomposition=decomposition)
+
+    if best is None:
+        return status, termination_condition
+
+    if not quiet and termination_condition != TerminationCondition.optimal:
+        print(
+            "Benders decomposition did not converge; loading the best solution "
+            "found."
+        )
+    load_best_solution(instance=instance, decomposition=decomposition, best=best)
+
+    return status, termination_condition
+
+
+def load_best_solution(instance, decomposition, best):
+    """
+    :param instance: the compiled problem instance
+    :param decomposition: the BendersDecomposition object
+    :param best: dictionary with the master-problem values and duals and
+        the subproblem duals of the best iteration
+
+    Load the master-problem variable values and the constraint duals of the
+    best iteration into the instance (the operational variable values are
+    loaded when the best iteration is found). The decomposition minimizes,
+    so the duals are converted back to the sense of the original objective.
+    """
+    instance.dual.clear()
+    for v, val in zip(decomposition.master_variables, best["master_values"]):
+        v.set_value(val, skip_validation=True)
+    for c, dual in zip(decomposition.master_constraints, best["master_duals"]):
+        if dual is not None:
+            instance.dual[c] = decomposition.sign * dual
+
+    for sp, duals in zip(decomposition.subproblems, best["subproblem_duals"]):
+        load_subproblem_duals(
+            instance=instance, subproblem=sp, duals=duals, sign=decomposition.sign
+        )
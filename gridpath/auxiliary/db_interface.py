@@ -13,9 +13,13 @@
 # limitations under the License.
 
 import os.path
-import pandas as pd
+import sqlite3
 
-from db.common_functions import spin_on_database_lock, spin_on_database_lock_generic
+from db.common_functions import (
+    spin_on_database_lock,
+    spin_on_database_lock_generic,
+    spin_on_database_lock_transaction,
+)
 
 
 def get_required_capacity_types_from_database(conn, scenario_id):
@@ -222,6 +226,8 @@ def import_csv(
         stage=stage,
     )
 
+    import pandas as pd
+
     df = pd.read_csv(os.path.join(results_directory, f"{which_results}.csv"))
     df["scenario_id"] = scenario_id
     df["subproblem_id"] = subproblem
@@ -234,6 +240,98 @@ def import_csv(
     )
 
 
+def get_update_from_source_statement(
+    tbl, col, scenario_id, source_sql, source_data, join_cols, value=None
+):
+    """
+    :param tbl: the results table to update
+    :param col: the column to update
+    :param scenario_id: the scenario whose rows to update
+    :param source_sql: query returning the join_cols and the columns used
+        in the new value
+    :param source_data: the parameters of source_sql
+    :param join_cols: list of the columns on which to match the table rows
+        to the source_sql rows
+    :param value: SQL expression for the new value in terms of the source
+        columns (prefixed with 'src.') and the table columns; defaults to the
+        col column of the source_sql rows
+    :return: (SQL statement, data) tuple
+
+    Build a single statement that updates the column of the scenario's
+    table rows that match a source_sql row. Only rows whose value changes
+    are written; rows without a match are not modified (see
+    get_set_null_if_no_source_statement to set them to NULL).
+    """
+    value = "src.{}".format(col) if value is None else value
+    join_sql = " AND ".join("{0}.{1} = src.{1}".format(tbl, c) for c in join_cols)
+    if sqlite3.sqlite_version_info >= (3, 33, 0):
+        sql = """
+            UPDATE {tbl}
+            SET {col} = {value}
+            FROM ({source_sql}) AS src
+            WHERE {tbl}.scenario_id = ?
+            AND {join_sql}
+            AND {tbl}.{col} IS NOT {value};
+            """.format(
+            tbl=tbl, col=col, value=value, source_sql=source_sql, join_sql=join_sql
+        )
+        data = tuple(source_data) + (scenario_id,)
+    # UPDATE FROM requires SQLite 3.33.0 or newer
+    else:
+        sql = """
+            UPDATE {tbl}
+            SET {col} = (
+                SELECT {value} FROM ({source_sql}) AS src WHERE {join_sql}
+            )
+            WHERE {tbl}.scenario_id = ?
+            AND EXISTS (
+                SELECT 1 FROM ({source_sql}) AS src
+                WHERE {join_sql}
+                AND {tbl}.{col} IS NOT {value}
+            );
+            """.format(
+            tbl=tbl, col=col, value=value, source_sql=source_sql, join_sql=join_sql
+        )
+        data = tuple(source_data) + (scenario_id,) + tuple(source_data)
+
+    return sql, data
+
+
+def get_set_null_if_no_source_statement(
+    tbl, col, scenario_id, source_sql, source_data, join_cols
+):
+    """
+    :param tbl: the results table to update
+    :param col: the column to update
+    :param scenario_id: the scenario whose rows to update
+    :param source_sql: query returning the join_cols
+    :param source_data: the parameters of source_sql
+    :param join_cols: list of the columns on which to match the table rows
+        to the source_sql rows
+    :return: (SQL statement, data) tuple
+
+    Build a statement that sets the column of the scenario's table rows
+    that don't match any source_sql row to NULL. Together with the
+    get_update_from_source_statement statement, this gives the result of a
+    correlated UPDATE ... SET col = (SELECT ...) of all the scenario's rows.
+    """
+    join_sql = " AND ".join("{0}.{1} = src.{1}".format(tbl, c) for c in join_cols)
+    sql = """
+        UPDATE {tbl}
+        SET {col} = NULL
+        WHERE {tbl}.scenario_id = ?
+        AND {tbl}.{col} IS NOT NULL
+        AND NOT EXISTS (
+            SELECT 1 FROM ({source_sql}) AS src WHERE {join_sql}
+        );
+        """.format(
+        tbl=tbl, col=col, source_sql=source_sql, join_sql=join_sql
+    )
+    data = (scenario_id,) + tuple(source_data)
+
+    return sql, data
+
+
 def update_prj_zone_column(
     conn, scenario_id, subscenarios, subscenario, subsc_tbl, prj_tbl, col
 ):
@@ -248,30 +346,51 @@ def update_prj_zone_column(
     Update a column of a project table based on the scenario's relevant
     subscenario ID.
     """
-    c = conn.cursor()
+    update_prj_zone_columns(
+        conn=conn,
+        scenario_id=scenario_id,
+        subscenarios=subscenarios,
+        subscenario=subscenario,
+        subsc_tbl=subsc_tbl,
+        prj_tbls=[prj_tbl],
+        col=col,
+    )
 
-    # Determine the zones for each project
-    project_zones = c.execute(
-        """SELECT project, {}
-            FROM {}
-            WHERE {} = {}""".format(
-            col, subsc_tbl, subscenario, getattr(subscenarios, subscenario.upper())
-        )
-    ).fetchall()
 
-    updates = []
-    for prj, zone in project_zones:
-        updates.append((zone, scenario_id, prj))
+def update_prj_zone_columns(
+    conn, scenario_id, subscenarios, subscenario, subsc_tbl, prj_tbls, col
+):
+    """
+    :param conn:
+    :param scenario_id:
+    :param subscenarios:
+    :param subscenario:
+    :param subsc_tbl:
+    :param prj_tbls: list of project tables
+    :param col:
 
-    sql = """
-        UPDATE {}
-        SET {} = ?
-        WHERE scenario_id = ?
-        AND project = ?;
-        """.format(
-        prj_tbl, col
+    Update a column of several project tables based on the scenario's
+    relevant subscenario ID, with one statement per table in a single
+    transaction.
+    """
+    source_sql = """SELECT project, {} FROM {} WHERE {} = ?""".format(
+        col, subsc_tbl, subscenario
+    )
+    statements = [
+        get_update_from_source_statement(
+            tbl=prj_tbl,
+            col=col,
+            scenario_id=scenario_id,
+            source_sql=source_sql,
+            source_data=(getattr(subscenarios, subscenario.upper()),),
+            join_cols=["project"],
+        )
+        for prj_tbl in prj_tbls
+    ]
+
+    spin_on_database_lock_transaction(
+        conn=conn, cursor=conn.cursor(), statements=statements
     )
-    spin_on_database_lock(conn=conn, cursor=c, sql=sql, data=updates)
 
 
 def determine_table_subset_by_start_and_column(conn, tbl_start, cols):
@@ -284,15 +403,21 @@ def determine_table_subset_by_start_and_column(conn, tbl_start, cols):
     Determine which tables that start with a particular string have a
     particular column.
     """
-    all_tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table';")
+    all_tables = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table';"
+    ).fetchall()
     table_subset = []
 
     c = conn.cursor()
     for tbl_tuple in all_tables:
         table = tbl_tuple[0]
         if table.startswith(tbl_start):
-            table_data_query = c.execute("""SELECT * FROM {};""".format(table))
-            column_names = [s[0] for s in table_data_query.description]
+            column_names = [
+                col_info[1]
+                for col_info in c.execute(
+                    """PRAGMA table_info({});""".format(table)
+                ).fetchall()
+            ]
             if all(col in column_names for col in cols):
                 table_subset.append(table)
 
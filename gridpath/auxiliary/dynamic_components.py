@@ -17,12 +17,18 @@ This module creates the DynamicComponents class, which contains the lists and
 dictionaries of the names of dynamic optimization components. These are
 components that are populated by GridPath modules based on the selected
 features and the scenario input data.
+
+It also creates the ResultsFrame class, which holds the results tables that
+modules add their results to before they are exported.
 """
 
+import math
+
 # Create global variables for the dynamic component names, so that we can
 # more easily import the correct names into other modules
 capacity_type_operational_period_sets = "capacity_type_operational_period_sets"
 capacity_type_financial_period_sets = "capacity_type_financial_period_sets"
+capacity_variables = "capacity_variables"
 
 headroom_variables = "headroom_variables"
 footroom_variables = "footroom_variables"
@@ -64,6 +70,8 @@ local_capacity_balance_provision_components = (
 
 fuel_burn_balance_components = "fuel_burn_balance_components"
 
+lazy_constraints = "lazy_constraints"
+
 cost_components = "cost_components"
 revenue_components = "revenue_components"
 
@@ -93,6 +101,11 @@ class DynamicComponents(object):
         setattr(self, capacity_type_operational_period_sets, list())
         setattr(self, capacity_type_financial_period_sets, list())
 
+        # The names of the investment-decision variables; if called,
+        # the project and transmission capacity-type modules will add the
+        # names of their build/retirement variables to this list
+        setattr(self, capacity_variables, list())
+
         # PRM cost groups
         setattr(self, prm_cost_group_sets, list())
         setattr(self, prm_cost_group_prm_type, dict())
@@ -156,7 +169,126 @@ class DynamicComponents(object):
         # Modules will add component names to this list
         setattr(self, fuel_burn_balance_components, list())
 
+        # Constraints that can be generated lazily, i.e. only activated if
+        # violated (see gridpath.auxiliary.lazy_constraints)
+        # Modules will add component names to this list
+        setattr(self, lazy_constraints, list())
+
         # Objective functions
         # Modules will add component names to this list
         setattr(self, cost_components, list())
         setattr(self, revenue_components, list())
+
+
+class ResultsFrame(object):
+    """
+    A results table by index (e.g. project-timepoint) that modules add their
+    results columns to in *export_results* before the table is written to
+    disk. The rows are fixed when the table is created, so the position of
+    each index is looked up once and each column is a preallocated list of
+    values; modules write their results into these slots directly instead of
+    aligning a new DataFrame with the table. The table is only converted to
+    a pandas DataFrame when it is exported (see *to_df*).
+    """
+
+    __slots__ = ("index_columns", "index", "_positions", "_columns", "_n_fixed")
+
+    def __init__(self, index_columns, columns, data):
+        """
+        :param index_columns: list of the names of the index columns
+        :param columns: list of the names of all columns, including the index
+            columns
+        :param data: list of the rows (lists with a value for each column)
+
+        Create the table with the given rows, sorted by index.
+        """
+        index_positions = [columns.index(c) for c in index_columns]
+        rows = sorted(data, key=lambda row: tuple(row[i] for i in index_positions))
+
+        self.index_columns = list(index_columns)
+        self.index = [tuple(row[i] for i in index_positions) for row in rows]
+        self._positions = {idx: position for position, idx in enumerate(self.index)}
+        self._columns = {
+            c: [row[i] for row in rows]
+            for i, c in enumerate(columns)
+            if c not in index_columns
+        }
+        # The columns the table is created with keep the data types pandas
+        # infers; results columns are exported as objects
+        self._n_fixed = len(self._columns)
+
+    def __contains__(self, column):
+        return column in self._columns
+
+    def __len__(self):
+        return len(self.index)
+
+    def add_columns(self, columns):
+        """
+        :param columns: list of column names
+
+        Add the columns that are not in the table yet, with no values.
+        """
+        for c in columns:
+            if c not in self._columns:
+                self._columns[c] = [None] * len(self.index)
+
+    def update(self, columns, data):
+        """
+        :param columns: list of the names of the results columns
+        :param data: list of rows with the index values followed by a value
+            for each results column
+
+        Add the columns if needed and write the values of the rows whose
+        index is in the table. Missing values (None or NaN) don't overwrite
+        the values already in the table.
+        """
+        self.add_columns(columns)
+        n_index = len(self.index_columns)
+        slots = [self._columns[c] for c in columns]
+        for row in data:
+            position = self._positions.get(tuple(row[:n_index]))
+            if position is None:
+                continue
+            for slot, v in zip(slots, row[n_index:]):
+                if not (v is None or (isinstance(v, float) and math.isnan(v))):
+                    slot[position] = v
+
+    def get_column(self, column):
+        """
+        :param column: the column name
+        :return: list of the column's values in the order of the index
+        """
+        return list(self._columns[column])
+
+    def set_column(self, column, values):
+        """
+        :param column: the column name
+        :param values: list of values in the order of the index
+
+        Add the column if needed and replace all its values.
+        """
+        self.add_columns([column])
+        self._columns[column][:] = values
+
+    def to_df(self):
+        """
+        :return: the table as a pandas DataFrame indexed by the index columns
+        """
+        import pandas as pd
+
+        index = pd.MultiIndex.from_arrays(
+            [[idx[i] for idx in self.index] for i in range(len(self.index_columns))],
+            names=self.index_columns,
+        )
+        return pd.DataFrame(
+            {
+                c: pd.Series(
+                    values,
+                    index=index,
+                    dtype=None if i < self._n_fixed else object,
+                )
+                for i, (c, values) in enumerate(self._columns.items())
+            },
+            index=index,
+        )
@@ -0,0 +1,364 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parallel solution of subproblems whose horizons are independent.
+
+In production-cost runs without investment decisions or period-level
+policies, the operations of a horizon (e.g. a week) often don't depend on
+the operations of the other horizons in the subproblem. With the
+*--n_parallel_horizons* argument, *run_scenario.py* checks whether this is
+the case and, if so, solves the horizons as separate problems in parallel
+worker processes instead of solving the subproblem as a single problem.
+
+We first screen the subproblem based on its features and temporal
+structure: the modules that add period-level constraints across horizons
+(see *PERIOD_COUPLING_MODULES*), investment decisions, and horizons with
+'linked' boundaries make the horizons dependent. Once the problem instance
+has been compiled, we then separate its constraints into independent blocks
+(constraints that share no unfixed variables), as in Benders decomposition
+(see *gridpath.auxiliary.benders*), and group the blocks by horizon. The
+horizons are those of the balancing type with the most horizons such that
+each block is within a single horizon. If the instance can't be split into
+more than one horizon this way, it is solved as usual.
+
+The horizon problems are sent to the worker processes as coefficient
+arrays and the solutions (variable values and constraint duals) are loaded
+back into the instance, so results are exported as usual. The objective
+function value matches that of the single solve, but if the problem has
+several optimal solutions (e.g. degenerate primal solutions), the variable
+values and therefore the result files may differ.
+"""
+
+from multiprocessing import get_context, current_process
+
+from pyomo.core.expr.current import identify_variables
+from pyomo.environ import (
+    Constraint,
+    maximize,
+    Objective,
+    SolverStatus,
+    TerminationCondition,
+    Var,
+)
+
+from gridpath.auxiliary.benders import (
+    create_subproblem,
+    find_root,
+    get_linear_repn,
+    load_subproblem_duals,
+    load_subproblem_values,
+    solve_subproblem,
+)
+from gridpath.auxiliary.dynamic_components import capacity_variables
+
+# Optional modules with constraints that span all horizons in a period;
+# other constraints across horizons (e.g. capacity factor limits of a
+# balancing type with longer horizons) are found from the problem structure
+PERIOD_COUPLING_MODULES = [
+    "system.policy.energy_targets.period_energy_target",
+    "system.policy.transmission_targets.period_transmission_target",
+    "system.policy.carbon_cap.carbon_cap",
+    "system.policy.performance_standard.performance_standard",
+    "system.policy.carbon_credits",
+]
+
+SEPARABLE_BOUNDARIES = ["circular", "linear"]
+
+
+class HorizonDecomposition(object):
+    """
+    The independent horizon problems of a problem instance.
+    """
+
+    def __init__(self):
+        # 1 if the original objective is minimized and -1 if it is
+        # maximized; the horizon problems always minimize
+        self.sign = 1
+        # The balancing type whose horizons the problems are grouped by
+        self.balancing_type = None
+        # Horizon problems (one dictionary per problem with its name, Pyomo
+        # variables and constraints, and its picklable coefficient data)
+        self.subproblems = list()
+
+
+def get_coupling_reason(instance, dynamic_components, modules_to_use):
+    """
+    :param instance: the compiled problem instance
+    :param dynamic_components: the populated dynamic components class
+    :param modules_to_use: list of the names of the modules the scenario
+        uses
+    :return: the reason the horizons can't be solved independently or None
+        if the features and temporal structure allow it
+    """
+    for module in PERIOD_COUPLING_MODULES:
+        if module in modules_to_use:
+            return "module {} links the horizons in a period".format(module)
+
+    for var_name in getattr(dynamic_components, capacity_variables):
+        if any(not v.fixed for v in getattr(instance, var_name).values()):
+            return "the problem includes investment decisions ({})".format(var_name)
+
+    for bt, h in instance.BLN_TYPE_HRZS:
+        if instance.boundary[bt, h] not in SEPARABLE_BOUNDARIES:
+            return "horizon {} of balancing type {} has a '{}' boundary".format(
+                h, bt, instance.boundary[bt, h]
+            )
+
+    return None
+
+
+def get_grouping_balancing_type(instance, block_tmps):
+    """
+    :param instance: the compiled problem instance
+    :param block_tmps: list of the sets of timepoints of each block
+    :return: the balancing type with the most horizons such that the
+        timepoints of each block are within a single horizon, or None if
+        there is no such balancing type
+    """
+    candidates = list()
+    for bt in instance.BLN_TYPES:
+        if all(
+            len(set(instance.horizon[tmp, bt] for tmp in tmps)) <= 1
+            for tmps in block_tmps
+        ):
+            candidates.append((len(instance.HRZS_BY_BLN_TYPE[bt]), bt))
+    if not candidates:
+        return None
+    return max(candidates)[1]
+
+
+def decompose_by_horizon(instance):
+    """
+    :param instance: the compiled problem instance
+    :return: a HorizonDecomposition object or None if the instance can't
+        be split into more than one horizon problem
+
+    Separate the constraints of the instance into independent blocks and
+    group them by horizon.
+    """
+    decomposition = HorizonDecomposition()
+
+    objectives = list(instance.component_data_objects(Objective, active=True))
+    if len(objectives) != 1:
+        return None
+    objective = objectives[0]
+    decomposition.sign = -1 if objective.sense == maximize else 1
+
+    # Find the independent blocks by joining the variables that share a
+    # constraint
+    parents = dict()
+    variables = dict()
+    constraint_roots = list()
+    for c in instance.component_data_objects(Constraint, active=True):
+        # Constraints without finite bounds are not passed to the solver
+        if not c.has_lb() and not c.has_ub():
+            continue
+        c_vars = list(identify_variables(c.body, include_fixed=False))
+        if not c_vars:
+            continue
+        for v in c_vars:
+            if id(v) not in parents:
+                parents[id(v)] = id(v)
+                variables[id(v)] = v
+        root = find_root(parents, id(c_vars[0]))
+        for v in c_vars[1:]:
+            other_root = find_root(parents, id(v))
+            if other_root != root:
+                parents[other_root] = root
+        constraint_roots.append((c, id(c_vars[0])))
+
+    # Variables only in the objective function are blocks of their own
+    obj_repn = get_linear_repn(objective.expr, objective.name)
+    obj_coefs = dict()
+    for v, coef in zip(obj_repn.linear_vars, obj_repn.linear_coefs):
+        if id(v) not in parents:
+            parents[id(v)] = id(v)
+            variables[id(v)] = v
+        obj_coefs[id(v)] = obj_coefs.get(id(v), 0) + coef
+
+    block_constraints = dict()
+    for c, var_id in constraint_roots:
+        block_constraints.setdefault(find_root(parents, var_id), list()).append(c)
+    block_variables = dict()
+    for var_id, v in variables.items():
+        block_variables.setdefault(find_root(parents, var_id), list()).append(v)
+    if len(block_variables) < 2:
+        return None
+
+    # Get the timepoints of each block from the variable indices
+    var_indices = {
+        id(v): idx for var in instance.component_objects(Var) for idx, v in var.items()
+    }
+    tmps = set(instance.TMPS)
+    roots = list(block_variables.keys())
+    block_tmps = list()
+    for root in roots:
+        block_tmps.append(
+            set(
+                i
+                for v in block_variables[root]
+                for i in (
+                    var_indices[id(v)]
+                    if isinstance(var_indices[id(v)], tuple)
+                    else (var_indices[id(v)],)
+                )
+                if i in tmps
+            )
+        )
+
+    decomposition.balancing_type = get_grouping_balancing_type(
+        instance=instance, block_tmps=[t for t in block_tmps if t]
+    )
+    if decomposition.balancing_type is None:
+        return None
+
+    # Group the blocks by horizon; blocks without timepoints (e.g. with
+    # period-level variables only) are solved together
+    groups = dict()
+    for root, root_tmps in zip(roots, block_tmps):
+        if root_tmps:
+            key = instance.horizon[next(iter(root_tmps)), decomposition.balancing_type]
+        else:
+            key = None
+        groups.setdefault(key, list()).append(root)
+    if len(groups) < 2:
+        return None
+
+    for key in sorted(groups.keys(), key=lambda k: (k is None, k)):
+        decomposition.subproblems.append(
+            create_subproblem(
+                name="other" if key is None else str(key),
+                constraints=[
+                    c
+                    for root in groups[key]
+                    for c in block_constraints.get(root, list())
+                ],
+                variables=[v for root in groups[key] for v in block_variables[root]],
+                capacity_var_ids=set(),
+                objective_coefficients=obj_coefs,
+                sign=decomposition.sign,
+                allow_integer=True,
+            )
+        )
+
+    return decomposition
+
+
+def solve_horizons(
+    instance,
+    dynamic_components,
+    modules_to_use,
+    solver_name,
+    solver_options,
+    solver_executable=None,
+    n_parallel_horizons=1,
+    quiet=False,
+):
+    """
+    :param instance: the compiled problem instance
+    :param dynamic_components: the populated dynamic components class
+    :param modules_to_use: list of the names of the modules the scenario
+        uses
+    :param solver_name: the name of the solver
+    :param solver_options: dictionary of solver options
+    :param solver_executable: path to the solver executable (optional)
+    :param n_parallel_horizons: the number of worker processes that solve
+        the horizon problems
+    :param quiet: whether to print progress
+    :return: the solver status and termination condition, or None if the
+        horizons can't be solved independently
+
+    Solve the horizons of the problem instance independently and load their
+    solutions into the instance.
+    """
+    reason = get_coupling_reason(
+        instance=instance,
+        dynamic_components=dynamic_components,
+        modules_to_use=modules_to_use,
+    )
+    decomposition = None if reason is not None else decompose_by_horizon(instance)
+    if decomposition is None:
+        if not quiet:
+            print(
+                "Horizons can't be solved independently ({}); solving the "
+                "subproblem as a single problem.".format(
+                    reason
+                    if reason is not None
+                    else "the constraints link the horizons"
+                )
+            )
+        return None
+
+    if not quiet:
+        print(
+            "Solving {} independent problems by {} horizon".format(
+                len(decomposition.subproblems), decomposition.balancing_type
+            )
+        )
+
+    # Worker processes can't have children, so solve the horizons
+    # sequentially if we are already in a pool (e.g. --n_parallel_solve)
+    pool_data = [
+        [sp["data"], None, False, solver_name, solver_executable, solver_options]
+        for sp in decomposition.subproblems
+    ]
+    if n_parallel_horizons > 1 and not current_process().daemon:
+        pool = get_context("spawn").Pool(n_parallel_horizons)
+        try:
+            sp_results = pool.map(solve_subproblem, pool_data)
+        finally:
+            pool.close()
+    else:
+        sp_results = list(map(solve_subproblem, pool_data))
+
+    not_optimal = [
+        (sp["name"], r["termination_condition"])
+        for sp, r in zip(decomposition.subproblems, sp_results)
+        if r["termination_condition"] != TerminationCondition.optimal
+    ]
+    if not_optimal:
+        if not quiet:
+            print(
+                "The problem for horizon {} terminated with condition "
+                "{}.".format(*not_optimal[0])
+            )
+        return SolverStatus.warning, not_optimal[0][1]
+
+    load_horizon_solutions(
+        instance=instance, decomposition=decomposition, sp_results=sp_results
+    )
+
+    return SolverStatus.ok, TerminationCondition.optimal
+
+
+def load_horizon_solutions(instance, decomposition, sp_results):
+    """
+    :param instance: the compiled problem instance
+    :param decomposition: the HorizonDecomposition object
+    :param sp_results: the results of each horizon problem
+
+    Load the variable values and constraint duals of the horizon problems
+    into the instance. The horizon problems minimize, so the duals are
+    converted back to the sense of the original objective.
+    """
+    instance.dual.clear()
+    for sp, r in zip(decomposition.subproblems, sp_results):
+        load_subproblem_values(subproblem=sp, values=r["values"])
+        load_subproblem_duals(
+            instance=instance,
+            subproblem=sp,
+            duals=r["duals"],
+            sign=decomposition.sign,
+        )
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import os.path
-from pyomo.environ import value
 
 
 # Import-export rules
@@ -21,6 +20,8 @@ from pyomo.environ import value
 
 # Export & import if USE is found only
 def export_rule_use(instance, quiet):
+    from pyomo.environ import value
+
     unserved_energy_found = any(
         [
             value(instance.Unserved_Energy_MW_Expression[z, tmp])
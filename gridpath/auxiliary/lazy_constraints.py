@@ -0,0 +1,210 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Iterative (lazy) generation of constraints that rarely bind.
+
+Modules add the names of constraints that only bind in a small fraction of
+their indices, e.g. the transmission flow limits of the *tx_simple* and
+*tx_dcopf* operational types, to the *lazy_constraints* dynamic component.
+With the *--lazy_constraints* flag, the problem is first solved with only a
+screened subset of these constraints active: the constraints listed in the
+binding-constraints file (if one is given). The inactive constraints that
+the solution violates are then activated and the problem is re-solved,
+warm-started from the previous solution, until no constraint is violated.
+The solution is then feasible for the full problem and, because the
+problem with fewer constraints is a relaxation, also optimal.
+
+If a solve with only some of the constraints active is not optimal (e.g.
+the relaxed problem is unbounded without the flow limits), all remaining
+constraints are activated and the full problem is solved instead.
+
+The constraints binding in the final solution are added to the
+binding-constraints file, so that later scenarios with a similar network
+and operations can start from them and need fewer iterations.
+
+Pyomo is imported in the functions that use it, so that importing this
+module (e.g. in run_scenario) doesn't load it.
+"""
+
+import csv
+import os.path
+
+from gridpath.auxiliary.dynamic_components import lazy_constraints
+
+
+def get_lazy_constraints(instance, dynamic_components):
+    """
+    :param instance: the compiled problem instance
+    :param dynamic_components: the populated dynamic components class
+    :return: list of the constraint data objects that can be generated lazily
+    """
+    return [
+        c
+        for constraint_name in getattr(dynamic_components, lazy_constraints)
+        for c in getattr(instance, constraint_name).values()
+    ]
+
+
+def read_binding_constraints(binding_constraints_file):
+    """
+    :param binding_constraints_file: path to the binding-constraints file
+    :return: set of the names of the constraints listed in the file (empty
+        if the file doesn't exist)
+    """
+    if binding_constraints_file is None or not os.path.exists(binding_constraints_file):
+        return set()
+    with open(binding_constraints_file, "r") as f:
+        reader = csv.reader(f)
+        next(reader)
+        return set(row[0] for row in reader)
+
+
+def write_binding_constraints(binding_constraints_file, constraint_names):
+    """
+    :param binding_constraints_file: path to the binding-constraints file
+    :param constraint_names: the names of the constraints to write
+    """
+    with open(binding_constraints_file, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["constraint"])
+        for name in sorted(constraint_names):
+            writer.writerow([name])
+
+
+def get_violation(c):
+    """
+    :param c: a constraint data object
+    :return: the amount by which the current variable values violate the
+        constraint (zero or negative if the constraint is satisfied)
+    """
+    from pyomo.environ import value
+
+    body = value(c.body, exception=False)
+    violation = float("-inf")
+    if body is None:
+        return violation
+    if c.has_lb():
+        violation = max(violation, c.lb - body)
+    if c.has_ub():
+        violation = max(violation, body - c.ub)
+    return violation
+
+
+def solve_with_lazy_constraints(
+    instance,
+    dynamic_components,
+    solve_function,
+    parsed_arguments,
+    binding_constraints_file=None,
+    tolerance=1e-6,
+    quiet=False,
+):
+    """
+    :param instance: the compiled problem instance
+    :param dynamic_components: the populated dynamic components class
+    :param solve_function: the function that solves the instance; it's
+        called with the instance, the parsed arguments, and whether to
+        warm-start the solver
+    :param parsed_arguments: the user-defined arguments (parsed)
+    :param binding_constraints_file: path to the binding-constraints file
+        (optional)
+    :param tolerance: the violation (and slack) below which a constraint
+        is considered satisfied (binding)
+    :param quiet: whether to print the iteration progress
+    :return: the results of the last solve
+
+    Solve the instance activating the lazy constraints as they are
+    violated. If a solve is not optimal while some constraints are still
+    inactive, all constraints are activated and the full problem is
+    solved. All constraints are active again when this returns; the duals
+    of the constraints that were never activated are set to zero (they were
+    not binding).
+    """
+    from pyomo.environ import TerminationCondition
+
+    candidates = get_lazy_constraints(instance, dynamic_components)
+    initial_names = read_binding_constraints(binding_constraints_file)
+
+    inactive = list()
+    for c in candidates:
+        if c.active and c.name not in initial_names:
+            c.deactivate()
+            inactive.append(c)
+    if not quiet:
+        print(
+            "Lazy constraints: {} of {} constraints active initially".format(
+                len(candidates) - len(inactive), len(candidates)
+            )
+        )
+
+    iteration = 1
+    results = solve_function(instance, parsed_arguments, warmstart=False)
+    while results.solver.termination_condition == TerminationCondition.optimal:
+        violated = [c for c in inactive if get_violation(c) > tolerance]
+        if not violated:
+            break
+        for c in violated:
+            c.activate()
+        violated_ids = set(id(c) for c in violated)
+        inactive = [c for c in inactive if id(c) not in violated_ids]
+        if not quiet:
+            print(
+                "Lazy constraints iteration {}: adding {} violated "
+                "constraints".format(iteration, len(violated))
+            )
+        iteration += 1
+        results = solve_function(instance, parsed_arguments, warmstart=True)
+
+    # The relaxed problem may be unbounded (or the solver may not be able to
+    # tell whether it is infeasible or unbounded), so solve the full problem
+    if (
+        results.solver.termination_condition != TerminationCondition.optimal
+        and inactive
+    ):
+        if not quiet:
+            print(
+                "Lazy constraints: solve terminated with condition {} with {} "
+                "constraints inactive; solving with all constraints "
+                "active".format(results.solver.termination_condition, len(inactive))
+            )
+        for c in inactive:
+            c.activate()
+        inactive = list()
+        iteration += 1
+        results = solve_function(instance, parsed_arguments, warmstart=False)
+
+    # Restore the constraints that were not needed
+    has_duals = len(instance.dual) > 0
+    for c in inactive:
+        c.activate()
+        if has_duals:
+            instance.dual[c] = 0
+
+    if results.solver.termination_condition == TerminationCondition.optimal:
+        if not quiet:
+            print(
+                "Lazy constraints: solved in {} iteration(s) with {} of {} "
+                "constraints active".format(
+                    iteration, len(candidates) - len(inactive), len(candidates)
+                )
+            )
+        if binding_constraints_file is not None:
+            write_binding_constraints(
+                binding_constraints_file=binding_constraints_file,
+                constraint_names=read_binding_constraints(binding_constraints_file)
+                | set(c.name for c in candidates if get_violation(c) > -tolerance),
+            )
+
+    return results
@@ -0,0 +1,318 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module reports the size of a compiled GridPath problem: the number of
+variables (continuous, binary, and integer), constraints, and constraint
+matrix nonzeros contributed by each Pyomo component and by each GridPath
+module, along with the size of each component's index set.
+
+The report is written by *run_scenario.py* when the user passes the
+*--model_size_report* flag. The component-level report and the module
+totals are written as CSV files to the results directory of the
+subproblem/stage; the component-level report is imported into the
+*results_model_size* table of the database with the other results.
+
+Fixed variables are counted separately, as they are not passed to the
+solver, and only the unfixed variables are counted as nonzeros. Variables
+that don't appear in any constraint or in the objective are still counted.
+"""
+
+import csv
+import os.path
+
+from db.common_functions import spin_on_database_lock
+
+MODEL_SIZE_COMPONENTS_FILENAME = "model_size_components.csv"
+MODEL_SIZE_MODULES_FILENAME = "model_size_modules.csv"
+
+COMPONENT_COLUMNS = [
+    "module",
+    "component",
+    "component_type",
+    "index_set",
+    "index_set_size",
+    "n_indices",
+    "n_continuous",
+    "n_binary",
+    "n_integer",
+    "n_fixed",
+    "n_constraints",
+    "n_nonzeros",
+]
+
+# Components not added by a GridPath module (e.g. the dual suffix)
+OTHER_MODULE = "(other)"
+
+
+def _count_variables(var):
+    """
+    :param var: an indexed or scalar Pyomo Var
+    :return: the number of continuous, binary, integer, and fixed variables
+    """
+    n_continuous, n_binary, n_integer, n_fixed = 0, 0, 0, 0
+    for v in var.values():
+        if v.fixed:
+            n_fixed += 1
+        elif v.is_binary():
+            n_binary += 1
+        elif v.is_integer():
+            n_integer += 1
+        else:
+            n_continuous += 1
+
+    return n_continuous, n_binary, n_integer, n_fixed
+
+
+def _count_constraints(constraint):
+    """
+    :param constraint: an indexed or scalar Pyomo Constraint
+    :return: the number of active constraints and the number of unfixed
+        variables that appear in them (the nonzeros of the constraint
+        matrix)
+
+    Constraints without a finite bound are not passed to the solver, so we
+    don't count them.
+    """
+    from pyomo.core.expr.current import identify_variables
+
+    n_constraints, n_nonzeros = 0, 0
+    for c in constraint.values():
+        if not c.active or not (c.has_lb() or c.has_ub()):
+            continue
+        n_constraints += 1
+        n_nonzeros += sum(1 for _ in identify_variables(c.body, include_fixed=False))
+
+    return n_constraints, n_nonzeros
+
+
+def _get_index_set(component):
+    """
+    :param component: a constructed Pyomo component
+    :return: the name of the component's index set and its size (no name
+        and a size of 1 for scalar components)
+    """
+    if not component.is_indexed():
+        return None, 1
+    index_set = component.index_set()
+    return index_set.name, len(index_set) if index_set.isfinite() else None
+
+
+def get_model_size(instance, component_modules):
+    """
+    :param instance: the compiled problem instance
+    :param component_modules: dictionary with the GridPath module that added
+        each model component (component names as keys)
+    :return: list of dictionaries with the size of each Var and Constraint
+        component, in declaration order
+    """
+    from pyomo.environ import Constraint, Var
+
+    records = list()
+    for component in instance.component_objects(
+        (Var, Constraint), active=True, descend_into=True
+    ):
+        if component.parent_block() is instance:
+            module = component_modules.get(component.local_name, OTHER_MODULE)
+        else:
+            module = OTHER_MODULE
+
+        index_set, index_set_size = _get_index_set(component)
+        record = dict.fromkeys(COMPONENT_COLUMNS, 0)
+        record.update(
+            {
+                "module": module,
+                "component": component.name,
+                "component_type": component.ctype.__name__,
+                "index_set": index_set,
+                "index_set_size": index_set_size,
+                "n_indices": len(component),
+            }
+        )
+        if component.ctype is Var:
+            (
+                record["n_continuous"],
+                record["n_binary"],
+                record["n_integer"],
+                record["n_fixed"],
+            ) = _count_variables(component)
+        else:
+            record["n_constraints"], record["n_nonzeros"] = _count_constraints(
+                component
+            )
+        records.append(record)
+
+    return records
+
+
+def get_module_totals(records):
+    """
+    :param records: the component-level records (see *get_model_size*)
+    :return: list of dictionaries with the totals per GridPath module,
+        sorted by number of nonzeros (largest first)
+    """
+    totals = dict()
+    for record in records:
+        module = record["module"]
+        if module not in totals:
+            totals[module] = {
+                "module": module,
+                "n_components": 0,
+                "n_variables": 0,
+                "n_continuous": 0,
+                "n_binary": 0,
+                "n_integer": 0,
+                "n_fixed": 0,
+                "n_constraints": 0,
+                "n_nonzeros": 0,
+            }
+        module_totals = totals[module]
+        module_totals["n_components"] += 1
+        module_totals["n_variables"] += (
+            record["n_continuous"] + record["n_binary"] + record["n_integer"]
+        )
+        for column in [
+            "n_continuous",
+            "n_binary",
+            "n_integer",
+            "n_fixed",
+            "n_constraints",
+            "n_nonzeros",
+        ]:
+            module_totals[column] += record[column]
+
+    return sorted(
+        totals.values(),
+        key=lambda r: (r["n_nonzeros"], r["n_variables"]),
+        reverse=True,
+    )
+
+
+def write_model_size_report(instance, component_modules, results_directory):
+    """
+    :param instance: the compiled problem instance
+    :param component_modules: dictionary with the GridPath module that added
+        each model component
+    :param results_directory: the directory to write the report to
+    :return: the module totals
+
+    Write the component-level model size and the module totals to the
+    results directory.
+    """
+    records = get_model_size(instance=instance, component_modules=component_modules)
+    module_totals = get_module_totals(records=records)
+
+    _write_csv(
+        filepath=os.path.join(results_directory, MODEL_SIZE_COMPONENTS_FILENAME),
+        columns=COMPONENT_COLUMNS,
+        records=records,
+    )
+    _write_csv(
+        filepath=os.path.join(results_directory, MODEL_SIZE_MODULES_FILENAME),
+        columns=list(module_totals[0].keys()) if module_totals else ["module"],
+        records=module_totals,
+    )
+
+    return module_totals
+
+
+def print_model_size_summary(module_totals, n=10):
+    """
+    :param module_totals: the module totals (see *get_module_totals*)
+    :param n: the number of modules to print
+
+    Print the total problem size and the modules with the most nonzeros.
+    """
+    print(
+        "Problem size: {} variables ({} binary, {} integer), {} constraints, "
+        "{} nonzeros".format(
+            sum(r["n_variables"] for r in module_totals),
+            sum(r["n_binary"] for r in module_totals),
+            sum(r["n_integer"] for r in module_totals),
+            sum(r["n_constraints"] for r in module_totals),
+            sum(r["n_nonzeros"] for r in module_totals),
+        )
+    )
+    print("Largest modules:")
+    for record in module_totals[:n]:
+        print(
+            "... {} nonzeros, {} variables, {} constraints {}".format(
+                record["n_nonzeros"],
+                record["n_variables"],
+                record["n_constraints"],
+                record["module"],
+            )
+        )
+
+
+def import_model_size_into_database(
+    conn, scenario_id, subproblem, stage, results_directory
+):
+    """
+    :param conn: the database connection object
+    :param scenario_id: the scenario_id
+    :param subproblem: the subproblem_id
+    :param stage: the stage_id
+    :param results_directory: the subproblem/stage results directory
+
+    Replace the subproblem/stage's rows in the *results_model_size* table
+    with the component-level model size report, if one was written.
+    """
+    filepath = os.path.join(results_directory, MODEL_SIZE_COMPONENTS_FILENAME)
+    if not os.path.exists(filepath):
+        return
+
+    c = conn.cursor()
+    spin_on_database_lock(
+        conn=conn,
+        cursor=c,
+        sql="""
+            DELETE FROM results_model_size
+            WHERE scenario_id = ? AND subproblem_id = ? AND stage_id = ?;
+            """,
+        data=(scenario_id, subproblem, stage),
+        many=False,
+    )
+
+    with open(filepath, "r") as f:
+        reader = csv.DictReader(f)
+        data = [
+            (scenario_id, subproblem, stage)
+            + tuple(
+                row[column] if row[column] != "" else None
+                for column in COMPONENT_COLUMNS
+            )
+            for row in reader
+        ]
+
+    spin_on_database_lock(
+        conn=conn,
+        cursor=c,
+        sql="""
+            INSERT INTO results_model_size
+            (scenario_id, subproblem_id, stage_id, gridpath_module, component,
+            component_type, index_set, index_set_size, n_indices, n_continuous,
+            n_binary, n_integer, n_fixed, n_constraints, n_nonzeros)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+            """,
+        data=data,
+    )
+
+
+def _write_csv(filepath, columns, records):
+    with open(filepath, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, lineterminator="\n")
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
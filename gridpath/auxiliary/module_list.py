@@ -19,13 +19,15 @@ This module contains:
 2) the modules included in each optional feature;
 3) the 'cross-feature' modules;
 4) the method for determining the user-requested features for the scenarios;
-5) the method for loading modules.
+5) the method for loading modules;
+6) the ModuleRegistry class, which caches the modules a scenario uses and
+   which of them implement each of the module hooks.
 """
 
 
+import csv
 from importlib import import_module
 import os.path
-import pandas as pd
 import sys
 import traceback
 
@@ -600,7 +602,8 @@ def determine_modules(
     elif scenario_directory is not None:
         features_file = os.path.join(scenario_directory, "features.csv")
         try:
-            requested_features = pd.read_csv(features_file)["features"].tolist()
+            with open(features_file, "r") as f:
+                requested_features = [row["features"] for row in csv.DictReader(f)]
         except IOError:
             print(
                 "ERROR! Features file {} not found in {}.".format(
@@ -707,3 +710,135 @@ def load_modules(modules_to_use):
             sys.exit(1)
 
     return loaded_modules
+
+
+class ModuleRegistry(object):
+    """
+    The list of module names a scenario uses, the loaded modules, and the
+    modules that implement each hook (e.g. 'export_results', 'save_duals').
+
+    A registry is built once per scenario per process (see
+    *get_module_registry*) and shared by all pipeline steps, so that we
+    don't need to re-read the features, re-scan the subproblem directories,
+    and re-load the modules at each step for each subproblem and stage.
+    """
+
+    def __init__(self, modules_to_use):
+        """
+        :param modules_to_use: list of the names of the modules to use
+        """
+        self.modules_to_use = modules_to_use
+        self.loaded_modules = load_modules(modules_to_use=modules_to_use)
+        self._hook_modules = dict()
+
+    def modules_with(self, hook):
+        """
+        :param hook: the name of the module method, e.g. 'export_results'
+        :return: list of (module name, module) tuples for the modules that
+            implement the hook, in the order the modules are loaded
+        """
+        if hook not in self._hook_modules:
+            self._hook_modules[hook] = [
+                (name, m)
+                for name, m in zip(self.modules_to_use, self.loaded_modules)
+                if hasattr(m, hook)
+            ]
+
+        return self._hook_modules[hook]
+
+
+# Registries and subproblem/stage structures by scenario directory for the
+# current process
+_module_registries = dict()
+_scenario_structures = dict()
+
+
+def refresh_scenario_structure(scenario_directory):
+    """
+    :param scenario_directory: the scenario directory
+    :return: tuple of the names of the subproblem directories and of their
+        stage directories, e.g. (("1", ("1", "2")), ("2", ("1", "2")))
+
+    Scan the subproblem and stage directories of the scenario. This is done
+    once per run (see *get_scenario_structure*); the entry points call this
+    function when a run starts, so that changes to the structure between
+    runs in the same process are picked up.
+    """
+    structure = tuple(
+        (
+            subproblem,
+            tuple(
+                check_for_integer_subdirectories(
+                    os.path.join(scenario_directory, subproblem)
+                )
+            ),
+        )
+        for subproblem in (
+            check_for_integer_subdirectories(scenario_directory)
+            if os.path.isdir(scenario_directory)
+            else []
+        )
+    )
+    _scenario_structures[os.path.abspath(scenario_directory)] = structure
+
+    return structure
+
+
+def get_scenario_structure(scenario_directory):
+    """
+    :param scenario_directory: the scenario directory
+    :return: the subproblem/stage structure of the scenario, scanned the
+        first time it's requested in this process or when the run started
+    """
+    key = os.path.abspath(scenario_directory)
+    if key not in _scenario_structures:
+        return refresh_scenario_structure(scenario_directory=scenario_directory)
+
+    return _scenario_structures[key]
+
+
+def get_registry_cache_key(scenario_directory):
+    """
+    :param scenario_directory: the scenario directory
+    :return: tuple of the modification time of the features file and the
+        subproblem/stage structure of the scenario
+
+    The modules a scenario uses depend on the features and on whether the
+    scenario has stages. Only the names of the subproblem and stage
+    directories are used, so directories created during a run (e.g.
+    results and logs) don't invalidate the registry.
+    """
+    features_file = os.path.join(scenario_directory, "features.csv")
+    features_mtime = (
+        os.stat(features_file).st_mtime_ns if os.path.exists(features_file) else None
+    )
+
+    return features_mtime, get_scenario_structure(scenario_directory=scenario_directory)
+
+
+def get_module_registry(scenario_directory):
+    """
+    :param scenario_directory: the scenario directory
+    :return: the ModuleRegistry object for the scenario
+
+    Return the cached module registry for the scenario or build it if it
+    doesn't exist yet. The features file is rewritten each time the
+    scenario inputs are written and the subproblem and stage directories
+    can change between runs, so we rebuild the registry if the features file
+    has been modified or the structure has changed since the registry was
+    built (see *get_registry_cache_key*).
+    """
+    key = os.path.abspath(scenario_directory)
+    cache_key = get_registry_cache_key(scenario_directory=scenario_directory)
+
+    if key not in _module_registries or _module_registries[key][0] != cache_key:
+        structure = cache_key[1]
+        registry = ModuleRegistry(
+            modules_to_use=determine_modules(
+                scenario_directory=scenario_directory,
+                multi_stage=any(stages for _, stages in structure),
+            )
+        )
+        _module_registries[key] = (cache_key, registry)
+
+    return _module_registries[key][1]
@@ -0,0 +1,208 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The problem snapshot is what we save alongside the problem file when
+running with *--create_lp_problem_file_only*, so that a solution file
+produced by a solver elsewhere can later be loaded back into the problem
+(*--load_cplex_solution* and *--load_gurobi_solution*).
+
+Rather than pickling the Pyomo instance, the snapshot stores only the
+problem file's symbol map as parallel arrays (the symbols, the position of
+each symbol's component in a table of component names, and each symbol's
+index) along with the number of variables and constraints in the problem.
+When loading a solution, the instance is rebuilt from the scenario inputs
+and the symbols are resolved to the rebuilt instance's components as they
+are looked up. The structure counts are used to check that the rebuilt
+instance matches the one the problem file was written for.
+"""
+
+import gzip
+import json
+import os.path
+
+SNAPSHOT_FILENAME = "problem_snapshot.json.gz"
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def write_problem_snapshot(prob_sol_files_directory, instance, symbol_map):
+    """
+    :param prob_sol_files_directory: the directory with the problem file
+    :param instance: the problem instance the problem file was written for
+    :param symbol_map: the Pyomo symbol map of the problem file
+
+    Write the problem snapshot. Symbols of components that are not on the
+    instance (e.g. the writer's ONE_VAR_CONSTANT variable) are not saved.
+    """
+    component_names = []
+    component_ids = dict()
+    symbols = []
+    symbol_component_ids = []
+    symbol_indices = []
+    for symbol, component_data_ref in symbol_map.bySymbol.items():
+        component_data = component_data_ref()
+        if component_data is None:
+            continue
+        component = component_data.parent_component()
+        if component.parent_block() is not instance:
+            continue
+        if component.local_name not in component_ids:
+            component_ids[component.local_name] = len(component_names)
+            component_names.append(component.local_name)
+
+        symbols.append(symbol)
+        symbol_component_ids.append(component_ids[component.local_name])
+        symbol_indices.append(component_data.index())
+
+    snapshot = {
+        "version": SNAPSHOT_FORMAT_VERSION,
+        "structure": get_instance_structure(instance=instance),
+        "components": component_names,
+        "symbols": symbols,
+        "component_ids": symbol_component_ids,
+        "indices": symbol_indices,
+    }
+
+    with gzip.open(
+        os.path.join(prob_sol_files_directory, SNAPSHOT_FILENAME), "wt"
+    ) as f_out:
+        json.dump(snapshot, f_out, separators=(",", ":"), default=_to_builtin)
+
+
+def problem_snapshot_exists(prob_sol_files_directory):
+    """
+    :param prob_sol_files_directory: the directory with the problem file
+    :return: boolean; whether a problem snapshot was saved in the directory
+    """
+    return os.path.exists(os.path.join(prob_sol_files_directory, SNAPSHOT_FILENAME))
+
+
+def read_problem_snapshot(prob_sol_files_directory):
+    """
+    :param prob_sol_files_directory: the directory with the problem file
+    :return: the snapshot dictionary
+
+    Read the problem snapshot and check its format version.
+    """
+    with gzip.open(
+        os.path.join(prob_sol_files_directory, SNAPSHOT_FILENAME), "rt"
+    ) as f_in:
+        snapshot = json.load(f_in)
+
+    if snapshot.get("version") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            "Problem snapshot in {} has format version {}, but version {} is "
+            "expected. Please re-create the problem file.".format(
+                prob_sol_files_directory,
+                snapshot.get("version"),
+                SNAPSHOT_FORMAT_VERSION,
+            )
+        )
+
+    return snapshot
+
+
+def get_instance_structure(instance):
+    """
+    :param instance: the problem instance
+    :return: dictionary with the number of active variables and constraints
+        in the instance
+    """
+    from pyomo.environ import Constraint, Var
+
+    return {
+        "variables": sum(
+            1 for _ in instance.component_data_objects(Var, descend_into=False)
+        ),
+        "constraints": sum(
+            1
+            for _ in instance.component_data_objects(
+                Constraint, active=True, descend_into=False
+            )
+        ),
+    }
+
+
+def check_instance_structure(instance, snapshot):
+    """
+    :param instance: the rebuilt problem instance
+    :param snapshot: the snapshot dictionary
+
+    Check that the rebuilt instance has the same structure as the instance
+    the problem file was written for; if not, the scenario inputs have
+    changed since then and the solution can't be loaded.
+    """
+    structure = get_instance_structure(instance=instance)
+    if structure != snapshot["structure"]:
+        raise ValueError(
+            "The problem instance rebuilt from the scenario inputs has {} "
+            "variables and {} constraints, but the problem file was written "
+            "for an instance with {} variables and {} constraints. Have the "
+            "scenario inputs changed since the problem file was "
+            "created?".format(
+                structure["variables"],
+                structure["constraints"],
+                snapshot["structure"]["variables"],
+                snapshot["structure"]["constraints"],
+            )
+        )
+
+
+class SnapshotSymbolComponents(object):
+    """
+    Mapping from the problem file symbols to the instance's variable and
+    constraint data objects. Symbols are resolved to components only when
+    looked up.
+    """
+
+    def __init__(self, instance, snapshot, solution_components=None):
+        """
+        :param instance: the rebuilt problem instance
+        :param snapshot: the snapshot dictionary
+        :param solution_components: list of the names of the components to
+            resolve symbols for; symbols of all components are resolved if
+            None
+        """
+        if solution_components is not None:
+            solution_components = set(solution_components)
+        self.components = [
+            getattr(instance, name)
+            if solution_components is None or name in solution_components
+            else None
+            for name in snapshot["components"]
+        ]
+        self.component_ids = snapshot["component_ids"]
+        self.indices = snapshot["indices"]
+        self.positions = {
+            symbol: position for position, symbol in enumerate(snapshot["symbols"])
+        }
+
+    def get(self, symbol, default=None):
+        position = self.positions.get(symbol)
+        if position is None:
+            return default
+        component = self.components[self.component_ids[position]]
+        if component is None:
+            return default
+        index = self.indices[position]
+        return component[tuple(index) if isinstance(index, list) else index]
+
+
+def _to_builtin(obj):
+    # Component indices may include numpy scalars
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(
+        "Object of type {} is not JSON serializable".format(type(obj).__name__)
+    )
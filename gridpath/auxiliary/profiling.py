@@ -0,0 +1,325 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the tools for profiling the construction of a GridPath
+problem: wall time, peak memory, and the number of components and indices
+created by each GridPath module and by each Pyomo component.
+
+The profiler is used by *run_scenario.py* when the user passes the
+*--profile_construction* flag. Results are written as CSV files to the
+logs directory of the subproblem/stage.
+"""
+
+from contextlib import contextmanager, nullcontext
+import csv
+import logging
+import os.path
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+# Pyomo reports component construction through this logger (see
+# pyomo.common.timing.ConstructionTimer)
+PYOMO_CONSTRUCTION_LOGGER = "pyomo.common.timing.construction"
+
+MODULE_PROFILE_FILENAME = "construction_profile_modules.csv"
+COMPONENT_PROFILE_FILENAME = "construction_profile_components.csv"
+
+
+def get_peak_rss_mb():
+    """
+    :return: the peak resident set size of the current process in MB or
+        None if it can't be determined on this platform
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    if sys.platform == "darwin":
+        return peak_rss / 1024**2
+    return peak_rss / 1024
+
+
+def _delta(end, start):
+    if end is None or start is None:
+        return None
+    return end - start
+
+
+def _count_indices(component):
+    """
+    :param component: a constructed Pyomo component
+    :return: the number of indices of the component (1 for scalar
+        components, None if the component is not indexed, e.g. a Suffix)
+    """
+    try:
+        if component.is_indexed():
+            if component.index_set().isfinite():
+                return len(component.index_set())
+            return len(component)
+        elif hasattr(component, "index_set"):
+            return len(component.index_set())
+    except AttributeError:
+        pass
+    return None
+
+
+def _count_data_values(data_portal):
+    """
+    :param data_portal: a Pyomo DataPortal object
+    :return: the number of components with data in the DataPortal and the
+        total number of values loaded for them
+    """
+    data = data_portal._data.get(None, {})
+    n_values = 0
+    for values in data.values():
+        n_values += len(values) if hasattr(values, "__len__") else 1
+
+    return len(data), n_values
+
+
+class _ConstructionHandler(logging.Handler):
+    """
+    Logging handler that receives the ConstructionTimer objects Pyomo emits
+    after each component is constructed and passes them to the profiler.
+    """
+
+    def __init__(self, profiler):
+        logging.Handler.__init__(self, level=logging.INFO)
+        self.profiler = profiler
+
+    def emit(self, record):
+        self.profiler.record_component(construction_timer=record.msg)
+
+
+class ConstructionProfiler(object):
+    """
+    Collect wall time, peak RSS delta, and the number of components and
+    indices for each GridPath module's *add_model_components*,
+    *load_model_data*, and *fix_variables* call, and for each Pyomo
+    component constructed during *create_instance*.
+    """
+
+    def __init__(self):
+        self.module_records = list()
+        self.component_records = list()
+        # Name of the GridPath module that added each model component
+        self.component_modules = dict()
+        self._last_peak_rss = None
+
+    @contextmanager
+    def profile_module(self, step, module, model, data_portal=None):
+        """
+        :param step: the name of the construction step (e.g.
+            'add_model_components')
+        :param module: the GridPath module (Python module object)
+        :param model: the Pyomo model the module adds components to
+        :param data_portal: the DataPortal object (only for load_model_data)
+
+        Context manager that profiles a single module call.
+        """
+        module_name = module.__name__.replace("gridpath.", "", 1)
+        components_before = set(model.component_map().keys())
+        _, values_before = (
+            (0, 0) if data_portal is None else _count_data_values(data_portal)
+        )
+        peak_rss_before = get_peak_rss_mb()
+        start = time.perf_counter()
+
+        yield
+
+        wall_time = time.perf_counter() - start
+        new_components = [
+            c for c in model.component_map().keys() if c not in components_before
+        ]
+        if step == "add_model_components":
+            for c in new_components:
+                self.component_modules[c] = module_name
+
+        if data_portal is None:
+            n_indices = None
+        else:
+            _, values_after = _count_data_values(data_portal)
+            n_indices = values_after - values_before
+
+        self.module_records.append(
+            {
+                "step": step,
+                "module": module_name,
+                "wall_time_s": wall_time,
+                "peak_rss_delta_mb": _delta(get_peak_rss_mb(), peak_rss_before),
+                "n_components": len(new_components),
+                "n_indices": n_indices,
+            }
+        )
+
+    @contextmanager
+    def profile_instance_construction(self):
+        """
+        Context manager that records each Pyomo component's construction
+        while the instance is created. We listen to the construction
+        timers Pyomo emits rather than re-implement create_instance.
+        """
+        pyomo_logger = logging.getLogger(PYOMO_CONSTRUCTION_LOGGER)
+        original_level = pyomo_logger.level
+        original_propagate = pyomo_logger.propagate
+
+        handler = _ConstructionHandler(profiler=self)
+        pyomo_logger.addHandler(handler)
+        pyomo_logger.setLevel(logging.INFO)
+        # Don't also print the construction messages to the terminal
+        pyomo_logger.propagate = False
+        self._last_peak_rss = get_peak_rss_mb()
+        try:
+            yield
+        finally:
+            pyomo_logger.removeHandler(handler)
+            pyomo_logger.setLevel(original_level)
+            pyomo_logger.propagate = original_propagate
+
+    def record_component(self, construction_timer):
+        """
+        :param construction_timer: the pyomo.common.timing.ConstructionTimer
+            object for a constructed component
+
+        Record the construction of a single Pyomo component. The peak RSS
+        delta is attributed to the component constructed since the last
+        report.
+        """
+        component = construction_timer.obj
+        try:
+            component_name = component.local_name
+        except (AttributeError, RuntimeError):
+            component_name = "(unknown)"
+        try:
+            component_type = component.ctype.__name__
+        except AttributeError:
+            component_type = type(component).__name__
+
+        peak_rss = get_peak_rss_mb()
+        self.component_records.append(
+            {
+                "component": component_name,
+                "component_type": component_type,
+                "module": self.component_modules.get(component_name, "(other)"),
+                "wall_time_s": construction_timer.timer,
+                "peak_rss_delta_mb": _delta(peak_rss, self._last_peak_rss),
+                "n_indices": _count_indices(component),
+            }
+        )
+        self._last_peak_rss = peak_rss
+
+    def module_totals(self):
+        """
+        :return: list of dictionaries with the totals per GridPath module
+            across all construction steps, including the time spent
+            constructing the module's components in create_instance
+        """
+        totals = dict()
+        for record in self.module_records + [
+            dict(r, step="create_instance") for r in self.component_records
+        ]:
+            module_name = record["module"]
+            if module_name not in totals:
+                totals[module_name] = {
+                    "module": module_name,
+                    "total_wall_time_s": 0,
+                    "add_model_components_s": 0,
+                    "load_model_data_s": 0,
+                    "create_instance_s": 0,
+                    "fix_variables_s": 0,
+                    "peak_rss_delta_mb": 0,
+                    "n_components": 0,
+                    "n_indices": 0,
+                }
+            module_totals = totals[module_name]
+            module_totals["total_wall_time_s"] += record["wall_time_s"]
+            module_totals["{}_s".format(record["step"])] += record["wall_time_s"]
+            module_totals["peak_rss_delta_mb"] += record["peak_rss_delta_mb"] or 0
+            if record["step"] == "add_model_components":
+                module_totals["n_components"] += record["n_components"]
+            if record["step"] == "create_instance":
+                module_totals["n_indices"] += record["n_indices"] or 0
+
+        return sorted(
+            totals.values(), key=lambda r: r["total_wall_time_s"], reverse=True
+        )
+
+    def write(self, logs_directory):
+        """
+        :param logs_directory: the directory to write the profile files to
+
+        Write the module and component profiles as CSV files sorted by
+        wall time (slowest first).
+        """
+        _write_records(
+            filepath=os.path.join(logs_directory, MODULE_PROFILE_FILENAME),
+            records=self.module_totals(),
+        )
+        _write_records(
+            filepath=os.path.join(logs_directory, COMPONENT_PROFILE_FILENAME),
+            records=sorted(
+                self.component_records,
+                key=lambda r: r["wall_time_s"],
+                reverse=True,
+            ),
+        )
+
+    def print_summary(self, n=10):
+        """
+        :param n: the number of modules to print
+
+        Print the modules that take longest to construct.
+        """
+        print("Slowest modules to construct:")
+        for record in self.module_totals()[:n]:
+            print(
+                "... {:.2f}s {}".format(record["total_wall_time_s"], record["module"])
+            )
+
+
+def profile_module(profiler, step, module, model, data_portal=None):
+    """
+    :param profiler: a ConstructionProfiler object or None if we are not
+        profiling
+    :param step: the name of the construction step
+    :param module: the GridPath module (Python module object)
+    :param model: the Pyomo model
+    :param data_portal: the DataPortal object (only for load_model_data)
+    :return: a context manager profiling the module call (a no-op if
+        profiler is None)
+    """
+    if profiler is None:
+        return nullcontext()
+    return profiler.profile_module(
+        step=step, module=module, model=model, data_portal=data_portal
+    )
+
+
+def _write_records(filepath, records):
+    if not records:
+        return
+    with open(filepath, "w", newline="") as f:
+        writer = csv.DictWriter(
+            f, fieldnames=list(records[0].keys()), lineterminator="\n"
+        )
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
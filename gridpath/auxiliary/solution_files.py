@@ -0,0 +1,223 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Streaming readers for solution files saved by external solvers (CPLEX XML
+and Gurobi JSON solution files) and a batched loader that applies the
+solution values to a problem instance.
+
+The solution files can be very large, so we don't read them into memory at
+once. Instead, the readers yield one variable value or constraint dual at a
+time and the loader applies them to the instance in batches.
+"""
+
+from itertools import islice
+import json
+import re
+import xml.etree.ElementTree as ET
+
+VARIABLE = "variable"
+CONSTRAINT = "constraint"
+
+SOLUTION_BATCH_SIZE = 100000
+
+_JSON_CHUNK_SIZE = 2**20
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_cplex_xml_solution(filepath, header):
+    """
+    :param filepath: path to the CPLEX XML (.sol) solution file
+    :param header: dictionary that will be updated with the attributes of
+        the solution header element
+    :return: generator of (VARIABLE or CONSTRAINT, symbol, value) tuples; the
+        value is the variable value or the constraint dual
+
+    Elements are cleared once they have been read, so memory use does not
+    grow with the size of the solution file.
+    """
+    container = None
+    for event, elem in ET.iterparse(filepath, events=("start", "end")):
+        if event == "start":
+            if elem.tag in ("variables", "linearConstraints"):
+                container = elem
+            continue
+
+        if elem.tag == "variable":
+            var_id = elem.get("name")
+            if not var_id == "ONE_VAR_CONSTANT":
+                yield VARIABLE, var_id, float(elem.get("value"))
+        elif elem.tag == "constraint":
+            constraint_id_w_extra_symbols = elem.get("name")
+            dual = elem.get("dual")
+            if (
+                not constraint_id_w_extra_symbols == "c_e_ONE_VAR_CONSTANT"
+                and dual is not None
+            ):
+                yield CONSTRAINT, constraint_id_w_extra_symbols[4:-1], float(dual)
+        elif elem.tag == "header":
+            header.update(elem.attrib)
+        else:
+            continue
+
+        if container is not None:
+            container.clear()
+
+
+def iter_gurobi_json_solution(filepath, solution_info):
+    """
+    :param filepath: path to the Gurobi JSON solution file
+    :param solution_info: dictionary that will be updated with the
+        'SolutionInfo' object of the solution file
+    :return: generator of (VARIABLE or CONSTRAINT, symbol, value) tuples; the
+        value is the variable value or the constraint dual
+
+    The 'Vars' and 'Constrs' arrays are decoded one element at a time.
+    """
+    with open(filepath, "r") as f:
+        reader = _JSONStreamReader(f)
+        for key, item in reader.iter_top_level_items(array_keys=("Vars", "Constrs")):
+            if key == "Vars":
+                var_id = item["VTag"][0]
+                if not var_id == "ONE_VAR_CONSTANT":
+                    yield VARIABLE, var_id, float(item["X"])
+            elif key == "Constrs":
+                constraint_id = item["CTag"][0][4:]
+                if not constraint_id == "ONE_VAR_CONSTAN" and "Pi" in item:
+                    yield CONSTRAINT, constraint_id, float(item["Pi"])
+            elif key == "SolutionInfo":
+                solution_info.update(item)
+
+
+def load_solution_values(
+    instance,
+    symbol_components,
+    solution_values,
+    load_duals=True,
+    batch_size=SOLUTION_BATCH_SIZE,
+):
+    """
+    :param instance: the problem instance
+    :param symbol_components: dictionary of the variable or constraint data
+        object by solution file symbol; symbols not in the dictionary are
+        skipped
+    :param solution_values: iterable of (VARIABLE or CONSTRAINT, symbol,
+        value) tuples
+    :param load_duals: boolean; whether to load the constraint duals
+    :param batch_size: the number of solution values to apply at a time
+
+    Apply the solution values to the instance in batches.
+    """
+    solution_values = iter(solution_values)
+    while True:
+        batch = list(islice(solution_values, batch_size))
+        if not batch:
+            break
+
+        duals = []
+        for value_type, symbol, value in batch:
+            component_data = symbol_components.get(symbol)
+            if component_data is None:
+                continue
+            if value_type == VARIABLE:
+                component_data.set_value(value, skip_validation=True)
+            elif load_duals:
+                duals.append((component_data, value))
+
+        if duals:
+            instance.dual.update(duals)
+
+
+class _JSONStreamReader(object):
+    """
+    Minimal incremental JSON reader: it decodes a top-level object one
+    member at a time (and the elements of selected array members one
+    element at a time) while reading the file in chunks.
+    """
+
+    def __init__(self, f, chunk_size=_JSON_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def iter_top_level_items(self, array_keys):
+        """
+        :param array_keys: the keys of the array members whose elements to
+            yield one at a time
+        :return: generator of (key, value) tuples; for the array_keys
+            members, a tuple is yielded for each element of the array
+        """
+        self._expect("{")
+        while self._peek() != "}":
+            key = self._decode()
+            self._expect(":")
+            if key in array_keys and self._peek() == "[":
+                self._expect("[")
+                while self._peek() != "]":
+                    yield key, self._decode()
+                    self._skip(",")
+                self._expect("]")
+            else:
+                yield key, self._decode()
+            self._skip(",")
+
+    def _fill(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self):
+        while True:
+            self.pos = _JSON_WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON solution file.")
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(
+                "Expected '{}' in JSON solution file, found '{}'.".format(
+                    char, self.buffer[self.pos]
+                )
+            )
+        self.pos += 1
+
+    def _skip(self, char):
+        if self._peek() == char:
+            self.pos += 1
+
+    def _decode(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # The value may continue in the next chunk
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may also continue in the
+            # next chunk
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
@@ -0,0 +1,260 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module records machine-readable timing and memory telemetry for the
+phases of the GridPath pipeline (getting inputs, building and solving the
+problem, exporting results, importing results into the database, and
+processing results).
+
+Telemetry is off by default and is enabled with the *--telemetry* flag of
+the end-to-end scripts. Each phase is written as a single JSON object per
+line to the *telemetry.jsonl* file in the scenario's logs directory. The
+events can also be imported into the *status_telemetry* table of the
+database (see *import_telemetry_into_database*).
+
+Each event is tagged with the id of the run that recorded it. A run starts
+with *get_scenario_inputs.py*, *run_scenario.py*, or *run_end_to_end.py*
+(the steps called by *run_end_to_end.py* share its run); the import and
+processing steps continue the latest run in the file. Only the events of
+the current run are imported into the database, so re-running a scenario
+doesn't re-import the events of prior runs.
+"""
+
+from contextlib import contextmanager
+import datetime
+import json
+import os.path
+import time
+import uuid
+
+from db.common_functions import spin_on_database_lock
+from gridpath.auxiliary.profiling import get_peak_rss_mb
+
+TELEMETRY_FILENAME = "telemetry.jsonl"
+
+# We keep the telemetry settings in environment variables, so that they are
+# inherited by the subproblem worker processes (which are spawned)
+TELEMETRY_FILE_ENV_VAR = "GRIDPATH_TELEMETRY_FILE"
+TELEMETRY_PROCESS_ENV_VAR = "GRIDPATH_TELEMETRY_PROCESS"
+TELEMETRY_RUN_ID_ENV_VAR = "GRIDPATH_TELEMETRY_RUN_ID"
+TELEMETRY_ENV_VARS = [
+    TELEMETRY_FILE_ENV_VAR,
+    TELEMETRY_PROCESS_ENV_VAR,
+    TELEMETRY_RUN_ID_ENV_VAR,
+]
+
+
+def enable_telemetry(scenario_directory, process, new_run=True):
+    """
+    :param scenario_directory: the scenario directory
+    :param process: the name of the pipeline step recording the events
+        (e.g. 'run_scenario')
+    :param new_run: boolean; whether the step starts a new run or continues
+        the latest run recorded for the scenario
+    :return: dictionary of the prior telemetry settings, to pass to
+        *disable_telemetry* when the step is done
+
+    Start recording telemetry events for the current process (and any
+    processes it starts) to the scenario's logs directory. If telemetry is
+    already enabled (e.g. the step is called by *run_end_to_end.py*), the
+    events are recorded for the run already in progress.
+    """
+    prior_settings = {var: os.environ.get(var) for var in TELEMETRY_ENV_VARS}
+
+    logs_directory = os.path.join(scenario_directory, "logs")
+    if not os.path.exists(logs_directory):
+        os.makedirs(logs_directory, exist_ok=True)
+
+    os.environ[TELEMETRY_FILE_ENV_VAR] = os.path.join(
+        logs_directory, TELEMETRY_FILENAME
+    )
+    os.environ[TELEMETRY_PROCESS_ENV_VAR] = process
+
+    if TELEMETRY_RUN_ID_ENV_VAR not in os.environ:
+        run_id = None if new_run else get_latest_run_id(scenario_directory)
+        os.environ[TELEMETRY_RUN_ID_ENV_VAR] = (
+            run_id if run_id is not None else uuid.uuid4().hex
+        )
+
+    return prior_settings
+
+
+def disable_telemetry(prior_settings=None):
+    """
+    :param prior_settings: dictionary of the telemetry settings to restore,
+        as returned by *enable_telemetry*; telemetry is turned off if not
+        specified
+
+    Stop recording telemetry events for the current step.
+    """
+    for var in TELEMETRY_ENV_VARS:
+        if prior_settings is not None and prior_settings.get(var) is not None:
+            os.environ[var] = prior_settings[var]
+        else:
+            os.environ.pop(var, None)
+
+
+def telemetry_enabled():
+    """
+    :return: boolean; whether telemetry is being recorded
+    """
+    return TELEMETRY_FILE_ENV_VAR in os.environ
+
+
+@contextmanager
+def record_phase(phase, subproblem="", stage="", module=None, db_table=None):
+    """
+    :param phase: the name of the phase, e.g. 'solve' or 'export_results'
+    :param subproblem: the subproblem (string or integer)
+    :param stage: the stage (string or integer)
+    :param module: the GridPath module, if the phase is a module call
+        (Python module object or module name)
+    :param db_table: the database table, if the phase reads or writes a
+        single table
+
+    Context manager that records the wall time, CPU time, and peak RSS of
+    the phase it wraps. Nothing is recorded if telemetry is disabled. The
+    phase is also recorded if it raises an exception.
+    """
+    if not telemetry_enabled():
+        yield
+        return
+
+    start_time = datetime.datetime.now()
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    start_peak_rss = get_peak_rss_mb()
+
+    try:
+        yield
+    finally:
+        end_peak_rss = get_peak_rss_mb()
+        if module is not None and not isinstance(module, str):
+            module = module.__name__.replace("gridpath.", "", 1)
+
+        write_event(
+            {
+                "run_id": os.environ.get(TELEMETRY_RUN_ID_ENV_VAR),
+                "time_stamp": start_time.isoformat(),
+                "pid": os.getpid(),
+                "process": os.environ.get(TELEMETRY_PROCESS_ENV_VAR),
+                "phase": phase,
+                "subproblem": str(subproblem),
+                "stage": str(stage),
+                "module": module,
+                "db_table": db_table,
+                "wall_time_s": time.perf_counter() - start_wall,
+                "cpu_time_s": time.process_time() - start_cpu,
+                "peak_rss_mb": end_peak_rss,
+                "peak_rss_delta_mb": None
+                if end_peak_rss is None or start_peak_rss is None
+                else end_peak_rss - start_peak_rss,
+            }
+        )
+
+
+def write_event(event):
+    """
+    :param event: dictionary with the event data
+
+    Append an event to the telemetry file. Each event is written with a
+    single call, so that events from parallel subproblems don't interleave.
+    """
+    with open(os.environ[TELEMETRY_FILE_ENV_VAR], "a") as f:
+        f.write(json.dumps(event) + "\n")
+
+
+def read_telemetry(scenario_directory, run_id=None):
+    """
+    :param scenario_directory: the scenario directory
+    :param run_id: the run whose events to return; all events are returned
+        if not specified
+    :return: list of the telemetry events (dictionaries) recorded for the
+        scenario
+    """
+    filepath = os.path.join(scenario_directory, "logs", TELEMETRY_FILENAME)
+    if not os.path.exists(filepath):
+        return []
+    with open(filepath, "r") as f:
+        events = [json.loads(line) for line in f if line.strip()]
+    if run_id is None:
+        return events
+    return [e for e in events if e.get("run_id") == run_id]
+
+
+def get_latest_run_id(scenario_directory):
+    """
+    :param scenario_directory: the scenario directory
+    :return: the run id of the last event recorded for the scenario or None
+        if there are no events
+    """
+    events = read_telemetry(scenario_directory=scenario_directory)
+    return events[-1].get("run_id") if events else None
+
+
+def import_telemetry_into_database(conn, scenario_id, scenario_directory):
+    """
+    :param conn: the database connection object
+    :param scenario_id: the scenario_id
+    :param scenario_directory: the scenario directory
+
+    Replace the scenario's events in the *status_telemetry* table with the
+    events of the current run (or of the latest run if telemetry is not
+    enabled) in the scenario's telemetry file.
+    """
+    run_id = os.environ.get(TELEMETRY_RUN_ID_ENV_VAR)
+    if run_id is None:
+        run_id = get_latest_run_id(scenario_directory=scenario_directory)
+
+    c = conn.cursor()
+    spin_on_database_lock(
+        conn=conn,
+        cursor=c,
+        sql="DELETE FROM status_telemetry WHERE scenario_id = ?;",
+        data=(scenario_id,),
+        many=False,
+    )
+
+    data = [
+        (
+            scenario_id,
+            int(e["subproblem"]) if e["subproblem"] else None,
+            int(e["stage"]) if e["stage"] else None,
+            e["process"],
+            e["phase"],
+            e["module"],
+            e["db_table"],
+            e["pid"],
+            e["wall_time_s"],
+            e["cpu_time_s"],
+            e["peak_rss_mb"],
+            e["peak_rss_delta_mb"],
+            e["time_stamp"],
+        )
+        for e in read_telemetry(scenario_directory=scenario_directory, run_id=run_id)
+    ]
+
+    spin_on_database_lock(
+        conn=conn,
+        cursor=c,
+        sql="""
+            INSERT INTO status_telemetry
+            (scenario_id, subproblem_id, stage_id, process, phase, gridpath_module,
+            db_table, pid, wall_time_s, cpu_time_s, peak_rss_mb,
+            peak_rss_delta_mb, time_stamp)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+            """,
+        data=data,
+    )
@@ -0,0 +1,418 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Aggregation of identical unit-commitment projects.
+
+Fleets of identical units (e.g. the combustion turbines at a plant) are
+often modeled as separate :code:`gen_commit_bin` or :code:`gen_commit_lin`
+projects, each with its own commitment variables. With the
+*--aggregate_identical_units* option of *get_scenario_inputs*, the input
+files written for the scenario are rewritten after they are exported from
+the database so that each group of identical projects is modeled as a
+single :code:`gen_commit_cap` project (named after the first project in
+the group with a "_cluster" suffix) with the capacity of the whole group
+and a unit size equal to the capacity of one of its units. Clusters of
+:code:`gen_commit_bin` projects are added to the
+:code:`GEN_COMMIT_CAP_INTEGER` set, so that they commit a whole number of
+units.
+
+Projects are identical if they have the same inputs in every project input
+file for every subproblem and stage. Only projects with specified capacity
+(:code:`gen_spec`) and exogenous availability are aggregated, and projects
+with features that the :code:`gen_commit_cap` operational type does not
+have (startup types, startup and shutdown power, partial availability, and
+allowed constraint violations), as well as projects referenced by other
+projects (e.g. as a supplemental firing project), are modeled as they are.
+
+The map of projects to clusters is saved in the inputs directory and the
+results of the clusters are split evenly among their projects after the
+results are exported (see *disaggregate_results*), so downstream scripts
+see results for the original projects.
+"""
+
+import os.path
+
+from gridpath.auxiliary.auxiliary import check_for_integer_subdirectories
+
+AGGREGATION_MAP_FILENAME = "aggregated_projects.tab"
+INTEGER_PROJECTS_FILENAME = "gen_commit_cap_integer_projects.tab"
+
+# Operational types that can be aggregated and whether their clusters
+# commit a whole number of units
+AGGREGATED_OPERATIONAL_TYPES = {"gen_commit_bin": True, "gen_commit_lin": False}
+
+# Projects with any of these in projects.tab are not aggregated
+UNSUPPORTED_PROJECT_COLUMNS = [
+    "allow_startup_shutdown_power",
+    "partial_availability_threshold",
+    "ramp_up_violation_penalty",
+    "ramp_down_violation_penalty",
+    "min_up_time_violation_penalty",
+    "min_down_time_violation_penalty",
+]
+
+# Projects in any of these files are not aggregated
+UNSUPPORTED_PROJECT_FILES = ["startup_chars.tab"]
+
+# Input columns with quantities that are added up for clusters
+SUMMED_INPUT_COLUMNS = {
+    "spec_capacity_period_params.tab": [
+        "specified_capacity_mw",
+        "hyb_gen_specified_capacity_mw",
+        "hyb_stor_specified_capacity_mw",
+        "specified_capacity_mwh",
+        "fuel_production_capacity_fuelunitperhour",
+        "fuel_release_capacity_fuelunitperhour",
+        "fuel_storage_capacity_fuelunit",
+    ]
+}
+
+# Results columns that are not split among the projects of a cluster
+# (in addition to non-numeric columns)
+COPIED_RESULTS_COLUMNS = [
+    "period",
+    "horizon",
+    "timepoint",
+    "subproblem_id",
+    "stage_id",
+    "timepoint_weight",
+    "number_of_hours_in_timepoint",
+    "hours_in_period_timepoints",
+    "hours_in_subproblem_period",
+]
+COPIED_RESULTS_COLUMN_SUFFIXES = ("dual", "_derate", "_fraction", "_rate")
+
+NULL_VALUES = [".", ""]
+
+
+def get_inputs_directories(scenario_directory):
+    """
+    :param scenario_directory: the scenario directory
+    :return: list of the inputs directories of all subproblems and stages
+    """
+    subproblems = check_for_integer_subdirectories(scenario_directory)
+    if not subproblems:
+        return [os.path.join(scenario_directory, "inputs")]
+
+    inputs_directories = []
+    for subproblem in subproblems:
+        subproblem_directory = os.path.join(scenario_directory, subproblem)
+        stages = check_for_integer_subdirectories(subproblem_directory)
+        if not stages:
+            inputs_directories.append(os.path.join(subproblem_directory, "inputs"))
+        for stage in stages:
+            inputs_directories.append(
+                os.path.join(subproblem_directory, stage, "inputs")
+            )
+
+    return inputs_directories
+
+
+def read_project_input_files(inputs_directory):
+    """
+    :param inputs_directory: the inputs directory
+    :return: dictionary of the data frames (with all values as strings) of
+        the .tab files with a 'project' column
+    """
+    import pandas as pd
+
+    project_files = dict()
+    for f in sorted(os.listdir(inputs_directory)):
+        if not f.endswith(".tab"):
+            continue
+        df = pd.read_csv(
+            os.path.join(inputs_directory, f),
+            sep="\t",
+            dtype=str,
+            keep_default_na=False,
+        )
+        if "project" in df.columns:
+            project_files[f] = df
+
+    return project_files
+
+
+def get_candidate_projects(project_files):
+    """
+    :param project_files: dictionary of the project input data frames of an
+        inputs directory
+    :return: dictionary of the unit size of the projects that can be
+        aggregated
+    """
+    import pandas as pd
+
+    prj_df = project_files["projects.tab"]
+    candidates = prj_df[
+        prj_df["operational_type"].isin(AGGREGATED_OPERATIONAL_TYPES.keys())
+        & (prj_df["capacity_type"] == "gen_spec")
+        & (prj_df["availability_type"] == "exogenous")
+    ]
+    for column in UNSUPPORTED_PROJECT_COLUMNS:
+        if column in candidates.columns:
+            candidates = candidates[candidates[column].isin(NULL_VALUES)]
+    candidates = set(candidates["project"])
+
+    for f, df in project_files.items():
+        if f in UNSUPPORTED_PROJECT_FILES:
+            candidates -= set(df["project"])
+        # Projects referenced by other projects, e.g. as their
+        # supplemental_firing_project
+        for column in df.columns:
+            if column != "project" and "project" in column:
+                candidates -= set(df[column])
+
+    # The unit size is the capacity of the project, which must not change
+    # across periods
+    unit_sizes = dict()
+    cap_df = project_files.get("spec_capacity_period_params.tab")
+    if cap_df is None:
+        return unit_sizes
+    for prj, prj_df in cap_df[cap_df["project"].isin(candidates)].groupby("project"):
+        capacities = set(pd.to_numeric(prj_df["specified_capacity_mw"]))
+        if len(capacities) == 1:
+            (capacity,) = capacities
+            if capacity > 0:
+                unit_sizes[prj] = capacity
+
+    return unit_sizes
+
+
+def find_identical_unit_groups(project_files_by_directory):
+    """
+    :param project_files_by_directory: list of the project input data frames
+        of each inputs directory
+    :return: list of the groups (lists of projects) of identical projects
+        with more than one project
+
+    Projects are identical if their rows (without the project column) are
+    the same in all project input files of all inputs directories.
+    """
+    candidates = None
+    for project_files in project_files_by_directory:
+        unit_sizes = get_candidate_projects(project_files)
+        if candidates is None:
+            candidates = set(unit_sizes.keys())
+        else:
+            candidates &= set(unit_sizes.keys())
+    if not candidates:
+        return []
+
+    signatures = {prj: [] for prj in candidates}
+    for project_files in project_files_by_directory:
+        for f, df in sorted(project_files.items()):
+            other_columns = [c for c in df.columns if c != "project"]
+            rows_by_project = {
+                prj: sorted(
+                    tuple(row) for row in prj_df[other_columns].itertuples(index=False)
+                )
+                for prj, prj_df in df[df["project"].isin(candidates)].groupby("project")
+            }
+            for prj in candidates:
+                signatures[prj].append((f, tuple(rows_by_project.get(prj, []))))
+
+    groups = dict()
+    for prj in sorted(candidates):
+        groups.setdefault(tuple(signatures[prj]), []).append(prj)
+
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def aggregate_project_files(project_files, groups, unit_sizes):
+    """
+    :param project_files: dictionary of the project input data frames of an
+        inputs directory
+    :param groups: list of the groups of identical projects
+    :param unit_sizes: dictionary of the unit size of each project
+    :return: dictionary of the project input data frames with the projects
+        in each group replaced by their cluster
+    """
+    import pandas as pd
+
+    cluster_by_project = dict()
+    n_units_by_cluster = dict()
+    for group in groups:
+        cluster = "{}_cluster".format(group[0])
+        n_units_by_cluster[cluster] = len(group)
+        cluster_by_project[group[0]] = cluster
+        for prj in group[1:]:
+            cluster_by_project[prj] = None
+
+    aggregated_files = dict()
+    for f, df in project_files.items():
+        if not df["project"].isin(cluster_by_project.keys()).any():
+            aggregated_files[f] = df
+            continue
+        df = df.copy()
+        df["project"] = df["project"].map(lambda prj: cluster_by_project.get(prj, prj))
+        df = df[df["project"].notna()].reset_index(drop=True)
+        is_cluster = df["project"].isin(n_units_by_cluster.keys())
+        n_units = df["project"].map(n_units_by_cluster)
+        for column in SUMMED_INPUT_COLUMNS.get(f, []):
+            if column not in df.columns:
+                continue
+            has_value = is_cluster & ~df[column].isin(NULL_VALUES)
+            df.loc[has_value, column] = (
+                pd.to_numeric(df.loc[has_value, column]) * n_units[has_value]
+            ).map(repr)
+        if f == "projects.tab":
+            df.loc[is_cluster, "operational_type"] = "gen_commit_cap"
+            if "unit_size_mw" not in df.columns:
+                df["unit_size_mw"] = "."
+            for group in groups:
+                df.loc[
+                    df["project"] == cluster_by_project[group[0]], "unit_size_mw"
+                ] = repr(unit_sizes[group[0]])
+        aggregated_files[f] = df
+
+    return aggregated_files
+
+
+def aggregate_identical_units(scenario_directory, quiet=False):
+    """
+    :param scenario_directory: the scenario directory with the input files
+        written by *get_scenario_inputs*
+    :param quiet: boolean; whether to print the number of clusters
+    :return: list of the groups of identical projects that were aggregated
+
+    Find the groups of identical unit-commitment projects and rewrite the
+    input files of all subproblems and stages so that each group is modeled
+    as a single clustered project.
+    """
+    import pandas as pd
+
+    inputs_directories = get_inputs_directories(scenario_directory)
+    project_files_by_directory = [
+        read_project_input_files(inputs_directory)
+        for inputs_directory in inputs_directories
+    ]
+
+    groups = find_identical_unit_groups(project_files_by_directory)
+    if not quiet:
+        print(
+            "Aggregating {} projects into {} clusters of identical "
+            "units...".format(sum(len(group) for group in groups), len(groups))
+        )
+    if not groups:
+        return groups
+
+    for inputs_directory, project_files in zip(
+        inputs_directories, project_files_by_directory
+    ):
+        unit_sizes = get_candidate_projects(project_files)
+        prj_df = project_files["projects.tab"].set_index("project")
+        aggregated_files = aggregate_project_files(
+            project_files=project_files, groups=groups, unit_sizes=unit_sizes
+        )
+        for f, df in aggregated_files.items():
+            if df is not project_files[f]:
+                df.to_csv(
+                    os.path.join(inputs_directory, f),
+                    sep="\t",
+                    index=False,
+                )
+
+        pd.DataFrame(
+            [[prj, "{}_cluster".format(group[0])] for group in groups for prj in group],
+            columns=["project", "aggregated_project"],
+        ).to_csv(
+            os.path.join(inputs_directory, AGGREGATION_MAP_FILENAME),
+            sep="\t",
+            index=False,
+        )
+
+        integer_projects = [
+            "{}_cluster".format(group[0])
+            for group in groups
+            if AGGREGATED_OPERATIONAL_TYPES[prj_df.loc[group[0], "operational_type"]]
+        ]
+        if integer_projects:
+            pd.DataFrame(integer_projects, columns=["project"]).to_csv(
+                os.path.join(inputs_directory, INTEGER_PROJECTS_FILENAME),
+                sep="\t",
+                index=False,
+            )
+
+    return groups
+
+
+def disaggregate_results(scenario_directory, subproblem, stage):
+    """
+    :param scenario_directory: the scenario directory
+    :param subproblem: the subproblem
+    :param stage: the stage
+
+    If projects were aggregated, replace the results of each cluster in the
+    project results files with results for each of its projects. Numeric
+    results (e.g. power, costs, and emissions) are split evenly among the
+    projects in the cluster, except for time indices, weights, duals,
+    derates, and similar columns, which are copied.
+    """
+    import pandas as pd
+
+    map_file = os.path.join(
+        scenario_directory,
+        str(subproblem),
+        str(stage),
+        "inputs",
+        AGGREGATION_MAP_FILENAME,
+    )
+    if not os.path.exists(map_file):
+        return
+
+    map_df = pd.read_csv(map_file, sep="\t")
+    projects_by_cluster = {
+        cluster: list(cluster_df["project"])
+        for cluster, cluster_df in map_df.groupby("aggregated_project", sort=False)
+    }
+
+    results_directory = os.path.join(
+        scenario_directory, str(subproblem), str(stage), "results"
+    )
+    for f in sorted(os.listdir(results_directory)):
+        if not f.endswith(".csv"):
+            continue
+        results_file = os.path.join(results_directory, f)
+        with open(results_file, "r") as fh:
+            header = fh.readline().rstrip("\n").split(",")
+        if "project" not in header:
+            continue
+        df = pd.read_csv(results_file)
+        is_cluster = df["project"].isin(projects_by_cluster.keys())
+        if not is_cluster.any():
+            continue
+
+        split_columns = [
+            c
+            for c in df.columns
+            if c != "project"
+            and pd.api.types.is_numeric_dtype(df[c])
+            and c not in COPIED_RESULTS_COLUMNS
+            and not c.endswith(COPIED_RESULTS_COLUMN_SUFFIXES)
+        ]
+
+        disaggregated_dfs = [df[~is_cluster]]
+        for cluster, projects in projects_by_cluster.items():
+            cluster_df = df[df["project"] == cluster]
+            if cluster_df.empty:
+                continue
+            cluster_df = cluster_df.astype({c: float for c in split_columns})
+            cluster_df[split_columns] = cluster_df[split_columns] / len(projects)
+            for prj in projects:
+                disaggregated_dfs.append(cluster_df.assign(project=prj))
+
+        # Keep the rows of each project in the original order of the file
+        pd.concat(disaggregated_dfs).sort_index(kind="stable").to_csv(
+            results_file, index=False
+        )
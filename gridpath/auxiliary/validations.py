@@ -16,6 +16,7 @@
 Various input validation functions used in other modules
 """
 
+from contextlib import contextmanager
 import datetime
 import numpy as np
 import pandas as pd
@@ -23,6 +24,11 @@ import pandas as pd
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import cursor_to_df
 
+# Validation findings are collected here instead of being inserted one
+# write_validation_to_database call at a time while a collect_validations
+# block is active
+_VALIDATION_BUFFER = None
+
 
 def _get_idx_col(df):
     if "project" in df.columns:
@@ -83,6 +89,26 @@ def write_validation_to_database(
         )
         for error in errors
     ]
+    if _VALIDATION_BUFFER is not None:
+        _VALIDATION_BUFFER.extend(rows)
+    else:
+        insert_validations_into_database(conn=conn, rows=rows)
+
+    return True
+
+
+def insert_validations_into_database(conn, rows):
+    """
+    :param conn: The database connection
+    :param rows: list of (scenario_id, subproblem_id, stage_id,
+        gridpath_module, db_table, severity, description, time_stamp) tuples
+
+    Insert the validation findings into the status_validation table with a
+    single executemany.
+    """
+    if not rows:
+        return
+
     c = conn.cursor()
     sql = """
     INSERT INTO status_validation
@@ -93,7 +119,33 @@ def write_validation_to_database(
     spin_on_database_lock(conn, c, sql, rows)
     c.close()
 
-    return True
+
+@contextmanager
+def collect_validations(conn, insert=True):
+    """
+    :param conn: The database connection
+    :param insert: boolean, whether to insert the collected findings into the
+        database when the block exits, defaults to True
+    :return: yields the list of collected findings (status_validation rows)
+
+    Context manager that collects the findings of all
+    write_validation_to_database calls made in its block. If insert is True,
+    they are bulk-inserted into the status_validation table when the block
+    exits, even if the block raises an exception.
+    """
+    global _VALIDATION_BUFFER
+    if _VALIDATION_BUFFER is not None:
+        # Already collecting; the outer block handles the findings
+        yield _VALIDATION_BUFFER
+        return
+
+    _VALIDATION_BUFFER = []
+    try:
+        yield _VALIDATION_BUFFER
+    finally:
+        rows, _VALIDATION_BUFFER = _VALIDATION_BUFFER, None
+        if insert:
+            insert_validations_into_database(conn=conn, rows=rows)
 
 
 def get_expected_dtypes(conn, tables):
@@ -327,6 +379,78 @@ def validate_dtypes(df, expected_dtypes):
     return result, columns
 
 
+class ValidationRule(object):
+    """
+    A row-level validation rule: the rows of a DataFrame for which the rule
+    expression evaluates to True are invalid.
+    """
+
+    def __init__(self, invalid_if, message):
+        """
+        :param invalid_if: str, boolean column expression evaluated over the
+            whole DataFrame with DataFrame.eval (e.g.
+            "min_mw > max_mw or min_mw < 0"), or a function that takes the
+            DataFrame and returns a boolean Series
+        :param message: str, the error message; '{idxs}' is replaced with
+            the comma-separated indexes of the invalid rows
+        """
+        self.invalid_if = invalid_if
+        self.message = message
+
+    def get_invalids(self, df):
+        """
+        :param df: DataFrame to validate
+        :return: boolean Series, True for the invalid rows
+        """
+        if callable(self.invalid_if):
+            invalids = self.invalid_if(df)
+        else:
+            invalids = df.eval(self.invalid_if)
+        # Comparisons with NULL inputs are not violations
+        return invalids.fillna(False).astype(bool)
+
+
+def validate_rules(df, rules, idx_col="project"):
+    """
+    Evaluate a list of validation rules over a DataFrame. Each rule is
+    evaluated once over all rows rather than row by row.
+
+    Example: check that the minimum of each project is less than its
+    maximum and that its ramp rate is a fraction:
+        validate_rules(
+            df,
+            [
+                ValidationRule(
+                    "min_mw > max_mw",
+                    "project(s) '{idxs}': min_mw can't exceed max_mw",
+                ),
+                ValidationRule(
+                    "ramp_rate < 0 or ramp_rate > 1",
+                    "project(s) '{idxs}': Expected 0 <= 'ramp_rate' <= 1",
+                ),
+            ],
+        )
+
+    :param df: DataFrame to validate. Must have the idx_col column and the
+        columns used in the rules.
+    :param rules: list of ValidationRule objects
+    :param idx_col: str, the index column whose values are reported for the
+        invalid rows, defaults to "project"
+    :return: List of error messages, one for each rule with invalid rows.
+    """
+    results = []
+    if len(df) == 0:
+        return results
+
+    for rule in rules:
+        invalids = rule.get_invalids(df)
+        if invalids.any():
+            bad_idxs = df[idx_col][invalids].astype(str).unique()
+            results.append(rule.message.format(idxs=", ".join(bad_idxs)))
+
+    return results
+
+
 def validate_values(
     df, col, idx_col="project", min=0, max=np.inf, strict_min=False, strict_max=False
 ):
@@ -578,19 +702,14 @@ def validate_row_monotonicity(
     results = []
 
     cols = [col] if isinstance(col, str) else col
+    direction = "increase" if increasing else "decrease"
     for c in cols:
-        df2 = df.dropna(subset=[c])
-        group = df2.sort_values([idx_col, rank_col]).groupby(idx_col, group_keys=False)[
-            c
-        ]
-        if increasing:
-            invalids = ~group.apply(lambda x: x.is_monotonic_increasing)
-            direction = "increase"
-        else:
-            invalids = ~group.apply(lambda x: x.is_monotonic_decreasing)
-            direction = "decrease"
+        df2 = df.dropna(subset=[c]).sort_values([idx_col, rank_col])
+        # Compare each row to the previous row of the same index
+        changes = df2.groupby(idx_col, group_keys=False)[c].diff()
+        invalids = changes < 0 if increasing else changes > 0
         if invalids.any():
-            bad_idxs = invalids.index[invalids]
+            bad_idxs = sorted(df2[idx_col][invalids].unique())
             print_bad_idxs = ", ".join(bad_idxs)
             results.append(
                 "{}(s) '{}': {} should monotonically {} with {}. {}".format(
@@ -614,7 +733,10 @@ def validate_column_monotonicity(df, cols, idx_col="project", msg=""):
     results = []
 
     df = df.dropna(subset=cols)
-    invalids = ~df[cols].apply(lambda x: x.is_monotonic_increasing, axis=1)
+    values = df[cols].to_numpy(dtype=float)
+    invalids = pd.Series(
+        (np.diff(values, axis=1) < 0).any(axis=1), index=df.index, dtype=bool
+    )
     if invalids.any():
         bad_idxs = df[idx_col][invalids].values
         results.append(
@@ -673,42 +795,53 @@ def validate_piecewise_curves(df, x_col, slope_col, y_name):
     :return:
     """
     results = []
-    # TODO: might be able to do this with groupby and a flexible idx
-    #  Or could simply do the validation on x_values, slopes and do
-    #  pre-processing outside of function
-    uniques = df.drop_duplicates(["project", "period"])[["project", "period"]]
-    for project, period in uniques.itertuples(index=False, name=None):
-        df_slice = df[(df["project"] == project) & (df["period"] == period)]
-        df_slice = df_slice.sort_values(by=[x_col])
-        x_values = df_slice[x_col].values
-        avg_slopes = df_slice[slope_col].values
+    if len(df) == 0:
+        return results
 
-        if len(x_values) > 1:
-            incr_x = np.diff(x_values)
+    idx_cols = ["project", "period"]
+    # Report the curves in the order in which they first appear
+    uniques = df.drop_duplicates(idx_cols)[idx_cols]
+
+    df = df.sort_values(by=idx_cols + [x_col], kind="mergesort")
+    by = [df[c] for c in idx_cols]
+
+    # Differences between consecutive points of each project-period curve
+    incr_x = df[x_col].groupby(by).diff()
+    incr_y = (df[x_col] * df[slope_col]).groupby(by).diff()
+    incr_slopes = incr_y / incr_x
+    flags = (
+        pd.DataFrame(
+            {
+                "identical": incr_x == 0,
+                "not_increasing": incr_y <= 0,
+                "not_convex": incr_slopes.groupby(by).diff() <= 0,
+            }
+        )
+        .groupby(by)
+        .any()
+    )
 
-            if np.any(incr_x == 0):
-                # note: primary key should already prohibit this
+    for project, period in uniques.itertuples(index=False, name=None):
+        identical, not_increasing, not_convex = flags.loc[(project, period)]
+        if identical:
+            # note: primary key should already prohibit this
+            results.append(
+                "project-period '{}-{}': {} values can not be "
+                "identical".format(project, period, x_col)
+            )
+        else:
+            if not_increasing:
                 results.append(
-                    "project-period '{}-{}': {} values can not be "
-                    "identical".format(project, period, x_col)
+                    "project-period '{}-{}': {} should increase with "
+                    "increasing load".format(project, period, y_name)
                 )
-            else:
-                y = x_values * avg_slopes
-                incr_y = np.diff(y)
-                incr_slopes = incr_y / incr_x
-
-                if np.any(incr_y <= 0):
-                    results.append(
-                        "project-period '{}-{}': {} should increase with "
-                        "increasing load".format(project, period, y_name)
-                    )
-                if np.any(np.diff(incr_slopes) <= 0):
-                    results.append(
-                        "project-period '{}-{}': {} curve should be convex, "
-                        "i.e. the slope should increase with increasing {}".format(
-                            project, period, y_name, x_col
-                        )
+            if not_convex:
+                results.append(
+                    "project-period '{}-{}': {} curve should be convex, "
+                    "i.e. the slope should increase with increasing {}".format(
+                        project, period, y_name, x_col
                     )
+                )
 
     return results
 
@@ -748,9 +881,9 @@ def validate_startup_shutdown_rate_inputs(prj_df, su_df, hrs_in_tmp):
     # 0. Prepare DataFrame
 
     # Split su_df in df with hottest starts and df with coldest starts
+    su_by_prj = su_df.groupby("project", group_keys=False)
     su_df_hot = (
-        su_df.groupby("project", group_keys=False)
-        .apply(lambda grp: grp.nsmallest(1, columns=["down_time_cutoff_hours"]))
+        su_df.loc[su_by_prj["down_time_cutoff_hours"].idxmin()]
         .reset_index(drop=True)
         .rename(
             columns={
@@ -760,8 +893,7 @@ def validate_startup_shutdown_rate_inputs(prj_df, su_df, hrs_in_tmp):
         )
     )
     su_df_cold = (
-        su_df.groupby("project", group_keys=False)
-        .apply(lambda grp: grp.nlargest(1, columns=["down_time_cutoff_hours"]))
+        su_df.loc[su_by_prj["down_time_cutoff_hours"].idxmax()]
         .reset_index(drop=True)
         .rename(
             columns={
@@ -772,19 +904,13 @@ def validate_startup_shutdown_rate_inputs(prj_df, su_df, hrs_in_tmp):
     )
 
     # Calculate number of startup types and null values for each project
-    su_count = (
-        su_df.groupby("project", group_keys=False).size().reset_index(name="n_types")
-    )
+    su_count = su_by_prj.size().reset_index(name="n_types")
     su_count_series = su_count.set_index("project")["n_types"]  # DF to Series
-    cutoff_na_count = su_df.groupby("project", group_keys=False)[
-        "down_time_cutoff_hours"
-    ].apply(
-        lambda grp: grp.isnull().sum()
+    cutoff_na_count = (
+        su_df["down_time_cutoff_hours"].isnull().groupby(su_df["project"]).sum()
     )  # pd.Series (index = project)
-    ramp_na_count = su_df.groupby("project", group_keys=False)[
-        "startup_plus_ramp_up_rate"
-    ].apply(
-        lambda grp: grp.isnull().sum()
+    ramp_na_count = (
+        su_df["startup_plus_ramp_up_rate"].isnull().groupby(su_df["project"]).sum()
     )  # pd.Series (index = project)
 
     # Join DataFrames (left join since not all projects have startup chars,
@@ -836,82 +962,60 @@ def validate_startup_shutdown_rate_inputs(prj_df, su_df, hrs_in_tmp):
     )
 
     # 1. Calculate Masks (True/False Arrays)
-    trajectories_fit_mask = (
-        prj_df["startup_plus_shutdown_duration"] > prj_df["min_down_time_hours"]
-    )
-    down_time_mask = prj_df["min_down_time_hours"] > 0
-    ramp_rate_mask = (
-        (prj_df["startup_plus_ramp_up_rate_cold"] < 1)
-        | (prj_df["startup_plus_ramp_up_rate_hot"] < 1)
-        | (prj_df["shutdown_plus_ramp_down_rate"] < 1)
-    )
-    startup_fuel_mask = prj_df["startup_fuel_mmbtu_per_mw"] > 0
-    startup_trajectory_mask = prj_df["startup_duration"] > hrs_in_tmp
-    shutdown_trajectory_mask = prj_df["shutdown_duration"] > hrs_in_tmp
-    down_time_mismatch_mask = (
-        prj_df["min_down_time_hours"] != prj_df["down_time_cutoff_hours_hot"]
-    )
     cutoff_na_mask = cutoff_na_count > 0
     ramp_na_mask = ramp_na_count > 0
     all_ramp_na_mask = ramp_na_count == su_count_series
 
-    # 2. Check startup and shutdown ramp duration fit within min down time
-    # (to avoid overlap of startup and shutdown trajectory)
-    # Invalid projects are projects with a non-fitting trajectory, with a
-    # specified down time and/or a specified startup or shutdown rate
-    # and at least a startup or shutdown trajectory (i.e. across multiple tmps)
-    invalids = (
-        trajectories_fit_mask
-        & (down_time_mask | ramp_rate_mask)
-        & (startup_trajectory_mask | shutdown_trajectory_mask)
-    )
-    if invalids.any():
-        bad_projects = prj_df[invalids]["project"]
-        print_bad_projects = ", ".join(bad_projects)
-        results.append(
-            "Project(s) '{}': Startup ramp duration plus shutdown ramp duration"
-            " should be less than the minimum down time. Make sure the minimum"
-            " down time is long enough to fit the (coldest) trajectories!".format(
-                print_bad_projects
-            )
-        )
-
-    # 2. Check that startup fuel and startup trajectories are not combined
-    invalids = startup_fuel_mask & startup_trajectory_mask
-    if invalids.any():
-        bad_projects = prj_df[invalids]["project"]
-        print_bad_projects = ", ".join(bad_projects)
-        results.append(
-            "Project(s) '{}': Cannot have both startup_fuel inputs and a startup "
-            "trajectory that takes multiple timepoints as this will double "
-            "count startup fuel consumption. Please adjust startup ramp rate or"
-            " startup fuel consumption inputs".format(print_bad_projects)
-        )
-
-    # 3. Check that down time cutoff is in line with min down time
-    invalids = down_time_mismatch_mask
-    if invalids.any():
-        bad_projects = prj_df[invalids]["project"]
-        print_bad_projects = ", ".join(bad_projects)
-        results.append(
-            "Project(s) '{}': down_time_cutoff_hours of hottest start should "
-            "match project's minimum_down_time_hours. If there is no minimum "
-            "down time, set cutoff to zero.".format(print_bad_projects)
-        )
-
-    # 4. Check that only gen_commit_lin/bin have inputs in startup_chars
-    invalids = (prj_df["n_types"] > 0) & (
-        ~prj_df["operational_type"].isin(["gen_commit_lin", "gen_commit_bin"])
+    prj_df["startup_trajectory"] = prj_df["startup_duration"] > hrs_in_tmp
+    prj_df["shutdown_trajectory"] = prj_df["shutdown_duration"] > hrs_in_tmp
+
+    results += validate_rules(
+        prj_df,
+        [
+            # 2. Check startup and shutdown ramp duration fit within min down
+            # time (to avoid overlap of startup and shutdown trajectory)
+            # Invalid projects are projects with a non-fitting trajectory,
+            # with a specified down time and/or a specified startup or
+            # shutdown rate and at least a startup or shutdown trajectory
+            # (i.e. across multiple tmps)
+            ValidationRule(
+                "startup_plus_shutdown_duration > min_down_time_hours "
+                "and (min_down_time_hours > 0 "
+                "or startup_plus_ramp_up_rate_cold < 1 "
+                "or startup_plus_ramp_up_rate_hot < 1 "
+                "or shutdown_plus_ramp_down_rate < 1) "
+                "and (startup_trajectory or shutdown_trajectory)",
+                "Project(s) '{idxs}': Startup ramp duration plus shutdown ramp "
+                "duration should be less than the minimum down time. Make sure "
+                "the minimum down time is long enough to fit the (coldest) "
+                "trajectories!",
+            ),
+            # 2. Check that startup fuel and startup trajectories are not
+            # combined
+            ValidationRule(
+                "startup_fuel_mmbtu_per_mw > 0 and startup_trajectory",
+                "Project(s) '{idxs}': Cannot have both startup_fuel inputs and a "
+                "startup trajectory that takes multiple timepoints as this will "
+                "double count startup fuel consumption. Please adjust startup "
+                "ramp rate or startup fuel consumption inputs",
+            ),
+            # 3. Check that down time cutoff is in line with min down time
+            ValidationRule(
+                "min_down_time_hours != down_time_cutoff_hours_hot",
+                "Project(s) '{idxs}': down_time_cutoff_hours of hottest start "
+                "should match project's minimum_down_time_hours. If there is no "
+                "minimum down time, set cutoff to zero.",
+            ),
+            # 4. Check that only gen_commit_lin/bin have inputs in
+            # startup_chars
+            ValidationRule(
+                lambda df: (df["n_types"] > 0)
+                & ~df["operational_type"].isin(["gen_commit_lin", "gen_commit_bin"]),
+                "Project(s) '{idxs}': Only projects of the gen_commit_lin or "
+                "gen_commit_bin operational type can have startup_chars inputs.",
+            ),
+        ],
     )
-    if invalids.any():
-        bad_projects = prj_df[invalids]["project"]
-        print_bad_projects = ", ".join(bad_projects)
-        results.append(
-            "Project(s) '{}': Only projects of the gen_commit_lin or "
-            "gen_commit_bin operational type can have startup_chars inputs.".format(
-                print_bad_projects
-            )
-        )
 
     # 5. Check that ramp rate is specified for all or none
     invalids = ramp_na_mask & ~all_ramp_na_mask
@@ -17,8 +17,6 @@ import sys
 
 from argparse import ArgumentParser
 
-import pandas as pd
-
 
 def determine_scenario_directory(scenario_location, scenario_name):
     """
@@ -85,6 +83,14 @@ def get_required_e2e_arguments_parser():
         help="Print extra output, e.g. current module info.",
     )
 
+    parser.add_argument(
+        "--telemetry",
+        default=False,
+        action="store_true",
+        help="Record the time and memory usage of each run phase to the "
+        "scenario's logs directory as JSON lines.",
+    )
+
     return parser
 
 
@@ -158,6 +164,13 @@ def get_get_inputs_parser():
         default=1,
         help="Get inputs for n subproblems in parallel.",
     )
+    parser.add_argument(
+        "--aggregate_identical_units",
+        default=False,
+        action="store_true",
+        help="Model groups of identical gen_commit_bin and gen_commit_lin "
+        "projects as single gen_commit_cap projects.",
+    )
 
     return parser
 
@@ -204,6 +217,28 @@ def get_run_scenario_parser():
         action="store_true",
         help="Skip solve and load results from a Gurobi solution file instead.",
     )
+    parser.add_argument(
+        "--solution_components",
+        nargs="+",
+        help="When loading a solution file, only load the values of these "
+        "variables and the duals of these constraints (Pyomo component "
+        "names). If not specified, all variables and the duals of the "
+        "constraints the modules export are loaded. Results export may fail "
+        "for modules whose variables are not loaded.",
+    )
+    parser.add_argument(
+        "--skip_solution_duals",
+        default=False,
+        action="store_true",
+        help="Don't load constraint duals when loading a solution file.",
+    )
+    parser.add_argument(
+        "--export_constraint_duals",
+        default=False,
+        action="store_true",
+        help="Write the duals of the constraints that modules register for "
+        "export to a CSV file per constraint in the results directory.",
+    )
     # Solver options
     parser.add_argument(
         "--solver",
@@ -246,6 +281,21 @@ def get_run_scenario_parser():
         action="store_true",
         help="Use symbolic labels in solver files.",
     )
+    # Profiling
+    parser.add_argument(
+        "--profile_construction",
+        default=False,
+        action="store_true",
+        help="Record the time and memory each module and Pyomo component "
+        "take to construct and write the profile to the logs directory.",
+    )
+    parser.add_argument(
+        "--model_size_report",
+        default=False,
+        action="store_true",
+        help="Write the number of variables, constraints, and nonzeros of "
+        "each module and Pyomo component to the results directory.",
+    )
     # Flag for test runs (various changes in behavior)
     parser.add_argument(
         "--testing",
@@ -261,6 +311,68 @@ def get_run_scenario_parser():
         help="Solve n subproblems in parallel.",
     )
 
+    # Benders decomposition
+    parser.add_argument(
+        "--benders",
+        default=False,
+        action="store_true",
+        help="Solve with Benders decomposition: a master problem with the "
+        "investment decisions and operational subproblems that are solved "
+        "with the investment decisions fixed. The operational subproblems "
+        "must be linear.",
+    )
+    parser.add_argument(
+        "--benders_subproblems",
+        default="period",
+        choices=["period", "block"],
+        help="Create one Benders subproblem per period or one per independent "
+        "block of operational constraints (e.g. per horizon).",
+    )
+    parser.add_argument(
+        "--benders_gap",
+        default=0.0001,
+        help="Stop the Benders iterations when the relative gap between the "
+        "upper and lower bound is within this tolerance.",
+    )
+    parser.add_argument(
+        "--benders_max_iterations",
+        default=50,
+        help="The maximum number of Benders iterations.",
+    )
+    parser.add_argument(
+        "--n_parallel_benders_subproblems",
+        default=1,
+        help="Solve n Benders subproblems in parallel.",
+    )
+
+    # Parallel solution of independent horizons
+    parser.add_argument(
+        "--n_parallel_horizons",
+        default=1,
+        help="If the horizons of a subproblem don't depend on each other "
+        "(no investment decisions, period-level policies, or linked "
+        "horizons), solve them as separate problems, n in parallel. The "
+        "subproblem is solved as a single problem otherwise. Can't be used "
+        "with --benders or --lazy_constraints.",
+    )
+
+    # Lazy constraint generation
+    parser.add_argument(
+        "--lazy_constraints",
+        default=False,
+        action="store_true",
+        help="Generate constraints that rarely bind (e.g. transmission flow "
+        "limits) iteratively: solve without them, add the ones the solution "
+        "violates, and re-solve until none are violated. Can't be used with "
+        "--benders or --n_parallel_horizons.",
+    )
+    parser.add_argument(
+        "--binding_constraints_file",
+        help="With --lazy_constraints, include the constraints listed in "
+        "this file from the start and add the constraints binding in the "
+        "solution to it, so that other scenarios can start from them.",
+    )
+
     # Solve only incomplete subproblems
     parser.add_argument(
         "--incomplete_only",
@@ -280,6 +392,35 @@ def get_run_scenario_parser():
     return parser
 
 
+def check_solve_method_arguments(parser, parsed_arguments):
+    """
+    :param parser: the argument parser
+    :param parsed_arguments: the parsed arguments
+
+    Only one of the alternative solve methods (--benders,
+    --n_parallel_horizons greater than 1, and --lazy_constraints) can be
+    used; exit with a usage error if more than one is requested.
+    """
+    requested = [
+        flag
+        for flag, requested in [
+            ("--benders", parsed_arguments.benders),
+            (
+                "--n_parallel_horizons",
+                int(parsed_arguments.n_parallel_horizons) > 1,
+            ),
+            ("--lazy_constraints", parsed_arguments.lazy_constraints),
+        ]
+        if requested
+    ]
+    if len(requested) > 1:
+        parser.error(
+            "{} can't be used together; choose one solve method.".format(
+                " and ".join(requested)
+            )
+        )
+
+
 def get_import_results_parser():
     parser = ArgumentParser(add_help=False)
     parser.add_argument(
@@ -392,6 +533,8 @@ def string_from_time(datetime_string):
 
 
 def create_results_df(index_columns, results_columns, data):
+    import pandas as pd
+
     df = pd.DataFrame(
         columns=index_columns + results_columns,
         data=data,
@@ -25,7 +25,6 @@ from argparse import ArgumentParser
 import csv
 from multiprocessing import get_context
 import os.path
-import pandas as pd
 import sys
 import warnings
 
@@ -38,7 +37,13 @@ from gridpath.common_functions import (
     get_required_e2e_arguments_parser,
     get_get_inputs_parser,
 )
+from gridpath.auxiliary.telemetry import (
+    disable_telemetry,
+    enable_telemetry,
+    record_phase,
+)
 from gridpath.auxiliary.module_list import determine_modules, load_modules
+from gridpath.auxiliary.unit_aggregation import aggregate_identical_units
 from gridpath.auxiliary.scenario_chars import (
     OptionalFeatures,
     SubScenarios,
@@ -187,14 +192,17 @@ def get_inputs_for_subproblem(
         conn = connect_to_database(db_path=db_path)
         for m in loaded_modules:
             if hasattr(m, "write_model_inputs"):
-                m.write_model_inputs(
-                    scenario_directory=scenario_directory,
-                    scenario_id=scenario_id,
-                    subscenarios=subscenarios,
-                    subproblem=subproblem_str,
-                    stage=stage_str,
-                    conn=conn,
-                )
+                with record_phase(
+                    "write_model_inputs", subproblem_str, stage_str, module=m
+                ):
+                    m.write_model_inputs(
+                        scenario_directory=scenario_directory,
+                        scenario_id=scenario_id,
+                        subscenarios=subscenarios,
+                        subproblem=subproblem_str,
+                        stage=stage_str,
+                        conn=conn,
+                    )
 
         conn.close()
 
@@ -375,6 +383,8 @@ def write_units_csv(scenario_directory, conn):
         SELECT metric, unit
         FROM mod_units;
         """
+    import pandas as pd
+
     df = pd.read_sql(sql, conn)
     df.to_csv(os.path.join(scenario_directory, "units.csv"), index=False)
 
@@ -412,6 +422,8 @@ def write_linked_subproblems_map(scenario_directory, conn, subscenarios):
         AND temporal_scenario_id = ?;
         """
 
+    import pandas as pd
+
     df = pd.read_sql(sql=sql, con=conn, params=(subscenarios.TEMPORAL_SCENARIO_ID,))
 
     # Only write this file if there are any linked problems
@@ -456,70 +468,90 @@ def main(args=None):
     )
     create_directory_if_not_exists(directory=scenario_directory)
 
-    # Get scenario characteristics (features, scenario_id, subscenarios, subproblems)
-    # TODO: it seems these fail silently if empty; we may want to implement
-    #  some validation
-    optional_features = OptionalFeatures(conn=conn, scenario_id=scenario_id)
-    subscenarios = SubScenarios(conn=conn, scenario_id=scenario_id)
-    subproblem_structure = get_subproblem_structure_from_db(
-        conn=conn, scenario_id=scenario_id
-    )
-    solver_options = SolverOptions(conn=conn, scenario_id=scenario_id)
-
-    # Determine requested features and use this to determine what modules to
-    # load for Gridpath
-    feature_list = optional_features.get_active_features()
-    # If any subproblem's stage list is non-empty, we have stages, so set
-    # the stages_flag to True to pass to determine_modules below
-    # This tells the determine_modules function to include the
-    # stages-related modules
-    stages_flag = any(
-        [
-            len(subproblem_structure.SUBPROBLEM_STAGES[subp]) > 1
-            for subp in list(subproblem_structure.SUBPROBLEM_STAGES.keys())
-        ]
-    )
+    if parsed_arguments.telemetry:
+        prior_telemetry_settings = enable_telemetry(
+            scenario_directory=scenario_directory, process="get_scenario_inputs"
+        )
 
-    # Figure out which modules to use and load the modules
-    modules_to_use = determine_modules(features=feature_list, multi_stage=stages_flag)
+    try:
+        # Get scenario characteristics (features, scenario_id, subscenarios, subproblems)
+        # TODO: it seems these fail silently if empty; we may want to implement
+        #  some validation
+        optional_features = OptionalFeatures(conn=conn, scenario_id=scenario_id)
+        subscenarios = SubScenarios(conn=conn, scenario_id=scenario_id)
+        subproblem_structure = get_subproblem_structure_from_db(
+            conn=conn, scenario_id=scenario_id
+        )
+        solver_options = SolverOptions(conn=conn, scenario_id=scenario_id)
+
+        # Determine requested features and use this to determine what modules to
+        # load for Gridpath
+        feature_list = optional_features.get_active_features()
+        # If any subproblem's stage list is non-empty, we have stages, so set
+        # the stages_flag to True to pass to determine_modules below
+        # This tells the determine_modules function to include the
+        # stages-related modules
+        stages_flag = any(
+            [
+                len(subproblem_structure.SUBPROBLEM_STAGES[subp]) > 1
+                for subp in list(subproblem_structure.SUBPROBLEM_STAGES.keys())
+            ]
+        )
 
-    # Get appropriate inputs from database and write the .tab file model inputs
-    write_model_inputs(
-        scenario_directory=scenario_directory,
-        subproblem_structure=subproblem_structure,
-        multi_stage=stages_flag,
-        modules_to_use=modules_to_use,
-        scenario_id=scenario_id,
-        subscenarios=subscenarios,
-        db_path=db_path,
-        n_parallel_subproblems=int(parsed_arguments.n_parallel_get_inputs),
-    )
+        # Figure out which modules to use and load the modules
+        modules_to_use = determine_modules(
+            features=feature_list, multi_stage=stages_flag
+        )
 
-    # Save the list of optional features to a file (will be used to determine
-    # modules without database connection)
-    write_features_csv(scenario_directory=scenario_directory, feature_list=feature_list)
-    # Write full scenario description
-    write_scenario_description(
-        scenario_directory=scenario_directory,
-        scenario_id=scenario_id,
-        scenario_name=scenario_name,
-        optional_features=optional_features,
-        subscenarios=subscenarios,
-    )
+        # Get appropriate inputs from database and write the .tab file model inputs
+        write_model_inputs(
+            scenario_directory=scenario_directory,
+            subproblem_structure=subproblem_structure,
+            multi_stage=stages_flag,
+            modules_to_use=modules_to_use,
+            scenario_id=scenario_id,
+            subscenarios=subscenarios,
+            db_path=db_path,
+            n_parallel_subproblems=int(parsed_arguments.n_parallel_get_inputs),
+        )
 
-    # Write the units used for all metrics
-    write_units_csv(scenario_directory, conn)
+        # Model groups of identical unit-commitment projects as clusters if
+        # requested
+        if parsed_arguments.aggregate_identical_units:
+            aggregate_identical_units(
+                scenario_directory=scenario_directory, quiet=parsed_arguments.quiet
+            )
 
-    # Write the solver options file if needed
-    write_solver_options(
-        scenario_directory=scenario_directory, solver_options=solver_options
-    )
+        # Save the list of optional features to a file (will be used to determine
+        # modules without database connection)
+        write_features_csv(
+            scenario_directory=scenario_directory, feature_list=feature_list
+        )
+        # Write full scenario description
+        write_scenario_description(
+            scenario_directory=scenario_directory,
+            scenario_id=scenario_id,
+            scenario_name=scenario_name,
+            optional_features=optional_features,
+            subscenarios=subscenarios,
+        )
 
-    # Write the subproblem linked timepoints map file if needed
-    write_linked_subproblems_map(scenario_directory, conn, subscenarios)
+        # Write the units used for all metrics
+        write_units_csv(scenario_directory, conn)
 
-    # Close the database connection
-    conn.close()
+        # Write the solver options file if needed
+        write_solver_options(
+            scenario_directory=scenario_directory, solver_options=solver_options
+        )
+
+        # Write the subproblem linked timepoints map file if needed
+        write_linked_subproblems_map(scenario_directory, conn, subscenarios)
+
+        # Close the database connection
+        conn.close()
+    finally:
+        if parsed_arguments.telemetry:
+            disable_telemetry(prior_settings=prior_telemetry_settings)
 
 
 if __name__ == "__main__":
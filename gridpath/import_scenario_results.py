@@ -23,11 +23,17 @@ The main()_ function of this script can also be called with the
 
 from argparse import ArgumentParser
 import os.path
-import pandas as pd
 import sys
 
 from gridpath.auxiliary.db_interface import get_scenario_id_and_name
 from gridpath.auxiliary.import_export_rules import import_export_rules
+from gridpath.auxiliary.model_size import import_model_size_into_database
+from gridpath.auxiliary.telemetry import (
+    disable_telemetry,
+    enable_telemetry,
+    import_telemetry_into_database,
+    record_phase,
+)
 from gridpath.common_functions import (
     determine_scenario_directory,
     get_db_parser,
@@ -35,8 +41,10 @@ from gridpath.common_functions import (
     get_import_results_parser,
 )
 from db.common_functions import connect_to_database, spin_on_database_lock
-from db.utilities.scenario import delete_scenario_results
-from gridpath.auxiliary.module_list import determine_modules, load_modules
+from gridpath.auxiliary.module_list import (
+    get_module_registry,
+    refresh_scenario_structure,
+)
 from gridpath.auxiliary.scenario_chars import (
     get_subproblem_structure_from_db,
     get_subproblem_structure_from_disk,
@@ -130,6 +138,19 @@ def import_scenario_results_into_database(
                 many=False,
             )
 
+            # The problem size doesn't depend on the solution, so we import
+            # it regardless of the solver status
+            with record_phase(
+                "import_results", subproblem, stage, db_table="results_model_size"
+            ):
+                import_model_size_into_database(
+                    conn=db,
+                    scenario_id=scenario_id,
+                    subproblem=subproblem,
+                    stage=stage,
+                    results_directory=results_directory,
+                )
+
             with open(
                 os.path.join(results_directory, "solver_status.txt"), "r"
             ) as status_f:
@@ -141,13 +162,16 @@ def import_scenario_results_into_database(
             # throwing an error at some point during results-export,
             # so we don't attempt to import missing results into the database
             if solver_status == "ok":
-                import_objective_function_value(
-                    db=db,
-                    scenario_id=scenario_id,
-                    subproblem=subproblem,
-                    stage=stage,
-                    results_directory=results_directory,
-                )
+                with record_phase(
+                    "import_results", subproblem, stage, db_table="results_scenario"
+                ):
+                    import_objective_function_value(
+                        db=db,
+                        scenario_id=scenario_id,
+                        subproblem=subproblem,
+                        stage=stage,
+                        results_directory=results_directory,
+                    )
                 import_subproblem_stage_results_into_database(
                     import_rule=import_rule,
                     db=db,
@@ -222,15 +246,16 @@ def import_subproblem_stage_results_into_database(
         c = db.cursor()
         for m in loaded_modules:
             if hasattr(m, "import_results_into_database"):
-                m.import_results_into_database(
-                    scenario_id=scenario_id,
-                    subproblem=subproblem,
-                    stage=stage,
-                    c=c,
-                    db=db,
-                    results_directory=results_directory,
-                    quiet=quiet,
-                )
+                with record_phase("import_results", subproblem, stage, module=m):
+                    m.import_results_into_database(
+                        scenario_id=scenario_id,
+                        subproblem=subproblem,
+                        stage=stage,
+                        c=c,
+                        db=db,
+                        results_directory=results_directory,
+                        quiet=quiet,
+                    )
     else:
         if not quiet:
             print("Results-import skipped based on import rule.")
@@ -299,6 +324,8 @@ def main(args=None):
     )
 
     # Check that the saved scenario_id matches
+    import pandas as pd
+
     sc_df = pd.read_csv(
         os.path.join(scenario_directory, "scenario_description.csv"),
         header=None,
@@ -308,30 +335,55 @@ def main(args=None):
     if scenario_id_saved != scenario_id:
         raise AssertionError("ERROR: saved scenario_id does not match")
 
-    # Delete all previous results for this scenario_id
-    # Each module also makes sure results are deleted, but this step ensures
-    # that if a scenario_id was run with different modules before, we also
-    # delete previously imported "phantom" results
-    delete_scenario_results(conn=conn, scenario_id=scenario_id)
-
-    # Go through modules
-    modules_to_use = determine_modules(scenario_directory=scenario_directory)
-    loaded_modules = load_modules(modules_to_use)
-
-    # Import appropriate results into database
-    import_scenario_results_into_database(
-        import_rule=parsed_arguments.results_import_rule,
-        loaded_modules=loaded_modules,
-        scenario_id=scenario_id,
-        subproblems=subproblem_structure,
-        cursor=c,
-        db=conn,
-        scenario_directory=scenario_directory,
-        quiet=quiet,
-    )
+    # Telemetry events are recorded for the latest run of the scenario
+    if parsed_arguments.telemetry:
+        prior_telemetry_settings = enable_telemetry(
+            scenario_directory=scenario_directory,
+            process="import_scenario_results",
+            new_run=False,
+        )
+
+    try:
+        # Delete all previous results for this scenario_id
+        # (db.utilities loads pandas, so we only import it when needed)
+        from db.utilities.scenario import delete_scenario_results
+
+        # Each module also makes sure results are deleted, but this step ensures
+        # that if a scenario_id was run with different modules before, we also
+        # delete previously imported "phantom" results
+        delete_scenario_results(conn=conn, scenario_id=scenario_id)
+
+        # Go through modules
+        refresh_scenario_structure(scenario_directory=scenario_directory)
+        loaded_modules = get_module_registry(
+            scenario_directory=scenario_directory
+        ).loaded_modules
+
+        # Import appropriate results into database
+        import_scenario_results_into_database(
+            import_rule=parsed_arguments.results_import_rule,
+            loaded_modules=loaded_modules,
+            scenario_id=scenario_id,
+            subproblems=subproblem_structure,
+            cursor=c,
+            db=conn,
+            scenario_directory=scenario_directory,
+            quiet=quiet,
+        )
+
+        # Collect the telemetry recorded so far for the scenario in the database
+        if parsed_arguments.telemetry:
+            import_telemetry_into_database(
+                conn=conn,
+                scenario_id=scenario_id,
+                scenario_directory=scenario_directory,
+            )
 
-    # Close the database connection
-    conn.close()
+        # Close the database connection
+        conn.close()
+    finally:
+        if parsed_arguments.telemetry:
+            disable_telemetry(prior_settings=prior_telemetry_settings)
 
 
 if __name__ == "__main__":
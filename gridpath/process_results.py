@@ -23,17 +23,27 @@ The main() function of this script can also be called with the
 
 
 from argparse import ArgumentParser
+import datetime
 import sys
 
-from db.common_functions import connect_to_database
+from db.common_functions import connect_to_database, spin_on_database_lock
 from gridpath.common_functions import (
     determine_scenario_directory,
     get_db_parser,
     get_required_e2e_arguments_parser,
 )
 from gridpath.auxiliary.db_interface import get_scenario_id_and_name
-from gridpath.auxiliary.module_list import determine_modules, load_modules
+from gridpath.auxiliary.module_list import (
+    get_module_registry,
+    refresh_scenario_structure,
+)
 from gridpath.auxiliary.scenario_chars import SubScenarios
+from gridpath.auxiliary.telemetry import (
+    disable_telemetry,
+    enable_telemetry,
+    import_telemetry_into_database,
+    record_phase,
+)
 
 
 def process_results(loaded_modules, db, cursor, scenario_id, subscenarios, quiet):
@@ -48,7 +58,53 @@ def process_results(loaded_modules, db, cursor, scenario_id, subscenarios, quiet
     """
     for m in loaded_modules:
         if hasattr(m, "process_results"):
-            m.process_results(db, cursor, scenario_id, subscenarios, quiet)
+            with record_phase("process_results", module=m):
+                m.process_results(db, cursor, scenario_id, subscenarios, quiet)
+
+    update_results_aggregates_timestamp(db=db, cursor=cursor, scenario_id=scenario_id)
+
+
+def update_results_aggregates_timestamp(db, cursor, scenario_id):
+    """
+    :param db:
+    :param cursor:
+    :param scenario_id:
+    :return:
+
+    Record when the scenario's results aggregates were built. Cached results
+    queries (see *viz.results_cache*) are keyed on this timestamp, so they
+    are invalidated when results are re-imported (which deletes the row) and
+    processed again.
+    """
+    spin_on_database_lock(
+        conn=db,
+        cursor=cursor,
+        sql="""
+            INSERT OR REPLACE INTO results_scenario_aggregates
+            (scenario_id, aggregates_timestamp)
+            VALUES (?, ?);
+            """,
+        data=(scenario_id, datetime.datetime.now().isoformat()),
+        many=False,
+    )
+
+
+def results_aggregates_exist(cursor, scenario_id):
+    """
+    :param cursor:
+    :param scenario_id:
+    :return: boolean
+
+    Check whether the scenario's results aggregates have been built since
+    its results were last imported.
+    """
+    return (
+        cursor.execute(
+            """SELECT 1 FROM results_scenario_aggregates WHERE scenario_id = ?;""",
+            (scenario_id,),
+        ).fetchone()
+        is not None
+    )
 
 
 def parse_arguments(args):
@@ -62,6 +118,13 @@ def parse_arguments(args):
     parser = ArgumentParser(
         add_help=True, parents=[get_db_parser(), get_required_e2e_arguments_parser()]
     )
+    parser.add_argument(
+        "--force_process_results",
+        default=False,
+        action="store_true",
+        help="Process the results even if they have not been re-imported "
+        "since they were last processed.",
+    )
     parsed_arguments = parser.parse_known_args(args=args)[0]
 
     return parsed_arguments
@@ -95,29 +158,64 @@ def main(args=None):
         script="process_results",
     )
 
+    # Importing results deletes the scenario's results aggregates row, so
+    # if it exists, nothing has changed since the results were last processed
+    if not parsed_arguments.force_process_results and results_aggregates_exist(
+        cursor=c, scenario_id=scenario_id
+    ):
+        if not parsed_arguments.quiet:
+            print(
+                "Results have not changed since they were last processed. "
+                "Use --force_process_results to process them again."
+            )
+        conn.close()
+        return
+
     # Determine scenario directory
     scenario_directory = determine_scenario_directory(
         scenario_location=scenario_location, scenario_name=scenario_name
     )
 
-    # Go through modules
-    modules_to_use = determine_modules(scenario_directory=scenario_directory)
-    loaded_modules = load_modules(modules_to_use)
-
-    # Subscenarios
-    subscenarios = SubScenarios(conn=conn, scenario_id=scenario_id)
-
-    process_results(
-        loaded_modules=loaded_modules,
-        db=conn,
-        cursor=c,
-        scenario_id=scenario_id,
-        subscenarios=subscenarios,
-        quiet=parsed_arguments.quiet,
-    )
-
-    # Close the database connection
-    conn.close()
+    # Telemetry events are recorded for the latest run of the scenario
+    if parsed_arguments.telemetry:
+        prior_telemetry_settings = enable_telemetry(
+            scenario_directory=scenario_directory,
+            process="process_results",
+            new_run=False,
+        )
+
+    try:
+        # Go through modules
+        refresh_scenario_structure(scenario_directory=scenario_directory)
+        loaded_modules = get_module_registry(
+            scenario_directory=scenario_directory
+        ).loaded_modules
+
+        # Subscenarios
+        subscenarios = SubScenarios(conn=conn, scenario_id=scenario_id)
+
+        process_results(
+            loaded_modules=loaded_modules,
+            db=conn,
+            cursor=c,
+            scenario_id=scenario_id,
+            subscenarios=subscenarios,
+            quiet=parsed_arguments.quiet,
+        )
+
+        # Collect the telemetry recorded so far for the scenario in the database
+        if parsed_arguments.telemetry:
+            import_telemetry_into_database(
+                conn=conn,
+                scenario_id=scenario_id,
+                scenario_directory=scenario_directory,
+            )
+
+        # Close the database connection
+        conn.close()
+    finally:
+        if parsed_arguments.telemetry:
+            disable_telemetry(prior_settings=prior_telemetry_settings)
 
 
 if __name__ == "__main__":
@@ -24,6 +24,7 @@ import pandas as pd
 from pyomo.environ import Set, Param, Any, value
 
 from gridpath.auxiliary.auxiliary import cursor_to_df
+from gridpath.auxiliary.dynamic_components import ResultsFrame
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
     validate_dtypes,
@@ -33,6 +34,8 @@ from gridpath.auxiliary.validations import (
     validate_missing_inputs,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 PROJECT_PERIOD_DF = "project_period_df"
 PROJECT_TIMEPOINT_DF = "project_timepoint_df"
 
@@ -240,7 +243,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     # The results dataframes are by index
 
     # Project-period DF
-    project_period_df = pd.DataFrame(
+    project_period_df = ResultsFrame(
         columns=[
             "project",
             "period",
@@ -262,15 +265,14 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             ]
             for (prj, prd) in set(m.PRJ_OPR_PRDS | m.PRJ_FIN_PRDS)
         ],
-    ).set_index(["project", "period"])
-
-    project_period_df.sort_index(inplace=True)
+        index_columns=["project", "period"],
+    )
 
-    # Add the dataframe to the dynamic components to pass to other modules
+    # Add the results frame to the dynamic components to pass to other modules
     setattr(d, PROJECT_PERIOD_DF, project_period_df)
 
     # Project-timepoint DF
-    project_timepoint_df = pd.DataFrame(
+    project_timepoint_df = ResultsFrame(
         columns=[
             "project",
             "timepoint",
@@ -304,11 +306,10 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             ]
             for (prj, tmp) in m.PRJ_OPR_TMPS
         ],
-    ).set_index(["project", "timepoint"])
-
-    project_timepoint_df.sort_index(inplace=True)
+        index_columns=["project", "timepoint"],
+    )
 
-    # Add the dataframe to the dynamic components to pass to other modules
+    # Add the results frame to the dynamic components to pass to other modules
     setattr(d, PROJECT_TIMEPOINT_DF, project_timepoint_df)
 
 
@@ -19,9 +19,10 @@ from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules,
     load_subtype_modules,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project import PROJECT_TIMEPOINT_DF
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -172,15 +173,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (prj, tmp) in m.PRJ_OPR_TMPS
     ]
-    results_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_DF).update(columns=results_columns, data=data)
 
     # Module-specific availability results
     required_availability_modules = get_required_subtype_modules(
@@ -194,12 +187,12 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     )
     for op_m in required_availability_modules:
         if hasattr(imported_availability_modules[op_m], "add_to_prj_tmp_results"):
-            results, results_df = imported_availability_modules[
+            results_columns, avltype_data = imported_availability_modules[
                 op_m
             ].add_to_prj_tmp_results(scenario_directory, subproblem, stage, m, d)
-            for c in results_columns:
-                getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-            getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+            getattr(d, PROJECT_TIMEPOINT_DF).update(
+                columns=results_columns, data=avltype_data
+            )
 
 
 def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
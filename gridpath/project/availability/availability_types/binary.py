@@ -35,7 +35,6 @@ from gridpath.auxiliary.validations import (
     validate_missing_inputs,
     validate_column_monotonicity,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project import PROJECT_TIMEPOINT_DF
 from gridpath.project.operations.operational_types.common_functions import (
     determine_relevant_timepoints,
@@ -45,6 +44,8 @@ from gridpath.project.common_functions import (
     check_if_boundary_type_and_first_timepoint,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -403,13 +404,7 @@ def add_to_prj_tmp_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (prj, tmp) in m.AVL_BIN_OPR_TMPS
     ]
-    results_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, results_df
+    return results_columns, data
 
 
 # Database
@@ -30,7 +30,6 @@ from gridpath.auxiliary.auxiliary import (
     join_sets,
 )
 from gridpath.auxiliary.dynamic_components import capacity_type_operational_period_sets
-from gridpath.common_functions import create_results_df
 from gridpath.project.capacity.common_functions import (
     load_project_capacity_type_modules,
 )
@@ -333,15 +332,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (prj, prd) in m.PRJ_OPR_PRDS
     ]
-    results_df = create_results_df(
-        index_columns=["project", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PROJECT_PERIOD_DF)[c] = None
-    getattr(d, PROJECT_PERIOD_DF).update(results_df)
+    getattr(d, PROJECT_PERIOD_DF).update(columns=results_columns, data=data)
 
     # Module-specific capacity results
     required_capacity_modules = get_required_subtype_modules(
@@ -357,13 +348,12 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     )
     for op_m in required_capacity_modules:
         if hasattr(imported_capacity_modules[op_m], "add_to_project_period_results"):
-            results_columns, optype_df = imported_capacity_modules[
+            results_columns, captype_data = imported_capacity_modules[
                 op_m
             ].add_to_project_period_results(scenario_directory, subproblem, stage, m, d)
-            for column in results_columns:
-                if column not in getattr(d, PROJECT_PERIOD_DF):
-                    getattr(d, PROJECT_PERIOD_DF)[column] = None
-            getattr(d, PROJECT_PERIOD_DF).update(optype_df)
+            getattr(d, PROJECT_PERIOD_DF).update(
+                columns=results_columns, data=captype_data
+            )
 
 
 def summarize_results(scenario_directory, subproblem, stage):
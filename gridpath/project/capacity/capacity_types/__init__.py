@@ -24,6 +24,8 @@ from gridpath.project.capacity.common_functions import (
 )
 from gridpath.auxiliary.db_interface import get_required_capacity_types_from_database
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
     """
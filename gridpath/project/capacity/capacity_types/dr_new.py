@@ -49,6 +49,7 @@ from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.dynamic_components import (
     capacity_type_operational_period_sets,
     capacity_type_financial_period_sets,
+    capacity_variables,
 )
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
@@ -56,13 +57,14 @@ from gridpath.auxiliary.validations import (
     validate_idxs,
     get_projects,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project.capacity.capacity_types.common_methods import (
     read_results_file_generic,
     write_summary_results_generic,
     get_units,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -255,6 +257,14 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         "DR_NEW_FIN_PRDS",
     )
 
+    # Add to list of capacity variables, i.e. the investment decisions
+    getattr(d, capacity_variables).extend(
+        [
+            "DRNew_Build_MWh",
+            "DRNew_Cost",
+        ]
+    )
+
 
 # Expression Rules
 ###############################################################################
@@ -428,13 +438,7 @@ def add_to_project_period_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (prj, prd) in m.DR_NEW_OPR_PRDS
     ]
-    captype_df = create_results_df(
-        index_columns=["project", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, captype_df
+    return results_columns, data
 
 
 def summarize_results(scenario_directory, subproblem, stage, summary_results_file):
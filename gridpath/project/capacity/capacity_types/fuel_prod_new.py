@@ -41,6 +41,7 @@ from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.dynamic_components import (
     capacity_type_operational_period_sets,
     capacity_type_financial_period_sets,
+    capacity_variables,
 )
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
@@ -50,7 +51,6 @@ from gridpath.auxiliary.validations import (
     validate_dtypes,
     validate_idxs,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project.capacity.capacity_types.common_methods import (
     relevant_periods_by_project_vintage,
     project_relevant_periods,
@@ -60,6 +60,8 @@ from gridpath.project.capacity.capacity_types.common_methods import (
     get_units,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -352,6 +354,15 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         "FUEL_PROD_NEW_FIN_PRDS",
     )
 
+    # Add to list of capacity variables, i.e. the investment decisions
+    getattr(d, capacity_variables).extend(
+        [
+            "FuelProdNew_Build_Prod_Cap_FuelUnitPerHour",
+            "FuelProdNew_Build_Rel_Cap_FuelUnitPerHour",
+            "FuelProdNew_Build_Stor_Cap_FuelUnit",
+        ]
+    )
+
 
 # Set Rules
 ###############################################################################
@@ -629,13 +640,7 @@ def add_to_project_period_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (prj, prd) in m.FUEL_PROD_NEW_VNTS
     ]
-    captype_df = create_results_df(
-        index_columns=["project", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, captype_df
+    return results_columns, data
 
 
 # TODO: add capacity type to the results file, so that we can filter the
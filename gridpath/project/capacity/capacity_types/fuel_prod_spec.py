@@ -40,6 +40,8 @@ from gridpath.project.capacity.capacity_types.common_methods import (
     spec_determine_inputs,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -46,6 +46,7 @@ from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.dynamic_components import (
     capacity_type_operational_period_sets,
     capacity_type_financial_period_sets,
+    capacity_variables,
 )
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
@@ -55,7 +56,6 @@ from gridpath.auxiliary.validations import (
     validate_dtypes,
     validate_idxs,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project.capacity.capacity_types.common_methods import (
     relevant_periods_by_project_vintage,
     project_relevant_periods,
@@ -65,6 +65,8 @@ from gridpath.project.capacity.capacity_types.common_methods import (
     get_units,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -298,6 +300,9 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         "GEN_NEW_LIN_FIN_PRDS",
     )
 
+    # Add to list of capacity variables, i.e. the investment decisions
+    getattr(d, capacity_variables).append("GenNewLin_Build_MW")
+
 
 # Set Rules
 ###############################################################################
@@ -494,13 +499,7 @@ def add_to_project_period_results(scenario_directory, subproblem, stage, m, d):
         [prj, prd, value(m.GenNewLin_Build_MW[prj, prd])]
         for (prj, prd) in m.GEN_NEW_LIN_VNTS
     ]
-    captype_df = create_results_df(
-        index_columns=["project", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, captype_df
+    return results_columns, data
 
 
 def summarize_results(scenario_directory, subproblem, stage, summary_results_file):
@@ -27,7 +27,10 @@ import pandas as pd
 from pyomo.environ import Set, Param, Var, Constraint, NonNegativeReals, Binary, value
 
 from gridpath.auxiliary.auxiliary import cursor_to_df
-from gridpath.auxiliary.dynamic_components import capacity_type_operational_period_sets
+from gridpath.auxiliary.dynamic_components import (
+    capacity_type_operational_period_sets,
+    capacity_variables,
+)
 from gridpath.auxiliary.validations import (
     get_projects,
     get_expected_dtypes,
@@ -37,7 +40,6 @@ from gridpath.auxiliary.validations import (
     validate_idxs,
     validate_missing_inputs,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project.capacity.capacity_types.common_methods import (
     spec_get_inputs_from_database,
     spec_write_tab_file,
@@ -47,6 +49,8 @@ from gridpath.project.capacity.capacity_types.common_methods import (
     get_units,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -179,6 +183,9 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         "GEN_RET_BIN_OPR_PRDS",
     )
 
+    # Add to list of capacity variables, i.e. the investment decisions
+    getattr(d, capacity_variables).append("GenRetBin_Retire")
+
 
 # Constraint Formulation Rules
 ###############################################################################
@@ -284,13 +291,7 @@ def add_to_project_period_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (prj, prd) in m.GEN_RET_BIN_OPR_PRDS
     ]
-    captype_df = create_results_df(
-        index_columns=["project", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, captype_df
+    return results_columns, data
 
 
 def summarize_results(scenario_directory, subproblem, stage, summary_results_file):
@@ -45,6 +45,7 @@ from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.dynamic_components import (
     capacity_type_operational_period_sets,
     capacity_type_financial_period_sets,
+    capacity_variables,
 )
 from gridpath.auxiliary.validations import (
     get_projects,
@@ -56,7 +57,6 @@ from gridpath.auxiliary.validations import (
     validate_row_monotonicity,
     validate_missing_inputs,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project.capacity.capacity_types.common_methods import (
     spec_get_inputs_from_database,
     spec_write_tab_file,
@@ -66,6 +66,8 @@ from gridpath.project.capacity.capacity_types.common_methods import (
     get_units,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -206,6 +208,9 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         "GEN_RET_LIN_OPR_PRDS",
     )
 
+    # Add to list of capacity variables, i.e. the investment decisions
+    getattr(d, capacity_variables).append("GenRetLin_Retire_MW")
+
 
 # Variable Bound Rules
 ###############################################################################
@@ -328,13 +333,7 @@ def add_to_project_period_results(scenario_directory, subproblem, stage, m, d):
         [prj, prd, value(m.GenRetLin_Retire_MW[prj, prd])]
         for (prj, prd) in m.GEN_RET_LIN_OPR_PRDS
     ]
-    captype_df = create_results_df(
-        index_columns=["project", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, captype_df
+    return results_columns, data
 
 
 def summarize_results(scenario_directory, subproblem, stage, summary_results_file):
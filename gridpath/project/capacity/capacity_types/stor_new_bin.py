@@ -44,6 +44,7 @@ from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.dynamic_components import (
     capacity_type_operational_period_sets,
     capacity_type_financial_period_sets,
+    capacity_variables,
 )
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
@@ -53,7 +54,6 @@ from gridpath.auxiliary.validations import (
     validate_values,
     validate_idxs,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project.capacity.capacity_types.common_methods import (
     relevant_periods_by_project_vintage,
     project_relevant_periods,
@@ -63,6 +63,8 @@ from gridpath.project.capacity.capacity_types.common_methods import (
     get_units,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -312,6 +314,9 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         "STOR_NEW_BIN_FIN_PRDS",
     )
 
+    # Add to list of capacity variables, i.e. the investment decisions
+    getattr(d, capacity_variables).append("StorNewBin_Build")
+
 
 # Set Rules
 ###############################################################################
@@ -585,13 +590,7 @@ def add_to_project_period_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (prj, prd) in m.STOR_NEW_BIN_VNTS
     ]
-    captype_df = create_results_df(
-        index_columns=["project", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, captype_df
+    return results_columns, data
 
 
 def summarize_results(scenario_directory, subproblem, stage, summary_results_file):
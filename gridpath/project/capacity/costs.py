@@ -24,8 +24,7 @@ import csv
 import os.path
 from pyomo.environ import Set, Expression, value
 
-from db.common_functions import spin_on_database_lock
-from gridpath.common_functions import create_results_df
+from db.common_functions import spin_on_database_lock_transaction
 from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules,
     join_sets,
@@ -169,15 +168,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for (prj, prd) in m.PRJ_FIN_PRDS
     ]
 
-    cost_df1 = create_results_df(
-        index_columns=["project", "period"],
-        results_columns=results_columns1,
-        data=data1,
-    )
-
-    for c in results_columns1:
-        getattr(d, PROJECT_PERIOD_DF)[c] = None
-    getattr(d, PROJECT_PERIOD_DF).update(cost_df1)
+    getattr(d, PROJECT_PERIOD_DF).update(columns=results_columns1, data=data1)
 
     results_columns2 = [
         "hours_in_period_timepoints",
@@ -195,15 +186,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for (prj, prd) in m.PRJ_OPR_PRDS
     ]
 
-    cost_df2 = create_results_df(
-        index_columns=["project", "period"],
-        results_columns=results_columns2,
-        data=data2,
-    )
-
-    for c in results_columns2:
-        getattr(d, PROJECT_PERIOD_DF)[c] = None
-    getattr(d, PROJECT_PERIOD_DF).update(cost_df2)
+    getattr(d, PROJECT_PERIOD_DF).update(columns=results_columns2, data=data2)
 
 
 # Database
@@ -228,9 +211,6 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM results_project_costs_capacity_agg 
         WHERE scenario_id = ?
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Insert new results
     agg_sql = """
@@ -261,11 +241,18 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         (SELECT scenario_id, subproblem_id, stage_id, period, load_zone,
         SUM(capacity_cost) AS capacity_cost
         FROM results_project_period
+        WHERE scenario_id = ?
         GROUP BY scenario_id, subproblem_id, stage_id, period, load_zone
         ) AS cap_table
         USING (scenario_id, subproblem_id, stage_id, period, load_zone)
+        WHERE spinup_or_lookahead_ratios.scenario_id = ?
         ;"""
 
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[
+            (del_sql, (scenario_id,)),
+            (agg_sql, (scenario_id, scenario_id, scenario_id)),
+        ],
     )
@@ -28,13 +28,14 @@ from gridpath.auxiliary.validations import (
     validate_column_monotonicity,
 )
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules
-from gridpath.common_functions import create_results_df
 from gridpath.project import PROJECT_PERIOD_DF
 from gridpath.project.capacity.common_functions import (
     load_project_capacity_type_modules,
 )
 import gridpath.project.capacity.capacity_types as cap_type_init
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -613,15 +614,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (prj, prd) in m.PRJ_OPR_PRDS
     ]
-    results_df = create_results_df(
-        index_columns=["project", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PROJECT_PERIOD_DF)[c] = None
-    getattr(d, PROJECT_PERIOD_DF).update(results_df)
+    getattr(d, PROJECT_PERIOD_DF).update(columns=results_columns, data=data)
 
 
 # Validation
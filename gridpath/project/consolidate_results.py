@@ -28,7 +28,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     Export all results from the PROJECT_CAPACITY_DF and PROJECT_OPERATIONS_DF
     that various modules have added to
     """
-    getattr(d, PROJECT_PERIOD_DF).to_csv(
+    getattr(d, PROJECT_PERIOD_DF).to_df().to_csv(
         os.path.join(
             scenario_directory,
             str(subproblem),
@@ -40,7 +40,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         index=True,
     )
 
-    getattr(d, PROJECT_TIMEPOINT_DF).to_csv(
+    getattr(d, PROJECT_TIMEPOINT_DF).to_df().to_csv(
         os.path.join(
             scenario_directory,
             str(subproblem),
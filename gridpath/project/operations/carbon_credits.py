@@ -26,10 +26,11 @@ from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules,
     subset_init_by_set_membership,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project import PROJECT_PERIOD_DF
-from gridpath.project.operations.common_functions import load_operational_type_modules
-import gridpath.project.operations.operational_types as op_type_init
+from gridpath.project.operations.common_functions import (
+    get_operational_type_rules,
+    load_operational_type_modules,
+)
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -114,6 +115,10 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         required_operational_modules
     )
 
+    power_provision_rules = get_operational_type_rules(
+        imported_operational_modules, "power_provision_rule"
+    )
+
     # Sets
     ###########################################################################
 
@@ -182,29 +187,26 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         The credits generated by each project.
         """
         op_type = mod.operational_type[prj]
+        prj_opr_tmps_in_prd = [
+            tmp
+            for tmp in mod.TMPS_IN_PRD[prd]
+            if (prj, tmp) in mod.CARBON_CREDITS_PRJ_OPR_TMPS
+        ]
         total_power_provision_in_prd = sum(
-            (
-                imported_operational_modules[op_type].power_provision_rule(mod, p, tmp)
-                if hasattr(
-                    imported_operational_modules[op_type], "power_provision_rule"
-                )
-                else op_type_init.power_provision_rule(mod, p, tmp)
-            )
+            power_provision_rules[op_type](mod, prj, tmp)
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (p, tmp) in mod.CARBON_CREDITS_PRJ_OPR_TMPS
-            if mod.period[tmp] == prd and p == prj
+            for tmp in prj_opr_tmps_in_prd
         )
         return mod.Project_Carbon_Credits_Generated[prj, prd] <= (
             total_power_provision_in_prd
             * mod.intensity_threshold_emissions_toCO2_per_MWh[prj, prd]
             + mod.absolute_threshold_emissions_toCO2[prj, prd]
             - sum(
-                mod.Project_Carbon_Emissions[p, tmp]
+                mod.Project_Carbon_Emissions[prj, tmp]
                 * mod.hrs_in_tmp[tmp]
                 * mod.tmp_weight[tmp]
-                for (p, tmp) in mod.CARBON_CREDITS_PRJ_OPR_TMPS
-                if mod.period[tmp] == prd and p == prj
+                for tmp in prj_opr_tmps_in_prd
             )
         )
 
@@ -428,15 +430,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for (prj, prd) in m.CARBON_CREDITS_PRJ_OPR_PRDS
     ]
 
-    results_df = create_results_df(
-        index_columns=["project", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PROJECT_PERIOD_DF)[c] = None
-    getattr(d, PROJECT_PERIOD_DF).update(results_df)
+    getattr(d, PROJECT_PERIOD_DF).update(columns=results_columns, data=data)
 
 
 # Validation
@@ -21,8 +21,7 @@ import csv
 import os.path
 from pyomo.environ import Expression, value
 
-from db.common_functions import spin_on_database_lock
-from gridpath.common_functions import create_results_df
+from db.common_functions import spin_on_database_lock_transaction
 from gridpath.project import PROJECT_TIMEPOINT_DF
 
 
@@ -102,15 +101,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (prj, tmp) in m.PRJ_OPR_TMPS
     ]
-    emissions_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(emissions_df)
+    getattr(d, PROJECT_TIMEPOINT_DF).update(columns=results_columns, data=data)
 
 
 # Database
@@ -134,9 +125,6 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM results_project_carbon_emissions_by_technology_period 
         WHERE scenario_id = ?
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Aggregate emissions by technology, period, and spinup_or_lookahead
     agg_sql = """
@@ -153,6 +141,8 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         spinup_or_lookahead
         ORDER BY subproblem_id, stage_id, period, load_zone, technology, 
         spinup_or_lookahead;"""
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[(del_sql, (scenario_id,)), (agg_sql, (scenario_id,))],
     )
@@ -27,12 +27,14 @@ from gridpath.auxiliary.auxiliary import (
     subset_init_by_set_membership,
 )
 from gridpath.auxiliary.db_interface import (
-    update_prj_zone_column,
+    update_prj_zone_columns,
     determine_table_subset_by_start_and_column,
     import_csv,
 )
 from gridpath.auxiliary.validations import write_validation_to_database, validate_idxs
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -498,16 +500,15 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         conn=db, tbl_start="results_project_", cols=["carbon_tax_zone"]
     )
 
-    for tbl in tables_to_update:
-        update_prj_zone_column(
-            conn=db,
-            scenario_id=scenario_id,
-            subscenarios=subscenarios,
-            subscenario="project_carbon_tax_zone_scenario_id",
-            subsc_tbl="inputs_project_carbon_tax_zones",
-            prj_tbl=tbl,
-            col="carbon_tax_zone",
-        )
+    update_prj_zone_columns(
+        conn=db,
+        scenario_id=scenario_id,
+        subscenarios=subscenarios,
+        subscenario="project_carbon_tax_zone_scenario_id",
+        subsc_tbl="inputs_project_carbon_tax_zones",
+        prj_tbls=tables_to_update,
+        col="carbon_tax_zone",
+    )
 
 
 def export_results(scenario_directory, subproblem, stage, m, d):
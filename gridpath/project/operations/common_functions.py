@@ -15,3 +15,27 @@ def load_operational_type_modules(required_operational_modules):
         package="gridpath.project.operations.operational_types",
         required_attributes=[],
     )
+
+
+def get_operational_type_rules(imported_operational_modules, rule_name):
+    """
+    Resolve which function implements a rule for each operational type
+    :param imported_operational_modules: dictionary with the imported
+        operational type modules {name of subtype module: Python module object}
+    :param rule_name: the name of the rule, e.g. "power_provision_rule"
+    :return: dictionary with the rule function of each operational type
+        {operational type: function}; operational types whose module does
+        not have the rule get the default in the operational_types package
+
+    Call this once when adding the model components and look up the rule
+    by the project's operational type inside the expression or constraint
+    rule, so that the modules are not searched for the rule for each index.
+    """
+    import gridpath.project.operations.operational_types as op_type_init
+
+    return {
+        op_type: getattr(op_m, rule_name)
+        if hasattr(op_m, rule_name)
+        else getattr(op_type_init, rule_name)
+        for op_type, op_m in imported_operational_modules.items()
+    }
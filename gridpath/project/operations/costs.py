@@ -24,16 +24,15 @@ operational type modules.
 
 from pyomo.environ import Set, Var, Expression, Constraint, NonNegativeReals, value
 
-from db.common_functions import spin_on_database_lock
+from db.common_functions import spin_on_database_lock_transaction
 from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules,
     subset_init_by_set_membership,
 )
 from gridpath.project.operations.common_functions import (
+    get_operational_type_rules,
     load_operational_type_modules,
 )
-from gridpath.common_functions import create_results_df
-import gridpath.project.operations.operational_types as op_type_init
 from gridpath.project import PROJECT_TIMEPOINT_DF
 
 
@@ -190,6 +189,34 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         required_operational_modules
     )
 
+    variable_om_cost_by_ll_rules = get_operational_type_rules(
+        imported_operational_modules, "variable_om_cost_by_ll_rule"
+    )
+    variable_om_cost_rules = get_operational_type_rules(
+        imported_operational_modules, "variable_om_cost_rule"
+    )
+    startup_cost_simple_rules = get_operational_type_rules(
+        imported_operational_modules, "startup_cost_simple_rule"
+    )
+    startup_cost_by_st_rules = get_operational_type_rules(
+        imported_operational_modules, "startup_cost_by_st_rule"
+    )
+    shutdown_cost_rules = get_operational_type_rules(
+        imported_operational_modules, "shutdown_cost_rule"
+    )
+    operational_violation_cost_rules = get_operational_type_rules(
+        imported_operational_modules, "operational_violation_cost_rule"
+    )
+    curtailment_cost_rules = get_operational_type_rules(
+        imported_operational_modules, "curtailment_cost_rule"
+    )
+    soc_penalty_cost_rules = get_operational_type_rules(
+        imported_operational_modules, "soc_penalty_cost_rule"
+    )
+    soc_last_tmp_penalty_cost_rules = get_operational_type_rules(
+        imported_operational_modules, "soc_last_tmp_penalty_cost_rule"
+    )
+
     # Sets
     ###########################################################################
 
@@ -324,14 +351,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         at very costly operating points.
         """
         op_type = mod.operational_type[prj]
-        if hasattr(
-            imported_operational_modules[op_type], "variable_om_cost_by_ll_rule"
-        ):
-            var_cost_by_ll = imported_operational_modules[
-                op_type
-            ].variable_om_cost_by_ll_rule(mod, prj, tmp, s)
-        else:
-            var_cost_by_ll = op_type_init.variable_om_cost_by_ll_rule(mod, prj, tmp, s)
+        var_cost_by_ll = variable_om_cost_by_ll_rules[op_type](mod, prj, tmp, s)
 
         return mod.Variable_OM_Curve_Cost[prj, tmp] >= var_cost_by_ll
 
@@ -356,12 +376,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         # Simple VOM cost
         op_type = mod.operational_type[prj]
         if prj in mod.VAR_OM_COST_SIMPLE_PRJS:
-            if hasattr(imported_operational_modules[op_type], "variable_om_cost_rule"):
-                var_cost_simple = imported_operational_modules[
-                    op_type
-                ].variable_om_cost_rule(mod, prj, tmp)
-            else:
-                var_cost_simple = op_type_init.variable_om_cost_rule(mod, prj, tmp)
+            var_cost_simple = variable_om_cost_rules[op_type](mod, prj, tmp)
         else:
             var_cost_simple = 0
 
@@ -405,28 +420,12 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         op_type = mod.operational_type[prj]
 
         if prj in mod.STARTUP_COST_SIMPLE_PRJS:
-            if hasattr(
-                imported_operational_modules[op_type], "startup_cost_simple_rule"
-            ):
-                startup_cost_simple = imported_operational_modules[
-                    op_type
-                ].startup_cost_simple_rule(mod, prj, tmp)
-            else:
-                startup_cost_simple = op_type_init.startup_cost_simple_rule(
-                    mod, prj, tmp
-                )
+            startup_cost_simple = startup_cost_simple_rules[op_type](mod, prj, tmp)
         else:
             startup_cost_simple = 0
 
         if prj in mod.STARTUP_BY_ST_PRJS:
-            if hasattr(
-                imported_operational_modules[op_type], "startup_cost_by_st_rule"
-            ):
-                startup_cost_by_st = imported_operational_modules[
-                    op_type
-                ].startup_cost_by_st_rule(mod, prj, tmp)
-            else:
-                startup_cost_by_st = op_type_init.startup_cost_by_st_rule(mod, prj, tmp)
+            startup_cost_by_st = startup_cost_by_st_rules[op_type](mod, prj, tmp)
         else:
             startup_cost_by_st = 0
 
@@ -441,12 +440,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         based on its operational type.
         """
         op_type = mod.operational_type[prj]
-        if hasattr(imported_operational_modules[op_type], "shutdown_cost_rule"):
-            return imported_operational_modules[op_type].shutdown_cost_rule(
-                mod, prj, tmp
-            )
-        else:
-            return op_type_init.shutdown_cost_rule(mod, prj, tmp)
+        return shutdown_cost_rules[op_type](mod, prj, tmp)
 
     m.Shutdown_Cost = Expression(m.SHUTDOWN_COST_PRJ_OPR_TMPS, rule=shutdown_cost_rule)
 
@@ -455,14 +449,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         Get any operational constraint violation costs.
         """
         op_type = mod.operational_type[prj]
-        if hasattr(
-            imported_operational_modules[op_type], "operational_violation_cost_rule"
-        ):
-            return imported_operational_modules[
-                op_type
-            ].operational_violation_cost_rule(mod, prj, tmp)
-        else:
-            return op_type_init.operational_violation_cost_rule(mod, prj, tmp)
+        return operational_violation_cost_rules[op_type](mod, prj, tmp)
 
     m.Operational_Violation_Cost = Expression(
         m.VIOL_ALL_PRJ_OPR_TMPS, rule=operational_violation_cost_rule
@@ -475,12 +462,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         based on its operational type.
         """
         op_type = mod.operational_type[prj]
-        if hasattr(imported_operational_modules[op_type], "curtailment_cost_rule"):
-            return imported_operational_modules[op_type].curtailment_cost_rule(
-                mod, prj, tmp
-            )
-        else:
-            return op_type_init.curtailment_cost_rule(mod, prj, tmp)
+        return curtailment_cost_rules[op_type](mod, prj, tmp)
 
     m.Curtailment_Cost = Expression(
         m.CURTAILMENT_COST_PRJ_OPR_TMPS, rule=curtailment_cost_rule
@@ -493,12 +475,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         based on its operational type.
         """
         op_type = mod.operational_type[prj]
-        if hasattr(imported_operational_modules[op_type], "soc_penalty_cost_rule"):
-            return imported_operational_modules[op_type].soc_penalty_cost_rule(
-                mod, prj, tmp
-            )
-        else:
-            return op_type_init.soc_penalty_cost_rule(mod, prj, tmp)
+        return soc_penalty_cost_rules[op_type](mod, prj, tmp)
 
     m.SOC_Penalty_Cost = Expression(
         m.SOC_PENALTY_COST_PRJ_OPR_TMPS, rule=soc_penalty_cost_rule
@@ -511,14 +488,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         based on its operational type.
         """
         op_type = mod.operational_type[prj]
-        if hasattr(
-            imported_operational_modules[op_type], "soc_last_tmp_penalty_cost_rule"
-        ):
-            return imported_operational_modules[op_type].soc_last_tmp_penalty_cost_rule(
-                mod, prj, tmp
-            )
-        else:
-            return op_type_init.soc_last_tmp_penalty_cost_rule(mod, prj, tmp)
+        return soc_last_tmp_penalty_cost_rules[op_type](mod, prj, tmp)
 
     m.SOC_Penalty_Last_Tmp_Cost = Expression(
         m.SOC_LAST_TMP_PENALTY_COST_PRJ_OPR_TMPS, rule=soc_last_tmp_penalty_cost_rule
@@ -580,15 +550,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (prj, tmp) in m.PRJ_OPR_TMPS
     ]
-    results_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_DF).update(columns=results_columns, data=data)
 
 
 # Database
@@ -613,9 +575,6 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM results_project_costs_operations_agg
         WHERE scenario_id = ?
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Aggregate operational costs by period and load zone
     agg_sql = """
@@ -636,6 +595,8 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         GROUP BY subproblem_id, stage_id, period, load_zone, spinup_or_lookahead
         ORDER BY subproblem_id, stage_id, period, load_zone, spinup_or_lookahead
         ;"""
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[(del_sql, (scenario_id,)), (agg_sql, (scenario_id,))],
     )
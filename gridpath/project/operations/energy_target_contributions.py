@@ -26,15 +26,18 @@ from gridpath.auxiliary.auxiliary import (
     subset_init_by_set_membership,
 )
 from gridpath.auxiliary.db_interface import (
-    update_prj_zone_column,
+    update_prj_zone_columns,
     determine_table_subset_by_start_and_column,
 )
-from gridpath.common_functions import create_results_df
-from gridpath.project.operations.common_functions import load_operational_type_modules
+from gridpath.project.operations.common_functions import (
+    get_operational_type_rules,
+    load_operational_type_modules,
+)
 from gridpath.auxiliary.validations import write_validation_to_database, validate_idxs
-import gridpath.project.operations.operational_types as op_type_init
 from gridpath.project import PROJECT_TIMEPOINT_DF
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -123,6 +126,19 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         required_operational_modules
     )
 
+    rec_provision_rules = get_operational_type_rules(
+        imported_operational_modules, "rec_provision_rule"
+    )
+    scheduled_curtailment_rules = get_operational_type_rules(
+        imported_operational_modules, "scheduled_curtailment_rule"
+    )
+    subhourly_energy_delivered_rules = get_operational_type_rules(
+        imported_operational_modules, "subhourly_energy_delivered_rule"
+    )
+    subhourly_curtailment_rules = get_operational_type_rules(
+        imported_operational_modules, "subhourly_curtailment_rule"
+    )
+
     # Sets
     ###########################################################################
 
@@ -161,12 +177,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         (hourly) schedule.
         """
         op_type = mod.operational_type[prj]
-        if hasattr(imported_operational_modules[op_type], "rec_provision_rule"):
-            return imported_operational_modules[op_type].rec_provision_rule(
-                mod, prj, tmp
-            )
-        else:
-            return op_type_init.rec_provision_rule(mod, prj, tmp)
+        return rec_provision_rules[op_type](mod, prj, tmp)
 
     m.Scheduled_Energy_Target_Energy_MW = Expression(
         m.ENERGY_TARGET_PRJ_OPR_TMPS, rule=scheduled_recs_rule
@@ -179,12 +190,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         curtailment component.
         """
         op_type = mod.operational_type[prj]
-        if hasattr(imported_operational_modules[op_type], "scheduled_curtailment_rule"):
-            return imported_operational_modules[op_type].scheduled_curtailment_rule(
-                mod, prj, tmp
-            )
-        else:
-            return op_type_init.scheduled_curtailment_rule(mod, prj, tmp)
+        return scheduled_curtailment_rules[op_type](mod, prj, tmp)
 
     m.Scheduled_Curtailment_MW = Expression(
         m.ENERGY_TARGET_PRJ_OPR_TMPS, rule=scheduled_curtailment_rule
@@ -196,14 +202,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         dispatch (upward reserve dispatch).
         """
         op_type = mod.operational_type[prj]
-        if hasattr(
-            imported_operational_modules[op_type], "subhourly_energy_delivered_rule"
-        ):
-            return imported_operational_modules[
-                op_type
-            ].subhourly_energy_delivered_rule(mod, prj, tmp)
-        else:
-            return op_type_init.subhourly_energy_delivered_rule(mod, prj, tmp)
+        return subhourly_energy_delivered_rules[op_type](mod, prj, tmp)
 
     m.Subhourly_Energy_Target_Energy_MW = Expression(
         m.ENERGY_TARGET_PRJ_OPR_TMPS, rule=subhourly_recs_delivered_rule
@@ -216,12 +215,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         curtailment component (downward reserve dispatch).
         """
         op_type = mod.operational_type[prj]
-        if hasattr(imported_operational_modules[op_type], "subhourly_curtailment_rule"):
-            return imported_operational_modules[op_type].subhourly_curtailment_rule(
-                mod, prj, tmp
-            )
-        else:
-            return op_type_init.subhourly_curtailment_rule(mod, prj, tmp)
+        return subhourly_curtailment_rules[op_type](mod, prj, tmp)
 
     m.Subhourly_Curtailment_MW = Expression(
         m.ENERGY_TARGET_PRJ_OPR_TMPS, rule=subhourly_curtailment_rule
@@ -299,15 +293,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for (prj, tmp) in m.ENERGY_TARGET_PRJ_OPR_TMPS
     ]
 
-    results_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_DF).update(columns=results_columns, data=data)
 
 
 # Database
@@ -435,16 +421,15 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         conn=db, tbl_start="results_project_", cols=["energy_target_zone"]
     )
 
-    for tbl in tables_to_update:
-        update_prj_zone_column(
-            conn=db,
-            scenario_id=scenario_id,
-            subscenarios=subscenarios,
-            subscenario="project_energy_target_zone_scenario_id",
-            subsc_tbl="inputs_project_energy_target_zones",
-            prj_tbl=tbl,
-            col="energy_target_zone",
-        )
+    update_prj_zone_columns(
+        conn=db,
+        scenario_id=scenario_id,
+        subscenarios=subscenarios,
+        subscenario="project_energy_target_zone_scenario_id",
+        subsc_tbl="inputs_project_energy_target_zones",
+        prj_tbls=tables_to_update,
+        col="energy_target_zone",
+    )
 
 
 # Validation
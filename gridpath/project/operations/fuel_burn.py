@@ -36,8 +36,10 @@ from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules,
     subset_init_by_set_membership,
 )
-from gridpath.project.operations.common_functions import load_operational_type_modules
-import gridpath.project.operations.operational_types as op_type_init
+from gridpath.project.operations.common_functions import (
+    get_operational_type_rules,
+    load_operational_type_modules,
+)
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -167,6 +169,19 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         required_operational_modules
     )
 
+    fuel_burn_rules = get_operational_type_rules(
+        imported_operational_modules, "fuel_burn_rule"
+    )
+    startup_fuel_burn_rules = get_operational_type_rules(
+        imported_operational_modules, "startup_fuel_burn_rule"
+    )
+    fuel_contribution_rules = get_operational_type_rules(
+        imported_operational_modules, "fuel_contribution_rule"
+    )
+    fuel_burn_by_ll_rules = get_operational_type_rules(
+        imported_operational_modules, "fuel_burn_by_ll_rule"
+    )
+
     # Sets
     ###########################################################################
 
@@ -272,12 +287,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         (and whether a project burns fuel)
         """
         op_type = mod.operational_type[prj]
-        if hasattr(imported_operational_modules[op_type], "fuel_burn_rule"):
-            fuel_burn_simple = imported_operational_modules[op_type].fuel_burn_rule(
-                mod, prj, tmp
-            )
-        else:
-            fuel_burn_simple = op_type_init.fuel_burn_rule(mod, prj, tmp)
+        fuel_burn_simple = fuel_burn_rules[op_type](mod, prj, tmp)
 
         return fuel_burn_simple + (
             mod.HR_Curve_Prj_Fuel_Burn[prj, tmp] if prj in mod.HR_CURVE_PRJS else 0
@@ -292,12 +302,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         generator based on its operational type.
         """
         op_type = mod.operational_type[prj]
-        if hasattr(imported_operational_modules[op_type], "startup_fuel_burn_rule"):
-            return imported_operational_modules[op_type].startup_fuel_burn_rule(
-                mod, prj, tmp
-            )
-        else:
-            return op_type_init.startup_fuel_burn_rule(mod, prj, tmp)
+        return startup_fuel_burn_rules[op_type](mod, prj, tmp)
 
     m.Startup_Fuel_Burn_MMBtu = Expression(
         m.STARTUP_FUEL_PRJ_OPR_TMPS, rule=startup_fuel_burn_rule
@@ -326,12 +331,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         Fuel contribution from each fuel project based on operational type.
         """
         op_type = mod.operational_type[prj]
-        if hasattr(imported_operational_modules[op_type], "fuel_contribution_rule"):
-            fuel_contribution = imported_operational_modules[
-                op_type
-            ].fuel_contribution_rule(mod, prj, tmp)
-        else:
-            fuel_contribution = op_type_init.fuel_contribution_rule(mod, prj, tmp)
+        fuel_contribution = fuel_contribution_rules[op_type](mod, prj, tmp)
 
         return fuel_contribution
 
@@ -375,12 +375,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         at very inefficient operating points.
         """
         gen_op_type = mod.operational_type[prj]
-        if hasattr(imported_operational_modules[gen_op_type], "fuel_burn_by_ll_rule"):
-            fuel_burn_by_ll = imported_operational_modules[
-                gen_op_type
-            ].fuel_burn_by_ll_rule(mod, prj, tmp, s)
-        else:
-            fuel_burn_by_ll = op_type_init.fuel_burn_by_ll_rule(mod, prj, tmp, s)
+        fuel_burn_by_ll = fuel_burn_by_ll_rules[gen_op_type](mod, prj, tmp, s)
 
         return mod.HR_Curve_Prj_Fuel_Burn[prj, tmp] >= fuel_burn_by_ll
 
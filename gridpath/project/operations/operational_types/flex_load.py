@@ -44,7 +44,6 @@ from gridpath.project.operations.operational_types.common_functions import (
     validate_opchars,
     write_tab_file_model_inputs,
 )
-from gridpath.common_functions import create_results_df
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -569,13 +568,7 @@ def add_to_prj_tmp_results(mod):
         for (prj, tmp) in mod.FLEX_LOAD_OPR_TMPS
     ]
 
-    optype_dispatch_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, optype_dispatch_df
+    return results_columns, data
 
 
 def export_results(mod, d, scenario_directory, subproblem, stage):
@@ -47,9 +47,10 @@ Morales-Espana et al. (2013).
 from gridpath.project.operations.operational_types.common_functions import (
     validate_opchars,
 )
-from gridpath.common_functions import create_results_df
 import gridpath.project.operations.operational_types.gen_commit_unit_common as gen_commit_unit_common
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -250,27 +251,13 @@ def add_to_prj_tmp_results(mod):
         Bin_or_Lin="Bin",
     )
 
-    # Create DF
-    optype_dispatch_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    # Get the duals
-    optype_duals_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=duals_results_columns,
-        data=duals_data,
-    )
-
-    # Add duals to dispatch DF
+    # Add the duals to the dispatch results
+    duals_by_index = {(row[0], row[1]): row[2:] for row in duals_data}
+    no_duals = [None] * len(duals_results_columns)
+    data = [row + duals_by_index.get((row[0], row[1]), no_duals) for row in data]
     results_columns += duals_results_columns
-    for column in duals_results_columns:
-        optype_dispatch_df[column] = None
-    optype_dispatch_df.update(optype_duals_df)
 
-    return results_columns, optype_dispatch_df
+    return results_columns, data
 
 
 def export_results(mod, d, scenario_directory, subproblem, stage):
@@ -54,6 +54,7 @@ from pyomo.environ import (
     Set,
     Constraint,
     Param,
+    NonNegativeIntegers,
     NonNegativeReals,
     NonPositiveReals,
     PercentFraction,
@@ -73,11 +74,12 @@ from gridpath.project.operations.operational_types.common_functions import (
     check_for_tmps_to_link,
     validate_opchars,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project.common_functions import (
     check_if_boundary_type_and_first_timepoint,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -100,6 +102,18 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     | Two-dimensional set with generators of the :code:`gen_commit_cap`       |
     | operational type and their linked timepoints.                           |
     +-------------------------------------------------------------------------+
+    | | :code:`GEN_COMMIT_CAP_INTEGER`                                        |
+    |                                                                         |
+    | The set of generators of the :code:`gen_commit_cap` operational type    |
+    | whose committed capacity must be a whole number of units, e.g. the      |
+    | clusters of identical units created with the                            |
+    | :code:`--aggregate_identical_units` option of get_scenario_inputs.      |
+    +-------------------------------------------------------------------------+
+    | | :code:`GEN_COMMIT_CAP_INTEGER_OPR_TMPS`                               |
+    |                                                                         |
+    | Two-dimensional set with the generators in                              |
+    | :code:`GEN_COMMIT_CAP_INTEGER` and their operational timepoints.        |
+    +-------------------------------------------------------------------------+
 
     |
 
@@ -293,6 +307,12 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     |                                                                         |
     | The amount of capacity shut down (in MW).                               |
     +-------------------------------------------------------------------------+
+    | | :code:`GenCommitCap_Units_On`                                         |
+    | | *Within*: :code:`NonNegativeIntegers`                                 |
+    | | *Defined over*: :code:`GEN_COMMIT_CAP_INTEGER_OPR_TMPS`               |
+    |                                                                         |
+    | The number of units committed.                                          |
+    +-------------------------------------------------------------------------+
 
     |
 
@@ -316,6 +336,12 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     |                                                                         |
     | Limits committed capacity to the available capacity.                    |
     +-------------------------------------------------------------------------+
+    | | :code:`GenCommitCap_Integer_Units_Constraint`                         |
+    | | *Defined over*: :code:`GEN_COMMIT_CAP_INTEGER_OPR_TMPS`               |
+    |                                                                         |
+    | Sets the committed capacity to the number of units committed times the  |
+    | unit size.                                                              |
+    +-------------------------------------------------------------------------+
     | | :code:`GenCommitCap_Max_Power_Constraint`                             |
     | | *Defined over*: :code:`GEN_COMMIT_CAP_OPR_TMPS`                       |
     |                                                                         |
@@ -424,6 +450,19 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
 
     m.GEN_COMMIT_CAP_LINKED_TMPS = Set(dimen=2)
 
+    m.GEN_COMMIT_CAP_INTEGER = Set(within=m.GEN_COMMIT_CAP)
+
+    m.GEN_COMMIT_CAP_INTEGER_OPR_TMPS = Set(
+        dimen=2,
+        within=m.GEN_COMMIT_CAP_OPR_TMPS,
+        initialize=lambda mod: subset_init_by_set_membership(
+            mod=mod,
+            superset="GEN_COMMIT_CAP_OPR_TMPS",
+            index=0,
+            membership_set=mod.GEN_COMMIT_CAP_INTEGER,
+        ),
+    )
+
     # Required Params
     ###########################################################################
     m.gen_commit_cap_unit_size_mw = Param(m.GEN_COMMIT_CAP, within=NonNegativeReals)
@@ -521,6 +560,11 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     m.GenCommitCap_Startup_MW = Var(m.GEN_COMMIT_CAP_OPR_TMPS, within=NonNegativeReals)
     m.GenCommitCap_Shutdown_MW = Var(m.GEN_COMMIT_CAP_OPR_TMPS, within=NonNegativeReals)
 
+    # Number of units committed for projects with integer commitment
+    m.GenCommitCap_Units_On = Var(
+        m.GEN_COMMIT_CAP_INTEGER_OPR_TMPS, within=NonNegativeIntegers
+    )
+
     # Expressions
     ###########################################################################
     # TODO: the reserve rules are the same in all modules, so should be
@@ -551,6 +595,10 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         m.GEN_COMMIT_CAP_OPR_TMPS, rule=commit_capacity_constraint_rule
     )
 
+    m.GenCommitCap_Integer_Units_Constraint = Constraint(
+        m.GEN_COMMIT_CAP_INTEGER_OPR_TMPS, rule=integer_units_constraint_rule
+    )
+
     m.GenCommitCap_Max_Power_Constraint = Constraint(
         m.GEN_COMMIT_CAP_OPR_TMPS, rule=max_power_rule
     )
@@ -643,6 +691,19 @@ def commit_capacity_constraint_rule(mod, g, tmp):
     )
 
 
+def integer_units_constraint_rule(mod, g, tmp):
+    """
+    **Constraint Name**: GenCommitCap_Integer_Units_Constraint
+    **Enforced Over**: GEN_COMMIT_CAP_INTEGER_OPR_TMPS
+
+    Committed capacity is a whole number of units.
+    """
+    return (
+        mod.Commit_Capacity_MW[g, tmp]
+        == mod.GenCommitCap_Units_On[g, tmp] * mod.gen_commit_cap_unit_size_mw[g]
+    )
+
+
 def max_power_rule(mod, g, tmp):
     """
     **Constraint Name**: GenCommitCap_Max_Power_Constraint
@@ -1411,6 +1472,20 @@ def load_model_data(mod, d, data_portal, scenario_directory, subproblem, stage):
         op_type="gen_commit_cap",
     )
 
+    # Projects with integer commitment (if any)
+    integer_projects_filename = os.path.join(
+        scenario_directory,
+        str(subproblem),
+        str(stage),
+        "inputs",
+        "gen_commit_cap_integer_projects.tab",
+    )
+    if os.path.exists(integer_projects_filename):
+        data_portal.load(
+            filename=integer_projects_filename,
+            set=mod.GEN_COMMIT_CAP_INTEGER,
+        )
+
     # Linked timepoint params
     linked_inputs_filename = os.path.join(
         scenario_directory,
@@ -1457,13 +1532,7 @@ def add_to_prj_tmp_results(mod):
         for (prj, tmp) in mod.GEN_COMMIT_CAP_OPR_TMPS
     ]
 
-    optype_dispatch_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, optype_dispatch_df
+    return results_columns, data
 
 
 def export_results(mod, d, scenario_directory, subproblem, stage):
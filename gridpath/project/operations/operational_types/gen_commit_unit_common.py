@@ -46,7 +46,9 @@ Morales-Espana et al. (2013).
 
 
 import csv
+from functools import lru_cache
 import os.path
+from types import SimpleNamespace
 from pyomo.environ import (
     Var,
     Set,
@@ -63,6 +65,7 @@ import warnings
 
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import (
+    get_constraint_duals,
     subset_init_by_param_value,
     subset_init_by_set_membership,
 )
@@ -81,6 +84,123 @@ from gridpath.project.common_functions import (
 )
 
 
+# Component Names and Lookups
+###############################################################################
+
+
+@lru_cache(maxsize=None)
+def get_component_names(Bin_or_Lin):
+    """
+    :param Bin_or_Lin: 'Bin' or 'Lin'
+    :return: namespace with the names of the components of the
+        gen_commit_bin or gen_commit_lin operational type
+
+    The names are formatted once per operational type rather than each time
+    a rule is called.
+    """
+    BIN_OR_LIN = Bin_or_Lin.upper()
+    bin_or_lin = Bin_or_Lin.lower()
+    return SimpleNamespace(
+        active_startup_type=f"GenCommit{Bin_or_Lin}_Active_Startup_Type",
+        auxiliary_consumption_mw=f"GenCommit{Bin_or_Lin}_Auxiliary_Consumption_MW",
+        startup_by_st_prjs=f"GEN_COMMIT_{BIN_OR_LIN}_STARTUP_BY_ST_PRJS",
+        startup_by_st_prjs_types=f"GEN_COMMIT_{BIN_OR_LIN}_STARTUP_BY_ST_PRJS_TYPES",
+        str_types_by_prj=f"GEN_COMMIT_{BIN_OR_LIN}_STR_TYPES_BY_PRJ",
+        commit=f"GenCommit{Bin_or_Lin}_Commit",
+        downwards_reserves_mw=f"GenCommit{Bin_or_Lin}_Downwards_Reserves_MW",
+        min_down_time_violation=f"GenCommit{Bin_or_Lin}_Min_Down_Time_Violation",
+        min_up_time_violation=f"GenCommit{Bin_or_Lin}_Min_Up_Time_Violation",
+        pmax_mw=f"GenCommit{Bin_or_Lin}_Pmax_MW",
+        pmin_mw=f"GenCommit{Bin_or_Lin}_Pmin_MW",
+        provide_power_above_pmin_mw=f"GenCommit{Bin_or_Lin}_Provide_Power_Above_Pmin_MW",
+        provide_power_mw=f"GenCommit{Bin_or_Lin}_Provide_Power_MW",
+        provide_power_shutdown_mw=f"GenCommit{Bin_or_Lin}_Provide_Power_Shutdown_MW",
+        provide_power_startup_by_st_mw=f"GenCommit{Bin_or_Lin}_Provide_Power_Startup_By_ST_MW",
+        provide_power_startup_mw=f"GenCommit{Bin_or_Lin}_Provide_Power_Startup_MW",
+        ramp_down_rate_mw_per_tmp=f"GenCommit{Bin_or_Lin}_Ramp_Down_Rate_MW_Per_Tmp",
+        ramp_down_violation_mw=f"GenCommit{Bin_or_Lin}_Ramp_Down_Violation_MW",
+        ramp_up_rate_mw_per_tmp=f"GenCommit{Bin_or_Lin}_Ramp_Up_Rate_MW_Per_Tmp",
+        ramp_up_violation_mw=f"GenCommit{Bin_or_Lin}_Ramp_Up_Violation_MW",
+        shutdown=f"GenCommit{Bin_or_Lin}_Shutdown",
+        shutdown_ramp_rate_mw_per_tmp=f"GenCommit{Bin_or_Lin}_Shutdown_Ramp_Rate_MW_Per_Tmp",
+        startup=f"GenCommit{Bin_or_Lin}_Startup",
+        startup_ramp_rate_by_st_mw_per_tmp=f"GenCommit{Bin_or_Lin}_Startup_Ramp_Rate_By_ST_MW_Per_Tmp",
+        startup_type=f"GenCommit{Bin_or_Lin}_Startup_Type",
+        synced=f"GenCommit{Bin_or_Lin}_Synced",
+        upwards_reserves_mw=f"GenCommit{Bin_or_Lin}_Upwards_Reserves_MW",
+        allow_min_down_time_violation=f"gen_commit_{bin_or_lin}_allow_min_down_time_violation",
+        allow_min_up_time_violation=f"gen_commit_{bin_or_lin}_allow_min_up_time_violation",
+        allow_ramp_down_violation=f"gen_commit_{bin_or_lin}_allow_ramp_down_violation",
+        allow_ramp_up_violation=f"gen_commit_{bin_or_lin}_allow_ramp_up_violation",
+        allow_startup_shutdown_power=f"gen_commit_{bin_or_lin}_allow_startup_shutdown_power",
+        aux_consumption_frac_capacity=f"gen_commit_{bin_or_lin}_aux_consumption_frac_capacity",
+        aux_consumption_frac_power=f"gen_commit_{bin_or_lin}_aux_consumption_frac_power",
+        down_time_cutoff_hours=f"gen_commit_{bin_or_lin}_down_time_cutoff_hours",
+        linked_commit=f"gen_commit_{bin_or_lin}_linked_commit",
+        linked_downwards_reserves=f"gen_commit_{bin_or_lin}_linked_downwards_reserves",
+        linked_power_above_pmin=f"gen_commit_{bin_or_lin}_linked_power_above_pmin",
+        linked_provide_power_shutdown_mw=f"gen_commit_{bin_or_lin}_linked_provide_power_shutdown_mw",
+        linked_provide_power_startup_by_st_mw=f"gen_commit_{bin_or_lin}_linked_provide_power_startup_by_st_mw",
+        linked_ramp_down_rate_mw_per_tmp=f"gen_commit_{bin_or_lin}_linked_ramp_down_rate_mw_per_tmp",
+        linked_ramp_up_rate_mw_per_tmp=f"gen_commit_{bin_or_lin}_linked_ramp_up_rate_mw_per_tmp",
+        linked_shutdown=f"gen_commit_{bin_or_lin}_linked_shutdown",
+        linked_shutdown_ramp_rate_mw_per_tmp=f"gen_commit_{bin_or_lin}_linked_shutdown_ramp_rate_mw_per_tmp",
+        linked_startup=f"gen_commit_{bin_or_lin}_linked_startup",
+        linked_startup_ramp_rate_by_st_mw_per_tmp=f"gen_commit_{bin_or_lin}_linked_startup_ramp_rate_by_st_mw_per_tmp",
+        linked_upwards_reserves=f"gen_commit_{bin_or_lin}_linked_upwards_reserves",
+        min_down_time_hours=f"gen_commit_{bin_or_lin}_min_down_time_hours",
+        min_stable_level_fraction=f"gen_commit_{bin_or_lin}_min_stable_level_fraction",
+        min_up_time_hours=f"gen_commit_{bin_or_lin}_min_up_time_hours",
+        partial_availability_threshold=f"gen_commit_{bin_or_lin}_partial_availability_threshold",
+        ramp_down_when_on_rate=f"gen_commit_{bin_or_lin}_ramp_down_when_on_rate",
+        ramp_up_when_on_rate=f"gen_commit_{bin_or_lin}_ramp_up_when_on_rate",
+        shutdown_plus_ramp_down_rate=f"gen_commit_{bin_or_lin}_shutdown_plus_ramp_down_rate",
+        startup_plus_ramp_up_rate_by_st=f"gen_commit_{bin_or_lin}_startup_plus_ramp_up_rate_by_st",
+    )
+
+
+class ComponentLookup(object):
+    """
+    The components of the gen_commit_bin or gen_commit_lin operational type
+    in a model. Each component is looked up by name the first time it is
+    accessed and then kept as an attribute.
+    """
+
+    def __init__(self, mod, names):
+        self._mod = mod
+        self._names = names
+
+    def __getattr__(self, attr):
+        # Private and special attributes (e.g. when copying) are not
+        # components
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        component = getattr(self._mod, getattr(self._names, attr))
+        setattr(self, attr, component)
+        return component
+
+
+def get_components(mod, Bin_or_Lin):
+    """
+    :param mod: the model
+    :param Bin_or_Lin: 'Bin' or 'Lin'
+    :return: the ComponentLookup of the operational type in the model
+
+    The lookup is created once per model and operational type, so the rules
+    below that are called for each index don't look up their components by
+    name each time.
+    """
+    lookups = getattr(mod, "_gen_commit_component_lookups", None)
+    if lookups is None:
+        lookups = dict()
+        mod._gen_commit_component_lookups = lookups
+    if Bin_or_Lin not in lookups:
+        lookups[Bin_or_Lin] = ComponentLookup(
+            mod=mod, names=get_component_names(Bin_or_Lin)
+        )
+    return lookups[Bin_or_Lin]
+
+
 def add_model_components(
     m, d, scenario_directory, subproblem, stage, bin_or_lin_optype
 ):
@@ -134,6 +254,22 @@ def add_model_components(
     | project is in :code:`GEN_COMMIT_BIN_STARTUP_BY_ST_PRJS` or              |
     | :code:`GEN_COMMIT_LIN_STARTUP_BY_ST_PRJS` respectively).                |
     +-------------------------------------------------------------------------+
+    | | :code:`GEN_COMMIT_BIN_RAMP_UP_VIOL_OPR_TMPS`                          |
+    | | :code:`GEN_COMMIT_BIN_RAMP_DOWN_VIOL_OPR_TMPS`                        |
+    | | :code:`GEN_COMMIT_BIN_MIN_UP_TIME_VIOL_OPR_TMPS`                      |
+    | | :code:`GEN_COMMIT_BIN_MIN_DOWN_TIME_VIOL_OPR_TMPS`                    |
+    | | *within*: :code:`GEN_COMMIT_BIN_OPR_TMPS`                             |
+    |                                                                         |
+    | | :code:`GEN_COMMIT_LIN_RAMP_UP_VIOL_OPR_TMPS`                          |
+    | | :code:`GEN_COMMIT_LIN_RAMP_DOWN_VIOL_OPR_TMPS`                        |
+    | | :code:`GEN_COMMIT_LIN_MIN_UP_TIME_VIOL_OPR_TMPS`                      |
+    | | :code:`GEN_COMMIT_LIN_MIN_DOWN_TIME_VIOL_OPR_TMPS`                    |
+    | | *within*: :code:`GEN_COMMIT_LIN_OPR_TMPS`                             |
+    |                                                                         |
+    | The operational timepoints of the projects that are allowed to violate  |
+    | the respective constraint; the violation variables are only defined     |
+    | over these.                                                             |
+    +-------------------------------------------------------------------------+
     | | :code:`GEN_COMMIT_BIN_STR_TYPES_BY_PRJ`                               |
     | | *Defined over*: :code:`GEN_COMMIT_BIN`                                |
     |                                                                         |
@@ -608,44 +744,44 @@ def add_model_components(
     +-------------------------------------------------------------------------+
     | | :code:`GenCommitBin_Ramp_Up_Violation_MW`                             |
     | | *Within*: :code:`NonNegativeReals`                                    |
-    | | *Defined over*: :code:`GEN_COMMIT_BIN_OPR_TMPS`                       |
+    | | *Defined over*: :code:`GEN_COMMIT_BIN_RAMP_UP_VIOL_OPR_TMPS`          |
     |                                                                         |
     | | :code:`GenCommitLin_Ramp_Up_Violation_MW`                             |
     | | *Within*: :code:`NonNegativeReals`                                    |
-    | | *Defined over*: :code:`GEN_COMMIT_LIN_OPR_TMPS`                       |
+    | | *Defined over*: :code:`GEN_COMMIT_LIN_RAMP_UP_VIOL_OPR_TMPS`          |
     |                                                                         |
     | Violation of the project's ramp up constraint in each operational       |
     | timepoint.                                                              |
     +-------------------------------------------------------------------------+
     | | :code:`GenCommitBin_Ramp_Down_Violation_MW`                           |
     | | *Within*: :code:`NonNegativeReals`                                    |
-    | | *Defined over*: :code:`GEN_COMMIT_BIN_OPR_TMPS`                       |
+    | | *Defined over*: :code:`GEN_COMMIT_BIN_RAMP_DOWN_VIOL_OPR_TMPS`        |
     |                                                                         |
     | | :code:`GenCommitLin_Ramp_Down_Violation_MW`                           |
     | | *Within*: :code:`NonNegativeReals`                                    |
-    | | *Defined over*: :code:`GEN_COMMIT_LIN_OPR_TMPS`                       |
+    | | *Defined over*: :code:`GEN_COMMIT_LIN_RAMP_DOWN_VIOL_OPR_TMPS`        |
     |                                                                         |
     | Violation of the project's ramp down constraint in each operational     |
     | timepoint.                                                              |
     +-------------------------------------------------------------------------+
     | | :code:`GenCommitBin_Min_Up_Time_Violation`                            |
     | | *Within*: :code:`NonNegativeReals`                                    |
-    | | *Defined over*: :code:`GEN_COMMIT_BIN_OPR_TMPS`                       |
+    | | *Defined over*: :code:`GEN_COMMIT_BIN_MIN_UP_TIME_VIOL_OPR_TMPS`      |
     |                                                                         |
     | | :code:`GenCommitLin_Min_Up_Time_Violation`                            |
     | | *Within*: :code:`NonNegativeReals`                                    |
-    | | *Defined over*: :code:`GEN_COMMIT_LIN_OPR_TMPS`                       |
+    | | *Defined over*: :code:`GEN_COMMIT_LIN_MIN_UP_TIME_VIOL_OPR_TMPS`      |
     |                                                                         |
     | Violation of the project's min up time constraint in each operational   |
     | timepoint.                                                              |
     +-------------------------------------------------------------------------+
     | | :code:`GenCommitBin_Min_Down_Time_Violation`                          |
     | | *Within*: :code:`NonNegativeReals`                                    |
-    | | *Defined over*: :code:`GEN_COMMIT_BIN_OPR_TMPS`                       |
+    | | *Defined over*: :code:`GEN_COMMIT_BIN_MIN_DOWN_TIME_VIOL_OPR_TMPS`    |
     |                                                                         |
     | | :code:`GenCommitLin_Min_Down_Time_Violation`                          |
     | | *Within*: :code:`NonNegativeReals`                                    |
-    | | *Defined over*: :code:`GEN_COMMIT_LIN_OPR_TMPS`                       |
+    | | *Defined over*: :code:`GEN_COMMIT_LIN_MIN_DOWN_TIME_VIOL_OPR_TMPS`    |
     |                                                                         |
     | Violation of the project's min down time constraint in each operational |
     | timepoint.                                                              |
@@ -984,6 +1120,17 @@ def add_model_components(
             )
         )
 
+    def get_violation(allow_violation, violation, g, tmp):
+        """
+        The project's violation variable in the timepoint or 0 if the project
+        is not allowed to violate the constraint (the violation variables are
+        only defined for the projects that are)
+        """
+        if allow_violation[g]:
+            return violation[g, tmp]
+        else:
+            return 0
+
     # Sets
     ###########################################################################
 
@@ -1064,14 +1211,9 @@ def add_model_components(
         Get indexed set of startup types by project, ordered from hottest to
         coldest.
         """
+        components = get_components(mod, Bin_or_Lin)
         types = sorted(
-            [
-                s
-                for (_g, s) in getattr(
-                    mod, "GEN_COMMIT_{}_STARTUP_BY_ST_PRJS_TYPES".format(BIN_OR_LIN)
-                )
-                if g == _g
-            ]
+            [s for (_g, s) in components.startup_by_st_prjs_types if g == _g]
         )
         return types
 
@@ -1268,6 +1410,28 @@ def add_model_components(
         ),
     )
 
+    # The violation variables are only defined for the projects that are
+    # allowed to violate the respective constraint
+    def viol_opr_tmps_init(allow_violation_param):
+        return lambda mod: [
+            (g, tmp)
+            for (g, tmp) in getattr(mod, "GEN_COMMIT_{}_OPR_TMPS".format(BIN_OR_LIN))
+            if getattr(mod, allow_violation_param)[g]
+        ]
+
+    for viol_type in ["ramp_up", "ramp_down", "min_up_time", "min_down_time"]:
+        setattr(
+            m,
+            "GEN_COMMIT_{}_{}_VIOL_OPR_TMPS".format(BIN_OR_LIN, viol_type.upper()),
+            Set(
+                dimen=2,
+                within=getattr(m, "GEN_COMMIT_{}_OPR_TMPS".format(BIN_OR_LIN)),
+                initialize=viol_opr_tmps_init(
+                    "gen_commit_{}_allow_{}_violation".format(bin_or_lin, viol_type)
+                ),
+            ),
+        )
+
     # Linked Params
     ###########################################################################
 
@@ -1458,7 +1622,7 @@ def add_model_components(
         m,
         "GenCommit{}_Ramp_Up_Violation_MW".format(Bin_or_Lin),
         Var(
-            getattr(m, "GEN_COMMIT_{}_OPR_TMPS".format(BIN_OR_LIN)),
+            getattr(m, "GEN_COMMIT_{}_RAMP_UP_VIOL_OPR_TMPS".format(BIN_OR_LIN)),
             within=NonNegativeReals,
             initialize=0,
         ),
@@ -1468,7 +1632,7 @@ def add_model_components(
         m,
         "GenCommit{}_Ramp_Down_Violation_MW".format(Bin_or_Lin),
         Var(
-            getattr(m, "GEN_COMMIT_{}_OPR_TMPS".format(BIN_OR_LIN)),
+            getattr(m, "GEN_COMMIT_{}_RAMP_DOWN_VIOL_OPR_TMPS".format(BIN_OR_LIN)),
             within=NonNegativeReals,
             initialize=0,
         ),
@@ -1478,7 +1642,7 @@ def add_model_components(
         m,
         "GenCommit{}_Min_Up_Time_Violation".format(Bin_or_Lin),
         Var(
-            getattr(m, "GEN_COMMIT_{}_OPR_TMPS".format(BIN_OR_LIN)),
+            getattr(m, "GEN_COMMIT_{}_MIN_UP_TIME_VIOL_OPR_TMPS".format(BIN_OR_LIN)),
             within=NonNegativeReals,
             initialize=0,
         ),
@@ -1488,7 +1652,7 @@ def add_model_components(
         m,
         "GenCommit{}_Min_Down_Time_Violation".format(Bin_or_Lin),
         Var(
-            getattr(m, "GEN_COMMIT_{}_OPR_TMPS".format(BIN_OR_LIN)),
+            getattr(m, "GEN_COMMIT_{}_MIN_DOWN_TIME_VIOL_OPR_TMPS".format(BIN_OR_LIN)),
             within=NonNegativeReals,
             initialize=0,
         ),
@@ -1517,12 +1681,11 @@ def add_model_components(
         **Expression Name**: GenCommitBin_Pmin_MW
         **Defined Over**: GEN_COMMIT_BIN_OPR_TMPS
         """
+        components = get_components(mod, Bin_or_Lin)
         return (
             mod.Capacity_MW[g, mod.period[tmp]]
             * mod.Availability_Derate[g, tmp]
-            * getattr(
-                mod, "gen_commit_{}_min_stable_level_fraction".format(bin_or_lin)
-            )[g]
+            * components.min_stable_level_fraction[g]
         )
 
     setattr(
@@ -1538,13 +1701,10 @@ def add_model_components(
         **Expression Name**: GenCommitBin_Provide_Power_Startup_MW
         **Defined Over**: GEN_COMMIT_BIN_OPR_TMPS
         """
+        components = get_components(mod, Bin_or_Lin)
         return sum(
-            getattr(
-                mod, "GenCommit{}_Provide_Power_Startup_By_ST_MW".format(Bin_or_Lin)
-            )[g, tmp, s]
-            for s in getattr(mod, "GEN_COMMIT_{}_STR_TYPES_BY_PRJ".format(BIN_OR_LIN))[
-                g
-            ]
+            components.provide_power_startup_by_st_mw[g, tmp, s]
+            for s in components.str_types_by_prj[g]
         )
 
     setattr(
@@ -1561,18 +1721,12 @@ def add_model_components(
         **Expression Name**: GenCommitBin_Provide_Power_MW
         **Defined Over**: GEN_COMMIT_BIN_OPR_TMPS
         """
+        components = get_components(mod, Bin_or_Lin)
         return (
-            getattr(mod, "GenCommit{}_Provide_Power_Above_Pmin_MW".format(Bin_or_Lin))[
-                g, tmp
-            ]
-            + getattr(mod, "GenCommit{}_Pmin_MW".format(Bin_or_Lin))[g, tmp]
-            * getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp]
-            + getattr(mod, "GenCommit{}_Provide_Power_Startup_MW".format(Bin_or_Lin))[
-                g, tmp
-            ]
-            + getattr(mod, "GenCommit{}_Provide_Power_Shutdown_MW".format(Bin_or_Lin))[
-                g, tmp
-            ]
+            components.provide_power_above_pmin_mw[g, tmp]
+            + components.pmin_mw[g, tmp] * components.commit[g, tmp]
+            + components.provide_power_startup_mw[g, tmp]
+            + components.provide_power_shutdown_mw[g, tmp]
         )
 
     setattr(
@@ -1601,10 +1755,11 @@ def add_model_components(
             * minutes per hour [min/hour]
             = ramp up rate [MW/timepoint]
         """
+        components = get_components(mod, Bin_or_Lin)
         return (
             mod.Capacity_MW[g, mod.period[tmp]]
             * mod.Availability_Derate[g, tmp]
-            * getattr(mod, "gen_commit_{}_ramp_up_when_on_rate".format(bin_or_lin))[g]
+            * components.ramp_up_when_on_rate[g]
             * mod.hrs_in_tmp[tmp]
             * 60
         )  # convert min to hours
@@ -1635,10 +1790,11 @@ def add_model_components(
             * minutes per hour [min/hour]
             = ramp down rate [MW/timepoint]
         """
+        components = get_components(mod, Bin_or_Lin)
         return (
             mod.Capacity_MW[g, mod.period[tmp]]
             * mod.Availability_Derate[g, tmp]
-            * getattr(mod, "gen_commit_{}_ramp_down_when_on_rate".format(bin_or_lin))[g]
+            * components.ramp_down_when_on_rate[g]
             * mod.hrs_in_tmp[tmp]
             * 60
         )  # convert min to hours
@@ -1657,14 +1813,12 @@ def add_model_components(
         **Expression Name**: GenCommitBin_Startup_Ramp_Rate_By_ST_MW_Per_Tmp
         **Defined Over**: GEN_COMMIT_BIN_OPR_TMPS_STR_TYPES
         """
+        components = get_components(mod, Bin_or_Lin)
         return (
             mod.Capacity_MW[g, mod.period[tmp]]
             * mod.Availability_Derate[g, tmp]
             * min(
-                getattr(
-                    mod,
-                    "gen_commit_{}_startup_plus_ramp_up_rate_by_st".format(bin_or_lin),
-                )[g, s]
+                components.startup_plus_ramp_up_rate_by_st[g, s]
                 * mod.hrs_in_tmp[tmp]
                 * 60,
                 1,
@@ -1685,15 +1839,12 @@ def add_model_components(
         **Expression Name**: GenCommitBin_Shutdown_Ramp_Rate_MW_Per_Tmp
         **Defined Over**: GEN_COMMIT_BIN_OPR_TMPS
         """
+        components = get_components(mod, Bin_or_Lin)
         return (
             mod.Capacity_MW[g, mod.period[tmp]]
             * mod.Availability_Derate[g, tmp]
             * min(
-                getattr(
-                    mod, "gen_commit_{}_shutdown_plus_ramp_down_rate".format(bin_or_lin)
-                )[g]
-                * mod.hrs_in_tmp[tmp]
-                * 60,
+                components.shutdown_plus_ramp_down_rate[g] * mod.hrs_in_tmp[tmp] * 60,
                 1,
             )
         )
@@ -1712,11 +1863,10 @@ def add_model_components(
         **Expression Name**: GenCommitBin_Active_Startup_Type
         **Defined Over**: GEN_COMMIT_BIN_OPR_TMPS
         """
+        components = get_components(mod, Bin_or_Lin)
         return sum(
-            getattr(mod, "GenCommit{}_Startup_Type".format(Bin_or_Lin))[g, tmp, s] * s
-            for s in getattr(mod, "GEN_COMMIT_{}_STR_TYPES_BY_PRJ".format(BIN_OR_LIN))[
-                g
-            ]
+            components.startup_type[g, tmp, s] * s
+            for s in components.str_types_by_prj[g]
         )
 
     setattr(
@@ -1757,17 +1907,14 @@ def add_model_components(
         **Expression Name**: GenCommitBin_Auxiliary_Consumption_MW
         **Defined Over**: GEN_COMMIT_BIN_OPR_TMPS
         """
+        components = get_components(mod, Bin_or_Lin)
         return (
             mod.Capacity_MW[g, mod.period[tmp]]
             * mod.Availability_Derate[g, tmp]
-            * getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp]
-            * getattr(
-                mod, "gen_commit_{}_aux_consumption_frac_capacity".format(bin_or_lin)
-            )[g]
-            + getattr(mod, "GenCommit{}_Provide_Power_MW".format(Bin_or_Lin))[g, tmp]
-            * getattr(
-                mod, "gen_commit_{}_aux_consumption_frac_power".format(bin_or_lin)
-            )[g]
+            * components.commit[g, tmp]
+            * components.aux_consumption_frac_capacity[g]
+            + components.provide_power_mw[g, tmp]
+            * components.aux_consumption_frac_power[g]
         )
 
     setattr(
@@ -1812,13 +1959,9 @@ def add_model_components(
         unlikely to have availabilities lower than this and the number is scaled
         appropriately to avoid numerical issues.
         """
-        return getattr(mod, "GenCommit{}_Synced".format(Bin_or_Lin))[
-            g, tmp
-        ] <= mod.Availability_Derate[g, tmp] + (
-            1
-            - getattr(
-                mod, "gen_commit_{}_partial_availability_threshold".format(bin_or_lin)
-            )[g]
+        components = get_components(mod, Bin_or_Lin)
+        return components.synced[g, tmp] <= mod.Availability_Derate[g, tmp] + (
+            1 - components.partial_availability_threshold[g]
         )
 
     setattr(
@@ -1844,14 +1987,10 @@ def add_model_components(
         unlikely to have availabilities lower than this and the number is scaled
         appropriately to avoid numerical issues.
         """
+        components = get_components(mod, Bin_or_Lin)
 
-        return getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[
-            g, tmp
-        ] <= mod.Availability_Derate[g, tmp] + (
-            1
-            - getattr(
-                mod, "gen_commit_{}_partial_availability_threshold".format(bin_or_lin)
-            )[g]
+        return components.commit[g, tmp] <= mod.Availability_Derate[g, tmp] + (
+            1 - components.partial_availability_threshold[g]
         )
 
     setattr(
@@ -1875,6 +2014,7 @@ def add_model_components(
         where Pmin would be zero need to be treated differently to avoid
         zero-division errors.
         """
+        components = get_components(mod, Bin_or_Lin)
         # If min stable level Pmin expression is exogenously specified as
         # zero, whether due to the min stable level fraction, availability,
         # or capacity being zero, there will be no startup/shutdown power
@@ -1889,26 +2029,18 @@ def add_model_components(
                 mod.availability_type[g] == "exogenous"
                 and mod.avl_exog_cap_derate[g, tmp] == 0
             )
-            or getattr(
-                mod, "gen_commit_{}_min_stable_level_fraction".format(bin_or_lin)
-            )[g]
-            == 0
+            or components.min_stable_level_fraction[g] == 0
         ):
             startup_shutdown_fraction = 0
         else:
             startup_shutdown_fraction = (
-                getattr(mod, "GenCommit{}_Provide_Power_Startup_MW".format(Bin_or_Lin))[
-                    g, tmp
-                ]
-                + getattr(
-                    mod, "GenCommit{}_Provide_Power_Shutdown_MW".format(Bin_or_Lin)
-                )[g, tmp]
-            ) / getattr(mod, "GenCommit{}_Pmin_MW".format(Bin_or_Lin))[g, tmp]
+                components.provide_power_startup_mw[g, tmp]
+                + components.provide_power_shutdown_mw[g, tmp]
+            ) / components.pmin_mw[g, tmp]
 
         return (
-            getattr(mod, "GenCommit{}_Synced".format(Bin_or_Lin))[g, tmp]
-            >= getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp]
-            + startup_shutdown_fraction
+            components.synced[g, tmp]
+            >= components.commit[g, tmp] + startup_shutdown_fraction
         )
 
     setattr(
@@ -1935,6 +2067,7 @@ def add_model_components(
 
         Constraint (8) in Morales-Espana et al. (2013)
         """
+        components = get_components(mod, Bin_or_Lin)
         # If this is the first timepoint of a linear horizon, skip the
         # constraint
         if check_if_boundary_type_and_first_timepoint(
@@ -1954,20 +2087,16 @@ def add_model_components(
                 balancing_type=mod.balancing_type_project[g],
                 boundary_type="linked",
             ):
-                prev_timepoint_commit = getattr(
-                    mod, "gen_commit_{}_linked_commit".format(bin_or_lin)
-                )[g, 0]
+                prev_timepoint_commit = components.linked_commit[g, 0]
             # Otherwise, use the previous timepoint's commitment
             else:
-                prev_timepoint_commit = getattr(
-                    mod, "GenCommit{}_Commit".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]]
+                prev_timepoint_commit = components.commit[
+                    g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
+                ]
 
             return (
-                getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp]
-                - prev_timepoint_commit
-                == getattr(mod, "GenCommit{}_Startup".format(Bin_or_Lin))[g, tmp]
-                - getattr(mod, "GenCommit{}_Shutdown".format(Bin_or_Lin))[g, tmp]
+                components.commit[g, tmp] - prev_timepoint_commit
+                == components.startup[g, tmp] - components.shutdown[g, tmp]
             )
 
     setattr(
@@ -1987,17 +2116,13 @@ def add_model_components(
 
         Power provision plus upward reserves shall not exceed maximum power.
         """
+        components = get_components(mod, Bin_or_Lin)
         return (
-            getattr(mod, "GenCommit{}_Provide_Power_Above_Pmin_MW".format(Bin_or_Lin))[
-                g, tmp
-            ]
-            + getattr(mod, "GenCommit{}_Upwards_Reserves_MW".format(Bin_or_Lin))[g, tmp]
+            components.provide_power_above_pmin_mw[g, tmp]
+            + components.upwards_reserves_mw[g, tmp]
         ) <= (
-            getattr(mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin))[g, tmp]
-            - getattr(mod, "GenCommit{}_Pmin_MW".format(Bin_or_Lin))[g, tmp]
-        ) * getattr(
-            mod, "GenCommit{}_Commit".format(Bin_or_Lin)
-        )[
+            components.pmax_mw[g, tmp] - components.pmin_mw[g, tmp]
+        ) * components.commit[
             g, tmp
         ]
 
@@ -2020,13 +2145,10 @@ def add_model_components(
         don't look at downward reserves. In that case, enforcing
         provide_power_above_pmin to be within NonNegativeReals is sufficient.
         """
+        components = get_components(mod, Bin_or_Lin)
         return (
-            getattr(mod, "GenCommit{}_Provide_Power_Above_Pmin_MW".format(Bin_or_Lin))[
-                g, tmp
-            ]
-            - getattr(mod, "GenCommit{}_Downwards_Reserves_MW".format(Bin_or_Lin))[
-                g, tmp
-            ]
+            components.provide_power_above_pmin_mw[g, tmp]
+            - components.downwards_reserves_mw[g, tmp]
             >= 0
         )
 
@@ -2089,21 +2211,18 @@ def add_model_components(
           --> in tmp 2. The unit either has to be on for all timepoints, or
           --> off for all timepoints
         """
+        components = get_components(mod, Bin_or_Lin)
 
         relevant_tmps, relevant_linked_timepoints = determine_relevant_timepoints(
             mod,
             g,
             tmp,
-            getattr(mod, "gen_commit_{}_min_up_time_hours".format(bin_or_lin))[g],
+            components.min_up_time_hours[g],
         )
 
         number_of_starts_min_up_time_or_less_hours_ago = sum(
-            getattr(mod, "GenCommit{}_Startup".format(Bin_or_Lin))[g, tp]
-            for tp in relevant_tmps
-        ) + sum(
-            getattr(mod, "gen_commit_{}_linked_startup".format(bin_or_lin))[g, ltp]
-            for ltp in relevant_linked_timepoints
-        )
+            components.startup[g, tp] for tp in relevant_tmps
+        ) + sum(components.linked_startup[g, ltp] for ltp in relevant_linked_timepoints)
 
         # If we've reached the first timepoint in linear boundary mode and
         # the total duration of the relevant timepoints (which includes *tmp*)
@@ -2123,7 +2242,7 @@ def add_model_components(
                 mod.horizon[tmp, mod.balancing_type_project[g]],
             ]
             and sum(mod.hrs_in_tmp[t] for t in relevant_tmps)
-            < getattr(mod, "gen_commit_{}_min_up_time_hours".format(bin_or_lin))[g]
+            < components.min_up_time_hours[g]
             and tmp
             != mod.last_hrz_tmp[
                 mod.balancing_type_project[g],
@@ -2135,13 +2254,13 @@ def add_model_components(
         # to remain committed.
         else:
             return (
-                getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp]
-                + getattr(
-                    mod, "gen_commit_{}_allow_min_up_time_violation".format(bin_or_lin)
-                )[g]
-                * getattr(mod, "GenCommit{}_Min_Up_Time_Violation".format(Bin_or_Lin))[
-                    g, tmp
-                ]
+                components.commit[g, tmp]
+                + get_violation(
+                    components.allow_min_up_time_violation,
+                    components.min_up_time_violation,
+                    g,
+                    tmp,
+                )
                 >= number_of_starts_min_up_time_or_less_hours_ago
             )
 
@@ -2180,20 +2299,19 @@ def add_model_components(
 
         Constraint (7) in Morales-Espana et al. (2013)
         """
+        components = get_components(mod, Bin_or_Lin)
 
         relevant_tmps, relevant_linked_timepoints = determine_relevant_timepoints(
             mod,
             g,
             tmp,
-            getattr(mod, "gen_commit_{}_min_down_time_hours".format(bin_or_lin))[g],
+            components.min_down_time_hours[g],
         )
 
         number_of_stops_min_down_time_or_less_hours_ago = sum(
-            getattr(mod, "GenCommit{}_Shutdown".format(Bin_or_Lin))[g, tp]
-            for tp in relevant_tmps
+            components.shutdown[g, tp] for tp in relevant_tmps
         ) + sum(
-            getattr(mod, "gen_commit_{}_linked_shutdown".format(bin_or_lin))[g, ltp]
-            for ltp in relevant_linked_timepoints
+            components.linked_shutdown[g, ltp] for ltp in relevant_linked_timepoints
         )
 
         # If we've reached the first timepoint in linear boundary mode and
@@ -2214,7 +2332,7 @@ def add_model_components(
                 mod.horizon[tmp, mod.balancing_type_project[g]],
             ]
             and sum(mod.hrs_in_tmp[t] for t in relevant_tmps)
-            < getattr(mod, "gen_commit_{}_min_down_time_hours".format(bin_or_lin))[g]
+            < components.min_down_time_hours[g]
             and tmp
             != mod.last_hrz_tmp[
                 mod.balancing_type_project[g],
@@ -2228,16 +2346,13 @@ def add_model_components(
             return (
                 1
                 - (
-                    getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp]
-                    - getattr(
-                        mod,
-                        "gen_commit_{}_allow_min_down_time_violation".format(
-                            bin_or_lin
-                        ),
-                    )[g]
-                    * getattr(
-                        mod, "GenCommit{}_Min_Down_Time_Violation".format(Bin_or_Lin)
-                    )[g, tmp]
+                    components.commit[g, tmp]
+                    - get_violation(
+                        components.allow_min_down_time_violation,
+                        components.min_down_time_violation,
+                        g,
+                        tmp,
+                    )
                 )
                 >= number_of_stops_min_down_time_or_less_hours_ago
             )
@@ -2266,6 +2381,7 @@ def add_model_components(
         ramp rate is adjusted for the duration of the first timepoint.
         Constraint (12) in Morales-Espana et al. (2013)
         """
+        components = get_components(mod, Bin_or_Lin)
         if check_if_boundary_type_and_first_timepoint(
             mod=mod,
             tmp=tmp,
@@ -2281,63 +2397,45 @@ def add_model_components(
                 boundary_type="linked",
             ):
                 prev_tmp_hrs_in_tmp = mod.hrs_in_linked_tmp[0]
-                prev_tmp_power_above_pmin = getattr(
-                    mod, "gen_commit_{}_linked_power_above_pmin".format(bin_or_lin)
-                )[g, 0]
-                prev_tmp_downwards_reserves = getattr(
-                    mod, "gen_commit_{}_linked_downwards_reserves".format(bin_or_lin)
-                )[g, 0]
-                prev_tmp_ramp_up_rate_mw_per_tmp = getattr(
-                    mod,
-                    "gen_commit_{}_linked_ramp_up_rate_mw_per_tmp".format(bin_or_lin),
-                )[g, 0]
+                prev_tmp_power_above_pmin = components.linked_power_above_pmin[g, 0]
+                prev_tmp_downwards_reserves = components.linked_downwards_reserves[g, 0]
+                prev_tmp_ramp_up_rate_mw_per_tmp = (
+                    components.linked_ramp_up_rate_mw_per_tmp[g, 0]
+                )
             else:
                 prev_tmp_hrs_in_tmp = mod.hrs_in_tmp[
                     mod.prev_tmp[tmp, mod.balancing_type_project[g]]
                 ]
-                prev_tmp_power_above_pmin = getattr(
-                    mod, "GenCommit{}_Provide_Power_Above_Pmin_MW".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]]
-                prev_tmp_downwards_reserves = getattr(
-                    mod, "GenCommit{}_Downwards_Reserves_MW".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]]
-                prev_tmp_ramp_up_rate_mw_per_tmp = getattr(
-                    mod, "GenCommit{}_Ramp_Up_Rate_MW_Per_Tmp".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]]
+                prev_tmp_power_above_pmin = components.provide_power_above_pmin_mw[
+                    g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
+                ]
+                prev_tmp_downwards_reserves = components.downwards_reserves_mw[
+                    g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
+                ]
+                prev_tmp_ramp_up_rate_mw_per_tmp = components.ramp_up_rate_mw_per_tmp[
+                    g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
+                ]
 
             # Apply constraints
             # If ramp rate limits, adjusted for timepoint duration, allow you
             # to ramp up the full operable range between timepoints, constraint
             # won't bind, so skip
-            if getattr(mod, "gen_commit_{}_ramp_up_when_on_rate".format(bin_or_lin))[
-                g
-            ] * 60 * prev_tmp_hrs_in_tmp >= (
-                1
-                - getattr(
-                    mod, "gen_commit_{}_min_stable_level_fraction".format(bin_or_lin)
-                )[g]
+            if components.ramp_up_when_on_rate[g] * 60 * prev_tmp_hrs_in_tmp >= (
+                1 - components.min_stable_level_fraction[g]
             ):
                 return Constraint.Skip
             else:
                 return (
-                    getattr(
-                        mod,
-                        "GenCommit{}_Provide_Power_Above_Pmin_MW".format(Bin_or_Lin),
-                    )[g, tmp]
-                    + getattr(
-                        mod, "GenCommit{}_Upwards_Reserves_MW".format(Bin_or_Lin)
-                    )[g, tmp]
+                    components.provide_power_above_pmin_mw[g, tmp]
+                    + components.upwards_reserves_mw[g, tmp]
                 ) - (
                     prev_tmp_power_above_pmin - prev_tmp_downwards_reserves
-                ) <= prev_tmp_ramp_up_rate_mw_per_tmp + getattr(
-                    mod, "gen_commit_{}_allow_ramp_up_violation".format(bin_or_lin)
-                )[
-                    g
-                ] * getattr(
-                    mod, "GenCommit{}_Ramp_Up_Violation_MW".format(Bin_or_Lin)
-                )[
-                    g, tmp
-                ]
+                ) <= prev_tmp_ramp_up_rate_mw_per_tmp + get_violation(
+                    components.allow_ramp_up_violation,
+                    components.ramp_up_violation_mw,
+                    g,
+                    tmp,
+                )
 
     setattr(
         m,
@@ -2361,6 +2459,7 @@ def add_model_components(
         ramp rate is adjusted for the duration of the first timepoint.
         Constraint (13) in Morales-Espana et al. (2013)
         """
+        components = get_components(mod, Bin_or_Lin)
         if check_if_boundary_type_and_first_timepoint(
             mod=mod,
             tmp=tmp,
@@ -2376,59 +2475,43 @@ def add_model_components(
                 boundary_type="linked",
             ):
                 prev_tmp_hrs_in_tmp = mod.hrs_in_linked_tmp[0]
-                prev_tmp_power_above_pmin = getattr(
-                    mod, "gen_commit_{}_linked_power_above_pmin".format(bin_or_lin)
-                )[g, 0]
-                prev_tmp_upwards_reserves = getattr(
-                    mod, "gen_commit_{}_linked_upwards_reserves".format(bin_or_lin)
-                )[g, 0]
-                prev_tmp_ramp_down_rate_mw_per_tmp = getattr(
-                    mod,
-                    "gen_commit_{}_linked_ramp_down_rate_mw_per_tmp".format(bin_or_lin),
-                )[g, 0]
+                prev_tmp_power_above_pmin = components.linked_power_above_pmin[g, 0]
+                prev_tmp_upwards_reserves = components.linked_upwards_reserves[g, 0]
+                prev_tmp_ramp_down_rate_mw_per_tmp = (
+                    components.linked_ramp_down_rate_mw_per_tmp[g, 0]
+                )
             else:
                 prev_tmp_hrs_in_tmp = mod.hrs_in_tmp[
                     mod.prev_tmp[tmp, mod.balancing_type_project[g]]
                 ]
-                prev_tmp_power_above_pmin = getattr(
-                    mod, "GenCommit{}_Provide_Power_Above_Pmin_MW".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]]
-                prev_tmp_upwards_reserves = getattr(
-                    mod, "GenCommit{}_Upwards_Reserves_MW".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]]
-                prev_tmp_ramp_down_rate_mw_per_tmp = getattr(
-                    mod, "GenCommit{}_Ramp_Down_Rate_MW_Per_Tmp".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]]
+                prev_tmp_power_above_pmin = components.provide_power_above_pmin_mw[
+                    g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
+                ]
+                prev_tmp_upwards_reserves = components.upwards_reserves_mw[
+                    g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
+                ]
+                prev_tmp_ramp_down_rate_mw_per_tmp = (
+                    components.ramp_down_rate_mw_per_tmp[
+                        g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
+                    ]
+                )
             # If ramp rate limits, adjusted for timepoint duration, allow you
             # to ramp down the full operable range between timepoints,
             # constraint won't bind, so skip
-            if getattr(mod, "gen_commit_{}_ramp_down_when_on_rate".format(bin_or_lin))[
-                g
-            ] * 60 * prev_tmp_hrs_in_tmp >= (
-                1
-                - getattr(
-                    mod, "gen_commit_{}_min_stable_level_fraction".format(bin_or_lin)
-                )[g]
+            if components.ramp_down_when_on_rate[g] * 60 * prev_tmp_hrs_in_tmp >= (
+                1 - components.min_stable_level_fraction[g]
             ):
                 return Constraint.Skip
             else:
                 return (prev_tmp_power_above_pmin + prev_tmp_upwards_reserves) - (
-                    getattr(
-                        mod,
-                        "GenCommit{}_Provide_Power_Above_Pmin_MW".format(Bin_or_Lin),
-                    )[g, tmp]
-                    - getattr(
-                        mod, "GenCommit{}_Downwards_Reserves_MW".format(Bin_or_Lin)
-                    )[g, tmp]
-                ) <= prev_tmp_ramp_down_rate_mw_per_tmp + getattr(
-                    mod, "gen_commit_{}_allow_ramp_down_violation".format(bin_or_lin)
-                )[
-                    g
-                ] * getattr(
-                    mod, "GenCommit{}_Ramp_Down_Violation_MW".format(Bin_or_Lin)
-                )[
-                    g, tmp
-                ]
+                    components.provide_power_above_pmin_mw[g, tmp]
+                    - components.downwards_reserves_mw[g, tmp]
+                ) <= prev_tmp_ramp_down_rate_mw_per_tmp + get_violation(
+                    components.allow_ramp_down_violation,
+                    components.ramp_down_violation_mw,
+                    g,
+                    tmp,
+                )
 
     setattr(
         m,
@@ -2447,21 +2530,16 @@ def add_model_components(
 
         Only one startup type can be active (>= 1) at the same time.
         """
+        components = get_components(mod, Bin_or_Lin)
 
-        if g not in getattr(mod, "GEN_COMMIT_{}_STARTUP_BY_ST_PRJS".format(BIN_OR_LIN)):
+        if g not in components.startup_by_st_prjs:
             return Constraint.Skip
 
         sum_startup_types = sum(
-            getattr(mod, "GenCommit{}_Startup_Type".format(Bin_or_Lin))[g, tmp, s]
-            for s in getattr(mod, "GEN_COMMIT_{}_STR_TYPES_BY_PRJ".format(BIN_OR_LIN))[
-                g
-            ]
+            components.startup_type[g, tmp, s] for s in components.str_types_by_prj[g]
         )
 
-        return (
-            sum_startup_types
-            == getattr(mod, "GenCommit{}_Startup".format(Bin_or_Lin))[g, tmp]
-        )
+        return sum_startup_types == components.startup[g, tmp]
 
     setattr(
         m,
@@ -2505,11 +2583,10 @@ def add_model_components(
 
         See constraint (7) in Morales-Espana et al. (2017).
         """
+        components = get_components(mod, Bin_or_Lin)
 
         # Coldest startup type is un-constrained
-        if s == getattr(mod, "GEN_COMMIT_{}_STR_TYPES_BY_PRJ".format(BIN_OR_LIN))[g].at(
-            -1
-        ):
+        if s == components.str_types_by_prj[g].at(-1):
             return Constraint.Skip
 
         # Get the timepoints within [TSU,s; TSU,s+1) hours from *tmp*
@@ -2517,17 +2594,13 @@ def add_model_components(
             mod,
             g,
             tmp,
-            getattr(mod, "gen_commit_{}_down_time_cutoff_hours".format(bin_or_lin))[
-                g, s
-            ],
+            components.down_time_cutoff_hours[g, s],
         )
         relevant_tmps2, relevant_linked_tmps2 = determine_relevant_timepoints(
             mod,
             g,
             tmp,
-            getattr(mod, "gen_commit_{}_down_time_cutoff_hours".format(bin_or_lin))[
-                g, s + 1
-            ],
+            components.down_time_cutoff_hours[g, s + 1],
         )
         relevant_tmps = set(relevant_tmps2) - set(relevant_tmps1)
         relevant_linked_tmps = set(relevant_linked_tmps2) - set(relevant_linked_tmps1)
@@ -2544,17 +2617,10 @@ def add_model_components(
         # Equal to 1 if unit has been down within interval [TSU,s; TSU,s+1)
         # before hour t. This "activates" this particular startup type
         shutdown_within_interval = sum(
-            getattr(mod, "GenCommit{}_Shutdown".format(Bin_or_Lin))[g, tp]
-            for tp in relevant_tmps
-        ) + sum(
-            getattr(mod, "gen_commit_{}_linked_shutdown".format(bin_or_lin))[g, ltp]
-            for ltp in relevant_linked_tmps
-        )
+            components.shutdown[g, tp] for tp in relevant_tmps
+        ) + sum(components.linked_shutdown[g, ltp] for ltp in relevant_linked_tmps)
 
-        return (
-            getattr(mod, "GenCommit{}_Startup_Type".format(Bin_or_Lin))[g, tmp, s]
-            <= shutdown_within_interval
-        )
+        return components.startup_type[g, tmp, s] <= shutdown_within_interval
 
     setattr(
         m,
@@ -2573,16 +2639,13 @@ def add_model_components(
         Startup power is 0 when the unit is committed and must be less than or
         equal to the minimum stable level when not committed.
         """
+        components = get_components(mod, Bin_or_Lin)
 
         return (
-            getattr(mod, "GenCommit{}_Provide_Power_Startup_MW".format(Bin_or_Lin))[
-                g, tmp
-            ]
-            <= (1 - getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp])
-            * getattr(mod, "GenCommit{}_Pmin_MW".format(Bin_or_Lin))[g, tmp]
-            * getattr(
-                mod, "gen_commit_{}_allow_startup_shutdown_power".format(bin_or_lin)
-            )[g]
+            components.provide_power_startup_mw[g, tmp]
+            <= (1 - components.commit[g, tmp])
+            * components.pmin_mw[g, tmp]
+            * components.allow_startup_shutdown_power[g]
         )
 
     setattr(
@@ -2607,6 +2670,7 @@ def add_model_components(
         take place during the duration of the first timepoint, and the
         ramp rate is adjusted for the duration of the first timepoint.
         """
+        components = get_components(mod, Bin_or_Lin)
 
         if check_if_boundary_type_and_first_timepoint(
             mod=mod,
@@ -2622,39 +2686,31 @@ def add_model_components(
                 balancing_type=mod.balancing_type_project[g],
                 boundary_type="linked",
             ):
-                prev_tmp_provide_power_startup = getattr(
-                    mod,
-                    "gen_commit_{}_linked_provide_power_startup_by_st_mw".format(
-                        bin_or_lin
-                    ),
-                )[g, 0, s]
-                prev_tmp_startup_ramp_rate_mw_per_tmp = getattr(
-                    mod,
-                    "gen_commit_{}_linked_startup_ramp_rate_by_st_mw_per_tmp".format(
-                        bin_or_lin
-                    ),
-                )[g, 0, s]
+                prev_tmp_provide_power_startup = (
+                    components.linked_provide_power_startup_by_st_mw[g, 0, s]
+                )
+                prev_tmp_startup_ramp_rate_mw_per_tmp = (
+                    components.linked_startup_ramp_rate_by_st_mw_per_tmp[g, 0, s]
+                )
             else:
-                prev_tmp_provide_power_startup = getattr(
-                    mod, "GenCommit{}_Provide_Power_Startup_By_ST_MW".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]], s]
-                prev_tmp_startup_ramp_rate_mw_per_tmp = getattr(
-                    mod,
-                    "GenCommit{}_Startup_Ramp_Rate_By_ST_MW_Per_Tmp".format(Bin_or_Lin),
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]], s]
+                prev_tmp_provide_power_startup = (
+                    components.provide_power_startup_by_st_mw[
+                        g, mod.prev_tmp[tmp, mod.balancing_type_project[g]], s
+                    ]
+                )
+                prev_tmp_startup_ramp_rate_mw_per_tmp = (
+                    components.startup_ramp_rate_by_st_mw_per_tmp[
+                        g, mod.prev_tmp[tmp, mod.balancing_type_project[g]], s
+                    ]
+                )
 
-            return (
-                getattr(
-                    mod, "GenCommit{}_Provide_Power_Startup_By_ST_MW".format(Bin_or_Lin)
-                )[g, tmp, s]
-                - prev_tmp_provide_power_startup
-                <= prev_tmp_startup_ramp_rate_mw_per_tmp
-                + getattr(
-                    mod, "gen_commit_{}_allow_ramp_up_violation".format(bin_or_lin)
-                )[g]
-                * getattr(mod, "GenCommit{}_Ramp_Up_Violation_MW".format(Bin_or_Lin))[
-                    g, tmp
-                ]
+            return components.provide_power_startup_by_st_mw[
+                g, tmp, s
+            ] - prev_tmp_provide_power_startup <= prev_tmp_startup_ramp_rate_mw_per_tmp + get_violation(
+                components.allow_ramp_up_violation,
+                components.ramp_up_violation_mw,
+                g,
+                tmp,
             )
 
     setattr(
@@ -2681,6 +2737,7 @@ def add_model_components(
         providing starting power in some timepoints and then reducing power
         back to 0 without ever committing the unit.
         """
+        components = get_components(mod, Bin_or_Lin)
         if check_if_boundary_type_and_first_timepoint(
             mod=mod,
             tmp=tmp,
@@ -2695,26 +2752,20 @@ def add_model_components(
                 balancing_type=mod.balancing_type_project[g],
                 boundary_type="linked",
             ):
-                prev_tmp_provide_power_startup = getattr(
-                    mod,
-                    "gen_commit_{}_linked_provide_power_startup_by_st_mw".format(
-                        bin_or_lin
-                    ),
-                )[g, 0, s]
+                prev_tmp_provide_power_startup = (
+                    components.linked_provide_power_startup_by_st_mw[g, 0, s]
+                )
             else:
-                prev_tmp_provide_power_startup = getattr(
-                    mod, "GenCommit{}_Provide_Power_Startup_By_ST_MW".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]], s]
+                prev_tmp_provide_power_startup = (
+                    components.provide_power_startup_by_st_mw[
+                        g, mod.prev_tmp[tmp, mod.balancing_type_project[g]], s
+                    ]
+                )
 
             return (
-                getattr(
-                    mod, "GenCommit{}_Provide_Power_Startup_By_ST_MW".format(Bin_or_Lin)
-                )[g, tmp, s]
+                components.provide_power_startup_by_st_mw[g, tmp, s]
                 - prev_tmp_provide_power_startup
-                >= -getattr(mod, "GenCommit{}_Startup_Type".format(Bin_or_Lin))[
-                    g, tmp, s
-                ]
-                * getattr(mod, "GenCommit{}_Pmin_MW".format(Bin_or_Lin))[g, tmp]
+                >= -components.startup_type[g, tmp, s] * components.pmin_mw[g, tmp]
             )
 
     setattr(
@@ -2752,6 +2803,7 @@ def add_model_components(
         <=
         (1 - Start[t]) x Pmax + Start[t] x Startup_Ramp_Rate x Pmax
         """
+        components = get_components(mod, Bin_or_Lin)
 
         if check_if_boundary_type_and_first_timepoint(
             mod=mod,
@@ -2767,45 +2819,34 @@ def add_model_components(
                 balancing_type=mod.balancing_type_project[g],
                 boundary_type="linked",
             ):
-                prev_tmp_provide_power_startup = getattr(
-                    mod,
-                    "gen_commit_{}_linked_provide_power_startup_by_st_mw".format(
-                        bin_or_lin
-                    ),
-                )[g, 0, s]
-                prev_tmp_startup_ramp_rate_mw_per_tmp = getattr(
-                    mod,
-                    "gen_commit_{}_linked_startup_ramp_rate_by_st_mw_per_tmp".format(
-                        bin_or_lin
-                    ),
-                )[g, 0, s]
+                prev_tmp_provide_power_startup = (
+                    components.linked_provide_power_startup_by_st_mw[g, 0, s]
+                )
+                prev_tmp_startup_ramp_rate_mw_per_tmp = (
+                    components.linked_startup_ramp_rate_by_st_mw_per_tmp[g, 0, s]
+                )
             else:
-                prev_tmp_provide_power_startup = getattr(
-                    mod, "GenCommit{}_Provide_Power_Startup_By_ST_MW".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]], s]
-                prev_tmp_startup_ramp_rate_mw_per_tmp = getattr(
-                    mod,
-                    "GenCommit{}_Startup_Ramp_Rate_By_ST_MW_Per_Tmp".format(Bin_or_Lin),
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]], s]
+                prev_tmp_provide_power_startup = (
+                    components.provide_power_startup_by_st_mw[
+                        g, mod.prev_tmp[tmp, mod.balancing_type_project[g]], s
+                    ]
+                )
+                prev_tmp_startup_ramp_rate_mw_per_tmp = (
+                    components.startup_ramp_rate_by_st_mw_per_tmp[
+                        g, mod.prev_tmp[tmp, mod.balancing_type_project[g]], s
+                    ]
+                )
 
             return (
-                getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp]
-                * getattr(mod, "GenCommit{}_Pmin_MW".format(Bin_or_Lin))[g, tmp]
-                + getattr(
-                    mod, "GenCommit{}_Provide_Power_Above_Pmin_MW".format(Bin_or_Lin)
-                )[g, tmp]
-            ) + getattr(mod, "GenCommit{}_Upwards_Reserves_MW".format(Bin_or_Lin))[
+                components.commit[g, tmp] * components.pmin_mw[g, tmp]
+                + components.provide_power_above_pmin_mw[g, tmp]
+            ) + components.upwards_reserves_mw[
                 g, tmp
             ] - prev_tmp_provide_power_startup <= (
-                1
-                - getattr(mod, "GenCommit{}_Startup_Type".format(Bin_or_Lin))[g, tmp, s]
-            ) * getattr(
-                mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin)
-            )[
+                1 - components.startup_type[g, tmp, s]
+            ) * components.pmax_mw[
                 g, tmp
-            ] + getattr(
-                mod, "GenCommit{}_Startup".format(Bin_or_Lin)
-            )[
+            ] + components.startup[
                 g, tmp
             ] * prev_tmp_startup_ramp_rate_mw_per_tmp
 
@@ -2827,16 +2868,13 @@ def add_model_components(
         Shutdown power is 0 when the unit is committed and must be less than or
         equal to the minimum stable level when not committed
         """
+        components = get_components(mod, Bin_or_Lin)
 
         return (
-            getattr(mod, "GenCommit{}_Provide_Power_Shutdown_MW".format(Bin_or_Lin))[
-                g, tmp
-            ]
-            <= (1 - getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp])
-            * getattr(mod, "GenCommit{}_Pmin_MW".format(Bin_or_Lin))[g, tmp]
-            * getattr(
-                mod, "gen_commit_{}_allow_startup_shutdown_power".format(bin_or_lin)
-            )[g]
+            components.provide_power_shutdown_mw[g, tmp]
+            <= (1 - components.commit[g, tmp])
+            * components.pmin_mw[g, tmp]
+            * components.allow_startup_shutdown_power[g]
         )
 
     setattr(
@@ -2861,6 +2899,7 @@ def add_model_components(
         take place during the duration of the first timepoint, and the
         ramp rate is adjusted for the duration of the first timepoint.
         """
+        components = get_components(mod, Bin_or_Lin)
 
         if check_if_boundary_type_and_first_timepoint(
             mod=mod,
@@ -2876,36 +2915,32 @@ def add_model_components(
                 balancing_type=mod.balancing_type_project[g],
                 boundary_type="linked",
             ):
-                prev_tmp_provide_power_shutdown = getattr(
-                    mod,
-                    "gen_commit_{}_linked_provide_power_shutdown_mw".format(bin_or_lin),
-                )[g, 0]
-                prev_tmp_shutdown_ramp_rate_mw_per_tmp = getattr(
-                    mod,
-                    "gen_commit_{}_linked_shutdown_ramp_rate_mw_per_tmp".format(
-                        bin_or_lin
-                    ),
-                )[g, 0]
+                prev_tmp_provide_power_shutdown = (
+                    components.linked_provide_power_shutdown_mw[g, 0]
+                )
+                prev_tmp_shutdown_ramp_rate_mw_per_tmp = (
+                    components.linked_shutdown_ramp_rate_mw_per_tmp[g, 0]
+                )
             else:
-                prev_tmp_provide_power_shutdown = getattr(
-                    mod, "GenCommit{}_Provide_Power_Shutdown_MW".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]]
-                prev_tmp_shutdown_ramp_rate_mw_per_tmp = getattr(
-                    mod, "GenCommit{}_Shutdown_Ramp_Rate_MW_Per_Tmp".format(Bin_or_Lin)
-                )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]]
+                prev_tmp_provide_power_shutdown = components.provide_power_shutdown_mw[
+                    g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
+                ]
+                prev_tmp_shutdown_ramp_rate_mw_per_tmp = (
+                    components.shutdown_ramp_rate_mw_per_tmp[
+                        g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
+                    ]
+                )
 
             return (
                 prev_tmp_provide_power_shutdown
-                - getattr(
-                    mod, "GenCommit{}_Provide_Power_Shutdown_MW".format(Bin_or_Lin)
-                )[g, tmp]
+                - components.provide_power_shutdown_mw[g, tmp]
                 <= prev_tmp_shutdown_ramp_rate_mw_per_tmp
-                + getattr(
-                    mod, "gen_commit_{}_allow_ramp_down_violation".format(bin_or_lin)
-                )[g]
-                * getattr(mod, "GenCommit{}_Ramp_Down_Violation_MW".format(Bin_or_Lin))[
-                    g, tmp
-                ]
+                + get_violation(
+                    components.allow_ramp_down_violation,
+                    components.ramp_down_violation_mw,
+                    g,
+                    tmp,
+                )
             )
 
     setattr(
@@ -2930,6 +2965,7 @@ def add_model_components(
         model can abuse this by providing stopping power in some timepoints without
         previously having committed the unit.
         """
+        components = get_components(mod, Bin_or_Lin)
         if check_if_last_timepoint(
             mod=mod, tmp=tmp, balancing_type=mod.balancing_type_project[g]
         ) and (
@@ -2949,16 +2985,14 @@ def add_model_components(
             return Constraint.Skip
         else:
             return (
-                getattr(
-                    mod, "GenCommit{}_Provide_Power_Shutdown_MW".format(Bin_or_Lin)
-                )[g, tmp]
-                - getattr(
-                    mod, "GenCommit{}_Provide_Power_Shutdown_MW".format(Bin_or_Lin)
-                )[g, mod.next_tmp[tmp, mod.balancing_type_project[g]]]
-                >= -getattr(mod, "GenCommit{}_Shutdown".format(Bin_or_Lin))[
+                components.provide_power_shutdown_mw[g, tmp]
+                - components.provide_power_shutdown_mw[
+                    g, mod.next_tmp[tmp, mod.balancing_type_project[g]]
+                ]
+                >= -components.shutdown[
                     g, mod.next_tmp[tmp, mod.balancing_type_project[g]]
                 ]
-                * getattr(mod, "GenCommit{}_Pmin_MW".format(Bin_or_Lin))[g, tmp]
+                * components.pmin_mw[g, tmp]
             )
 
     setattr(
@@ -2995,6 +3029,7 @@ def add_model_components(
         <=
         (1 - Stop[t+1]) x Pmax + Stop[t+1] x Shutdown_Ramp_Rate x Pmax
         """
+        components = get_components(mod, Bin_or_Lin)
 
         if check_if_last_timepoint(
             mod=mod, tmp=tmp, balancing_type=mod.balancing_type_project[g]
@@ -3015,33 +3050,22 @@ def add_model_components(
             return Constraint.Skip
         else:
             return (
-                getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp]
-                * getattr(mod, "GenCommit{}_Pmin_MW".format(Bin_or_Lin))[g, tmp]
-                + getattr(
-                    mod, "GenCommit{}_Provide_Power_Above_Pmin_MW".format(Bin_or_Lin)
-                )[g, tmp]
-            ) + getattr(mod, "GenCommit{}_Upwards_Reserves_MW".format(Bin_or_Lin))[
+                components.commit[g, tmp] * components.pmin_mw[g, tmp]
+                + components.provide_power_above_pmin_mw[g, tmp]
+            ) + components.upwards_reserves_mw[
                 g, tmp
-            ] - getattr(
-                mod, "GenCommit{}_Provide_Power_Shutdown_MW".format(Bin_or_Lin)
-            )[
+            ] - components.provide_power_shutdown_mw[
                 g, mod.next_tmp[tmp, mod.balancing_type_project[g]]
             ] <= (
                 1
-                - getattr(mod, "GenCommit{}_Shutdown".format(Bin_or_Lin))[
+                - components.shutdown[
                     g, mod.next_tmp[tmp, mod.balancing_type_project[g]]
                 ]
-            ) * getattr(
-                mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin)
-            )[
+            ) * components.pmax_mw[
                 g, mod.next_tmp[tmp, mod.balancing_type_project[g]]
-            ] + getattr(
-                mod, "GenCommit{}_Shutdown".format(Bin_or_Lin)
-            )[
+            ] + components.shutdown[
                 g, mod.next_tmp[tmp, mod.balancing_type_project[g]]
-            ] * getattr(
-                mod, "GenCommit{}_Shutdown_Ramp_Rate_MW_Per_Tmp".format(Bin_or_Lin)
-            )[
+            ] * components.shutdown_ramp_rate_mw_per_tmp[
                 g, tmp
             ]
 
@@ -3065,11 +3089,10 @@ def power_provision_rule(mod, g, tmp, Bin_or_Lin):
     constrained to be between the generator's minimum stable level and its
     capacity if the generator is committed and 0 otherwise.
     """
+    components = get_components(mod, Bin_or_Lin)
     return (
-        getattr(mod, "GenCommit{}_Provide_Power_MW".format(Bin_or_Lin))[g, tmp]
-        - getattr(mod, "GenCommit{}_Auxiliary_Consumption_MW".format(Bin_or_Lin))[
-            g, tmp
-        ]
+        components.provide_power_mw[g, tmp]
+        - components.auxiliary_consumption_mw[g, tmp]
     )
 
 
@@ -3079,17 +3102,15 @@ def commitment_rule(mod, g, tmp, Bin_or_Lin):
     """
     # TODO: shouldn't we return MW here to make this consistent w
     #  gen_commit_cap?
-    return getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp]
+    return get_components(mod, Bin_or_Lin).commit[g, tmp]
 
 
 def online_capacity_rule(mod, g, tmp, Bin_or_Lin):
     """
     Capacity online in each timepoint.
     """
-    return (
-        getattr(mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin))[g, tmp]
-        * getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp]
-    )
+    components = get_components(mod, Bin_or_Lin)
+    return components.pmax_mw[g, tmp] * components.commit[g, tmp]
 
 
 def variable_om_cost_rule(mod, g, tmp, Bin_or_Lin):
@@ -3114,7 +3135,7 @@ def variable_om_cost_rule(mod, g, tmp, Bin_or_Lin):
     the gross power.
     """
     return (
-        getattr(mod, "GenCommit{}_Provide_Power_MW".format(Bin_or_Lin))[g, tmp]
+        get_components(mod, Bin_or_Lin).provide_power_mw[g, tmp]
         * mod.variable_om_cost_per_mwh[g]
     )
 
@@ -3134,12 +3155,13 @@ def variable_om_cost_by_ll_rule(mod, g, tmp, s, Bin_or_Lin):
     operational characteristics table.  Only operational types with
     commitment decisions can have the second component.
     """
+    components = get_components(mod, Bin_or_Lin)
     return (
         mod.vom_slope_cost_per_mwh[g, mod.period[tmp], s]
-        * getattr(mod, "GenCommit{}_Provide_Power_MW".format(Bin_or_Lin))[g, tmp]
+        * components.provide_power_mw[g, tmp]
         + mod.vom_intercept_cost_per_mw_hr[g, mod.period[tmp], s]
-        * getattr(mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin))[g, tmp]
-        * getattr(mod, "GenCommit{}_Synced".format(Bin_or_Lin))[g, tmp]
+        * components.pmax_mw[g, tmp]
+        * components.synced[g, tmp]
     )
 
 
@@ -3149,9 +3171,10 @@ def startup_cost_simple_rule(mod, g, tmp, Bin_or_Lin):
     capacity (in MW) that is started up in that timepoint and the startup cost
     parameter.
     """
+    components = get_components(mod, Bin_or_Lin)
     return (
-        getattr(mod, "GenCommit{}_Startup".format(Bin_or_Lin))[g, tmp]
-        * getattr(mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin))[g, tmp]
+        components.startup[g, tmp]
+        * components.pmax_mw[g, tmp]
         * mod.startup_cost_per_mw[g]
     )
 
@@ -3163,15 +3186,13 @@ def startup_cost_by_st_rule(mod, g, tmp, BIN_OR_LIN, Bin_or_Lin):
     the startup cost parameter for that startup type. We take the sum across
     all startup types since only one startup type is active at the same time.
     """
+    components = get_components(mod, Bin_or_Lin)
     return (
         sum(
-            mod.startup_cost_by_st_per_mw[g, s]
-            * getattr(mod, "GenCommit{}_Startup_Type".format(Bin_or_Lin))[g, tmp, s]
-            for s in getattr(mod, "GEN_COMMIT_{}_STR_TYPES_BY_PRJ".format(BIN_OR_LIN))[
-                g
-            ]
+            mod.startup_cost_by_st_per_mw[g, s] * components.startup_type[g, tmp, s]
+            for s in components.str_types_by_prj[g]
         )
-        * getattr(mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin))[g, tmp]
+        * components.pmax_mw[g, tmp]
     )
 
 
@@ -3181,21 +3202,23 @@ def shutdown_cost_rule(mod, g, tmp, Bin_or_Lin):
     capacity (in Mw) that is shut down in that timepoint and the shutdown
     cost parameter.
     """
+    components = get_components(mod, Bin_or_Lin)
     return (
-        getattr(mod, "GenCommit{}_Shutdown".format(Bin_or_Lin))[g, tmp]
-        * getattr(mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin))[g, tmp]
+        components.shutdown[g, tmp]
+        * components.pmax_mw[g, tmp]
         * mod.shutdown_cost_per_mw[g]
     )
 
 
 def fuel_burn_by_ll_rule(mod, g, tmp, s, Bin_or_Lin):
     """ """
+    components = get_components(mod, Bin_or_Lin)
     return (
         mod.fuel_burn_slope_mmbtu_per_mwh[g, mod.period[tmp], s]
-        * getattr(mod, "GenCommit{}_Provide_Power_MW".format(Bin_or_Lin))[g, tmp]
+        * components.provide_power_mw[g, tmp]
         + mod.fuel_burn_intercept_mmbtu_per_mw_hr[g, mod.period[tmp], s]
-        * getattr(mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin))[g, tmp]
-        * getattr(mod, "GenCommit{}_Synced".format(Bin_or_Lin))[g, tmp]
+        * components.pmax_mw[g, tmp]
+        * components.synced[g, tmp]
     )
 
 
@@ -3205,9 +3228,10 @@ def startup_fuel_burn_rule(mod, g, tmp, Bin_or_Lin):
     capacity (in MW) that is started up in that timepoint and the startup
     fuel parameter. This does not vary by startup type.
     """
+    components = get_components(mod, Bin_or_Lin)
     return (
-        getattr(mod, "GenCommit{}_Startup".format(Bin_or_Lin))[g, tmp]
-        * getattr(mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin))[g, tmp]
+        components.startup[g, tmp]
+        * components.pmax_mw[g, tmp]
         * mod.startup_fuel_mmbtu_per_mw[g]
     )
 
@@ -3237,22 +3261,22 @@ def power_delta_rule(mod, g, tmp, Bin_or_Lin):
     ):
         pass
     else:
+        provide_power_above_pmin_mw = get_components(
+            mod, Bin_or_Lin
+        ).provide_power_above_pmin_mw
         return (
-            getattr(mod, "GenCommit{}_Provide_Power_Above_Pmin_MW".format(Bin_or_Lin))[
-                g, tmp
+            provide_power_above_pmin_mw[g, tmp]
+            - provide_power_above_pmin_mw[
+                g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]
             ]
-            - getattr(
-                mod, "GenCommit{}_Provide_Power_Above_Pmin_MW".format(Bin_or_Lin)
-            )[g, mod.prev_tmp[tmp, mod.balancing_type_project[g]]]
         )
 
 
 def fix_commitment(mod, g, tmp, Bin_or_Lin):
     """ """
-    getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[
-        g, tmp
-    ] = mod.fixed_commitment[g, mod.prev_stage_tmp_map[tmp]]
-    getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[g, tmp].fixed = True
+    commit = get_components(mod, Bin_or_Lin).commit
+    commit[g, tmp] = mod.fixed_commitment[g, mod.prev_stage_tmp_map[tmp]]
+    commit[g, tmp].fixed = True
 
 
 def operational_violation_cost_rule(mod, g, tmp, bin_or_lin, Bin_or_Lin):
@@ -3263,44 +3287,31 @@ def operational_violation_cost_rule(mod, g, tmp, bin_or_lin, Bin_or_Lin):
     :param tmp:
     :return:
     """
+    components = get_components(mod, Bin_or_Lin)
     ramp_up_violation = (
-        (
-            getattr(mod, "GenCommit{}_Ramp_Up_Violation_MW".format(Bin_or_Lin))[g, tmp]
-            * mod.ramp_up_violation_penalty[g]
-        )
-        if getattr(mod, "gen_commit_{}_allow_ramp_up_violation".format(bin_or_lin))[g]
+        (components.ramp_up_violation_mw[g, tmp] * mod.ramp_up_violation_penalty[g])
+        if components.allow_ramp_up_violation[g]
         else 0
     )
     ramp_down_violation = (
-        (
-            getattr(mod, "GenCommit{}_Ramp_Down_Violation_MW".format(Bin_or_Lin))[
-                g, tmp
-            ]
-            * mod.ramp_down_violation_penalty[g]
-        )
-        if getattr(mod, "gen_commit_{}_allow_ramp_down_violation".format(bin_or_lin))[g]
+        (components.ramp_down_violation_mw[g, tmp] * mod.ramp_down_violation_penalty[g])
+        if components.allow_ramp_down_violation[g]
         else 0
     )
     min_up_time_violation = (
         (
-            getattr(mod, "GenCommit{}_Min_Up_Time_Violation".format(Bin_or_Lin))[g, tmp]
+            components.min_up_time_violation[g, tmp]
             * mod.min_up_time_violation_penalty[g]
         )
-        if getattr(mod, "gen_commit_{}_allow_min_up_time_violation".format(bin_or_lin))[
-            g
-        ]
+        if components.allow_min_up_time_violation[g]
         else 0
     )
     min_down_time_violation = (
         (
-            getattr(mod, "GenCommit{}_Min_Down_Time_Violation".format(Bin_or_Lin))[
-                g, tmp
-            ]
+            components.min_down_time_violation[g, tmp]
             * mod.min_down_time_violation_penalty[g]
         )
-        if getattr(
-            mod, "gen_commit_{}_allow_min_down_time_violation".format(bin_or_lin)
-        )[g]
+        if components.allow_min_down_time_violation[g]
         else 0
     )
 
@@ -3455,64 +3466,35 @@ def add_to_prj_tmp_results(
         "min_down_time_violation",
     ]
 
+    components = get_components(mod, Bin_or_Lin)
     data = [
         [
             prj,
             tmp,
-            value(
-                getattr(mod, "GenCommit{}_Provide_Power_MW".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
-            ),
-            value(
-                getattr(
-                    mod,
-                    "GenCommit{}_Auxiliary_Consumption_MW".format(Bin_or_Lin),
-                )[prj, tmp]
-            ),
-            value(
-                getattr(mod, "GenCommit{}_Provide_Power_MW".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
-            )
-            - value(
-                getattr(
-                    mod,
-                    "GenCommit{}_Auxiliary_Consumption_MW".format(Bin_or_Lin),
-                )[prj, tmp]
-            ),
-            value(getattr(mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin))[prj, tmp])
-            * value(getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[prj, tmp]),
-            value(getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[prj, tmp]),
-            value(getattr(mod, "GenCommit{}_Startup".format(Bin_or_Lin))[prj, tmp]),
-            value(getattr(mod, "GenCommit{}_Shutdown".format(Bin_or_Lin))[prj, tmp]),
-            value(getattr(mod, "GenCommit{}_Synced".format(Bin_or_Lin))[prj, tmp]),
-            value(
-                getattr(mod, "GenCommit{}_Active_Startup_Type".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
-            ),
-            value(
-                getattr(mod, "GenCommit{}_Ramp_Up_Violation_MW".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
-            ),
-            value(
-                getattr(mod, "GenCommit{}_Ramp_Down_Violation_MW".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
-            ),
-            value(
-                getattr(mod, "GenCommit{}_Min_Up_Time_Violation".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
-            ),
-            value(
-                getattr(
-                    mod,
-                    "GenCommit{}_Min_Down_Time_Violation".format(Bin_or_Lin),
-                )[prj, tmp]
-            ),
+            value(components.provide_power_mw[prj, tmp]),
+            value(components.auxiliary_consumption_mw[prj, tmp]),
+            value(components.provide_power_mw[prj, tmp])
+            - value(components.auxiliary_consumption_mw[prj, tmp]),
+            value(components.pmax_mw[prj, tmp]) * value(components.commit[prj, tmp]),
+            value(components.commit[prj, tmp]),
+            value(components.startup[prj, tmp]),
+            value(components.shutdown[prj, tmp]),
+            value(components.synced[prj, tmp]),
+            value(components.active_startup_type[prj, tmp]),
+            # The violation variables are only defined if violations are
+            # allowed
+            value(components.ramp_up_violation_mw[prj, tmp])
+            if (prj, tmp) in components.ramp_up_violation_mw
+            else 0,
+            value(components.ramp_down_violation_mw[prj, tmp])
+            if (prj, tmp) in components.ramp_down_violation_mw
+            else 0,
+            value(components.min_up_time_violation[prj, tmp])
+            if (prj, tmp) in components.min_up_time_violation
+            else 0,
+            value(components.min_down_time_violation[prj, tmp])
+            if (prj, tmp) in components.min_down_time_violation
+            else 0,
         ]
         for (prj, tmp) in getattr(mod, "GEN_COMMIT_{}_OPR_TMPS".format(BIN_OR_LIN))
     ]
@@ -3535,6 +3517,7 @@ def export_linked_subproblem_inputs(
     # directory
     if tmps_to_link:
         next_subproblem = str(int(subproblem) + 1)
+        components = get_components(mod, Bin_or_Lin)
 
         # Export params by project and timepoint
         with open(
@@ -3576,114 +3559,51 @@ def export_linked_subproblem_inputs(
                             tmp_linked_tmp_dict[tmp],
                             max(
                                 min(
-                                    value(
-                                        getattr(
-                                            mod, "GenCommit{}_Commit".format(Bin_or_Lin)
-                                        )[p, tmp]
-                                    ),
+                                    value(components.commit[p, tmp]),
                                     1,
                                 ),
                                 0,
                             ),
                             max(
                                 min(
-                                    value(
-                                        getattr(
-                                            mod,
-                                            "GenCommit{}_Startup".format(Bin_or_Lin),
-                                        )[p, tmp]
-                                    ),
+                                    value(components.startup[p, tmp]),
                                     1,
                                 ),
                                 0,
                             ),
                             max(
                                 min(
-                                    value(
-                                        getattr(
-                                            mod,
-                                            "GenCommit{}_Shutdown".format(Bin_or_Lin),
-                                        )[p, tmp]
-                                    ),
+                                    value(components.shutdown[p, tmp]),
                                     1,
                                 ),
                                 0,
                             ),
                             max(
-                                value(
-                                    getattr(
-                                        mod,
-                                        "GenCommit{}_Provide_Power_Above_Pmin_MW".format(
-                                            Bin_or_Lin
-                                        ),
-                                    )[p, tmp]
-                                ),
+                                value(components.provide_power_above_pmin_mw[p, tmp]),
                                 0,
                             ),
                             max(
-                                value(
-                                    getattr(
-                                        mod,
-                                        "GenCommit{}_Upwards_Reserves_MW".format(
-                                            Bin_or_Lin
-                                        ),
-                                    )[p, tmp]
-                                ),
+                                value(components.upwards_reserves_mw[p, tmp]),
                                 0,
                             ),
                             max(
-                                value(
-                                    getattr(
-                                        mod,
-                                        "GenCommit{}_Downwards_Reserves_MW".format(
-                                            Bin_or_Lin
-                                        ),
-                                    )[p, tmp]
-                                ),
+                                value(components.downwards_reserves_mw[p, tmp]),
                                 0,
                             ),
                             max(
-                                value(
-                                    getattr(
-                                        mod,
-                                        "GenCommit{}_Ramp_Up_Rate_MW_Per_Tmp".format(
-                                            Bin_or_Lin
-                                        ),
-                                    )[p, tmp]
-                                ),
+                                value(components.ramp_up_rate_mw_per_tmp[p, tmp]),
                                 0,
                             ),
                             max(
-                                value(
-                                    getattr(
-                                        mod,
-                                        "GenCommit{}_Ramp_Down_Rate_MW_Per_Tmp".format(
-                                            Bin_or_Lin
-                                        ),
-                                    )[p, tmp]
-                                ),
+                                value(components.ramp_down_rate_mw_per_tmp[p, tmp]),
                                 0,
                             ),
                             max(
-                                value(
-                                    getattr(
-                                        mod,
-                                        "GenCommit{}_Provide_Power_Shutdown_MW".format(
-                                            Bin_or_Lin
-                                        ),
-                                    )[p, tmp]
-                                ),
+                                value(components.provide_power_shutdown_mw[p, tmp]),
                                 0,
                             ),
                             max(
-                                value(
-                                    getattr(
-                                        mod,
-                                        "GenCommit{}_Shutdown_Ramp_Rate_MW_Per_Tmp".format(
-                                            Bin_or_Lin
-                                        ),
-                                    )[p, tmp]
-                                ),
+                                value(components.shutdown_ramp_rate_mw_per_tmp[p, tmp]),
                                 0,
                             ),
                         ]
@@ -3729,23 +3649,17 @@ def export_linked_subproblem_inputs(
                                     s,
                                     max(
                                         value(
-                                            getattr(
-                                                mod,
-                                                "GenCommit{}_Provide_Power_Startup_By_ST_MW".format(
-                                                    Bin_or_Lin
-                                                ),
-                                            )[p, tmp, s]
+                                            components.provide_power_startup_by_st_mw[
+                                                p, tmp, s
+                                            ]
                                         ),
                                         0,
                                     ),
                                     max(
                                         value(
-                                            getattr(
-                                                mod,
-                                                "GenCommit{}_Startup_Ramp_Rate_By_ST_MW_Per_Tmp".format(
-                                                    Bin_or_Lin
-                                                ),
-                                            )[p, tmp, s]
+                                            components.startup_ramp_rate_by_st_mw_per_tmp[
+                                                p, tmp, s
+                                            ]
                                         ),
                                         0,
                                     ),
@@ -3796,16 +3710,14 @@ def add_duals_to_dispatch_results(mod, Bin_or_Lin, BIN_OR_LIN):
         constraint_column_dict[c] for c in sorted(constraint_column_dict.keys())
     ]
 
-    data = []
-    for prj, tmp in getattr(mod, "GEN_COMMIT_{}_OPR_TMPS".format(BIN_OR_LIN)):
-        duals = []
-        for c in sorted(constraint_column_dict.keys()):
-            constraint_object = getattr(mod, c)
-            if (prj, tmp) in constraint_object:
-                duals.append(mod.dual[constraint_object[prj, tmp]])
-            else:
-                duals.append(None)
+    constraint_duals = [
+        get_constraint_duals(instance=mod, constraint_name=c)
+        for c in sorted(constraint_column_dict.keys())
+    ]
 
-        data.append([prj, tmp] + duals)
+    data = [
+        [prj, tmp] + [duals.get((prj, tmp)) for duals in constraint_duals]
+        for prj, tmp in getattr(mod, "GEN_COMMIT_{}_OPR_TMPS".format(BIN_OR_LIN))
+    ]
 
     return results_columns, data
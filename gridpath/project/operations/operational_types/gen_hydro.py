@@ -40,7 +40,7 @@ from pyomo.environ import (
 )
 import warnings
 
-from db.common_functions import spin_on_database_lock
+from db.common_functions import spin_on_database_lock_transaction
 from gridpath.auxiliary.auxiliary import (
     subset_init_by_param_value,
     subset_init_by_set_membership,
@@ -60,7 +60,6 @@ from gridpath.project.operations.operational_types.common_functions import (
     validate_opchars,
     validate_hydro_opchars,
 )
-from gridpath.common_functions import create_results_df
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -767,13 +766,7 @@ def add_to_prj_tmp_results(mod):
         for (prj, tmp) in mod.GEN_HYDRO_OPR_TMPS
     ]
 
-    optype_dispatch_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, optype_dispatch_df
+    return results_columns, data
 
 
 def export_results(mod, d, scenario_directory, subproblem, stage):
@@ -896,9 +889,6 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM results_project_curtailment_hydro_periodagg 
         WHERE scenario_id = ?
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Aggregate hydro curtailment (just scheduled curtailment)
     agg_sql = """
@@ -916,7 +906,8 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
             load_zone, 
             sum(scheduled_curtailment_mw) AS scheduled_curtailment_mw
             FROM results_project_timepoint
-            WHERE operational_type = 'gen_hydro'
+            WHERE scenario_id = ?
+            AND operational_type = 'gen_hydro'
             GROUP BY scenario_id, subproblem_id, stage_id, timepoint, load_zone
         ) as agg_curtailment_tbl
         JOIN (
@@ -932,8 +923,13 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
         WHERE scenario_id = ?
         ORDER BY subproblem_id, stage_id, load_zone, timepoint;
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id, scenario_id), many=False
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[
+            (del_sql, (scenario_id,)),
+            (agg_sql, (scenario_id, scenario_id, scenario_id)),
+        ],
     )
 
 
@@ -59,7 +59,8 @@ from gridpath.project.operations.operational_types.common_functions import (
     load_optype_model_data,
     validate_opchars,
 )
-from gridpath.common_functions import create_results_df
+
+VALIDATION_BY_SUBPROBLEM_STAGE = False
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -293,13 +294,7 @@ def add_to_prj_tmp_results(mod):
         for (prj, tmp) in mod.GEN_MUST_RUN_OPR_TMPS
     ]
 
-    optype_dispatch_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, optype_dispatch_df
+    return results_columns, data
 
 
 # Validation
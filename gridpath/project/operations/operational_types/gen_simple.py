@@ -61,6 +61,8 @@ from gridpath.project.operations.operational_types.common_functions import (
     validate_opchars,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -39,7 +39,7 @@ from pyomo.environ import (
 )
 import warnings
 
-from db.common_functions import spin_on_database_lock
+from db.common_functions import spin_on_database_lock_transaction
 from gridpath.auxiliary.auxiliary import (
     subset_init_by_param_value,
     subset_init_by_set_membership,
@@ -65,7 +65,6 @@ from gridpath.project.operations.operational_types.common_functions import (
     validate_var_profiles,
     load_optype_model_data,
 )
-from gridpath.common_functions import create_results_df
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -491,13 +490,7 @@ def add_to_prj_tmp_results(mod):
         for (prj, tmp) in mod.GEN_VAR_OPR_TMPS
     ]
 
-    optype_dispatch_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, optype_dispatch_df
+    return results_columns, data
 
 
 # Database
@@ -566,9 +559,6 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM results_project_curtailment_variable_periodagg 
         WHERE scenario_id = ?;
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Aggregate variable curtailment (just scheduled curtailment)
     insert_sql = """
@@ -586,7 +576,8 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
             load_zone, 
             sum(scheduled_curtailment_mw) AS scheduled_curtailment_mw
             FROM results_project_timepoint
-            WHERE operational_type = 'gen_var'
+            WHERE scenario_id = ?
+            AND operational_type = 'gen_var'
             GROUP BY scenario_id, subproblem_id, stage_id, timepoint, load_zone
         ) as agg_curtailment_tbl
         JOIN (
@@ -602,8 +593,13 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
         WHERE scenario_id = ?
         ORDER BY subproblem_id, stage_id, load_zone, timepoint;"""
 
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=insert_sql, data=(scenario_id, scenario_id), many=False
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[
+            (del_sql, (scenario_id,)),
+            (insert_sql, (scenario_id, scenario_id, scenario_id)),
+        ],
     )
 
 
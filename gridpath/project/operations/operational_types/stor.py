@@ -69,7 +69,8 @@ from gridpath.project.operations.operational_types.common_functions import (
     write_tab_file_model_inputs,
     get_prj_tmp_opr_inputs_from_db,
 )
-from gridpath.common_functions import create_results_df
+
+VALIDATION_BY_SUBPROBLEM_STAGE = False
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -846,13 +847,7 @@ def add_to_prj_tmp_results(mod):
         for (prj, tmp) in mod.STOR_OPR_TMPS
     ]
 
-    optype_dispatch_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, optype_dispatch_df
+    return results_columns, data
 
 
 def export_results(mod, d, scenario_directory, subproblem, stage):
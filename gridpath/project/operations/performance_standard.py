@@ -26,11 +26,13 @@ from gridpath.auxiliary.auxiliary import (
     subset_init_by_set_membership,
 )
 from gridpath.auxiliary.db_interface import (
-    update_prj_zone_column,
+    update_prj_zone_columns,
     determine_table_subset_by_start_and_column,
 )
 from gridpath.auxiliary.validations import write_validation_to_database, validate_idxs
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -263,16 +265,15 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         conn=db, tbl_start="results_project_", cols=["performance_standard_zone"]
     )
 
-    for tbl in tables_to_update:
-        update_prj_zone_column(
-            conn=db,
-            scenario_id=scenario_id,
-            subscenarios=subscenarios,
-            subscenario="project_performance_standard_zone_scenario_id",
-            subsc_tbl="inputs_project_performance_standard_zones",
-            prj_tbl=tbl,
-            col="performance_standard_zone",
-        )
+    update_prj_zone_columns(
+        conn=db,
+        scenario_id=scenario_id,
+        subscenarios=subscenarios,
+        subscenario="project_performance_standard_zone_scenario_id",
+        subsc_tbl="inputs_project_performance_standard_zones",
+        prj_tbls=tables_to_update,
+        col="performance_standard_zone",
+    )
 
 
 # Validation
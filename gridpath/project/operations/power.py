@@ -23,11 +23,12 @@ import os.path
 import pandas as pd
 from pyomo.environ import Expression, value
 
-from db.common_functions import spin_on_database_lock
+from db.common_functions import spin_on_database_lock_transaction
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules
-from gridpath.common_functions import create_results_df
-from gridpath.project.operations.common_functions import load_operational_type_modules
-import gridpath.project.operations.operational_types as op_type_init
+from gridpath.project.operations.common_functions import (
+    get_operational_type_rules,
+    load_operational_type_modules,
+)
 from gridpath.project import PROJECT_TIMEPOINT_DF
 
 
@@ -67,6 +68,10 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         required_operational_modules
     )
 
+    power_provision_rules = get_operational_type_rules(
+        imported_operational_modules, "power_provision_rule"
+    )
+
     # Expressions
     ###########################################################################
 
@@ -80,12 +85,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         type.
         """
         gen_op_type = mod.operational_type[prj]
-        if hasattr(imported_operational_modules[gen_op_type], "power_provision_rule"):
-            return imported_operational_modules[gen_op_type].power_provision_rule(
-                mod, prj, tmp
-            )
-        else:
-            return op_type_init.power_provision_rule(mod, prj, tmp)
+        return power_provision_rules[gen_op_type](mod, prj, tmp)
 
     m.Power_Provision_MW = Expression(m.PRJ_OPR_TMPS, rule=power_provision_rule)
 
@@ -119,15 +119,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (prj, tmp) in m.PRJ_OPR_TMPS
     ]
-    results_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_DF).update(columns=results_columns, data=data)
 
     required_operational_modules = get_required_subtype_modules(
         scenario_directory=scenario_directory,
@@ -144,13 +136,12 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         if hasattr(
             imported_operational_modules[optype_module], "add_to_prj_tmp_results"
         ):
-            results_columns, optype_df = imported_operational_modules[
+            results_columns, optype_data = imported_operational_modules[
                 optype_module
             ].add_to_prj_tmp_results(mod=m)
-            for column in results_columns:
-                if column not in getattr(d, PROJECT_TIMEPOINT_DF):
-                    getattr(d, PROJECT_TIMEPOINT_DF)[column] = None
-            getattr(d, PROJECT_TIMEPOINT_DF).update(optype_df)
+            getattr(d, PROJECT_TIMEPOINT_DF).update(
+                columns=results_columns, data=optype_data
+            )
 
 
 def summarize_results(scenario_directory, subproblem, stage):
@@ -274,9 +265,6 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM results_project_dispatch_by_technology 
         WHERE scenario_id = ?
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Aggregate dispatch by technology
     agg_sql = """
@@ -294,8 +282,10 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         load_zone, technology
         ORDER BY subproblem_id, stage_id, timepoint, 
         load_zone, technology;"""
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[(del_sql, (scenario_id,)), (agg_sql, (scenario_id,))],
     )
 
     if not quiet:
@@ -306,9 +296,6 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM results_project_dispatch_by_technology_period 
         WHERE scenario_id = ?
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Aggregate dispatch by technology, period, and spinup_or_lookahead
     agg_sql = """
@@ -326,6 +313,8 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         spinup_or_lookahead
         ORDER BY subproblem_id, stage_id, period, load_zone, technology, 
         spinup_or_lookahead;"""
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[(del_sql, (scenario_id,)), (agg_sql, (scenario_id,))],
     )
@@ -22,7 +22,6 @@ import pandas as pd
 from pyomo.environ import Set, value
 
 from gridpath.auxiliary.dynamic_components import headroom_variables
-from gridpath.common_functions import create_results_df
 from gridpath.project import PROJECT_TIMEPOINT_DF
 from gridpath.project.operations.reserves.reserve_provision import (
     generic_record_dynamic_components,
@@ -32,6 +31,9 @@ from gridpath.project.operations.reserves.reserve_provision import (
     generic_validate_project_bas,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
+
 # Reserve-module variables
 MODULE_NAME = "frequency_response"
 # Dynamic components
@@ -194,15 +196,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for (prj, tmp) in m.FREQUENCY_RESPONSE_PRJ_OPR_TMPS
     ]
 
-    results_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_DF).update(columns=results_columns, data=data)
 
 
 def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn):
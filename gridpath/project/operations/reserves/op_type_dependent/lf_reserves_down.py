@@ -28,6 +28,8 @@ from gridpath.project.operations.reserves.op_type_dependent.reserve_limits_by_op
     generic_load_model_data,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 # Inputs
 RESERVE_PROVISION_RAMP_RATE_LIMIT_COLUMN_NAME_IN_INPUT_FILE = (
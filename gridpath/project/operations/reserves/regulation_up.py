@@ -28,6 +28,9 @@ from gridpath.project.operations.reserves.reserve_provision import (
     generic_validate_project_bas,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
+
 # Reserve-module variables
 MODULE_NAME = "regulation_up"
 # Dynamic components
@@ -32,7 +32,6 @@ from gridpath.auxiliary.dynamic_components import (
     reserve_variable_derate_params,
     reserve_to_energy_adjustment_params,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project import PROJECT_TIMEPOINT_DF
 
 
@@ -407,15 +406,7 @@ def generic_export_results(
         for (prj, tmp) in getattr(m, reserve_project_operational_timepoints_set)
     ]
 
-    results_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_DF).update(columns=results_columns, data=data)
 
 
 def generic_get_inputs_from_database(
@@ -22,6 +22,8 @@ from pyomo.environ import Expression
 
 from gridpath.project.reliability.prm.common_functions import load_prm_type_modules
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 # TODO: rename to deliverability types; the PRM types are really 'simple'
 #  and 'elcc surface'
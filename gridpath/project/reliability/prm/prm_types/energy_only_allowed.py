@@ -30,7 +30,10 @@ from pyomo.environ import (
     value,
 )
 
-from db.common_functions import spin_on_database_lock
+from db.common_functions import (
+    spin_on_database_lock,
+    spin_on_database_lock_transaction,
+)
 from gridpath.auxiliary.auxiliary import (
     subset_init_by_param_value,
     subset_init_by_set_membership,
@@ -231,9 +234,6 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
         results_project_deliverability_groups_agg 
         WHERE scenario_id = ?
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Insert new results
     agg_sql = """
@@ -260,8 +260,11 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
         GROUP BY scenario_id, subproblem_id, stage_id, period
         ) AS cap_table
         USING (scenario_id, subproblem_id, stage_id, period)
+        WHERE spinup_or_lookahead_ratios.scenario_id = ?
         ;"""
 
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[(del_sql, (scenario_id,)), (agg_sql, (scenario_id, scenario_id))],
     )
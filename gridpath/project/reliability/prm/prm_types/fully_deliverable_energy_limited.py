@@ -33,6 +33,8 @@ from gridpath.auxiliary.validations import (
     validate_missing_inputs,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
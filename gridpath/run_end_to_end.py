@@ -35,6 +35,7 @@ from db.common_functions import connect_to_database, spin_on_database_lock
 from gridpath.common_functions import (
     get_db_parser,
     get_run_scenario_parser,
+    check_solve_method_arguments,
     get_required_e2e_arguments_parser,
     get_get_inputs_parser,
     create_logs_directory_if_not_exists,
@@ -50,6 +51,7 @@ from gridpath import (
 from gridpath.run_scenario import _export_rule, _summarize_rule
 from gridpath.import_scenario_results import _import_rule
 from gridpath.auxiliary.db_interface import get_scenario_id_and_name
+from gridpath.auxiliary.telemetry import disable_telemetry, enable_telemetry
 
 
 def parse_arguments(args):
@@ -105,6 +107,7 @@ def parse_arguments(args):
     )
 
     parsed_arguments = parser.parse_args(args=args)
+    check_solve_method_arguments(parser=parser, parsed_arguments=parsed_arguments)
 
     return parsed_arguments
 
@@ -348,85 +351,95 @@ def main(args=None):
         skip_import_results = False
         skip_process_results = False
 
-    # Go through the steps if user has not requested to skip them
-    if not skip_get_inputs and not parsed_args.skip_get_inputs:
-        try:
-            get_scenario_inputs.main(args=args)
-        except Exception as e:
-            logging.exception(e)
-            end_time = update_db_for_run_end(
-                db_path=db_path,
-                scenario=scenario,
-                queue_order_id=queue_order_id,
-                process_id=process_id,
-                run_status_id=3,
-            )
-            print(
-                "Error encountered when getting inputs from the database for "
-                "scenario {}. End time: {}.".format(scenario, end_time)
-            )
-            sys.exit(1)
-
-    if not skip_run_scenario and not parsed_args.skip_run_scenario:
-        try:
-            # make sure run_scenario.py gets the required --scenario argument
-            run_scenario_args = args + ["--scenario", scenario]
-            expected_objective_values = run_scenario.main(
-                args=run_scenario_args,
-            )
-        except Exception as e:
-            logging.exception(e)
-            end_time = update_db_for_run_end(
-                db_path=db_path,
-                scenario=scenario,
-                queue_order_id=queue_order_id,
-                process_id=process_id,
-                run_status_id=3,
-            )
-            print(
-                "Error encountered when running scenario {}. End time: {}.".format(
-                    scenario, end_time
+    # Record the telemetry of all steps for a single run
+    if parsed_args.telemetry:
+        prior_telemetry_settings = enable_telemetry(
+            scenario_directory=scenario_directory, process="run_end_to_end"
+        )
+
+    try:
+        # Go through the steps if user has not requested to skip them
+        if not skip_get_inputs and not parsed_args.skip_get_inputs:
+            try:
+                get_scenario_inputs.main(args=args)
+            except Exception as e:
+                logging.exception(e)
+                end_time = update_db_for_run_end(
+                    db_path=db_path,
+                    scenario=scenario,
+                    queue_order_id=queue_order_id,
+                    process_id=process_id,
+                    run_status_id=3,
                 )
-            )
-            sys.exit(1)
-    else:
-        expected_objective_values = None
-
-    if not skip_import_results and not parsed_args.skip_import_results:
-        try:
-            import_scenario_results.main(args=args)
-        except Exception as e:
-            logging.exception(e)
-            end_time = update_db_for_run_end(
-                db_path=db_path,
-                scenario=scenario,
-                queue_order_id=queue_order_id,
-                process_id=process_id,
-                run_status_id=3,
-            )
-            print(
-                "Error encountered when importing results for "
-                "scenario {}. End time: {}.".format(scenario, end_time)
-            )
-            sys.exit(1)
-
-    if not skip_process_results and not parsed_args.skip_process_results:
-        try:
-            process_results.main(args=args)
-        except Exception as e:
-            logging.exception(e)
-            end_time = update_db_for_run_end(
-                db_path=db_path,
-                scenario=scenario,
-                queue_order_id=queue_order_id,
-                process_id=process_id,
-                run_status_id=3,
-            )
-            print(
-                "Error encountered when importing results for "
-                "scenario {}. End time: {}.".format(scenario, end_time)
-            )
-            sys.exit(1)
+                print(
+                    "Error encountered when getting inputs from the database for "
+                    "scenario {}. End time: {}.".format(scenario, end_time)
+                )
+                sys.exit(1)
+
+        if not skip_run_scenario and not parsed_args.skip_run_scenario:
+            try:
+                # make sure run_scenario.py gets the required --scenario argument
+                run_scenario_args = args + ["--scenario", scenario]
+                expected_objective_values = run_scenario.main(
+                    args=run_scenario_args,
+                )
+            except Exception as e:
+                logging.exception(e)
+                end_time = update_db_for_run_end(
+                    db_path=db_path,
+                    scenario=scenario,
+                    queue_order_id=queue_order_id,
+                    process_id=process_id,
+                    run_status_id=3,
+                )
+                print(
+                    "Error encountered when running scenario {}. End time: {}.".format(
+                        scenario, end_time
+                    )
+                )
+                sys.exit(1)
+        else:
+            expected_objective_values = None
+
+        if not skip_import_results and not parsed_args.skip_import_results:
+            try:
+                import_scenario_results.main(args=args)
+            except Exception as e:
+                logging.exception(e)
+                end_time = update_db_for_run_end(
+                    db_path=db_path,
+                    scenario=scenario,
+                    queue_order_id=queue_order_id,
+                    process_id=process_id,
+                    run_status_id=3,
+                )
+                print(
+                    "Error encountered when importing results for "
+                    "scenario {}. End time: {}.".format(scenario, end_time)
+                )
+                sys.exit(1)
+
+        if not skip_process_results and not parsed_args.skip_process_results:
+            try:
+                process_results.main(args=args)
+            except Exception as e:
+                logging.exception(e)
+                end_time = update_db_for_run_end(
+                    db_path=db_path,
+                    scenario=scenario,
+                    queue_order_id=queue_order_id,
+                    process_id=process_id,
+                    run_status_id=3,
+                )
+                print(
+                    "Error encountered when importing results for "
+                    "scenario {}. End time: {}.".format(scenario, end_time)
+                )
+                sys.exit(1)
+    finally:
+        if parsed_args.telemetry:
+            disable_telemetry(prior_settings=prior_telemetry_settings)
 
     # If we make it here, mark run as complete and update run end time
     end_time = update_db_for_run_end(
@@ -23,41 +23,55 @@ The main() function of this script can also be called with the
 import argparse
 from csv import reader, writer
 import datetime
-import dill
-import json
 from multiprocessing import get_context, Manager
 import os.path
-import xml.etree.ElementTree as ET
-
-from pyomo.environ import (
-    AbstractModel,
-    Suffix,
-    DataPortal,
-    SolverFactory,
-    SolverStatus,
-    TerminationCondition,
-)
-
-# from pyomo.util.infeasible import log_infeasible_constraints
-from pyomo.common.tempfiles import TempfileManager
-from pyomo.core import ComponentUID, SymbolMap
-import pyomo.environ
-from pyomo.opt import ReaderFactory, ResultsFormat, ProblemFormat
 import sys
 import warnings
 
+# Pyomo and dill are imported in the functions that use them rather than
+# here, so that parsing the arguments (e.g. for --help) doesn't load them
+
+from gridpath.auxiliary.auxiliary import get_constraint_duals
 from gridpath.auxiliary.import_export_rules import import_export_rules
+from gridpath.auxiliary.lazy_constraints import solve_with_lazy_constraints
 from gridpath.auxiliary.scenario_chars import get_subproblem_structure_from_disk
 from gridpath.common_functions import (
     determine_scenario_directory,
     get_scenario_name_parser,
     get_required_e2e_arguments_parser,
     get_run_scenario_parser,
+    check_solve_method_arguments,
     create_logs_directory_if_not_exists,
     Logging,
 )
 from gridpath.auxiliary.dynamic_components import DynamicComponents
-from gridpath.auxiliary.module_list import determine_modules, load_modules
+from gridpath.auxiliary.module_list import (
+    get_module_registry,
+    refresh_scenario_structure,
+)
+from gridpath.auxiliary.problem_snapshot import (
+    check_instance_structure,
+    problem_snapshot_exists,
+    read_problem_snapshot,
+    SnapshotSymbolComponents,
+    write_problem_snapshot,
+)
+from gridpath.auxiliary.profiling import ConstructionProfiler, profile_module
+from gridpath.auxiliary.solution_files import (
+    iter_cplex_xml_solution,
+    iter_gurobi_json_solution,
+    load_solution_values,
+)
+from gridpath.auxiliary.model_size import (
+    print_model_size_summary,
+    write_model_size_report,
+)
+from gridpath.auxiliary.telemetry import (
+    disable_telemetry,
+    enable_telemetry,
+    record_phase,
+)
+from gridpath.auxiliary.unit_aggregation import disaggregate_results
 
 
 def create_problem(scenario_directory, subproblem, stage, parsed_arguments):
@@ -81,6 +95,8 @@ def create_problem(scenario_directory, subproblem, stage, parsed_arguments):
     *determine_modules* method (imported from
     *gridpath.auxiilary.module_list*) and import those modules (via the
     *load_modules* method imported from *gridpath.auxiliary.module_list*).
+    Both are done once per scenario per process by the module registry (see
+    *get_module_registry* in *gridpath.auxiliary.module_list*).
 
     We then determine the dynamic model components based on the selected
     modules and input data. See *populate_dynamic_components* method.
@@ -92,11 +108,33 @@ def create_problem(scenario_directory, subproblem, stage, parsed_arguments):
     Finally, we compile and solve the problem (*create_problem_instance* and
     *solve* methods respectively). If any variables need to be fixed,
     this is done before solving (see the *fix_variables* method).
+
+    If the *--profile_construction* flag is specified, we also record the
+    time, memory, and number of components and indices each module and
+    each Pyomo component take to construct, and write these to the logs
+    directory (see *gridpath.auxiliary.profiling*).
+
+    If the *--model_size_report* flag is specified, we write the number of
+    variables, constraints, and nonzeros of each module and Pyomo component
+    to the results directory once the problem is compiled (see
+    *gridpath.auxiliary.model_size*).
     """
+    from pyomo.environ import AbstractModel, Suffix
+
     # Create pyomo abstract model class
     model = AbstractModel()
     dynamic_components = DynamicComponents()
 
+    if parsed_arguments.profile_construction:
+        profiler = ConstructionProfiler()
+    else:
+        profiler = None
+
+    if parsed_arguments.model_size_report:
+        component_modules = dict()
+    else:
+        component_modules = None
+
     # Determine/load modules and dynamic components
     modules_to_use, loaded_modules = set_up_gridpath_modules(
         scenario_directory=scenario_directory, subproblem=subproblem, stage=stage
@@ -105,9 +143,17 @@ def create_problem(scenario_directory, subproblem, stage, parsed_arguments):
     # Create the abstract model; some components are initialized here
     if not parsed_arguments.quiet:
         print("Building model...")
-    create_abstract_model(
-        model, dynamic_components, loaded_modules, scenario_directory, subproblem, stage
-    )
+    with record_phase("add_model_components", subproblem, stage):
+        create_abstract_model(
+            model,
+            dynamic_components,
+            loaded_modules,
+            scenario_directory,
+            subproblem,
+            stage,
+            profiler=profiler,
+            component_modules=component_modules,
+        )
 
     # Create a dual suffix component
     # TODO: maybe this shouldn't always be needed
@@ -116,32 +162,90 @@ def create_problem(scenario_directory, subproblem, stage, parsed_arguments):
     # Load the scenario data
     if not parsed_arguments.quiet:
         print("Loading data...")
-    scenario_data = load_scenario_data(
-        model, dynamic_components, loaded_modules, scenario_directory, subproblem, stage
-    )
+    with record_phase("load_inputs", subproblem, stage):
+        scenario_data = load_scenario_data(
+            model,
+            dynamic_components,
+            loaded_modules,
+            scenario_directory,
+            subproblem,
+            stage,
+            profiler=profiler,
+        )
 
     if not parsed_arguments.quiet:
         print("Creating problem instance...")
-    instance = create_problem_instance(model, scenario_data)
+    with record_phase("create_instance", subproblem, stage):
+        instance = create_problem_instance(model, scenario_data, profiler=profiler)
 
     # Fix variables if modules request so
-    instance = fix_variables(
-        instance,
-        dynamic_components,
-        scenario_directory,
-        subproblem,
-        stage,
-        loaded_modules,
-    )
+    with record_phase("fix_variables", subproblem, stage):
+        instance = fix_variables(
+            instance,
+            dynamic_components,
+            scenario_directory,
+            subproblem,
+            stage,
+            loaded_modules,
+            profiler=profiler,
+        )
+
+    if profiler is not None:
+        logs_directory = create_logs_directory_if_not_exists(
+            scenario_directory, subproblem, stage
+        )
+        profiler.write(logs_directory=logs_directory)
+        if not parsed_arguments.quiet:
+            profiler.print_summary()
+            print("Construction profile written to {}".format(logs_directory))
+
+    if component_modules is not None:
+        results_directory = os.path.join(
+            scenario_directory, str(subproblem), str(stage), "results"
+        )
+        if not os.path.exists(results_directory):
+            os.makedirs(results_directory)
+        with record_phase("model_size_report", subproblem, stage):
+            module_totals = write_model_size_report(
+                instance=instance,
+                component_modules=component_modules,
+                results_directory=results_directory,
+            )
+        if not parsed_arguments.quiet:
+            print_model_size_summary(module_totals=module_totals)
 
     return dynamic_components, instance
 
 
-def solve_problem(parsed_arguments, instance):
+def solve_problem(
+    parsed_arguments,
+    instance,
+    subproblem="",
+    stage="",
+    dynamic_components=None,
+    modules_to_use=None,
+):
     # Solve
     if not parsed_arguments.quiet:
         print("Solving...")
-    results = solve(instance, parsed_arguments)
+    with record_phase("solve", subproblem, stage):
+        if parsed_arguments.benders:
+            results = solve_with_benders(instance, dynamic_components, parsed_arguments)
+        elif int(parsed_arguments.n_parallel_horizons) > 1:
+            results = solve_by_horizon(
+                instance, dynamic_components, modules_to_use, parsed_arguments
+            )
+        elif parsed_arguments.lazy_constraints:
+            results = solve_with_lazy_constraints(
+                instance=instance,
+                dynamic_components=dynamic_components,
+                solve_function=solve,
+                parsed_arguments=parsed_arguments,
+                binding_constraints_file=parsed_arguments.binding_constraints_file,
+                quiet=parsed_arguments.quiet,
+            )
+        else:
+            results = solve(instance, parsed_arguments)
 
     return instance, results
 
@@ -223,6 +327,8 @@ def run_optimization_for_subproblem_stage(
         # files into the log directory (rather than a hidden temp folder).
         # Use the --symbolic argument as well for best debugging results
         if parsed_arguments.write_solver_files_to_logs_dir:
+            from pyomo.common.tempfiles import TempfileManager
+
             logs_directory = create_logs_directory_if_not_exists(
                 scenario_directory, subproblem_directory, stage_directory
             )
@@ -243,25 +349,41 @@ def run_optimization_for_subproblem_stage(
         subproblem_directory = str(subproblem_directory)
         stage_directory = str(stage_directory)
 
-        # Used only if we are writing problem files or loading solutions
+        # Used only if we are writing problem files
         prob_sol_files_directory = os.path.join(
             scenario_directory, subproblem_directory, stage_directory, "prob_sol_files"
         )
 
         # Create problem instance and either save the problem file or solve the instance
         # TODO: incompatible options
-        # If we are loading a solution, skip the compilation step; we'll use the saved
-        # instance and dynamic components
+        # If we are loading a solution, the instance is rebuilt from the inputs
+        # and the solution is mapped to it with the saved problem snapshot
         if parsed_arguments.load_cplex_solution:
-            solved_instance, results, dynamic_components = load_cplex_xml_solution(
-                prob_sol_files_directory=prob_sol_files_directory,
-                solution_filename="cplex_solution.sol",
-            )
+            with record_phase("load_solution", subproblem_directory, stage_directory):
+                solved_instance, results, dynamic_components = load_cplex_xml_solution(
+                    scenario_directory=scenario_directory,
+                    subproblem=subproblem_directory,
+                    stage=stage_directory,
+                    parsed_arguments=parsed_arguments,
+                    solution_filename="cplex_solution.sol",
+                    solution_components=parsed_arguments.solution_components,
+                    load_duals=not parsed_arguments.skip_solution_duals,
+                )
         elif parsed_arguments.load_gurobi_solution:
-            solved_instance, results, dynamic_components = load_gurobi_json_solution(
-                prob_sol_files_directory=prob_sol_files_directory,
-                solution_filename="gurobi_solution.json",
-            )
+            with record_phase("load_solution", subproblem_directory, stage_directory):
+                (
+                    solved_instance,
+                    results,
+                    dynamic_components,
+                ) = load_gurobi_json_solution(
+                    scenario_directory=scenario_directory,
+                    subproblem=subproblem_directory,
+                    stage=stage_directory,
+                    parsed_arguments=parsed_arguments,
+                    solution_filename="gurobi_solution.json",
+                    solution_components=parsed_arguments.solution_components,
+                    load_duals=not parsed_arguments.skip_solution_duals,
+                )
         else:
             dynamic_components, instance = create_problem(
                 scenario_directory=scenario_directory,
@@ -271,45 +393,34 @@ def run_optimization_for_subproblem_stage(
             )
 
             if parsed_arguments.create_lp_problem_file_only:
-                prob_sol_files_directory = os.path.join(
-                    scenario_directory,
-                    subproblem_directory,
-                    stage_directory,
-                    "prob_sol_files",
-                )
                 if not os.path.exists(prob_sol_files_directory):
                     os.makedirs(prob_sol_files_directory)
-                with open(
-                    os.path.join(prob_sol_files_directory, "instance.pickle"), "wb"
-                ) as f_out:
-                    dill.dump(instance, f_out)
-                with open(
-                    os.path.join(prob_sol_files_directory, "dynamic_components.pickle"),
-                    "wb",
-                ) as f_out:
-                    dill.dump(dynamic_components, f_out)
-
-                smap_id = write_problem_file(
-                    instance=instance, prob_sol_files_directory=prob_sol_files_directory
-                )
-                symbol_map = instance.solutions.symbol_map[smap_id]
 
-                symbol_cuid_pairs = tuple(
-                    (symbol, ComponentUID(var_weakref(), cuid_buffer={}))
-                    for symbol, var_weakref in symbol_map.bySymbol.items()
+                with record_phase(
+                    "write_problem_file", subproblem_directory, stage_directory
+                ):
+                    smap_id = write_problem_file(
+                        instance=instance,
+                        prob_sol_files_directory=prob_sol_files_directory,
+                    )
+                write_problem_snapshot(
+                    prob_sol_files_directory=prob_sol_files_directory,
+                    instance=instance,
+                    symbol_map=instance.solutions.symbol_map[smap_id],
                 )
 
-                with open(
-                    os.path.join(prob_sol_files_directory, "symbol_map.pickle"), "wb"
-                ) as f_out:
-                    dill.dump(symbol_cuid_pairs, f_out)
-
                 print("Problem file written to {}".format(prob_sol_files_directory))
                 sys.exit()
             else:
                 solved_instance, results = solve_problem(
                     parsed_arguments=parsed_arguments,
                     instance=instance,
+                    subproblem=subproblem_directory,
+                    stage=stage_directory,
+                    dynamic_components=dynamic_components,
+                    modules_to_use=get_module_registry(
+                        scenario_directory=scenario_directory
+                    ).modules_to_use,
                 )
 
         # Save the scenario results to disk
@@ -324,12 +435,13 @@ def run_optimization_for_subproblem_stage(
         )
 
         # Summarize results
-        summarize_results(
-            scenario_directory,
-            subproblem_directory,
-            stage_directory,
-            parsed_arguments,
-        )
+        with record_phase("summarize_results", subproblem_directory, stage_directory):
+            summarize_results(
+                scenario_directory,
+                subproblem_directory,
+                stage_directory,
+                parsed_arguments,
+            )
 
         # If logging, we need to return sys.stdout to original (i.e. stop writing
         # to log file)
@@ -559,6 +671,8 @@ def save_results(
     Save objective function value.
     Save constraint duals.
     """
+    from pyomo.environ import SolverStatus, TerminationCondition
+
     if not parsed_arguments.quiet:
         print("Saving results...")
 
@@ -612,13 +726,14 @@ def save_results(
             verbose=parsed_arguments.verbose,
         )
 
-        export_pass_through_inputs(
-            scenario_directory=scenario_directory,
-            subproblem=subproblem,
-            stage=stage,
-            instance=instance,
-            verbose=parsed_arguments.verbose,
-        )
+        with record_phase("export_pass_through_inputs", subproblem, stage):
+            export_pass_through_inputs(
+                scenario_directory=scenario_directory,
+                subproblem=subproblem,
+                stage=stage,
+                instance=instance,
+                verbose=parsed_arguments.verbose,
+            )
 
         save_objective_function_value(
             scenario_directory=scenario_directory,
@@ -627,14 +742,16 @@ def save_results(
             instance=instance,
         )
 
-        save_duals(
-            scenario_directory=scenario_directory,
-            subproblem=subproblem,
-            stage=stage,
-            instance=instance,
-            dynamic_components=dynamic_components,
-            verbose=parsed_arguments.verbose,
-        )
+        if parsed_arguments.export_constraint_duals:
+            with record_phase("save_duals", subproblem, stage):
+                save_duals(
+                    scenario_directory=scenario_directory,
+                    subproblem=subproblem,
+                    stage=stage,
+                    instance=instance,
+                    dynamic_components=dynamic_components,
+                    verbose=parsed_arguments.verbose,
+                )
     # If solver status is not ok, don't export results and print some
     # messages for the user
     else:
@@ -657,7 +774,14 @@ def save_results(
 
 
 def create_abstract_model(
-    model, dynamic_components, loaded_modules, scenario_directory, subproblem, stage
+    model,
+    dynamic_components,
+    loaded_modules,
+    scenario_directory,
+    subproblem,
+    stage,
+    profiler=None,
+    component_modules=None,
 ):
     """
     :param model: the Pyomo AbstractModel object
@@ -666,6 +790,9 @@ def create_abstract_model(
     :param scenario_directory:
     :param subproblem:
     :param stage:
+    :param profiler: ConstructionProfiler object (optional)
+    :param component_modules: dictionary to record the module that added
+        each component in (optional)
 
     To create the abstract model, we iterate over all required modules and
     call their *add_model_components* method to add components to the Pyomo
@@ -673,15 +800,30 @@ def create_abstract_model(
     dynamic component class as an argument for any dynamic components to be
     added to the model.
     """
+    n_components = 0
     for m in loaded_modules:
         if hasattr(m, "add_model_components"):
-            m.add_model_components(
-                model, dynamic_components, scenario_directory, subproblem, stage
-            )
+            with profile_module(profiler, "add_model_components", m, model):
+                m.add_model_components(
+                    model, dynamic_components, scenario_directory, subproblem, stage
+                )
+            # Components are kept in declaration order, so the new ones are
+            # those after the components we've already seen
+            if component_modules is not None:
+                component_names = list(model.component_map().keys())
+                for name in component_names[n_components:]:
+                    component_modules[name] = m.__name__.replace("gridpath.", "", 1)
+                n_components = len(component_names)
 
 
 def load_scenario_data(
-    model, dynamic_components, loaded_modules, scenario_directory, subproblem, stage
+    model,
+    dynamic_components,
+    loaded_modules,
+    scenario_directory,
+    subproblem,
+    stage,
+    profiler=None,
 ):
     """
     :param model: the Pyomo abstract model object with components added
@@ -691,6 +833,7 @@ def load_scenario_data(
     :param scenario_directory: the main scenario directory
     :param subproblem: the horizon subproblem
     :param stage: the stage subproblem
+    :param profiler: ConstructionProfiler object (optional)
     :return: the DataPortal object populated with the input data
 
     Iterate over all required GridPath modules and call their
@@ -698,38 +841,54 @@ def load_scenario_data(
     model components. Return the resulting DataPortal object with the data
     loaded in.
     """
+    from pyomo.environ import DataPortal
+
     # Load data
     data_portal = DataPortal()
     for m in loaded_modules:
         if hasattr(m, "load_model_data"):
-            m.load_model_data(
-                model,
-                dynamic_components,
-                data_portal,
-                scenario_directory,
-                subproblem,
-                stage,
-            )
+            with profile_module(
+                profiler, "load_model_data", m, model, data_portal=data_portal
+            ):
+                m.load_model_data(
+                    model,
+                    dynamic_components,
+                    data_portal,
+                    scenario_directory,
+                    subproblem,
+                    stage,
+                )
     return data_portal
 
 
-def create_problem_instance(model, loaded_data):
+def create_problem_instance(model, loaded_data, profiler=None):
     """
     :param model: the AbstractModel Pyomo object with components added
     :param loaded_data: the DataPortal object with the data loaded in and
         linked to the relevant model components
+    :param profiler: ConstructionProfiler object (optional)
     :return: the compiled problem instance
 
     Compile the problem based on the abstract model formulation and the data
     loaded into the model components.
     """
     # Create problem instance
-    instance = model.create_instance(loaded_data)
+    if profiler is None:
+        instance = model.create_instance(loaded_data)
+    else:
+        with profiler.profile_instance_construction():
+            instance = model.create_instance(loaded_data)
     return instance
 
 
 def fix_variables(
-    instance, dynamic_components, scenario_directory, subproblem, stage, loaded_modules
+    instance,
+    dynamic_components,
+    scenario_directory,
+    subproblem,
+    stage,
+    loaded_modules,
+    profiler=None,
 ):
     """
     :param instance: the compiled problem instance
@@ -738,6 +897,7 @@ def fix_variables(
     :param subproblem: str
     :param stage: str
     :param loaded_modules: list of imported GridPath modules as Python objects
+    :param profiler: ConstructionProfiler object (optional)
     :return: the problem instance with the relevant variables fixed
 
     Iterate over the required GridPath modules and fix variables by calling
@@ -746,9 +906,10 @@ def fix_variables(
     """
     for m in loaded_modules:
         if hasattr(m, "fix_variables"):
-            m.fix_variables(
-                instance, dynamic_components, scenario_directory, subproblem, stage
-            )
+            with profile_module(profiler, "fix_variables", m, instance):
+                m.fix_variables(
+                    instance, dynamic_components, scenario_directory, subproblem, stage
+                )
 
     return instance
 
@@ -766,13 +927,13 @@ def view_loaded_data(loaded_modules, instance):
             m.view_loaded_data(instance)
 
 
-def solve(instance, parsed_arguments):
+def get_solver_name_and_options(parsed_arguments):
     """
-    :param instance: the compiled problem instance
     :param parsed_arguments: the user-defined arguments (parsed)
-    :return: the problem results
+    :return: the solver name and the dictionary of solver options
 
-    Send the compiled problem instance to the solver and solve.
+    Determine the solver to use and its options from the command line and
+    the solver_options.csv file in the scenario directory (if any).
     """
     # Start with solver name specified on command line
     solver_name = parsed_arguments.solver
@@ -820,6 +981,25 @@ def solve(instance, parsed_arguments):
         if parsed_arguments.solver is None:
             solver_name = "cbc"
 
+    return solver_name, solver_options
+
+
+def solve(instance, parsed_arguments, warmstart=False):
+    """
+    :param instance: the compiled problem instance
+    :param parsed_arguments: the user-defined arguments (parsed)
+    :param warmstart: whether to warm-start the solver from the current
+        variable values (if the solver supports it)
+    :return: the problem results
+
+    Send the compiled problem instance to the solver and solve.
+    """
+    from pyomo.environ import SolverFactory
+
+    # from pyomo.util.infeasible import log_infeasible_constraints
+
+    solver_name, solver_options = get_solver_name_and_options(parsed_arguments)
+
     # Get solver
     # If a solver executable is specified, pass it to Pyomo
     if parsed_arguments.solver_executable is not None:
@@ -877,11 +1057,16 @@ def solve(instance, parsed_arguments):
         for opt in solver_options.keys():
             optimizer.options[opt] = solver_options[opt]
 
+        # Only pass the warmstart keyword to solvers that accept it
+        warmstart_kwargs = (
+            {"warmstart": True} if warmstart and optimizer.warm_start_capable() else {}
+        )
         results = optimizer.solve(
             instance,
             tee=not parsed_arguments.mute_solver_output,
             keepfiles=parsed_arguments.keepfiles,
             symbolic_solver_labels=parsed_arguments.symbolic,
+            **warmstart_kwargs,
         )
 
     # Can optionally log infeasibilities but this has resulted in false
@@ -892,6 +1077,76 @@ def solve(instance, parsed_arguments):
     return results
 
 
+def solve_with_benders(instance, dynamic_components, parsed_arguments):
+    """
+    :param instance: the compiled problem instance
+    :param dynamic_components: the populated dynamic components class
+    :param parsed_arguments: the user-defined arguments (parsed)
+    :return: the problem results
+
+    Solve the compiled problem instance with Benders decomposition (see
+    *gridpath.auxiliary.benders*). The best solution found is loaded into
+    the instance.
+    """
+    from gridpath.auxiliary.benders import solve_benders
+
+    solver_name, solver_options = get_solver_name_and_options(parsed_arguments)
+    if solver_name == "gams":
+        raise ValueError("Benders decomposition is not supported with GAMS.")
+
+    solver_status, termination_condition = solve_benders(
+        instance=instance,
+        dynamic_components=dynamic_components,
+        solver_name=solver_name,
+        solver_options=solver_options,
+        solver_executable=parsed_arguments.solver_executable,
+        grouping=parsed_arguments.benders_subproblems,
+        gap=float(parsed_arguments.benders_gap),
+        max_iterations=int(parsed_arguments.benders_max_iterations),
+        n_parallel_subproblems=int(parsed_arguments.n_parallel_benders_subproblems),
+        tee=not parsed_arguments.mute_solver_output,
+        quiet=parsed_arguments.quiet,
+    )
+
+    return Results(solver_status, termination_condition)
+
+
+def solve_by_horizon(instance, dynamic_components, modules_to_use, parsed_arguments):
+    """
+    :param instance: the compiled problem instance
+    :param dynamic_components: the populated dynamic components class
+    :param modules_to_use: list of the names of the modules the scenario
+        uses
+    :param parsed_arguments: the user-defined arguments (parsed)
+    :return: the problem results
+
+    Solve the horizons of the compiled problem instance as independent
+    problems in parallel if nothing links them (see
+    *gridpath.auxiliary.horizon_decomposition*); otherwise, solve the
+    instance as a single problem.
+    """
+    from gridpath.auxiliary.horizon_decomposition import solve_horizons
+
+    solver_name, solver_options = get_solver_name_and_options(parsed_arguments)
+    if solver_name == "gams":
+        raise ValueError("Solving horizons in parallel is not supported with GAMS.")
+
+    horizon_results = solve_horizons(
+        instance=instance,
+        dynamic_components=dynamic_components,
+        modules_to_use=modules_to_use if modules_to_use is not None else list(),
+        solver_name=solver_name,
+        solver_options=solver_options,
+        solver_executable=parsed_arguments.solver_executable,
+        n_parallel_horizons=int(parsed_arguments.n_parallel_horizons),
+        quiet=parsed_arguments.quiet,
+    )
+    if horizon_results is None:
+        return solve(instance, parsed_arguments)
+
+    return Results(*horizon_results)
+
+
 def export_results(
     scenario_directory,
     subproblem,
@@ -914,21 +1169,26 @@ def export_results(
     Export results for each loaded module (if applicable)
     """
     if export_rule:
-        # Determine/load modules and dynamic components
-        modules_to_use, loaded_modules = set_up_gridpath_modules(
-            scenario_directory=scenario_directory, subproblem=subproblem, stage=stage
-        )
+        # Get the modules that export results
+        module_registry = get_module_registry(scenario_directory=scenario_directory)
 
-        n = 0
-        for m in loaded_modules:
-            if hasattr(m, "export_results"):
-                if verbose:
-                    print(f"... {modules_to_use[n]}")
+        for name, m in module_registry.modules_with("export_results"):
+            if verbose:
+                print(f"... {name}")
+            with record_phase("export_results", subproblem, stage, module=m):
                 m.export_results(
-                    scenario_directory, subproblem, stage, instance, dynamic_components
+                    scenario_directory,
+                    subproblem,
+                    stage,
+                    instance,
+                    dynamic_components,
                 )
 
-            n += 1
+        # Split the results of any clusters of identical projects among
+        # their projects
+        disaggregate_results(
+            scenario_directory=scenario_directory, subproblem=subproblem, stage=stage
+        )
 
 
 def export_pass_through_inputs(
@@ -944,20 +1204,13 @@ def export_pass_through_inputs(
 
     Export pass through inputs for each loaded module (if applicable)
     """
-    # Determine/load modules and dynamic components
-    modules_to_use, loaded_modules = set_up_gridpath_modules(
-        scenario_directory=scenario_directory, subproblem=subproblem, stage=stage
-    )
+    # Get the modules that export pass-through inputs
+    module_registry = get_module_registry(scenario_directory=scenario_directory)
 
-    n = 0
-    for m in loaded_modules:
-        if hasattr(m, "export_pass_through_inputs"):
-            if verbose:
-                print(f"... {modules_to_use[n]}")
-            m.export_pass_through_inputs(
-                scenario_directory, subproblem, stage, instance
-            )
-        n += 1
+    for name, m in module_registry.modules_with("export_pass_through_inputs"):
+        if verbose:
+            print(f"... {name}")
+        m.export_pass_through_inputs(scenario_directory, subproblem, stage, instance)
 
 
 def save_objective_function_value(scenario_directory, subproblem, stage, instance):
@@ -1001,41 +1254,123 @@ def save_duals(
     :param verbose:
     :return:
 
-    Save the duals of various constraints.
+    Save the duals of various constraints (if requested with the
+    *--export_constraint_duals* flag). Modules register the constraints
+    whose duals to save and the constraint index column names in the
+    instance's *constraint_indices* dictionary; we then get all duals of
+    each registered constraint in a single pass and write them to a CSV file
+    named after the constraint in the results directory.
     """
-    # Determine/load modules and dynamic components
-    modules_to_use, loaded_modules = set_up_gridpath_modules(
-        scenario_directory=scenario_directory, subproblem=subproblem, stage=stage
+    register_constraint_duals(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        instance=instance,
+        dynamic_components=dynamic_components,
+        verbose=verbose,
     )
 
+    # We don't get duals when solving MIPs, so don't break the script; only
+    # warn if the problem is not a MIP, as we'd expect duals otherwise
+    if len(instance.dual) == 0:
+        if instance.constraint_indices and not is_mip(instance):
+            warnings.warn(
+                """
+            No duals found in the solution. Duals were not exported.
+            """
+            )
+        return
+
+    results_directory = os.path.join(
+        scenario_directory, str(subproblem), str(stage), "results"
+    )
+    for constraint_name, columns in instance.constraint_indices.items():
+        duals = get_constraint_duals(instance=instance, constraint_name=constraint_name)
+        with open(
+            os.path.join(results_directory, "{}.csv".format(constraint_name)),
+            "w",
+            newline="",
+        ) as duals_file:
+            duals_writer = writer(duals_file, delimiter=",", lineterminator="\n")
+            duals_writer.writerow(columns)
+            duals_writer.writerows(
+                (list(idx) if isinstance(idx, tuple) else [idx]) + [dual]
+                for idx, dual in duals.items()
+            )
+
+
+def register_constraint_duals(
+    scenario_directory, subproblem, stage, instance, dynamic_components, verbose=False
+):
+    """
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :param instance:
+    :param dynamic_components:
+    :param verbose:
+
+    Call the *save_duals* method of the modules, which register the
+    constraints whose duals they export and the constraint index column
+    names in the instance's *constraint_indices* dictionary.
+    """
+    # Get the modules that save duals
+    module_registry = get_module_registry(scenario_directory=scenario_directory)
+
     instance.constraint_indices = {}
 
-    n = 0
-    for m in loaded_modules:
+    for name, m in module_registry.modules_with("save_duals"):
         if verbose:
-            print(f"... {modules_to_use[n]}")
-        if hasattr(m, "save_duals"):
-            m.save_duals(
-                scenario_directory, subproblem, stage, instance, dynamic_components
-            )
-        n += 1
-
-    # for index in constraint_object:
-    # try:
-    #     duals_writer.writerow(
-    #         list(index) + [instance.dual[constraint_object[index]]]
-    #     )
-    # # We get an error when trying to export duals with CPLEX
-    # # when solving MIPs, so catch it here and ignore to avoid
-    # # breaking the script, but throw a warning
-    # except KeyError:
-    #     warnings.warn(
-    #         """
-    #     KeyError caught when saving duals. Duals were not exported.
-    #     This is expected if solving a MIP with CPLEX,
-    #     not otherwise.
-    #     """
-    #     )
+            print(f"... {name}")
+        m.save_duals(
+            scenario_directory, subproblem, stage, instance, dynamic_components
+        )
+
+
+def get_default_solution_components(
+    scenario_directory, subproblem, stage, instance, dynamic_components
+):
+    """
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :param instance:
+    :param dynamic_components:
+    :return: list of the names of the variables and constraints to load
+        from a solution file if *--solution_components* is not specified
+
+    The results exports read expressions built from the variables of many
+    modules, so all variables are loaded. The duals the modules export are
+    those of the constraints they register with their *save_duals* methods,
+    so only the duals of these constraints are loaded.
+    """
+    from pyomo.environ import Var
+
+    register_constraint_duals(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        instance=instance,
+        dynamic_components=dynamic_components,
+    )
+
+    return [var.local_name for var in instance.component_objects(Var)] + list(
+        instance.constraint_indices.keys()
+    )
+
+
+def is_mip(instance):
+    """
+    :param instance: the problem instance
+    :return: boolean; whether the instance has any unfixed integer or binary
+        variables
+    """
+    from pyomo.environ import Var
+
+    return any(
+        v.is_integer() and not v.fixed
+        for v in instance.component_data_objects(Var, active=True)
+    )
 
 
 def summarize_results(scenario_directory, subproblem, stage, parsed_arguments):
@@ -1079,12 +1414,8 @@ def summarize_results(scenario_directory, subproblem, stage, parsed_arguments):
             if not parsed_arguments.quiet:
                 print("Summarizing results...")
 
-            # Determine/load modules and dynamic components
-            modules_to_use, loaded_modules = set_up_gridpath_modules(
-                scenario_directory=scenario_directory,
-                subproblem=subproblem,
-                stage=stage,
-            )
+            # Get the modules that summarize results
+            module_registry = get_module_registry(scenario_directory=scenario_directory)
 
             # Make the summary results file
             summary_results_file = os.path.join(
@@ -1101,13 +1432,10 @@ def summarize_results(scenario_directory, subproblem, stage, parsed_arguments):
                 )
 
             # Go through the modules and get the appropriate results
-            n = 0
-            for m in loaded_modules:
-                if hasattr(m, "summarize_results"):
-                    if parsed_arguments.verbose:
-                        print(f"... {modules_to_use[n]}")
-                    m.summarize_results(scenario_directory, subproblem, stage)
-                n += 1
+            for name, m in module_registry.modules_with("summarize_results"):
+                if parsed_arguments.verbose:
+                    print(f"... {name}")
+                m.summarize_results(scenario_directory, subproblem, stage)
 
 
 def set_up_gridpath_modules(scenario_directory, subproblem, stage):
@@ -1116,11 +1444,13 @@ def set_up_gridpath_modules(scenario_directory, subproblem, stage):
         loaded modules, and the populated dynamic components for the scenario
 
     Set up the modules and dynamic components for a scenario run problem
-    instance.
+    instance. The modules are determined and loaded only once per scenario
+    per process (see *gridpath.auxiliary.module_list.get_module_registry*).
     """
     # Determine and load modules
-    modules_to_use = determine_modules(scenario_directory=scenario_directory)
-    loaded_modules = load_modules(modules_to_use)
+    module_registry = get_module_registry(scenario_directory=scenario_directory)
+    modules_to_use = module_registry.modules_to_use
+    loaded_modules = module_registry.loaded_modules
     # Determine the dynamic components based on the needed modules and input
     # data
     # populate_dynamic_inputs(dynamic_components, loaded_modules,
@@ -1158,6 +1488,7 @@ def parse_arguments(args):
     #  other scripts)? run_start_to_end does pass unknown arguments (e.g.
     #  the database file path), so we'd have to suppress warnings then
     parsed_arguments = parser.parse_known_args(args=args)[0]
+    check_solve_method_arguments(parser=parser, parsed_arguments=parsed_arguments)
 
     return parsed_arguments
 
@@ -1189,16 +1520,28 @@ def main(args=None):
             )
         )
 
-    subproblem_structure = get_subproblem_structure_from_disk(
-        scenario_directory=scenario_directory
-    )
+    if parsed_args.telemetry:
+        prior_telemetry_settings = enable_telemetry(
+            scenario_directory=scenario_directory, process="run_scenario"
+        )
 
-    # Run the scenario (can be multiple optimization subproblems)
-    expected_objective_values = run_scenario(
-        scenario_directory=scenario_directory,
-        subproblem_structure=subproblem_structure,
-        parsed_arguments=parsed_args,
-    )
+    try:
+        subproblem_structure = get_subproblem_structure_from_disk(
+            scenario_directory=scenario_directory
+        )
+        refresh_scenario_structure(scenario_directory=scenario_directory)
+
+        # Run the scenario (can be multiple optimization subproblems)
+        expected_objective_values = run_scenario(
+            scenario_directory=scenario_directory,
+            subproblem_structure=subproblem_structure,
+            parsed_arguments=parsed_args,
+        )
+    finally:
+        # Don't record the events of later calls in the same process (e.g.
+        # from the UI server) unless they enable telemetry themselves
+        if parsed_args.telemetry:
+            disable_telemetry(prior_settings=prior_telemetry_settings)
 
     # Return the objective function values (used in testing)
     return expected_objective_values
@@ -1240,6 +1583,8 @@ def write_problem_file(instance, prob_sol_files_directory, problem_format="lp"):
     :return:
 
     """
+    from pyomo.opt import ProblemFormat
+
     formats = dict()
     # Only supporting LP problem format for now
     formats["lp"] = ProblemFormat.cpxlp
@@ -1266,49 +1611,56 @@ def write_problem_file(instance, prob_sol_files_directory, problem_format="lp"):
 
 
 def load_cplex_xml_solution(
-    prob_sol_files_directory, solution_filename="cplex_solution.sol"
+    scenario_directory,
+    subproblem,
+    stage,
+    parsed_arguments,
+    solution_filename="cplex_solution.sol",
+    solution_components=None,
+    load_duals=True,
 ):
     """
-    :param prob_sol_files_directory:
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :param parsed_arguments:
     :param solution_filename:
+    :param solution_components: list of the names of the variables and
+        constraints to load from the solution file; defaults to all
+        variables and the constraints whose duals the modules export
+    :param load_duals: boolean; whether to load the constraint duals
     :return:
     """
+    prob_sol_files_directory = os.path.join(
+        scenario_directory, subproblem, stage, "prob_sol_files"
+    )
     print(
         "Loading results from solution file {}...".format(
             os.path.join(prob_sol_files_directory, solution_filename)
         )
     )
-    instance, dynamic_components, symbol_map = load_problem_info(
-        prob_sol_files_directory=prob_sol_files_directory
+    instance, dynamic_components, symbol_components = load_problem_info(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        parsed_arguments=parsed_arguments,
+        solution_components=solution_components,
     )
 
-    # Read XML (.sol) solution file
-    root = ET.parse(os.path.join(prob_sol_files_directory, solution_filename)).getroot()
-
-    # Variables
-    for type_tag in root.findall("variables/variable"):
-        var_id, var_index, value = (
-            type_tag.get("name"),
-            type_tag.get("index"),
-            type_tag.get("value"),
-        )
-        if not var_id == "ONE_VAR_CONSTANT":
-            symbol_map.bySymbol[var_id]().value = float(value)
-
-    # Constraints
-    for type_tag in root.findall("linearConstraints/constraint"):
-        constraint_id_w_extra_symbols, const_index, dual = (
-            type_tag.get("name"),
-            type_tag.get("index"),
-            type_tag.get("dual"),
-        )
-        if not constraint_id_w_extra_symbols == "c_e_ONE_VAR_CONSTANT":
-            constraint_id = constraint_id_w_extra_symbols[4:-1]
-            instance.dual[symbol_map.bySymbol[constraint_id]()] = float(dual)
+    # Stream the XML (.sol) solution file and load the variable values and
+    # constraint duals
+    header = dict()
+    load_solution_values(
+        instance=instance,
+        symbol_components=symbol_components,
+        solution_values=iter_cplex_xml_solution(
+            filepath=os.path.join(prob_sol_files_directory, solution_filename),
+            header=header,
+        ),
+        load_duals=load_duals,
+    )
 
     # Solver status
-    header = root.findall("header")[0]  # Need a check that there is only one element
-
     termination_condition = header.get("solutionStatusString")
     # TODO: what are the types
     solver_status = "ok" if header.get("solutionStatusValue") == "1" else "unknown"
@@ -1320,48 +1672,59 @@ def load_cplex_xml_solution(
 
 
 def load_gurobi_json_solution(
-    prob_sol_files_directory, solution_filename="gurobi_solution.json"
+    scenario_directory,
+    subproblem,
+    stage,
+    parsed_arguments,
+    solution_filename="gurobi_solution.json",
+    solution_components=None,
+    load_duals=True,
 ):
     """
-    :param prob_sol_files_directory:
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :param parsed_arguments:
     :param solution_filename:
+    :param solution_components: list of the names of the variables and
+        constraints to load from the solution file; defaults to all
+        variables and the constraints whose duals the modules export
+    :param load_duals: boolean; whether to load the constraint duals
     :return:
     """
+    prob_sol_files_directory = os.path.join(
+        scenario_directory, subproblem, stage, "prob_sol_files"
+    )
     print(
         "Loading results from solution file {}...".format(
             os.path.join(prob_sol_files_directory, solution_filename)
         )
     )
-
-    instance, dynamic_components, symbol_map = load_problem_info(
-        prob_sol_files_directory=prob_sol_files_directory
+    instance, dynamic_components, symbol_components = load_problem_info(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        parsed_arguments=parsed_arguments,
+        solution_components=solution_components,
     )
 
-    # #### WORKING VERSION #####
-    # This needs to be under an if statement and execute when we are loading
-    # solution from disk
-    # Read JSON solution file
-    with open(os.path.join(prob_sol_files_directory, solution_filename), "r") as f:
-        solution = json.load(f)
-
-    # Variables
-    for v in solution["Vars"]:
-        var_id, value = v["VTag"][0], v["X"]
-        if not var_id == "ONE_VAR_CONSTANT":
-            symbol_map.bySymbol[var_id]().value = float(value)
-
-    # Constraints
-    for c in solution["Constrs"]:
-        constraint_id, dual = c["CTag"][0][4:], c["Pi"]
-        if not constraint_id == "ONE_VAR_CONSTAN":
-            instance.dual[symbol_map.bySymbol[constraint_id]()] = float(dual)
+    # Stream the JSON solution file and load the variable values and
+    # constraint duals
+    solution_info = dict()
+    load_solution_values(
+        instance=instance,
+        symbol_components=symbol_components,
+        solution_values=iter_gurobi_json_solution(
+            filepath=os.path.join(prob_sol_files_directory, solution_filename),
+            solution_info=solution_info,
+        ),
+        load_duals=load_duals,
+    )
 
     # Solver status
     # TODO: what are the types
-    termination_condition = (
-        "optimal" if solution["SolutionInfo"]["Status"] == 2 else "unknown"
-    )
-    solver_status = "ok" if solution["SolutionInfo"]["Status"] == 2 else "unknown"
+    termination_condition = "optimal" if solution_info.get("Status") == 2 else "unknown"
+    solver_status = "ok" if solution_info.get("Status") == 2 else "unknown"
     results = Results(
         solver_status=solver_status, termination_condition=termination_condition
     )
@@ -1369,7 +1732,75 @@ def load_gurobi_json_solution(
     return instance, results, dynamic_components
 
 
-def load_problem_info(prob_sol_files_directory):
+def load_problem_info(
+    scenario_directory, subproblem, stage, parsed_arguments, solution_components=None
+):
+    """
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :param parsed_arguments:
+    :param solution_components: list of the names of the variables and
+        constraints to load from the solution file; if None, all variables
+        and the constraints whose duals the modules export are loaded (see
+        *get_default_solution_components*)
+    :return: the instance, the dynamic components, and a mapping from the
+        problem file symbols to the instance's variable or constraint data
+        objects
+
+    The problem instance is rebuilt from the scenario inputs and the problem
+    file symbols are mapped to its components with the problem snapshot
+    saved when the problem file was created (see
+    *gridpath.auxiliary.problem_snapshot*). Problem files created by older
+    GridPath versions, for which the instance was pickled instead, can
+    still be loaded.
+    """
+    prob_sol_files_directory = os.path.join(
+        scenario_directory, subproblem, stage, "prob_sol_files"
+    )
+    if not problem_snapshot_exists(prob_sol_files_directory=prob_sol_files_directory):
+        return load_pickled_problem_info(
+            prob_sol_files_directory=prob_sol_files_directory,
+            solution_components=solution_components,
+        )
+
+    snapshot = read_problem_snapshot(prob_sol_files_directory=prob_sol_files_directory)
+    dynamic_components, instance = create_problem(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        parsed_arguments=parsed_arguments,
+    )
+    check_instance_structure(instance=instance, snapshot=snapshot)
+
+    if solution_components is None:
+        solution_components = get_default_solution_components(
+            scenario_directory=scenario_directory,
+            subproblem=subproblem,
+            stage=stage,
+            instance=instance,
+            dynamic_components=dynamic_components,
+        )
+    symbol_components = SnapshotSymbolComponents(
+        instance=instance, snapshot=snapshot, solution_components=solution_components
+    )
+
+    return instance, dynamic_components, symbol_components
+
+
+def load_pickled_problem_info(prob_sol_files_directory, solution_components=None):
+    """
+    :param prob_sol_files_directory:
+    :param solution_components: list of the names of the variables and
+        constraints to load from the solution file; all are loaded if None
+    :return: the instance, the dynamic components, and a dictionary of the
+        instance's variable or constraint data object by problem file symbol
+
+    Load the pickled instance, dynamic components, and symbol map saved by
+    older GridPath versions.
+    """
+    import dill
+
     with open(
         os.path.join(prob_sol_files_directory, "instance.pickle"), "rb"
     ) as instance_in:
@@ -1382,13 +1813,20 @@ def load_problem_info(prob_sol_files_directory):
         os.path.join(prob_sol_files_directory, "symbol_map.pickle"), "rb"
     ) as map_in:
         symbol_cuid_pairs = dill.load(map_in)
-        symbol_map = SymbolMap()
-        symbol_map.addSymbols(
-            (cuid.find_component_on(instance), symbol)
+
+    if solution_components is not None:
+        solution_components = set(solution_components)
+        symbol_cuid_pairs = (
+            (symbol, cuid)
             for symbol, cuid in symbol_cuid_pairs
+            if str(cuid).split("[", 1)[0] in solution_components
         )
 
-    return instance, dynamic_components, symbol_map
+    symbol_components = {
+        symbol: cuid.find_component_on(instance) for symbol, cuid in symbol_cuid_pairs
+    }
+
+    return instance, dynamic_components, symbol_components
 
 
 class Results(object):
@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pandas as pd
-
+from db.common_functions import spin_on_database_lock_transaction
 from gridpath.auxiliary.db_interface import import_csv
+from gridpath.auxiliary.dynamic_components import ResultsFrame
 
 LOAD_ZONE_TMP_DF = "load_zone_timepoint_df"
 
@@ -26,7 +26,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     # The results dataframes are by index
 
     # Zone-period DF
-    lz_tmp_df = pd.DataFrame(
+    lz_tmp_df = ResultsFrame(
         columns=[
             "load_zone",
             "period",
@@ -49,11 +49,10 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             for z in getattr(m, "LOAD_ZONES")
             for tmp in getattr(m, "TMPS")
         ],
-    ).set_index(["load_zone", "timepoint"])
-
-    lz_tmp_df.sort_index(inplace=True)
+        index_columns=["load_zone", "timepoint"],
+    )
 
-    # Add the dataframe to the dynamic components to pass to other modules
+    # Add the results frame to the dynamic components to pass to other modules
     setattr(d, LOAD_ZONE_TMP_DF, lz_tmp_df)
 
 
@@ -79,3 +78,49 @@ def import_results_into_database(
         results_directory=results_directory,
         which_results="system_load_zone_timepoint",
     )
+
+
+def process_results(db, c, scenario_id, subscenarios, quiet):
+    """
+    Aggregate the load zone results by period
+    :param db:
+    :param c:
+    :param subscenarios:
+    :param quiet:
+    :return:
+    """
+    if not quiet:
+        print("aggregate load zone results by period")
+
+    # Delete old load zone results by period
+    del_sql = """
+        DELETE FROM results_system_load_zone_period
+        WHERE scenario_id = ?
+        """
+
+    # Aggregate the load zone results by period and spinup_or_lookahead
+    agg_sql = """
+        INSERT INTO results_system_load_zone_period
+        (scenario_id, subproblem_id, stage_id, load_zone, period,
+        spinup_or_lookahead, static_load_mwh, total_power_mwh, net_imports_mwh,
+        net_market_purchases_mwh, overgeneration_mwh, unserved_energy_mwh)
+        SELECT
+        scenario_id, subproblem_id, stage_id, load_zone, period,
+        spinup_or_lookahead,
+        SUM(static_load_mw * timepoint_weight * number_of_hours_in_timepoint),
+        SUM(total_power_mw * timepoint_weight * number_of_hours_in_timepoint),
+        SUM(net_imports_mw * timepoint_weight * number_of_hours_in_timepoint),
+        SUM(net_market_purchases_mw * timepoint_weight
+            * number_of_hours_in_timepoint),
+        SUM(overgeneration_mw * timepoint_weight * number_of_hours_in_timepoint),
+        SUM(unserved_energy_mw * timepoint_weight * number_of_hours_in_timepoint)
+        FROM results_system_load_zone_timepoint
+        WHERE scenario_id = ?
+        GROUP BY subproblem_id, stage_id, load_zone, period, spinup_or_lookahead
+        ORDER BY subproblem_id, stage_id, load_zone, period, spinup_or_lookahead;
+        """
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[(del_sql, (scenario_id,)), (agg_sql, (scenario_id,))],
+    )
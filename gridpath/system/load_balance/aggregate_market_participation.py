@@ -23,7 +23,6 @@ from gridpath.auxiliary.dynamic_components import (
     load_balance_production_components,
     load_balance_consumption_components,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.system.load_balance import LOAD_ZONE_TMP_DF
 
 
@@ -86,12 +85,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for lz in getattr(m, "LOAD_ZONES")
         for tmp in getattr(m, "TMPS")
     ]
-    results_df = create_results_df(
-        index_columns=["load_zone", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, LOAD_ZONE_TMP_DF)[c] = None
-    getattr(d, LOAD_ZONE_TMP_DF).update(results_df)
+    getattr(d, LOAD_ZONE_TMP_DF).update(columns=results_columns, data=data)
@@ -20,8 +20,8 @@ load-balance constraint.
 
 from pyomo.environ import Expression, value
 
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
 from gridpath.auxiliary.dynamic_components import load_balance_production_components
-from gridpath.common_functions import create_results_df
 from gridpath.system.load_balance import LOAD_ZONE_TMP_DF
 
 
@@ -41,13 +41,13 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
 
     # Add power generation to load balance constraint
-    # TODO: is this better done with a set intersection (all projects in the
-    #  zone intersected with all operational project sin the timepoint)
     def total_power_production_rule(mod, z, tmp):
+        prj_opr_tmps = get_zone_tmp_index(
+            mod=mod, members="PRJ_OPR_TMPS", zone_param="load_zone"
+        )
         return sum(
             mod.Power_Provision_MW[g, tmp]
-            for g in mod.OPR_PRJS_IN_TMP[tmp]
-            if mod.load_zone[g] == z
+            for (g, tmp) in prj_opr_tmps.get((z, tmp), [])
         )
 
     m.Power_Production_in_Zone_MW = Expression(
@@ -91,12 +91,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for lz in getattr(m, "LOAD_ZONES")
         for tmp in getattr(m, "TMPS")
     ]
-    results_df = create_results_df(
-        index_columns=["load_zone", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, LOAD_ZONE_TMP_DF)[c] = None
-    getattr(d, LOAD_ZONE_TMP_DF).update(results_df)
+    getattr(d, LOAD_ZONE_TMP_DF).update(columns=results_columns, data=data)
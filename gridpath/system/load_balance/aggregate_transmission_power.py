@@ -20,11 +20,11 @@ production component, and adds it to the load-balance constraint.
 
 from pyomo.environ import Expression, value
 
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
 from gridpath.auxiliary.dynamic_components import (
     load_balance_production_components,
     load_balance_consumption_components,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.system.load_balance import LOAD_ZONE_TMP_DF
 
 
@@ -44,10 +44,12 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         Transmit_Power_MW is positive (losses are accounted for when the
         transmission flow is to the destination load zone) and 0 otherwise.
         """
+        tx_opr_tmps = get_zone_tmp_index(
+            mod=mod, members="TX_OPR_TMPS", zone_param="load_zone_to"
+        )
         return sum(
             (mod.Transmit_Power_MW[tx, tmp] - mod.Tx_Losses_LZ_To_MW[tx, tmp])
-            for tx in mod.TX_LINES_OPR_IN_TMP[tmp]
-            if mod.load_zone_to[tx] == z
+            for (tx, tmp) in tx_opr_tmps.get((z, tmp), [])
         )
 
     m.Transmission_to_Zone_MW = Expression(
@@ -62,10 +64,12 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         Transmit_Power_MW is negative (losses are accounted for when the
         transmission flow is to the origin load zone) and 0 otherwise.
         """
+        tx_opr_tmps = get_zone_tmp_index(
+            mod=mod, members="TX_OPR_TMPS", zone_param="load_zone_from"
+        )
         return sum(
             (mod.Transmit_Power_MW[tx, tmp] + mod.Tx_Losses_LZ_From_MW[tx, tmp])
-            for tx in mod.TX_LINES_OPR_IN_TMP[tmp]
-            if mod.load_zone_from[tx] == z
+            for (tx, tmp) in tx_opr_tmps.get((z, tmp), [])
         )
 
     m.Transmission_from_Zone_MW = Expression(
@@ -119,12 +123,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for lz in getattr(m, "LOAD_ZONES")
         for tmp in getattr(m, "TMPS")
     ]
-    results_df = create_results_df(
-        index_columns=["load_zone", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, LOAD_ZONE_TMP_DF)[c] = None
-    getattr(d, LOAD_ZONE_TMP_DF).update(results_df)
+    getattr(d, LOAD_ZONE_TMP_DF).update(columns=results_columns, data=data)
@@ -39,15 +39,18 @@ load-balance violation type.
 
 import csv
 import os.path
-from pyomo.environ import Var, Constraint, Expression, NonNegativeReals, value
+from pyomo.environ import Set, Var, Constraint, Expression, NonNegativeReals, value
 
 from db.common_functions import spin_on_database_lock
+from gridpath.auxiliary.auxiliary import (
+    get_constraint_duals,
+    subset_init_by_param_value,
+)
 from gridpath.auxiliary.db_interface import setup_results_import
 from gridpath.auxiliary.dynamic_components import (
     load_balance_consumption_components,
     load_balance_production_components,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.system.load_balance import LOAD_ZONE_TMP_DF
 
 
@@ -70,9 +73,27 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     tmp}`
     """
 
-    # Penalty variables
-    m.Overgeneration_MW = Var(m.LOAD_ZONES, m.TMPS, within=NonNegativeReals)
-    m.Unserved_Energy_MW = Var(m.LOAD_ZONES, m.TMPS, within=NonNegativeReals)
+    # Penalty variables; these are only created in the zones where the
+    # respective violation is allowed
+    m.LOAD_ZONES_WITH_OVERGENERATION_ALLOWED = Set(
+        within=m.LOAD_ZONES,
+        initialize=lambda mod: subset_init_by_param_value(
+            mod, "LOAD_ZONES", "allow_overgeneration", 1
+        ),
+    )
+    m.LOAD_ZONES_WITH_UNSERVED_ENERGY_ALLOWED = Set(
+        within=m.LOAD_ZONES,
+        initialize=lambda mod: subset_init_by_param_value(
+            mod, "LOAD_ZONES", "allow_unserved_energy", 1
+        ),
+    )
+
+    m.Overgeneration_MW = Var(
+        m.LOAD_ZONES_WITH_OVERGENERATION_ALLOWED, m.TMPS, within=NonNegativeReals
+    )
+    m.Unserved_Energy_MW = Var(
+        m.LOAD_ZONES_WITH_UNSERVED_ENERGY_ALLOWED, m.TMPS, within=NonNegativeReals
+    )
 
     # Penalty expressions (will be zero if violations not allowed)
     def overgeneration_expression_rule(mod, z, tmp):
@@ -192,25 +213,27 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         "load_balance_dual",
         "load_balance_marginal_cost_per_mw",
     ]
+    duals = get_constraint_duals(instance=m, constraint_name="Meet_Load_Constraint")
     data = [
         [
             lz,
             tmp,
             value(m.Overgeneration_MW_Expression[lz, tmp]),
             value(m.Unserved_Energy_MW_Expression[lz, tmp]),
-            m.dual[getattr(m, "Meet_Load_Constraint")[lz, tmp]],
-            m.dual[getattr(m, "Meet_Load_Constraint")[lz, tmp]]
-            / m.tmp_objective_coefficient[tmp],
+            duals[lz, tmp],
+            None
+            if duals[lz, tmp] is None
+            else duals[lz, tmp] / m.tmp_objective_coefficient[tmp],
         ]
         for lz in getattr(m, "LOAD_ZONES")
         for tmp in getattr(m, "TMPS")
     ]
-    results_df = create_results_df(
-        index_columns=["load_zone", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
+    getattr(d, LOAD_ZONE_TMP_DF).update(columns=results_columns, data=data)
 
-    for c in results_columns:
-        getattr(d, LOAD_ZONE_TMP_DF)[c] = None
-    getattr(d, LOAD_ZONE_TMP_DF).update(results_df)
+
+def save_duals(scenario_directory, subproblem, stage, instance, dynamic_components):
+    instance.constraint_indices["Meet_Load_Constraint"] = [
+        "load_zone",
+        "timepoint",
+        "dual",
+    ]
@@ -12,9 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pandas as pd
-
 from gridpath.auxiliary.db_interface import import_csv
+from gridpath.auxiliary.dynamic_components import ResultsFrame
 
 CARBON_CAP_ZONE_PRD_DF = "carbon_cap_zone_period_df"
 
@@ -26,7 +25,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     # The results dataframes are by index
 
     # Zone-period DF
-    z_prd_df = pd.DataFrame(
+    z_prd_df = ResultsFrame(
         columns=[
             "carbon_cap_zone",
             "period",
@@ -42,11 +41,10 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             ]
             for (z, p) in m.CARBON_CAP_ZONE_PERIODS_WITH_CARBON_CAP
         ],
-    ).set_index(["carbon_cap_zone", "period"])
-
-    z_prd_df.sort_index(inplace=True)
+        index_columns=["carbon_cap_zone", "period"],
+    )
 
-    # Add the dataframe to the dynamic components to pass to other modules
+    # Add the results frame to the dynamic components to pass to other modules
     setattr(d, CARBON_CAP_ZONE_PRD_DF, z_prd_df)
 
 
@@ -19,8 +19,8 @@ the carbon cap zone - period level.
 
 from pyomo.environ import Expression, value
 
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
 from gridpath.auxiliary.dynamic_components import carbon_cap_balance_emission_components
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.carbon_cap import CARBON_CAP_ZONE_PRD_DF
 
 
@@ -41,12 +41,17 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param p:
         :return:
         """
+        crbn_prj_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="CRBN_PRJ_OPR_TMPS",
+            elements_by_zone="CRBN_PRJS_BY_CARBON_CAP_ZONE",
+        )
         return sum(
             mod.Project_Carbon_Emissions[g, tmp]
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (g, tmp) in mod.CRBN_PRJ_OPR_TMPS
-            if g in mod.CRBN_PRJS_BY_CARBON_CAP_ZONE[z] and tmp in mod.TMPS_IN_PRD[p]
+            for t in mod.TMPS_IN_PRD[p]
+            for (g, tmp) in crbn_prj_opr_tmps.get((z, t), [])
         )
 
     m.Total_Carbon_Cap_Project_Emissions = Expression(
@@ -90,12 +95,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.CARBON_CAP_ZONE_PERIODS_WITH_CARBON_CAP
     ]
-    results_df = create_results_df(
-        index_columns=["carbon_cap_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, CARBON_CAP_ZONE_PRD_DF)[c] = None
-    getattr(d, CARBON_CAP_ZONE_PRD_DF).update(results_df)
+    getattr(d, CARBON_CAP_ZONE_PRD_DF).update(columns=results_columns, data=data)
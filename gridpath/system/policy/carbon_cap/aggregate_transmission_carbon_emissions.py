@@ -31,8 +31,8 @@ from pyomo.environ import (
 )
 
 from db.common_functions import spin_on_database_lock
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
 from gridpath.auxiliary.dynamic_components import carbon_cap_balance_emission_components
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.carbon_cap import CARBON_CAP_ZONE_PRD_DF
 from gridpath.transmission.operations.carbon_emissions import (
     calculate_carbon_emissions_imports,
@@ -56,13 +56,17 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param p:
         :return:
         """
+        crb_tx_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="CRB_TX_OPR_TMPS",
+            elements_by_zone="CRB_TX_LINES_BY_CARBON_CAP_ZONE",
+        )
         return sum(
             mod.Import_Carbon_Emissions_Tons[tx, tmp]
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (tx, tmp) in mod.CRB_TX_OPR_TMPS
-            if tx in mod.CRB_TX_LINES_BY_CARBON_CAP_ZONE[z]
-            and tmp in mod.TMPS_IN_PRD[p]
+            for t in mod.TMPS_IN_PRD[p]
+            for (tx, tmp) in crb_tx_opr_tmps.get((z, t), [])
         )
 
     m.Total_Carbon_Emission_Imports_Tons = Expression(
@@ -96,12 +100,17 @@ def total_carbon_emissions_imports_degen_expr_rule(mod, z, p):
     :param p:
     :return:
     """
+    crb_tx_opr_tmps = get_zone_tmp_index(
+        mod=mod,
+        members="CRB_TX_OPR_TMPS",
+        elements_by_zone="CRB_TX_LINES_BY_CARBON_CAP_ZONE",
+    )
     return sum(
         calculate_carbon_emissions_imports(mod, tx, tmp)
         * mod.hrs_in_tmp[tmp]
         * mod.tmp_weight[tmp]
-        for (tx, tmp) in mod.CRB_TX_OPR_TMPS
-        if tx in mod.CRB_TX_LINES_BY_CARBON_CAP_ZONE[z] and tmp in mod.TMPS_IN_PRD[p]
+        for t in mod.TMPS_IN_PRD[p]
+        for (tx, tmp) in crb_tx_opr_tmps.get((z, t), [])
     )
 
 
@@ -131,18 +140,19 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.CARBON_CAP_ZONE_PERIODS_WITH_CARBON_CAP
     ]
-    results_df = create_results_df(
-        index_columns=["carbon_cap_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, CARBON_CAP_ZONE_PRD_DF)[c] = None
-    getattr(d, CARBON_CAP_ZONE_PRD_DF).update(results_df)
+    getattr(d, CARBON_CAP_ZONE_PRD_DF).update(columns=results_columns, data=data)
 
     # Update the total_emissions_degen column
-    getattr(d, CARBON_CAP_ZONE_PRD_DF)["total_emissions_degen"] = (
-        getattr(d, CARBON_CAP_ZONE_PRD_DF)["project_emissions"]
-        + getattr(d, CARBON_CAP_ZONE_PRD_DF)["import_emissions_degen"]
+    results_frame = getattr(d, CARBON_CAP_ZONE_PRD_DF)
+    results_frame.set_column(
+        "total_emissions_degen",
+        [
+            None
+            if prj_emissions is None or import_emissions is None
+            else prj_emissions + import_emissions
+            for (prj_emissions, import_emissions) in zip(
+                results_frame.get_column("project_emissions"),
+                results_frame.get_column("import_emissions_degen"),
+            )
+        ],
     )
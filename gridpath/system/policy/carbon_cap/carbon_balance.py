@@ -16,13 +16,12 @@
 Constraint total carbon emissions to be less than cap
 """
 
-from pyomo.environ import Var, Constraint, Expression, NonNegativeReals, value
+from pyomo.environ import Set, Var, Constraint, Expression, NonNegativeReals, value
 
 from gridpath.auxiliary.dynamic_components import (
     carbon_cap_balance_emission_components,
     carbon_cap_balance_credit_components,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.carbon_cap import CARBON_CAP_ZONE_PRD_DF
 
 
@@ -34,8 +33,19 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     :return:
     """
 
+    # Only create violation variables where violations are allowed
+    m.CARBON_CAP_ZONE_PERIODS_WITH_VIOLATION_ALLOWED = Set(
+        dimen=2,
+        within=m.CARBON_CAP_ZONE_PERIODS_WITH_CARBON_CAP,
+        initialize=lambda mod: [
+            (z, p)
+            for (z, p) in mod.CARBON_CAP_ZONE_PERIODS_WITH_CARBON_CAP
+            if mod.carbon_cap_allow_violation[z]
+        ],
+    )
+
     m.Carbon_Cap_Overage = Var(
-        m.CARBON_CAP_ZONE_PERIODS_WITH_CARBON_CAP, within=NonNegativeReals
+        m.CARBON_CAP_ZONE_PERIODS_WITH_VIOLATION_ALLOWED, within=NonNegativeReals
     )
 
     def violation_expression_rule(mod, z, p):
@@ -119,15 +129,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.CARBON_CAP_ZONE_PERIODS_WITH_CARBON_CAP
     ]
-    results_df = create_results_df(
-        index_columns=["carbon_cap_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, CARBON_CAP_ZONE_PRD_DF)[c] = None
-    getattr(d, CARBON_CAP_ZONE_PRD_DF).update(results_df)
+    getattr(d, CARBON_CAP_ZONE_PRD_DF).update(columns=results_columns, data=data)
 
 
 def save_duals(scenario_directory, subproblem, stage, instance, dynamic_components):
@@ -22,7 +22,6 @@ import pandas as pd
 
 from pyomo.environ import Set, Param, NonNegativeReals, value
 
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.carbon_cap import CARBON_CAP_ZONE_PRD_DF
 
 
@@ -173,12 +172,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.CARBON_CAP_ZONE_PERIODS_WITH_CARBON_CAP
     ]
-    results_df = create_results_df(
-        index_columns=["carbon_cap_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, CARBON_CAP_ZONE_PRD_DF)[c] = None
-    getattr(d, CARBON_CAP_ZONE_PRD_DF).update(results_df)
+    getattr(d, CARBON_CAP_ZONE_PRD_DF).update(columns=results_columns, data=data)
@@ -21,7 +21,6 @@ from pyomo.environ import Expression, value
 from gridpath.auxiliary.dynamic_components import (
     carbon_credits_balance_purchase_components,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.carbon_credits import CARBON_CREDITS_ZONE_PRD_DF
 
 
@@ -77,12 +76,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for z in m.CARBON_CREDITS_ZONES
         for p in m.PERIODS
     ]
-    results_df = create_results_df(
-        index_columns=["carbon_credits_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, CARBON_CREDITS_ZONE_PRD_DF)[c] = None
-    getattr(d, CARBON_CREDITS_ZONE_PRD_DF).update(results_df)
+    getattr(d, CARBON_CREDITS_ZONE_PRD_DF).update(columns=results_columns, data=data)
@@ -20,7 +20,7 @@ zone - period level.
 
 from pyomo.environ import Expression, value
 
-from gridpath.common_functions import create_results_df
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
 from gridpath.auxiliary.dynamic_components import (
     carbon_credits_balance_generation_components,
 )
@@ -44,11 +44,14 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param prd:
         :return:
         """
+        carbon_credits_prj_opr_prds = get_zone_tmp_index(
+            mod=mod,
+            members="CARBON_CREDITS_PRJ_OPR_PRDS",
+            elements_by_zone="CARBON_CREDITS_PRJS_BY_CARBON_CREDITS_ZONE",
+        )
         return sum(
             mod.Project_Carbon_Credits_Generated[prj, prd]
-            for (prj, period) in mod.CARBON_CREDITS_PRJ_OPR_PRDS
-            if prj in mod.CARBON_CREDITS_PRJS_BY_CARBON_CREDITS_ZONE[z]
-            and prd == period
+            for (prj, prd) in carbon_credits_prj_opr_prds.get((z, prd), [])
         )
 
     m.Total_Project_Carbon_Credits_Generated = Expression(
@@ -92,12 +95,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for z in m.CARBON_CREDITS_ZONES
         for p in m.PERIODS
     ]
-    results_df = create_results_df(
-        index_columns=["carbon_credits_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, CARBON_CREDITS_ZONE_PRD_DF)[c] = None
-    getattr(d, CARBON_CREDITS_ZONE_PRD_DF).update(results_df)
+    getattr(d, CARBON_CREDITS_ZONE_PRD_DF).update(columns=results_columns, data=data)
@@ -21,7 +21,6 @@ import os.path
 from pyomo.environ import Param, Var, NonNegativeReals, value
 
 from gridpath.auxiliary.auxiliary import cursor_to_df
-from gridpath.common_functions import create_results_df
 from gridpath.auxiliary.dynamic_components import (
     carbon_credits_balance_purchase_components,
 )
@@ -179,12 +178,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for z in m.CARBON_CREDITS_ZONES
         for p in m.PERIODS
     ]
-    results_df = create_results_df(
-        index_columns=["carbon_credits_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, CARBON_CREDITS_ZONE_PRD_DF)[c] = None
-    getattr(d, CARBON_CREDITS_ZONE_PRD_DF).update(results_df)
+    getattr(d, CARBON_CREDITS_ZONE_PRD_DF).update(columns=results_columns, data=data)
@@ -21,8 +21,8 @@ the carbon tax zone - period level.
 
 from pyomo.environ import Expression, value
 
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
 from gridpath.auxiliary.dynamic_components import carbon_tax_cost_components
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.carbon_tax import CARBON_TAX_ZONE_PRD_DF
 
 
@@ -43,13 +43,17 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param p:
         :return:
         """
+        carbon_tax_prj_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="CARBON_TAX_PRJ_OPR_TMPS",
+            elements_by_zone="CARBON_TAX_PRJS_BY_CARBON_TAX_ZONE",
+        )
         return sum(
             mod.Project_Carbon_Emissions[g, tmp]
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (g, tmp) in mod.CARBON_TAX_PRJ_OPR_TMPS
-            if g in mod.CARBON_TAX_PRJS_BY_CARBON_TAX_ZONE[z]
-            and tmp in mod.TMPS_IN_PRD[p]
+            for t in mod.TMPS_IN_PRD[p]
+            for (g, tmp) in carbon_tax_prj_opr_tmps.get((z, t), [])
         )
 
     m.Total_Carbon_Tax_Project_Emissions = Expression(
@@ -65,13 +69,17 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param p:
         :return:
         """
+        carbon_tax_prj_fuel_group_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="CARBON_TAX_PRJ_FUEL_GROUP_OPR_TMPS",
+            elements_by_zone="CARBON_TAX_PRJS_BY_CARBON_TAX_ZONE",
+        )
         return sum(
             mod.Project_Carbon_Tax_Allowance[g, fg, tmp]
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (g, fg, tmp) in mod.CARBON_TAX_PRJ_FUEL_GROUP_OPR_TMPS
-            if g in mod.CARBON_TAX_PRJS_BY_CARBON_TAX_ZONE[z]
-            and tmp in mod.TMPS_IN_PRD[p]
+            for t in mod.TMPS_IN_PRD[p]
+            for (g, fg, tmp) in carbon_tax_prj_fuel_group_opr_tmps.get((z, t), [])
         )
 
     m.Total_Carbon_Tax_Project_Allowance = Expression(
@@ -124,12 +132,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.CARBON_TAX_ZONE_PERIODS_WITH_CARBON_TAX
     ]
-    results_df = create_results_df(
-        index_columns=["carbon_tax_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, CARBON_TAX_ZONE_PRD_DF)[c] = None
-    getattr(d, CARBON_TAX_ZONE_PRD_DF).update(results_df)
+    getattr(d, CARBON_TAX_ZONE_PRD_DF).update(columns=results_columns, data=data)
@@ -21,7 +21,6 @@ from pyomo.environ import Set, Var, NonNegativeReals, Expression, value
 
 from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.dynamic_components import carbon_tax_cost_components
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.carbon_tax import CARBON_TAX_ZONE_PRD_DF
 
 
@@ -171,12 +170,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.CARBON_TAX_ZONE_PERIODS_WITH_CARBON_TAX
     ]
-    results_df = create_results_df(
-        index_columns=["carbon_tax_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, CARBON_TAX_ZONE_PRD_DF)[c] = None
-    getattr(d, CARBON_TAX_ZONE_PRD_DF).update(results_df)
+    getattr(d, CARBON_TAX_ZONE_PRD_DF).update(columns=results_columns, data=data)
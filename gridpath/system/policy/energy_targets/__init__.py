@@ -13,9 +13,9 @@
 # limitations under the License.
 
 import os.path
-import pandas as pd
 
 from gridpath.auxiliary.db_interface import import_csv
+from gridpath.auxiliary.dynamic_components import ResultsFrame
 
 ENERGY_TARGET_ZONE_PRD_DF = "energy_target_zone_period_df"
 ENERGY_TARGET_ZONE_HRZ_DF = "energy_target_zone_horizon_df"
@@ -80,14 +80,13 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     }
     for target_type in target_types.keys():
         if target_types[target_type]["exists"]:
-            df = pd.DataFrame(
+            df = ResultsFrame(
                 columns=target_types[target_type]["columns"],
                 data=target_types[target_type]["data"],
-            ).set_index(target_types[target_type]["index"])
-
-            df.sort_index(inplace=True)
+                index_columns=target_types[target_type]["index"],
+            )
 
-            # Add the dataframe to the dynamic components to pass to other modules
+            # Add the results frame to the dynamic components to pass to other modules
             setattr(d, target_types[target_type]["df"], df)
 
 
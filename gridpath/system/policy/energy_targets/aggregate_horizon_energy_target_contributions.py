@@ -19,7 +19,7 @@ level to the energy-target zone - balancing type - horizon level.
 
 from pyomo.environ import Expression, value
 
-from gridpath.common_functions import create_results_df
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
 from gridpath.system.policy.energy_targets import ENERGY_TARGET_ZONE_HRZ_DF
 
 
@@ -45,6 +45,11 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param h:
         :return:
         """
+        energy_target_prj_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="ENERGY_TARGET_PRJ_OPR_TMPS",
+            elements_by_zone="ENERGY_TARGET_PRJS_BY_ENERGY_TARGET_ZONE",
+        )
         return sum(
             (
                 mod.Scheduled_Energy_Target_Energy_MW[g, tmp]
@@ -53,9 +58,8 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
             )
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (g, tmp) in mod.ENERGY_TARGET_PRJ_OPR_TMPS
-            if g in mod.ENERGY_TARGET_PRJS_BY_ENERGY_TARGET_ZONE[z]
-            and tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h]
+            for t in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h]
+            for (g, tmp) in energy_target_prj_opr_tmps.get((z, t), [])
         )
 
     m.Total_Delivered_Horizon_Energy_Target_Energy_MWh = Expression(
@@ -73,6 +77,11 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param h:
         :return:
         """
+        energy_target_prj_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="ENERGY_TARGET_PRJ_OPR_TMPS",
+            elements_by_zone="ENERGY_TARGET_PRJS_BY_ENERGY_TARGET_ZONE",
+        )
         return sum(
             (
                 mod.Scheduled_Curtailment_MW[g, tmp]
@@ -81,9 +90,8 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
             )
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (g, tmp) in mod.ENERGY_TARGET_PRJ_OPR_TMPS
-            if g in mod.ENERGY_TARGET_PRJS_BY_ENERGY_TARGET_ZONE[z]
-            and tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h]
+            for t in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h]
+            for (g, tmp) in energy_target_prj_opr_tmps.get((z, t), [])
         )
 
     m.Total_Curtailed_Horizon_Energy_Target_Energy_MWh = Expression(
@@ -117,12 +125,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, bt, h) in m.ENERGY_TARGET_ZONE_BLN_TYPE_HRZS_WITH_ENERGY_TARGET
     ]
-    results_df = create_results_df(
-        index_columns=["energy_target_zone", "balancing_type", "horizon"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, ENERGY_TARGET_ZONE_HRZ_DF)[c] = None
-    getattr(d, ENERGY_TARGET_ZONE_HRZ_DF).update(results_df)
+    getattr(d, ENERGY_TARGET_ZONE_HRZ_DF).update(columns=results_columns, data=data)
@@ -19,7 +19,7 @@ the energy-target zone - period level.
 
 from pyomo.environ import Expression, value
 
-from gridpath.common_functions import create_results_df
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
 from gridpath.system.policy.energy_targets import ENERGY_TARGET_ZONE_PRD_DF
 
 
@@ -43,6 +43,11 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param p:
         :return:
         """
+        energy_target_prj_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="ENERGY_TARGET_PRJ_OPR_TMPS",
+            elements_by_zone="ENERGY_TARGET_PRJS_BY_ENERGY_TARGET_ZONE",
+        )
         return sum(
             (
                 mod.Scheduled_Energy_Target_Energy_MW[g, tmp]
@@ -51,9 +56,8 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
             )
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (g, tmp) in mod.ENERGY_TARGET_PRJ_OPR_TMPS
-            if g in mod.ENERGY_TARGET_PRJS_BY_ENERGY_TARGET_ZONE[z]
-            and tmp in mod.TMPS_IN_PRD[p]
+            for t in mod.TMPS_IN_PRD[p]
+            for (g, tmp) in energy_target_prj_opr_tmps.get((z, t), [])
         )
 
     m.Total_Delivered_Period_Energy_Target_Energy_MWh = Expression(
@@ -70,6 +74,11 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param p:
         :return:
         """
+        energy_target_prj_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="ENERGY_TARGET_PRJ_OPR_TMPS",
+            elements_by_zone="ENERGY_TARGET_PRJS_BY_ENERGY_TARGET_ZONE",
+        )
         return sum(
             (
                 mod.Scheduled_Curtailment_MW[g, tmp]
@@ -78,9 +87,8 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
             )
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (g, tmp) in mod.ENERGY_TARGET_PRJ_OPR_TMPS
-            if g in mod.ENERGY_TARGET_PRJS_BY_ENERGY_TARGET_ZONE[z]
-            and tmp in mod.TMPS_IN_PRD[p]
+            for t in mod.TMPS_IN_PRD[p]
+            for (g, tmp) in energy_target_prj_opr_tmps.get((z, t), [])
         )
 
     m.Total_Curtailed_Period_Energy_Target_Energy_MWh = Expression(
@@ -113,12 +121,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.ENERGY_TARGET_ZONE_PERIODS_WITH_ENERGY_TARGET
     ]
-    results_df = create_results_df(
-        index_columns=["energy_target_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, ENERGY_TARGET_ZONE_PRD_DF)[c] = None
-    getattr(d, ENERGY_TARGET_ZONE_PRD_DF).update(results_df)
+    getattr(d, ENERGY_TARGET_ZONE_PRD_DF).update(columns=results_columns, data=data)
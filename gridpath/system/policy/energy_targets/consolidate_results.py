@@ -28,7 +28,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     """
 
     if hasattr(m, "ENERGY_TARGET_ZONE_PERIODS_WITH_ENERGY_TARGET"):
-        getattr(d, ENERGY_TARGET_ZONE_PRD_DF).to_csv(
+        getattr(d, ENERGY_TARGET_ZONE_PRD_DF).to_df().to_csv(
             os.path.join(
                 scenario_directory,
                 str(subproblem),
@@ -41,7 +41,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         )
 
     if hasattr(m, "ENERGY_TARGET_ZONE_BLN_TYPE_HRZS_WITH_ENERGY_TARGET"):
-        getattr(d, ENERGY_TARGET_ZONE_HRZ_DF).to_csv(
+        getattr(d, ENERGY_TARGET_ZONE_HRZ_DF).to_df().to_csv(
             os.path.join(
                 scenario_directory,
                 str(subproblem),
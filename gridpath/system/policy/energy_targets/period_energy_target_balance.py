@@ -21,9 +21,8 @@ import csv
 import os.path
 import pandas as pd
 
-from pyomo.environ import Var, Constraint, NonNegativeReals, Expression, value
+from pyomo.environ import Set, Var, Constraint, NonNegativeReals, Expression, value
 
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.energy_targets import ENERGY_TARGET_ZONE_PRD_DF
 
 
@@ -35,8 +34,19 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     :return:
     """
 
+    # Only create violation variables where violations are allowed
+    m.ENERGY_TARGET_ZONE_PERIODS_WITH_VIOLATION_ALLOWED = Set(
+        dimen=2,
+        within=m.ENERGY_TARGET_ZONE_PERIODS_WITH_ENERGY_TARGET,
+        initialize=lambda mod: [
+            (z, p)
+            for (z, p) in mod.ENERGY_TARGET_ZONE_PERIODS_WITH_ENERGY_TARGET
+            if mod.energy_target_allow_violation[z]
+        ],
+    )
+
     m.Period_Energy_Target_Shortage_MWh = Var(
-        m.ENERGY_TARGET_ZONE_PERIODS_WITH_ENERGY_TARGET, within=NonNegativeReals
+        m.ENERGY_TARGET_ZONE_PERIODS_WITH_VIOLATION_ALLOWED, within=NonNegativeReals
     )
 
     def violation_expression_rule(mod, z, p):
@@ -124,15 +134,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.ENERGY_TARGET_ZONE_PERIODS_WITH_ENERGY_TARGET
     ]
-    results_df = create_results_df(
-        index_columns=["energy_target_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, ENERGY_TARGET_ZONE_PRD_DF)[c] = None
-    getattr(d, ENERGY_TARGET_ZONE_PRD_DF).update(results_df)
+    getattr(d, ENERGY_TARGET_ZONE_PRD_DF).update(columns=results_columns, data=data)
 
 
 def save_duals(scenario_directory, subproblem, stage, instance, dynamic_components):
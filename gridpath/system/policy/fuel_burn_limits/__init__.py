@@ -12,9 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pandas as pd
-
 from gridpath.auxiliary.db_interface import import_csv
+from gridpath.auxiliary.dynamic_components import ResultsFrame
 
 FUEL_BURN_LIMITS_DF = "fuel_burn_limits_df"
 
@@ -26,7 +25,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     # The results dataframes are by index
 
     # Zone-period DF
-    df = pd.DataFrame(
+    df = ResultsFrame(
         columns=[
             "fuel",
             "fuel_burn_limit_ba",
@@ -46,18 +45,15 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             ]
             for (f, z, bt, h) in m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_LIMIT
         ],
-    ).set_index(
-        [
+        index_columns=[
             "fuel",
             "fuel_burn_limit_ba",
             "balancing_type",
             "horizon",
-        ]
+        ],
     )
 
-    df.sort_index(inplace=True)
-
-    # Add the dataframe to the dynamic components to pass to other modules
+    # Add the results frame to the dynamic components to pass to other modules
     setattr(d, FUEL_BURN_LIMITS_DF, df)
 
 
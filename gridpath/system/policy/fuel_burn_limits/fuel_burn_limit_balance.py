@@ -20,12 +20,11 @@ burn in another fuel - BA.
 import csv
 import os.path
 
-from pyomo.environ import Var, Constraint, NonNegativeReals, Expression, value
+from pyomo.environ import Set, Var, Constraint, NonNegativeReals, Expression, value
 
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.db_interface import setup_results_import
 from gridpath.auxiliary.dynamic_components import fuel_burn_balance_components
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.fuel_burn_limits import FUEL_BURN_LIMITS_DF
 
 
@@ -48,8 +47,19 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
 
     # Absolute constraints on fuel burn
     # Min fuel burn
+    # Only create violation variables where violations are allowed
+    m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MIN_ABS_VIOLATION_ALLOWED = Set(
+        dimen=4,
+        within=m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MIN_ABS_LIMIT,
+        initialize=lambda mod: [
+            idx
+            for idx in mod.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MIN_ABS_LIMIT
+            if mod.fuel_burn_min_allow_violation[idx[0], idx[1]]
+        ],
+    )
+
     m.Fuel_Burn_Min_Shortage_Abs_Unit = Var(
-        m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MIN_ABS_LIMIT,
+        m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MIN_ABS_VIOLATION_ALLOWED,
         within=NonNegativeReals,
     )
 
@@ -88,8 +98,18 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     )
 
     # Max fuel burn
+    m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MAX_ABS_VIOLATION_ALLOWED = Set(
+        dimen=4,
+        within=m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MAX_ABS_LIMIT,
+        initialize=lambda mod: [
+            idx
+            for idx in mod.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MAX_ABS_LIMIT
+            if mod.fuel_burn_max_allow_violation[idx[0], idx[1]]
+        ],
+    )
+
     m.Fuel_Burn_Max_Overage_Abs_Unit = Var(
-        m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MAX_ABS_LIMIT,
+        m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MAX_ABS_VIOLATION_ALLOWED,
         within=NonNegativeReals,
     )
 
@@ -128,8 +148,18 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     )
 
     # Relative to fuel burn in other fuel - BA
+    m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MAX_REL_VIOLATION_ALLOWED = Set(
+        dimen=4,
+        within=m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MAX_REL_LIMIT,
+        initialize=lambda mod: [
+            idx
+            for idx in mod.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MAX_REL_LIMIT
+            if mod.fuel_burn_relative_max_allow_violation[idx[0], idx[1]]
+        ],
+    )
+
     m.Fuel_Burn_Limit_Overage_Rel_Unit = Var(
-        m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MAX_REL_LIMIT,
+        m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_MAX_REL_VIOLATION_ALLOWED,
         within=NonNegativeReals,
     )
 
@@ -267,20 +297,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (f, z, bt, h) in m.FUEL_FUEL_BA_BLN_TYPE_HRZS_WITH_FUEL_BURN_LIMIT
     ]
-    results_df = create_results_df(
-        index_columns=[
-            "fuel",
-            "fuel_burn_limit_ba",
-            "balancing_type",
-            "horizon",
-        ],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, FUEL_BURN_LIMITS_DF)[c] = None
-    getattr(d, FUEL_BURN_LIMITS_DF).update(results_df)
+    getattr(d, FUEL_BURN_LIMITS_DF).update(columns=results_columns, data=data)
 
 
 def save_duals(scenario_directory, subproblem, stage, instance, dynamic_components):
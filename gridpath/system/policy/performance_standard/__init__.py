@@ -12,9 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pandas as pd
-
 from gridpath.auxiliary.db_interface import import_csv
+from gridpath.auxiliary.dynamic_components import ResultsFrame
 
 PERFORMANCE_STANDARD_Z_PRD_DF = "performance_standard_z_prd_df"
 
@@ -26,7 +25,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     # The results dataframes are by index
 
     # Zone-period DF
-    df = pd.DataFrame(
+    df = ResultsFrame(
         columns=[
             "performance_standard_zone",
             "period",
@@ -42,11 +41,10 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             ]
             for (z, p) in m.PERFORMANCE_STANDARD_ZONE_PERIODS_WITH_PERFORMANCE_STANDARD
         ],
-    ).set_index(["performance_standard_zone", "period"])
-
-    df.sort_index(inplace=True)
+        index_columns=["performance_standard_zone", "period"],
+    )
 
-    # Add the dataframe to the dynamic components to pass to other modules
+    # Add the results frame to the dynamic components to pass to other modules
     setattr(d, PERFORMANCE_STANDARD_Z_PRD_DF, df)
 
 
@@ -20,10 +20,10 @@ the performance zone - period level.
 
 from pyomo.environ import Expression, value
 
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
 from gridpath.auxiliary.dynamic_components import (
     performance_standard_balance_emission_components,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.performance_standard import PERFORMANCE_STANDARD_Z_PRD_DF
 
 
@@ -44,13 +44,17 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param p:
         :return:
         """
+        performance_standard_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="PERFORMANCE_STANDARD_OPR_TMPS",
+            elements_by_zone="PERFORMANCE_STANDARD_PRJS_BY_PERFORMANCE_STANDARD_ZONE",
+        )
         return sum(
             mod.Project_Carbon_Emissions[g, tmp]
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (g, tmp) in mod.PERFORMANCE_STANDARD_OPR_TMPS
-            if g in mod.PERFORMANCE_STANDARD_PRJS_BY_PERFORMANCE_STANDARD_ZONE[z]
-            and tmp in mod.TMPS_IN_PRD[p]
+            for t in mod.TMPS_IN_PRD[p]
+            for (g, tmp) in performance_standard_opr_tmps.get((z, t), [])
         )
 
     m.Total_Performance_Standard_Project_Emissions = Expression(
@@ -67,11 +71,15 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param p:
         :return:
         """
+        performance_standard_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="PERFORMANCE_STANDARD_OPR_TMPS",
+            elements_by_zone="PERFORMANCE_STANDARD_PRJS_BY_PERFORMANCE_STANDARD_ZONE",
+        )
         return sum(
             mod.Power_Provision_MW[g, tmp] * mod.hrs_in_tmp[tmp] * mod.tmp_weight[tmp]
-            for (g, tmp) in mod.PERFORMANCE_STANDARD_OPR_TMPS
-            if g in mod.PERFORMANCE_STANDARD_PRJS_BY_PERFORMANCE_STANDARD_ZONE[z]
-            and tmp in mod.TMPS_IN_PRD[p]
+            for t in mod.TMPS_IN_PRD[p]
+            for (g, tmp) in performance_standard_opr_tmps.get((z, t), [])
         )
 
     # We'll multiply this by the standard in the balance constraint
@@ -119,12 +127,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.PERFORMANCE_STANDARD_ZONE_PERIODS_WITH_PERFORMANCE_STANDARD
     ]
-    results_df = create_results_df(
-        index_columns=["performance_standard_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PERFORMANCE_STANDARD_Z_PRD_DF)[c] = None
-    getattr(d, PERFORMANCE_STANDARD_Z_PRD_DF).update(results_df)
+    getattr(d, PERFORMANCE_STANDARD_Z_PRD_DF).update(columns=results_columns, data=data)
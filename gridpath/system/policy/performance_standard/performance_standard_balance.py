@@ -17,13 +17,12 @@
 Constrain total carbon emissions to be less than performance standard
 """
 
-from pyomo.environ import Var, Constraint, Expression, NonNegativeReals, value
+from pyomo.environ import Set, Var, Constraint, Expression, NonNegativeReals, value
 
 from gridpath.auxiliary.dynamic_components import (
     performance_standard_balance_emission_components,
     performance_standard_balance_credit_components,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.performance_standard import PERFORMANCE_STANDARD_Z_PRD_DF
 
 
@@ -35,8 +34,19 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     :return:
     """
 
+    # Only create violation variables where violations are allowed
+    m.PERFORMANCE_STANDARD_ZONE_PERIODS_WITH_VIOLATION_ALLOWED = Set(
+        dimen=2,
+        within=m.PERFORMANCE_STANDARD_ZONE_PERIODS_WITH_PERFORMANCE_STANDARD,
+        initialize=lambda mod: [
+            z_p
+            for z_p in mod.PERFORMANCE_STANDARD_ZONE_PERIODS_WITH_PERFORMANCE_STANDARD
+            if mod.performance_standard_allow_violation[z_p[0]]
+        ],
+    )
+
     m.Performance_Standard_Overage = Var(
-        m.PERFORMANCE_STANDARD_ZONE_PERIODS_WITH_PERFORMANCE_STANDARD,
+        m.PERFORMANCE_STANDARD_ZONE_PERIODS_WITH_VIOLATION_ALLOWED,
         within=NonNegativeReals,
     )
 
@@ -114,15 +124,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.PERFORMANCE_STANDARD_ZONE_PERIODS_WITH_PERFORMANCE_STANDARD
     ]
-    results_df = create_results_df(
-        index_columns=["performance_standard_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PERFORMANCE_STANDARD_Z_PRD_DF)[c] = None
-    getattr(d, PERFORMANCE_STANDARD_Z_PRD_DF).update(results_df)
+    getattr(d, PERFORMANCE_STANDARD_Z_PRD_DF).update(columns=results_columns, data=data)
 
 
 def save_duals(scenario_directory, subproblem, stage, instance, dynamic_components):
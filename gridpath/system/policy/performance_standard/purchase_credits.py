@@ -23,7 +23,6 @@ from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.dynamic_components import (
     performance_standard_balance_credit_components,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.performance_standard import PERFORMANCE_STANDARD_Z_PRD_DF
 
 
@@ -167,12 +166,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.PERFORMANCE_STANDARD_ZONE_PERIODS_WITH_PERFORMANCE_STANDARD
     ]
-    results_df = create_results_df(
-        index_columns=["performance_standard_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PERFORMANCE_STANDARD_Z_PRD_DF)[c] = None
-    getattr(d, PERFORMANCE_STANDARD_Z_PRD_DF).update(results_df)
+    getattr(d, PERFORMANCE_STANDARD_Z_PRD_DF).update(columns=results_columns, data=data)
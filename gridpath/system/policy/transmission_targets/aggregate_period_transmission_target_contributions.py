@@ -19,7 +19,7 @@ the transmission-target zone - period level.
 
 from pyomo.environ import Expression, value
 
-from gridpath.common_functions import create_results_df
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
 from gridpath.system.policy.transmission_targets import TX_TARGETS_DF
 
 
@@ -39,6 +39,11 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param p:
         :return:
         """
+        transmission_target_tx_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="TRANSMISSION_TARGET_TX_OPR_TMPS",
+            elements_by_zone="TRANSMISSION_TARGET_TX_LINES_BY_TRANSMISSION_TARGET_ZONE",
+        )
         return sum(
             (
                 mod.Transmission_Target_Energy_MW_Pos_Dir[tx, tmp]
@@ -47,9 +52,8 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
             )
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (tx, tmp) in mod.TRANSMISSION_TARGET_TX_OPR_TMPS
-            if tx in mod.TRANSMISSION_TARGET_TX_LINES_BY_TRANSMISSION_TARGET_ZONE[z]
-            and tmp in mod.TMPS_IN_PRD[p]
+            for t in mod.TMPS_IN_PRD[p]
+            for (tx, tmp) in transmission_target_tx_opr_tmps.get((z, t), [])
         )
 
     m.Total_Period_Transmission_Target_Energy_Pos_Dir_MWh = Expression(
@@ -65,6 +69,11 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         :param p:
         :return:
         """
+        transmission_target_tx_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="TRANSMISSION_TARGET_TX_OPR_TMPS",
+            elements_by_zone="TRANSMISSION_TARGET_TX_LINES_BY_TRANSMISSION_TARGET_ZONE",
+        )
         return sum(
             (
                 mod.Transmission_Target_Energy_MW_Neg_Dir[tx, tmp]
@@ -73,9 +82,8 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
             )
             * mod.hrs_in_tmp[tmp]
             * mod.tmp_weight[tmp]
-            for (tx, tmp) in mod.TRANSMISSION_TARGET_TX_OPR_TMPS
-            if tx in mod.TRANSMISSION_TARGET_TX_LINES_BY_TRANSMISSION_TARGET_ZONE[z]
-            and tmp in mod.TMPS_IN_PRD[p]
+            for t in mod.TMPS_IN_PRD[p]
+            for (tx, tmp) in transmission_target_tx_opr_tmps.get((z, t), [])
         )
 
     m.Total_Period_Transmission_Target_Energy_Neg_Dir_MWh = Expression(
@@ -108,12 +116,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.TRANSMISSION_TARGET_ZONE_PERIODS_WITH_TRANSMISSION_TARGET
     ]
-    results_df = create_results_df(
-        index_columns=["transmission_target_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, TX_TARGETS_DF)[c] = None
-    getattr(d, TX_TARGETS_DF).update(results_df)
+    getattr(d, TX_TARGETS_DF).update(columns=results_columns, data=data)
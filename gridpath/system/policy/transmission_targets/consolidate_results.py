@@ -24,7 +24,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     have added to
     """
 
-    getattr(d, TX_TARGETS_DF).to_csv(
+    getattr(d, TX_TARGETS_DF).to_df().to_csv(
         os.path.join(
             scenario_directory,
             str(subproblem),
@@ -27,7 +27,6 @@ from pyomo.environ import (
     value,
 )
 
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.transmission_targets import TX_TARGETS_DF
 
 
@@ -214,12 +213,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.TRANSMISSION_TARGET_ZONE_PERIODS_WITH_TRANSMISSION_TARGET
     ]
-    results_df = create_results_df(
-        index_columns=["transmission_target_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, TX_TARGETS_DF)[c] = None
-    getattr(d, TX_TARGETS_DF).update(results_df)
+    getattr(d, TX_TARGETS_DF).update(columns=results_columns, data=data)
@@ -21,11 +21,10 @@ import csv
 import os.path
 import pandas as pd
 
-from pyomo.environ import Var, Constraint, NonNegativeReals, Expression, value
+from pyomo.environ import Set, Var, Constraint, NonNegativeReals, Expression, value
 
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.db_interface import setup_results_import
-from gridpath.common_functions import create_results_df
 from gridpath.system.policy.transmission_targets import TX_TARGETS_DF
 
 
@@ -37,13 +36,24 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     :return:
     """
 
+    # Only create violation variables where violations are allowed
+    m.TRANSMISSION_TARGET_ZONE_PERIODS_WITH_VIOLATION_ALLOWED = Set(
+        dimen=2,
+        within=m.TRANSMISSION_TARGET_ZONE_PERIODS_WITH_TRANSMISSION_TARGET,
+        initialize=lambda mod: [
+            (z, p)
+            for (z, p) in mod.TRANSMISSION_TARGET_ZONE_PERIODS_WITH_TRANSMISSION_TARGET
+            if mod.transmission_target_allow_violation[z]
+        ],
+    )
+
     m.Period_Transmission_Target_Shortage_Pos_Dir_MWh = Var(
-        m.TRANSMISSION_TARGET_ZONE_PERIODS_WITH_TRANSMISSION_TARGET,
+        m.TRANSMISSION_TARGET_ZONE_PERIODS_WITH_VIOLATION_ALLOWED,
         within=NonNegativeReals,
     )
 
     m.Period_Transmission_Target_Shortage_Neg_Dir_MWh = Var(
-        m.TRANSMISSION_TARGET_ZONE_PERIODS_WITH_TRANSMISSION_TARGET,
+        m.TRANSMISSION_TARGET_ZONE_PERIODS_WITH_VIOLATION_ALLOWED,
         within=NonNegativeReals,
     )
 
@@ -148,12 +158,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.TRANSMISSION_TARGET_ZONE_PERIODS_WITH_TRANSMISSION_TARGET
     ]
-    results_df = create_results_df(
-        index_columns=["transmission_target_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, TX_TARGETS_DF)[c] = None
-    getattr(d, TX_TARGETS_DF).update(results_df)
+    getattr(d, TX_TARGETS_DF).update(columns=results_columns, data=data)
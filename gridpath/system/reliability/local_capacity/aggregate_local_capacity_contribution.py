@@ -25,7 +25,6 @@ from pyomo.environ import Expression, value
 from gridpath.auxiliary.dynamic_components import (
     local_capacity_balance_provision_components,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.system.reliability.local_capacity import LOCAL_CAPACITY_ZONE_PRD_DF
 
 
@@ -93,12 +92,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.LOCAL_CAPACITY_ZONE_PERIODS_WITH_REQUIREMENT
     ]
-    results_df = create_results_df(
-        index_columns=["local_capacity_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, LOCAL_CAPACITY_ZONE_PRD_DF)[c] = None
-    getattr(d, LOCAL_CAPACITY_ZONE_PRD_DF).update(results_df)
+    getattr(d, LOCAL_CAPACITY_ZONE_PRD_DF).update(columns=results_columns, data=data)
@@ -21,13 +21,12 @@ requirement.
 import csv
 import os.path
 
-from pyomo.environ import Var, Constraint, Expression, NonNegativeReals, value
+from pyomo.environ import Set, Var, Constraint, Expression, NonNegativeReals, value
 
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.dynamic_components import (
     local_capacity_balance_provision_components,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.system.reliability.local_capacity import LOCAL_CAPACITY_ZONE_PRD_DF
 
 
@@ -47,8 +46,19 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         ),
     )
 
+    # Only create violation variables where violations are allowed
+    m.LOCAL_CAPACITY_ZONE_PERIODS_WITH_VIOLATION_ALLOWED = Set(
+        dimen=2,
+        within=m.LOCAL_CAPACITY_ZONE_PERIODS_WITH_REQUIREMENT,
+        initialize=lambda mod: [
+            (z, p)
+            for (z, p) in mod.LOCAL_CAPACITY_ZONE_PERIODS_WITH_REQUIREMENT
+            if mod.local_capacity_allow_violation[z]
+        ],
+    )
+
     m.Local_Capacity_Shortage_MW = Var(
-        m.LOCAL_CAPACITY_ZONE_PERIODS_WITH_REQUIREMENT, within=NonNegativeReals
+        m.LOCAL_CAPACITY_ZONE_PERIODS_WITH_VIOLATION_ALLOWED, within=NonNegativeReals
     )
 
     def violation_expression_rule(mod, z, p):
@@ -117,15 +127,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.LOCAL_CAPACITY_ZONE_PERIODS_WITH_REQUIREMENT
     ]
-    results_df = create_results_df(
-        index_columns=["local_capacity_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, LOCAL_CAPACITY_ZONE_PRD_DF)[c] = None
-    getattr(d, LOCAL_CAPACITY_ZONE_PRD_DF).update(results_df)
+    getattr(d, LOCAL_CAPACITY_ZONE_PRD_DF).update(columns=results_columns, data=data)
 
 
 def save_duals(scenario_directory, subproblem, stage, instance, dynamic_components):
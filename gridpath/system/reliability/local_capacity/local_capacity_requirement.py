@@ -21,7 +21,6 @@ import os.path
 
 from pyomo.environ import Set, Param, NonNegativeReals
 
-from gridpath.common_functions import create_results_df
 from gridpath.system.reliability.local_capacity import LOCAL_CAPACITY_ZONE_PRD_DF
 
 
@@ -178,12 +177,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.LOCAL_CAPACITY_ZONE_PERIODS_WITH_REQUIREMENT
     ]
-    results_df = create_results_df(
-        index_columns=["local_capacity_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, LOCAL_CAPACITY_ZONE_PRD_DF)[c] = None
-    getattr(d, LOCAL_CAPACITY_ZONE_PRD_DF).update(results_df)
+    getattr(d, LOCAL_CAPACITY_ZONE_PRD_DF).update(columns=results_columns, data=data)
@@ -25,7 +25,6 @@ from pyomo.environ import Expression, value
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.db_interface import setup_results_import
 from gridpath.auxiliary.dynamic_components import prm_balance_provision_components
-from gridpath.common_functions import create_results_df
 from gridpath.system.reliability.prm import PRM_ZONE_PRD_DF
 
 
@@ -83,12 +82,4 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.PRM_ZONE_PERIODS_WITH_REQUIREMENT
     ]
-    results_df = create_results_df(
-        index_columns=["prm_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PRM_ZONE_PRD_DF)[c] = None
-    getattr(d, PRM_ZONE_PRD_DF).update(results_df)
+    getattr(d, PRM_ZONE_PRD_DF).update(columns=results_columns, data=data)
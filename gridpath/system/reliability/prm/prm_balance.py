@@ -20,11 +20,10 @@ Constraint total PRM contribution to be more than or equal to the requirement.
 import csv
 import os.path
 
-from pyomo.environ import Var, Constraint, Expression, NonNegativeReals, value
+from pyomo.environ import Set, Var, Constraint, Expression, NonNegativeReals, value
 
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.dynamic_components import prm_balance_provision_components
-from gridpath.common_functions import create_results_df
 from gridpath.system.reliability.prm import PRM_ZONE_PRD_DF
 
 
@@ -44,8 +43,19 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         ),
     )
 
+    # Only create violation variables where violations are allowed
+    m.PRM_ZONE_PERIODS_WITH_VIOLATION_ALLOWED = Set(
+        dimen=2,
+        within=m.PRM_ZONE_PERIODS_WITH_REQUIREMENT,
+        initialize=lambda mod: [
+            (z, p)
+            for (z, p) in mod.PRM_ZONE_PERIODS_WITH_REQUIREMENT
+            if mod.prm_allow_violation[z]
+        ],
+    )
+
     m.PRM_Shortage_MW = Var(
-        m.PRM_ZONE_PERIODS_WITH_REQUIREMENT, within=NonNegativeReals
+        m.PRM_ZONE_PERIODS_WITH_VIOLATION_ALLOWED, within=NonNegativeReals
     )
 
     def violation_expression_rule(mod, z, p):
@@ -112,15 +122,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (z, p) in m.PRM_ZONE_PERIODS_WITH_REQUIREMENT
     ]
-    results_df = create_results_df(
-        index_columns=["prm_zone", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, PRM_ZONE_PRD_DF)[c] = None
-    getattr(d, PRM_ZONE_PRD_DF).update(results_df)
+    getattr(d, PRM_ZONE_PRD_DF).update(columns=results_columns, data=data)
 
 
 def save_duals(scenario_directory, subproblem, stage, instance, dynamic_components):
@@ -15,6 +15,7 @@
 
 from pyomo.environ import Set, Expression
 
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
 from .reserve_aggregation import generic_add_model_components
 
 
@@ -44,12 +45,15 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
 
     # Reserve provision
     def total_partial_frequency_response_rule(mod, ba, tmp):
+        fr_prj_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members="Provide_Frequency_Response_MW",
+            zone_param="frequency_response_ba",
+        )
         return sum(
             mod.Provide_Frequency_Response_MW[g, tmp]
-            for g in mod.FREQUENCY_RESPONSE_PARTIAL_PROJECTS_OPERATIONAL_IN_TIMEPOINT[
-                tmp
-            ]
-            if mod.frequency_response_ba[g] == ba
+            for (g, tmp) in fr_prj_opr_tmps.get((ba, tmp), [])
+            if g in mod.FREQUENCY_RESPONSE_PARTIAL_PROJECTS
         )
 
     m.Total_Partial_Frequency_Response_Provision_MW = Expression(
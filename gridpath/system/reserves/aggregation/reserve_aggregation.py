@@ -15,6 +15,8 @@
 
 from pyomo.environ import Set, Expression
 
+from gridpath.auxiliary.auxiliary import get_zone_tmp_index
+
 
 def generic_add_model_components(
     m,
@@ -54,11 +56,17 @@ def generic_add_model_components(
     )
 
     # Reserve provision
+    # The provision variable is indexed by the reserve project-operational
+    # timepoints, so we index its keys by balancing area and timepoint
     def total_reserve_rule(mod, ba, tmp):
+        reserve_prj_opr_tmps = get_zone_tmp_index(
+            mod=mod,
+            members=generator_reserve_provision_variable,
+            zone_param=reserve_zone_param,
+        )
         return sum(
             getattr(mod, generator_reserve_provision_variable)[g, tmp]
-            for g in getattr(mod, op_set)[tmp]
-            if getattr(mod, reserve_zone_param)[g] == ba
+            for (g, tmp) in reserve_prj_opr_tmps.get((ba, tmp), [])
         )
 
     setattr(
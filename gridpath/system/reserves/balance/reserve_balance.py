@@ -15,8 +15,12 @@
 
 import csv
 import os.path
-from pyomo.environ import Var, Constraint, NonNegativeReals, Expression, value
+from pyomo.environ import Set, Var, Constraint, NonNegativeReals, Expression, value
 
+from gridpath.auxiliary.auxiliary import (
+    get_constraint_duals,
+    subset_init_by_param_value,
+)
 from gridpath.auxiliary.db_interface import import_csv
 
 
@@ -45,11 +49,29 @@ def generic_add_model_components(
     :return:
     """
 
-    # Penalty for violation
+    # Penalty for violation; the violation variable is only created in the
+    # balancing areas where violations are allowed
+    reserve_zones_with_violation_allowed_set = (
+        f"{reserve_zone_set}_WITH_VIOLATION_ALLOWED"
+    )
+    setattr(
+        m,
+        reserve_zones_with_violation_allowed_set,
+        Set(
+            within=getattr(m, reserve_zone_set),
+            initialize=lambda mod: subset_init_by_param_value(
+                mod, reserve_zone_set, reserve_violation_allowed_param, 1
+            ),
+        ),
+    )
     setattr(
         m,
         reserve_violation_variable,
-        Var(getattr(m, reserve_zone_set), m.TMPS, within=NonNegativeReals),
+        Var(
+            getattr(m, reserve_zones_with_violation_allowed_set),
+            m.TMPS,
+            within=NonNegativeReals,
+        ),
     )
 
     def violation_expression_rule(mod, ba, tmp):
@@ -121,6 +143,7 @@ def generic_export_results(
         "frequency_response_partial": "Meet_Frequency_Response_Partial_Constraint",
         "spinning_reserves": "Meet_Spinning_Reserves_Constraint",
     }
+    duals = get_constraint_duals(instance=m, constraint_name=duals_map[reserve_type])
 
     with open(
         os.path.join(
@@ -159,14 +182,10 @@ def generic_export_results(
                     m.tmp_weight[tmp],
                     m.hrs_in_tmp[tmp],
                     value(getattr(m, reserve_violation_expression)[ba, tmp]),
-                    m.dual[getattr(m, duals_map[reserve_type])[ba, tmp]]
-                    if (ba, tmp) in [idx for idx in getattr(m, duals_map[reserve_type])]
-                    else None,
+                    duals.get((ba, tmp)),
                     (
-                        m.dual[getattr(m, duals_map[reserve_type])[ba, tmp]]
-                        / m.tmp_objective_coefficient[tmp]
-                        if (ba, tmp)
-                        in [idx for idx in getattr(m, duals_map[reserve_type])]
+                        duals[ba, tmp] / m.tmp_objective_coefficient[tmp]
+                        if duals.get((ba, tmp)) is not None
                         else None
                     ),
                 ]
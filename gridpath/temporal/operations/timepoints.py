@@ -71,8 +71,12 @@ from pyomo.environ import (
     Any,
 )
 
-from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import determine_table_subset_by_start_and_column
+from db.common_functions import spin_on_database_lock_transaction
+from gridpath.auxiliary.db_interface import (
+    determine_table_subset_by_start_and_column,
+    get_set_null_if_no_source_statement,
+    get_update_from_source_statement,
+)
 from gridpath.auxiliary.validations import write_validation_to_database
 
 
@@ -335,35 +339,49 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
             print("add spinup_or_lookahead flag")
 
         # Update tables with spinup_or_lookahead_flag
+        # Only the scenario's rows are updated, in a single transaction
         tables_to_update = determine_table_subset_by_start_and_column(
-            conn=db, tbl_start="results_", cols=["timepoint", "spinup_or_lookahead"]
+            conn=db,
+            tbl_start="results_",
+            cols=[
+                "scenario_id",
+                "subproblem_id",
+                "stage_id",
+                "timepoint",
+                "spinup_or_lookahead",
+            ],
         )
 
+        source_sql = """
+            SELECT subproblem_id, stage_id, timepoint, spinup_or_lookahead
+            FROM inputs_temporal
+            WHERE temporal_scenario_id = (
+                SELECT temporal_scenario_id
+                FROM scenarios
+                WHERE scenario_id = ?
+                )
+            """
+        statements = []
         for tbl in tables_to_update:
             if not quiet:
                 print("... {}".format(tbl))
-            sql = """
-                UPDATE {}
-                SET spinup_or_lookahead = (
-                SELECT spinup_or_lookahead
-                FROM inputs_temporal
-                WHERE temporal_scenario_id = (
-                    SELECT temporal_scenario_id 
-                    FROM scenarios 
-                    WHERE scenario_id = ?
+            # Rows without a timepoint in inputs_temporal get a NULL flag
+            for get_statement in [
+                get_update_from_source_statement,
+                get_set_null_if_no_source_statement,
+            ]:
+                statements.append(
+                    get_statement(
+                        tbl=tbl,
+                        col="spinup_or_lookahead",
+                        scenario_id=scenario_id,
+                        source_sql=source_sql,
+                        source_data=(scenario_id,),
+                        join_cols=["subproblem_id", "stage_id", "timepoint"],
                     )
-                AND {}.subproblem_id = 
-                inputs_temporal.subproblem_id
-                AND {}.stage_id = inputs_temporal.stage_id
-                AND {}.timepoint = inputs_temporal.timepoint
-                );
-                """.format(
-                tbl, tbl, tbl, tbl
-            )
+                )
 
-            spin_on_database_lock(
-                conn=db, cursor=c, sql=sql, data=(scenario_id,), many=False
-            )
+        spin_on_database_lock_transaction(conn=db, cursor=c, statements=statements)
 
 
 # Validation
@@ -19,10 +19,10 @@ components to the model formulation.
 
 import csv
 import os.path
-import pandas as pd
 from pyomo.environ import Set, Param
 
 from gridpath.auxiliary.auxiliary import cursor_to_df
+from gridpath.auxiliary.dynamic_components import ResultsFrame
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
     get_expected_dtypes,
@@ -33,6 +33,8 @@ from gridpath.auxiliary.validations import (
     validate_missing_inputs,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 TX_PERIOD_DF = "transmission_period_df"
 TX_TIMEPOINT_DF = "transmission_timepoint_df"
 
@@ -164,7 +166,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     # The results dataframes are by index
 
     # Project-period DF
-    tx_period_df = pd.DataFrame(
+    tx_period_df = ResultsFrame(
         columns=[
             "transmission_line",
             "period",
@@ -186,15 +188,14 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             ]
             for (tx, prd) in m.TX_OPR_PRDS
         ],
-    ).set_index(["transmission_line", "period"])
-
-    tx_period_df.sort_index(inplace=True)
+        index_columns=["transmission_line", "period"],
+    )
 
-    # Add the dataframe to the dynamic components to pass to other modules
+    # Add the results frame to the dynamic components to pass to other modules
     setattr(d, TX_PERIOD_DF, tx_period_df)
 
     # Project-timepoint DF
-    tx_timepoint_df = pd.DataFrame(
+    tx_timepoint_df = ResultsFrame(
         columns=[
             "transmission_line",
             "timepoint",
@@ -222,11 +223,10 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             ]
             for (tx, tmp) in m.TX_OPR_TMPS
         ],
-    ).set_index(["transmission_line", "timepoint"])
-
-    tx_timepoint_df.sort_index(inplace=True)
+        index_columns=["transmission_line", "timepoint"],
+    )
 
-    # Add the dataframe to the dynamic components to pass to other modules
+    # Add the results frame to the dynamic components to pass to other modules
     setattr(d, TX_TIMEPOINT_DF, tx_timepoint_df)
 
 
@@ -26,12 +26,11 @@ import os.path
 import pandas as pd
 from pyomo.environ import Set, Expression, value
 
-from db.common_functions import spin_on_database_lock
+from db.common_functions import spin_on_database_lock_transaction
 from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules,
     join_sets,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.transmission import TX_PERIOD_DF
 from gridpath.transmission.capacity.common_functions import (
     load_tx_capacity_type_modules,
@@ -213,15 +212,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for (tx_line, prd) in m.TX_OPR_PRDS
     ]
 
-    results_df = create_results_df(
-        index_columns=["transmission_line", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, TX_PERIOD_DF)[c] = None
-    getattr(d, TX_PERIOD_DF).update(results_df)
+    getattr(d, TX_PERIOD_DF).update(columns=results_columns, data=data)
 
     # Module-specific capacity results
     required_capacity_modules = get_required_subtype_modules(
@@ -237,13 +228,10 @@ def export_results(scenario_directory, subproblem, stage, m, d):
 
     for op_m in required_capacity_modules:
         if hasattr(imported_capacity_modules[op_m], "add_to_tx_period_results"):
-            results_columns, optype_df = imported_capacity_modules[
+            results_columns, captype_data = imported_capacity_modules[
                 op_m
             ].add_to_tx_period_results(scenario_directory, subproblem, stage, m, d)
-            for column in results_columns:
-                if column not in getattr(d, TX_PERIOD_DF):
-                    getattr(d, TX_PERIOD_DF)[column] = None
-            getattr(d, TX_PERIOD_DF).update(optype_df)
+            getattr(d, TX_PERIOD_DF).update(columns=results_columns, data=captype_data)
 
 
 def save_duals(scenario_directory, subproblem, stage, instance, dynamic_components):
@@ -304,9 +292,6 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM results_transmission_costs_capacity_agg 
         WHERE scenario_id = ?
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Insert new results
     agg_sql = """
@@ -338,11 +323,18 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         load_zone_to AS load_zone,
         SUM(capacity_cost) AS capacity_cost
         FROM results_transmission_period
+        WHERE scenario_id = ?
         GROUP BY scenario_id, subproblem_id, stage_id, period, load_zone
         ) AS cap_table
         USING (scenario_id, subproblem_id, stage_id, period, load_zone)
+        WHERE spinup_or_lookahead_ratios.scenario_id = ?
         ;"""
 
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[
+            (del_sql, (scenario_id,)),
+            (agg_sql, (scenario_id, scenario_id, scenario_id)),
+        ],
     )
@@ -26,6 +26,8 @@ from gridpath.transmission.capacity.common_functions import (
     load_tx_capacity_type_modules,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """ """
@@ -49,6 +49,7 @@ from gridpath.auxiliary.db_interface import setup_results_import
 from gridpath.auxiliary.dynamic_components import (
     tx_capacity_type_operational_period_sets,
     tx_capacity_type_financial_period_sets,
+    capacity_variables,
 )
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
@@ -60,13 +61,14 @@ from gridpath.auxiliary.validations import (
     validate_row_monotonicity,
     validate_column_monotonicity,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.project.capacity.capacity_types.common_methods import (
     relevant_periods_by_project_vintage,
     project_relevant_periods,
     project_vintages_relevant_in_period,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 # TODO: can we have different capacities depending on the direction
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -361,6 +363,9 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         "TX_NEW_LIN_FIN_PRDS",
     )
 
+    # Add to list of capacity variables, i.e. the investment decisions
+    getattr(d, capacity_variables).append("TxNewLin_Build_MW")
+
 
 # Set Rules
 ###############################################################################
@@ -647,13 +652,7 @@ def add_to_tx_period_results(scenario_directory, subproblem, stage, m, d):
         [tx, prd, value(m.TxNewLin_Build_MW[tx, prd])]
         for (tx, prd) in m.TX_NEW_LIN_VNTS
     ]
-    captype_df = create_results_df(
-        index_columns=["tx_line", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    return results_columns, captype_df
+    return results_columns, data
 
 
 # Database
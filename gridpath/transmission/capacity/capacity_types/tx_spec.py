@@ -46,6 +46,8 @@ from gridpath.auxiliary.validations import (
     validate_column_monotonicity,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
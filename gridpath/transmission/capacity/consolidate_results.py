@@ -27,7 +27,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     Export all results from the TX_PERIOD_DF that various modules
     have added to
     """
-    tx_cap_df = getattr(d, TX_PERIOD_DF)
+    tx_cap_df = getattr(d, TX_PERIOD_DF).to_df()
 
     tx_cap_df.to_csv(
         os.path.join(
@@ -23,9 +23,12 @@ import os.path
 import pandas as pd
 from pyomo.environ import Set, Expression, value
 
-from db.common_functions import spin_on_database_lock
+from db.common_functions import spin_on_database_lock_transaction
 from gridpath.auxiliary.auxiliary import join_sets
-from gridpath.common_functions import create_results_df
+from gridpath.auxiliary.db_interface import (
+    get_set_null_if_no_source_statement,
+    get_update_from_source_statement,
+)
 from gridpath.transmission.capacity.common_functions import (
     load_tx_capacity_type_modules,
 )
@@ -239,15 +242,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for (tx, prd) in m.TX_FIN_PRDS
     ]
 
-    cost_df1 = create_results_df(
-        index_columns=["transmission_line", "period"],
-        results_columns=results_columns1,
-        data=data1,
-    )
-
-    for c in results_columns1:
-        getattr(d, TX_PERIOD_DF)[c] = None
-    getattr(d, TX_PERIOD_DF).update(cost_df1)
+    getattr(d, TX_PERIOD_DF).update(columns=results_columns1, data=data1)
 
     results_columns2 = [
         "hours_in_period_timepoints",
@@ -265,15 +260,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for (tx, prd) in m.TX_OPR_PRDS
     ]
 
-    cost_df2 = create_results_df(
-        index_columns=["transmission_line", "period"],
-        results_columns=results_columns2,
-        data=data2,
-    )
-
-    for c in results_columns2:
-        getattr(d, TX_PERIOD_DF)[c] = None
-    getattr(d, TX_PERIOD_DF).update(cost_df2)
+    getattr(d, TX_PERIOD_DF).update(columns=results_columns2, data=data2)
 
 
 def save_duals(scenario_directory, subproblem, stage, instance, dynamic_components):
@@ -334,9 +321,6 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM results_transmission_costs_capacity_agg 
         WHERE scenario_id = ?
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Insert new results
     agg_sql = """
@@ -368,33 +352,53 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         load_zone_to AS load_zone,
         SUM(capacity_cost) AS capacity_cost
         FROM results_transmission_period
+        WHERE scenario_id = ?
         GROUP BY scenario_id, subproblem_id, stage_id, period, load_zone
         ) AS cap_table
         USING (scenario_id, subproblem_id, stage_id, period, load_zone)
+        WHERE spinup_or_lookahead_ratios.scenario_id = ?
         ;"""
 
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[
+            (del_sql, (scenario_id,)),
+            (agg_sql, (scenario_id, scenario_id, scenario_id)),
+        ],
     )
 
     # Update the capacity cost removing the fraction attributable to the
-    # spinup and lookahead hours
-    update_sql = """
-        UPDATE results_transmission_period
-        SET capacity_cost_wo_spinup_or_lookahead = capacity_cost * (
-            SELECT fraction_of_hours_in_subproblem
-            FROM spinup_or_lookahead_ratios
-            WHERE spinup_or_lookahead = 0
-            AND results_transmission_period.scenario_id = 
-            spinup_or_lookahead_ratios.scenario_id
-            AND results_transmission_period.subproblem_id = 
-            spinup_or_lookahead_ratios.subproblem_id
-            AND results_transmission_period.stage_id = 
-            spinup_or_lookahead_ratios.stage_id
-            AND results_transmission_period.period = 
-            spinup_or_lookahead_ratios.period
-        )
-        ;
-    """
-
-    spin_on_database_lock(conn=db, cursor=c, sql=update_sql, data=(), many=False)
+    # spinup and lookahead hours; periods without spinup_or_lookahead = 0
+    # ratios get a NULL cost
+    source_sql = """SELECT subproblem_id, stage_id, period,
+        fraction_of_hours_in_subproblem
+        FROM spinup_or_lookahead_ratios
+        WHERE scenario_id = ?
+        AND spinup_or_lookahead = 0"""
+    join_cols = ["subproblem_id", "stage_id", "period"]
+
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[
+            get_update_from_source_statement(
+                tbl="results_transmission_period",
+                col="capacity_cost_wo_spinup_or_lookahead",
+                scenario_id=scenario_id,
+                source_sql=source_sql,
+                source_data=(scenario_id,),
+                join_cols=join_cols,
+                value="results_transmission_period.capacity_cost "
+                "* src.fraction_of_hours_in_subproblem",
+            ),
+            get_set_null_if_no_source_statement(
+                tbl="results_transmission_period",
+                col="capacity_cost_wo_spinup_or_lookahead",
+                scenario_id=scenario_id,
+                source_sql=source_sql,
+                source_data=(scenario_id,),
+                join_cols=join_cols,
+            ),
+        ],
+    )
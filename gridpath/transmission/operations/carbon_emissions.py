@@ -35,7 +35,6 @@ from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import subset_init_by_set_membership
 from gridpath.auxiliary.db_interface import setup_results_import
 from gridpath.auxiliary.dynamic_components import carbon_cap_balance_emission_components
-from gridpath.common_functions import create_results_df
 from gridpath.transmission import TX_TIMEPOINT_DF
 
 
@@ -307,15 +306,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (tx, tmp) in m.CRB_TX_OPR_TMPS
     ]
-    results_df = create_results_df(
-        index_columns=["transmission_line", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, TX_TIMEPOINT_DF)[c] = None
-    getattr(d, TX_TIMEPOINT_DF).update(results_df)
+    getattr(d, TX_TIMEPOINT_DF).update(columns=results_columns, data=data)
 
 
 # Database
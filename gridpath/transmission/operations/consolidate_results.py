@@ -25,7 +25,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     Export all results from the TX_OPERATIONS_DF that various modules
     have added to
     """
-    getattr(d, TX_TIMEPOINT_DF).to_csv(
+    getattr(d, TX_TIMEPOINT_DF).to_df().to_csv(
         os.path.join(
             scenario_directory,
             str(subproblem),
@@ -24,7 +24,7 @@ import csv
 import os.path
 from pyomo.environ import Param, Var, Constraint, NonNegativeReals, Expression, value
 
-from db.common_functions import spin_on_database_lock
+from db.common_functions import spin_on_database_lock_transaction
 from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.db_interface import setup_results_import
 from gridpath.auxiliary.validations import (
@@ -34,9 +34,10 @@ from gridpath.auxiliary.validations import (
     validate_values,
     validate_missing_inputs,
 )
-from gridpath.common_functions import create_results_df
 from gridpath.transmission import TX_TIMEPOINT_DF
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -236,15 +237,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         [tx, tmp, m.Hurdle_Cost_Pos_Dir[tx, tmp], m.Hurdle_Cost_Neg_Dir[tx, tmp]]
         for (tx, tmp) in m.TX_OPR_TMPS
     ]
-    cost_df = create_results_df(
-        index_columns=["transmission_line", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, TX_TIMEPOINT_DF)[c] = None
-    getattr(d, TX_TIMEPOINT_DF).update(cost_df)
+    getattr(d, TX_TIMEPOINT_DF).update(columns=results_columns, data=data)
 
 
 # Database
@@ -354,9 +347,6 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM results_transmission_hurdle_costs_agg
         WHERE scenario_id = ?
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Aggregate hurdle costs by period, load zone, and spinup_or_lookahead
     agg_sql = """
@@ -396,8 +386,10 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         spinup_or_lookahead)
         ;"""
 
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id, scenario_id), many=False
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[(del_sql, (scenario_id,)), (agg_sql, (scenario_id, scenario_id))],
     )
 
 
@@ -25,6 +25,8 @@ from gridpath.transmission.operations.common_functions import (
     load_tx_operational_type_modules,
 )
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 # TODO: missing test for this module
 
@@ -59,6 +59,7 @@ from gridpath.auxiliary.auxiliary import (
     subset_init_by_param_value,
     subset_init_by_set_membership,
 )
+from gridpath.auxiliary.dynamic_components import lazy_constraints
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -267,6 +268,18 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         m.CYCLES_OPR_TMPS, rule=kirchhoff_voltage_law_rule
     )
 
+    # Dynamic Components
+    ###########################################################################
+
+    # The flow limits only bind in a fraction of the line-timepoints, so
+    # they can be generated lazily
+    getattr(d, lazy_constraints).extend(
+        [
+            "TxDcopf_Min_Transmit_Constraint",
+            "TxDcopf_Max_Transmit_Constraint",
+        ]
+    )
+
 
 # Set Rules
 ###############################################################################
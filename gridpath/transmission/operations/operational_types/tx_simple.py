@@ -37,6 +37,7 @@ from gridpath.auxiliary.auxiliary import (
     subset_init_by_param_value,
     subset_init_by_set_membership,
 )
+from gridpath.auxiliary.dynamic_components import lazy_constraints
 
 Negative_Infinity = float("-inf")
 Infinity = float("inf")
@@ -211,6 +212,18 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         m.TX_SIMPLE_OPR_TMPS, rule=max_losses_to_rule
     )
 
+    # Dynamic Components
+    ###########################################################################
+
+    # The flow limits only bind in a fraction of the line-timepoints, so
+    # they can be generated lazily
+    getattr(d, lazy_constraints).extend(
+        [
+            "TxSimple_Min_Transmit_Constraint",
+            "TxSimple_Max_Transmit_Constraint",
+        ]
+    )
+
 
 # Constraint Formulation Rules
 ###############################################################################
@@ -22,9 +22,8 @@ import os.path
 import pandas as pd
 from pyomo.environ import Expression, value
 
-from db.common_functions import spin_on_database_lock
+from db.common_functions import spin_on_database_lock_transaction
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules
-from gridpath.common_functions import create_results_df
 from gridpath.transmission.operations.common_functions import (
     load_tx_operational_type_modules,
 )
@@ -145,15 +144,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         for (tx, tmp) in m.TX_OPR_TMPS
     ]
 
-    results_df = create_results_df(
-        index_columns=["transmission_line", "period"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, TX_TIMEPOINT_DF)[c] = None
-    getattr(d, TX_TIMEPOINT_DF).update(results_df)
+    getattr(d, TX_TIMEPOINT_DF).update(columns=results_columns, data=data)
 
     required_operational_modules = get_required_subtype_modules(
         scenario_directory=scenario_directory,
@@ -173,13 +164,12 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ):
             # TODO: make sure the order of export results is the same between
             #  this module and the optype modules
-            results_columns, optype_df = imported_operational_modules[
+            results_columns, optype_data = imported_operational_modules[
                 optype_module
             ].add_to_operations_results(mod=m)
-            for column in results_columns:
-                if column not in getattr(d, TX_TIMEPOINT_DF):
-                    getattr(d, TX_TIMEPOINT_DF)[column] = None
-            getattr(d, TX_TIMEPOINT_DF).update(optype_df)
+            getattr(d, TX_TIMEPOINT_DF).update(
+                columns=results_columns, data=optype_data
+            )
 
 
 # Database
@@ -205,9 +195,6 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM results_transmission_imports_exports_agg
         WHERE scenario_id = ?
         """
-    spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
-    )
 
     # Aggregate imports/exports by period, load zone, and spinup_or_lookahead
     agg_sql = """
@@ -335,4 +322,8 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         ;"""
 
     scenario_ids = tuple([scenario_id] * 8)
-    spin_on_database_lock(conn=db, cursor=c, sql=agg_sql, data=scenario_ids, many=False)
+    spin_on_database_lock_transaction(
+        conn=db,
+        cursor=c,
+        statements=[(del_sql, (scenario_id,)), (agg_sql, scenario_ids)],
+    )
@@ -38,9 +38,10 @@ from gridpath.auxiliary.db_interface import (
 )
 from gridpath.auxiliary.db_interface import setup_results_import
 from gridpath.auxiliary.validations import write_validation_to_database, validate_idxs
-from gridpath.common_functions import create_results_df
 from gridpath.transmission import TX_TIMEPOINT_DF
 
+VALIDATION_BY_SUBPROBLEM_STAGE = False
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -277,15 +278,7 @@ def export_results(scenario_directory, subproblem, stage, m, d):
         ]
         for (tx, tmp) in m.TRANSMISSION_TARGET_TX_OPR_TMPS
     ]
-    results_df = create_results_df(
-        index_columns=["transmission_line", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
-    for c in results_columns:
-        getattr(d, TX_TIMEPOINT_DF)[c] = None
-    getattr(d, TX_TIMEPOINT_DF).update(results_df)
+    getattr(d, TX_TIMEPOINT_DF).update(columns=results_columns, data=data)
 
 
 # Database
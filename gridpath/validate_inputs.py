@@ -18,6 +18,8 @@ calls their *validate_inputs()* method, which performs various validations
 of the input data and scenario setup.
 """
 
+from importlib import import_module
+from multiprocessing import get_context
 import pandas as pd
 import sqlite3
 import sys
@@ -29,6 +31,8 @@ from gridpath.auxiliary.db_interface import (
     get_scenario_id_and_name,
 )
 from gridpath.auxiliary.validations import (
+    collect_validations,
+    insert_validations_into_database,
     write_validation_to_database,
     validate_cols_equal,
 )
@@ -41,7 +45,17 @@ from gridpath.auxiliary.scenario_chars import (
 )
 
 
-def validate_inputs(subproblems, loaded_modules, scenario_id, subscenarios, conn):
+def validate_inputs(
+    subproblems,
+    loaded_modules,
+    scenario_id,
+    subscenarios,
+    conn,
+    db_path=None,
+    n_parallel_validation=1,
+    max_validation_errors=None,
+    quiet=True,
+):
     """ "
     For each module, load the inputs from the database and validate them
 
@@ -51,7 +65,20 @@ def validate_inputs(subproblems, loaded_modules, scenario_id, subscenarios, conn
         objects)
     :param subscenarios: SubScenarios object with all subscenario info
     :param conn: database connection
-    :return:
+    :param db_path: the database file path; required to validate in parallel
+    :param n_parallel_validation: number of processes in which to validate
+        the modules' inputs, defaults to 1
+    :param max_validation_errors: stop validating once this many validation
+        errors (findings of 'High' or 'Mid' severity) have been found;
+        'Low'-severity findings are warnings and don't count toward the
+        maximum; if None (the default), validate all inputs
+    :param quiet: boolean
+    :return: boolean, whether all inputs were validated
+
+    The modules' validate_inputs functions only read from the database; their
+    findings are collected and inserted into the database by this function
+    once validation is done. When validating in parallel, each process reads
+    through its own read-only connection.
     """
 
     # TODO: check if we even need database cursor (and subscenarios?)
@@ -62,25 +89,144 @@ def validate_inputs(subproblems, loaded_modules, scenario_id, subscenarios, conn
     #  each table in the database? Problem is that you don't necessarily want
     #  to check the full table but only the appropriate subscenario
 
-    subproblems_list = subproblems.SUBPROBLEM_STAGES.keys()
-    for subproblem in subproblems_list:
-        stages = subproblems.SUBPROBLEM_STAGES[subproblem]
-        for stage in stages:
-            # 1. input validation within each module
+    validation_tasks = get_validation_tasks(
+        subproblems=subproblems, loaded_modules=loaded_modules
+    )
+
+    findings = []
+    if n_parallel_validation > 1 and len(validation_tasks) > 1:
+        if db_path is None:
+            raise ValueError("The database path is required to validate in parallel.")
+        pool_data = tuple(
+            [db_path, m.__name__, scenario_id, subscenarios, subproblem, stage]
+            for (m, subproblem, stage) in validation_tasks
+        )
+
+        # Pool must use spawn to work properly on Linux
+        pool = get_context("spawn").Pool(n_parallel_validation)
+        try:
+            # Findings are returned in task order, so they are recorded in
+            # the same order as when validating serially
+            for task_findings in pool.imap(validate_module_inputs_pool, pool_data):
+                findings.extend(task_findings)
+                if too_many_errors(findings, max_validation_errors):
+                    break
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        with collect_validations(conn=conn, insert=False) as collected_findings:
+            for m, subproblem, stage in validation_tasks:
+                m.validate_inputs(
+                    scenario_id=scenario_id,
+                    subscenarios=subscenarios,
+                    subproblem=subproblem,
+                    stage=stage,
+                    conn=conn,
+                )
+                if too_many_errors(collected_findings, max_validation_errors):
+                    break
+            findings.extend(collected_findings)
+
+    # 2. input validation across modules
+    #    make sure geography and projects are in line
+    #    ... (see Evernote validation list)
+    #    create separate function for each validation that you call here
+
+    completed = not too_many_errors(findings, max_validation_errors)
+    if not completed:
+        if not quiet:
+            print("Stopped validation after {} errors.".format(max_validation_errors))
+        with collect_validations(conn=conn, insert=False) as stop_finding:
+            write_validation_to_database(
+                conn=conn,
+                scenario_id=scenario_id,
+                subproblem_id="N/A",
+                stage_id="N/A",
+                gridpath_module="N/A",
+                db_table="N/A",
+                severity="Low",
+                errors=[
+                    "Validation was stopped after the first {} errors; there "
+                    "may be more.".format(max_validation_errors)
+                ],
+            )
+        findings.extend(stop_finding)
+
+    # All findings are recorded by a single writer at once
+    insert_validations_into_database(conn=conn, rows=findings)
+
+    return completed
+
+
+def get_validation_tasks(subproblems, loaded_modules):
+    """
+    :param subproblems: SubProblems object with info on the subproblem/stage
+        structure
+    :param loaded_modules: list of imported modules (Python <class 'module'>
+        objects)
+    :return: list of (module, subproblem, stage) tuples to validate
+
+    Modules whose inputs don't vary by subproblem and stage (those that set
+    VALIDATION_BY_SUBPROBLEM_STAGE to False) are only validated for the
+    first subproblem and stage, as their findings would be the same for all
+    of them.
+    """
+    validation_tasks = []
+    validated_once = set()
+    for subproblem in subproblems.SUBPROBLEM_STAGES.keys():
+        for stage in subproblems.SUBPROBLEM_STAGES[subproblem]:
             for m in loaded_modules:
-                if hasattr(m, "validate_inputs"):
-                    m.validate_inputs(
-                        scenario_id=scenario_id,
-                        subscenarios=subscenarios,
-                        subproblem=subproblem,
-                        stage=stage,
-                        conn=conn,
-                    )
+                if not hasattr(m, "validate_inputs"):
+                    continue
+                if not getattr(m, "VALIDATION_BY_SUBPROBLEM_STAGE", True):
+                    if m.__name__ in validated_once:
+                        continue
+                    validated_once.add(m.__name__)
+                validation_tasks.append((m, subproblem, stage))
+
+    return validation_tasks
+
+
+def validate_module_inputs_pool(pool_datum):
+    """
+    Helper function to easily pass to pool.imap if validating in parallel.
+    Validate the module's inputs for the subproblem and stage through a
+    read-only database connection and return the findings.
+    """
+    [db_path, module_name, scenario_id, subscenarios, subproblem, stage] = pool_datum
+
+    conn = connect_to_database(
+        db_path=db_path, detect_types=sqlite3.PARSE_DECLTYPES, read_only=True
+    )
+    try:
+        with collect_validations(conn=conn, insert=False) as findings:
+            import_module(module_name).validate_inputs(
+                scenario_id=scenario_id,
+                subscenarios=subscenarios,
+                subproblem=subproblem,
+                stage=stage,
+                conn=conn,
+            )
+    finally:
+        conn.close()
 
-            # 2. input validation across modules
-            #    make sure geography and projects are in line
-            #    ... (see Evernote validation list)
-            #    create separate function for each validation that you call here
+    return findings
+
+
+def too_many_errors(findings, max_validation_errors):
+    """
+    :param findings: list of validation findings (status_validation rows)
+    :param max_validation_errors: the maximum number of validation errors, or
+        None if there is no maximum
+    :return: boolean, whether validation should stop
+
+    'Low'-severity findings are warnings, so they don't count as errors.
+    """
+    if max_validation_errors is None:
+        return False
+    n_errors = sum(1 for finding in findings if finding[5] != "Low")
+    return n_errors >= max_validation_errors
 
 
 def validate_subscenario_ids(scenario_id, subscenarios, optional_features, conn):
@@ -334,6 +480,19 @@ def parse_arguments(args):
     parser.add_argument(
         "--quiet", default=False, action="store_true", help="Don't print run output."
     )
+    parser.add_argument(
+        "--n_parallel_validation",
+        default=1,
+        type=int,
+        help="Validate the inputs of n modules or subproblems in parallel.",
+    )
+    parser.add_argument(
+        "--max_validation_errors",
+        type=int,
+        help="Stop validating after the first n validation errors (findings "
+        "of 'High' or 'Mid' severity; 'Low'-severity findings don't count). "
+        "By default, all inputs are validated.",
+    )
 
     parsed_arguments = parser.parse_known_args(args=args)[0]
 
@@ -428,7 +587,15 @@ def main(args=None):
 
         # Read in inputs from db and validate inputs for loaded modules
         validate_inputs(
-            subproblem_structure, loaded_modules, scenario_id, subscenarios, conn
+            subproblem_structure,
+            loaded_modules,
+            scenario_id,
+            subscenarios,
+            conn,
+            db_path=db_path,
+            n_parallel_validation=parsed_arguments.n_parallel_validation,
+            max_validation_errors=parsed_arguments.max_validation_errors,
+            quiet=parsed_arguments.quiet,
         )
     else:
         if not parsed_arguments.quiet:
@@ -80,9 +80,12 @@ setup(
             "gridpath_validate = gridpath.validate_inputs:main",
             "gridpath_run_server = ui.server.run_server:main",
             "gridpath_run_queue_manager = ui.server.run_queue_manager:main",
+            "gridpath_render_plots = viz.render_plots:main",
             "gridpath_create_database = db.create_database:main",
             "gridpath_load_csvs = db.utilities.port_csvs_to_db:main",
             "gridpath_load_scenarios = db.utilities.scenario:main",
+            "gridpath_representative_periods = "
+            "db.utilities.representative_periods:main",
         ]
     },
 )
@@ -12,7 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pyomo.environ import AbstractModel
+from pyomo.environ import (
+    AbstractModel,
+    ConcreteModel,
+    Constraint,
+    Param,
+    Set,
+    Suffix,
+    Var,
+)
 import unittest
 
 import gridpath.auxiliary.auxiliary as auxiliary_module_to_test
@@ -48,6 +56,53 @@ class TestAuxiliary(unittest.TestCase):
         )
         self.assertListEqual(two_sets_joined_expected, two_sets_joined_actual)
 
+    def test_get_zone_tmp_index(self):
+        """
+
+        :return:
+        """
+        mod = ConcreteModel()
+        mod.ZONES = Set(initialize=["z1", "z2"])
+        mod.PRJ_TMPS = Set(dimen=2, initialize=[("a", 1), ("a", 2), ("b", 1), ("c", 2)])
+        mod.zone = Param(["a", "b", "c"], initialize={"a": "z1", "b": "z2", "c": "z1"})
+        mod.PRJS_BY_ZONE = Set(
+            mod.ZONES, initialize={"z1": ["a", "b"], "z2": ["b", "c"]}
+        )
+
+        # Zone param
+        index = auxiliary_module_to_test.get_zone_tmp_index(
+            mod=mod, members="PRJ_TMPS", zone_param="zone"
+        )
+        self.assertDictEqual(
+            index,
+            {
+                ("z1", 1): [("a", 1)],
+                ("z1", 2): [("a", 2), ("c", 2)],
+                ("z2", 1): [("b", 1)],
+            },
+        )
+        # Built once per instance
+        self.assertIs(
+            index,
+            auxiliary_module_to_test.get_zone_tmp_index(
+                mod=mod, members="PRJ_TMPS", zone_param="zone"
+            ),
+        )
+
+        # Projects in more than one zone
+        index = auxiliary_module_to_test.get_zone_tmp_index(
+            mod=mod, members="PRJ_TMPS", elements_by_zone="PRJS_BY_ZONE"
+        )
+        self.assertDictEqual(
+            index,
+            {
+                ("z1", 1): [("a", 1), ("b", 1)],
+                ("z1", 2): [("a", 2)],
+                ("z2", 1): [("b", 1)],
+                ("z2", 2): [("c", 2)],
+            },
+        )
+
     def test_check_list_has_single_item(self):
         """
 
@@ -91,6 +146,24 @@ class TestAuxiliary(unittest.TestCase):
         self.assertEqual(True, auxiliary_module_to_test.is_number(100.5))
         self.assertEqual(False, auxiliary_module_to_test.is_number("string"))
 
+    def test_get_constraint_duals(self):
+        """
+        Duals are returned for all constraint indices, with None for indices
+        without a dual
+        """
+        m = ConcreteModel()
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        m.x = Var([1, 2])
+        m.C = Constraint([("a", 1), ("a", 2)], rule=lambda mod, z, i: mod.x[i] >= 0)
+        m.dual[m.C["a", 1]] = 5.0
+
+        self.assertDictEqual(
+            auxiliary_module_to_test.get_constraint_duals(
+                instance=m, constraint_name="C"
+            ),
+            {("a", 1): 5.0, ("a", 2): None},
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
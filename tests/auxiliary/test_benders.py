@@ -0,0 +1,200 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from pyomo.environ import (
+    ConcreteModel,
+    Constraint,
+    maximize,
+    NonNegativeReals,
+    Objective,
+    Param,
+    Set,
+    SolverFactory,
+    Suffix,
+    TerminationCondition,
+    Var,
+    value,
+)
+
+import gridpath.auxiliary.benders as benders_module_to_test
+from gridpath.auxiliary.dynamic_components import DynamicComponents, capacity_variables
+
+
+def create_instance(allow_unserved_energy=True):
+    """
+    Two-period capacity expansion: capacity built in 2020 is also available
+    in 2030 and unserved energy is penalized (or not allowed)
+    """
+    m = ConcreteModel()
+    m.PERIODS = Set(initialize=[2020, 2030], ordered=True)
+    m.TMPS = Set(initialize=[1, 2, 3, 4], ordered=True)
+    m.period = Param(m.TMPS, initialize={1: 2020, 2: 2020, 3: 2030, 4: 2030})
+    m.load_mw = Param(m.TMPS, initialize={1: 10, 2: 20, 3: 15, 4: 30})
+
+    m.Build_MW = Var(m.PERIODS, within=NonNegativeReals)
+    m.Power_MW = Var(m.TMPS, within=NonNegativeReals)
+    m.Unserved_MW = Var(m.TMPS, within=NonNegativeReals)
+
+    m.Min_Build_Constraint = Constraint(expr=m.Build_MW[2020] + m.Build_MW[2030] >= 5)
+    m.Max_Power_Constraint = Constraint(
+        m.TMPS,
+        rule=lambda mod, tmp: mod.Power_MW[tmp]
+        <= sum(mod.Build_MW[p] for p in mod.PERIODS if p <= mod.period[tmp]),
+    )
+    m.Meet_Load_Constraint = Constraint(
+        m.TMPS,
+        rule=lambda mod, tmp: mod.Power_MW[tmp] + mod.Unserved_MW[tmp]
+        == mod.load_mw[tmp],
+    )
+    m.NPV = Objective(
+        expr=-(
+            sum(25 * m.Build_MW[p] for p in m.PERIODS)
+            + sum(m.Power_MW[tmp] + 20 * m.Unserved_MW[tmp] for tmp in m.TMPS)
+        ),
+        sense=maximize,
+    )
+    m.dual = Suffix(direction=Suffix.IMPORT)
+
+    if not allow_unserved_energy:
+        for tmp in m.TMPS:
+            m.Unserved_MW[tmp].fix(0)
+
+    d = DynamicComponents()
+    getattr(d, capacity_variables).append("Build_MW")
+
+    return m, d
+
+
+class TestBenders(unittest.TestCase):
+    """ """
+
+    def test_decompose_problem(self):
+        """
+        The investment-only constraint stays in the master problem and the
+        operations are split by period
+        """
+        m, d = create_instance()
+        decomposition = benders_module_to_test.decompose_problem(
+            instance=m, dynamic_components=d
+        )
+
+        self.assertEqual(-1, decomposition.sign)
+        self.assertListEqual(
+            ["Min_Build_Constraint"],
+            [c.name for c in decomposition.master_constraints],
+        )
+        self.assertListEqual(
+            ["2020", "2030"], [sp["name"] for sp in decomposition.subproblems]
+        )
+        self.assertListEqual(
+            [["Build_MW[2020]"], ["Build_MW[2020]", "Build_MW[2030]"]],
+            [
+                sorted(v.name for v in sp["linking_variables"])
+                for sp in decomposition.subproblems
+            ],
+        )
+        self.assertListEqual(
+            [4, 4], [len(sp["constraints"]) for sp in decomposition.subproblems]
+        )
+        self.assertListEqual(
+            [25, 25], [coef for _, coef in decomposition.master_cost_terms]
+        )
+
+        # Each timepoint is an independent block
+        decomposition = benders_module_to_test.decompose_problem(
+            instance=m, dynamic_components=d, grouping="block"
+        )
+        self.assertEqual(4, len(decomposition.subproblems))
+
+    def test_solve_benders(self):
+        """
+        Benders decomposition finds the objective function value of the
+        monolithic problem, including when the operational subproblems
+        require feasibility cuts
+        """
+        for allow_unserved_energy in [True, False]:
+            m, d = create_instance(allow_unserved_energy=allow_unserved_energy)
+            SolverFactory("cbc").solve(m)
+            expected_npv = value(m.NPV)
+            expected_build = [m.Build_MW[p].value for p in m.PERIODS]
+
+            m, d = create_instance(allow_unserved_energy=allow_unserved_energy)
+            (
+                solver_status,
+                termination_condition,
+            ) = benders_module_to_test.solve_benders(
+                instance=m,
+                dynamic_components=d,
+                solver_name="cbc",
+                solver_options={},
+                gap=1e-6,
+                quiet=True,
+            )
+
+            self.assertEqual(TerminationCondition.optimal, termination_condition)
+            self.assertAlmostEqual(expected_npv, value(m.NPV), places=4)
+            self.assertListEqual(
+                expected_build, [m.Build_MW[p].value for p in m.PERIODS]
+            )
+            # The original problem is restored and the duals are loaded
+            self.assertIsNone(m.component("Benders_Master"))
+            self.assertTrue(m.NPV.active)
+            self.assertTrue(all(c.active for c in m.Meet_Load_Constraint.values()))
+            self.assertEqual(
+                4, len([c for c in m.Meet_Load_Constraint.values() if c in m.dual])
+            )
+
+    def test_solve_benders_feasibility_problem_not_optimal(self):
+        """
+        If the feasibility problem of an infeasible subproblem can't be
+        solved, Benders decomposition stops with its termination condition
+        """
+        solve_subproblem = benders_module_to_test.solve_subproblem
+        feasibility_solves = []
+
+        def solve_subproblem_w_failed_feasibility(pool_datum):
+            if pool_datum[2]:
+                feasibility_solves.append(pool_datum)
+                return {"termination_condition": TerminationCondition.error}
+            return solve_subproblem(pool_datum)
+
+        m, d = create_instance(allow_unserved_energy=False)
+        with mock.patch.object(
+            benders_module_to_test,
+            "solve_subproblem",
+            solve_subproblem_w_failed_feasibility,
+        ):
+            (
+                solver_status,
+                termination_condition,
+            ) = benders_module_to_test.solve_benders(
+                instance=m,
+                dynamic_components=d,
+                solver_name="cbc",
+                solver_options={},
+                gap=1e-6,
+                quiet=True,
+            )
+
+        self.assertEqual(TerminationCondition.error, termination_condition)
+        # The feasibility problems were solved once (one per subproblem)
+        self.assertLessEqual(len(feasibility_solves), len(m.PERIODS))
+        self.assertIsNone(m.component("Benders_Master"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sqlite3
+import unittest
+from unittest import mock
+
+from db.common_functions import spin_on_database_lock_transaction
+import gridpath.auxiliary.db_interface as module_to_test
+
+SOURCE_SQL = """SELECT timepoint, flag FROM source WHERE source_id = ?"""
+
+
+def create_database():
+    """
+    A results table with rows for scenarios 1 and 2, and a source table
+    with flags for timepoints 1 and 2 (but not 3)
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE results (scenario_id, timepoint, flag);
+        INSERT INTO results VALUES (1, 1, 0), (1, 2, 0), (1, 3, 0),
+        (2, 1, 0), (2, 2, 0), (2, 3, 0);
+        CREATE TABLE source (source_id, timepoint, flag);
+        INSERT INTO source VALUES (1, 1, 1), (1, 2, 0), (2, 1, 5);
+        """
+    )
+    return conn
+
+
+def update_results(conn, null_if_no_source):
+    """
+    Update the flags of scenario 1 from source 1 in a single transaction
+    """
+    statements = [
+        module_to_test.get_update_from_source_statement(
+            tbl="results",
+            col="flag",
+            scenario_id=1,
+            source_sql=SOURCE_SQL,
+            source_data=(1,),
+            join_cols=["timepoint"],
+        )
+    ]
+    if null_if_no_source:
+        statements.append(
+            module_to_test.get_set_null_if_no_source_statement(
+                tbl="results",
+                col="flag",
+                scenario_id=1,
+                source_sql=SOURCE_SQL,
+                source_data=(1,),
+                join_cols=["timepoint"],
+            )
+        )
+    spin_on_database_lock_transaction(
+        conn=conn, cursor=conn.cursor(), statements=statements
+    )
+
+    return conn.execute(
+        "SELECT scenario_id, timepoint, flag FROM results "
+        "ORDER BY scenario_id, timepoint;"
+    ).fetchall()
+
+
+class TestDbInterface(unittest.TestCase):
+    """ """
+
+    def test_get_update_from_source_statement(self):
+        """
+        Only the scenario's rows with a matching source row are updated,
+        with both the UPDATE ... FROM statement and the correlated UPDATE
+        fallback for older SQLite versions; the rows without a match are set
+        to NULL only with the get_set_null_if_no_source_statement statement
+        """
+        expected_results = [
+            (1, 1, 1),
+            (1, 2, 0),
+            (1, 3, 0),
+            (2, 1, 0),
+            (2, 2, 0),
+            (2, 3, 0),
+        ]
+        expected_results_w_null = [
+            (1, 1, 1),
+            (1, 2, 0),
+            (1, 3, None),
+            (2, 1, 0),
+            (2, 2, 0),
+            (2, 3, 0),
+        ]
+
+        for sqlite_version_info in [(3, 33, 0), (3, 32, 0)]:
+            with mock.patch.object(
+                module_to_test.sqlite3, "sqlite_version_info", sqlite_version_info
+            ):
+                sql, _ = module_to_test.get_update_from_source_statement(
+                    tbl="results",
+                    col="flag",
+                    scenario_id=1,
+                    source_sql=SOURCE_SQL,
+                    source_data=(1,),
+                    join_cols=["timepoint"],
+                )
+                self.assertEqual(sqlite_version_info < (3, 33, 0), "EXISTS" in sql)
+
+                for null_if_no_source, expected in [
+                    (False, expected_results),
+                    (True, expected_results_w_null),
+                ]:
+                    conn = create_database()
+                    self.assertListEqual(
+                        expected,
+                        update_results(conn=conn, null_if_no_source=null_if_no_source),
+                    )
+                    conn.close()
+
+    def test_get_update_from_source_statement_value(self):
+        """
+        The new value can be an expression of the source and table columns;
+        rows whose value doesn't change are not written
+        """
+        for sqlite_version_info in [(3, 33, 0), (3, 32, 0)]:
+            with mock.patch.object(
+                module_to_test.sqlite3, "sqlite_version_info", sqlite_version_info
+            ):
+                conn = create_database()
+                sql, data = module_to_test.get_update_from_source_statement(
+                    tbl="results",
+                    col="flag",
+                    scenario_id=2,
+                    source_sql=SOURCE_SQL,
+                    source_data=(1,),
+                    join_cols=["timepoint"],
+                    value="results.timepoint * src.flag",
+                )
+                changes = conn.total_changes
+                conn.execute(sql, data)
+                self.assertEqual(1, conn.total_changes - changes)
+                self.assertListEqual(
+                    [(1, 1), (2, 0), (3, 0)],
+                    conn.execute(
+                        "SELECT timepoint, flag FROM results WHERE scenario_id = 2 "
+                        "ORDER BY timepoint;"
+                    ).fetchall(),
+                )
+                conn.close()
+
+    def test_spin_on_database_lock_transaction(self):
+        """
+        If the database is locked, the statements executed so far are rolled
+        back and the transaction is retried
+        """
+        conn = create_database()
+        statements = [
+            ("UPDATE results SET flag = flag + 1 WHERE scenario_id = ?;", (1,)),
+            ("UPDATE results SET flag = flag + 2 WHERE scenario_id = ?;", (2,)),
+        ]
+
+        executed = []
+        cursor = conn.cursor()
+
+        def execute_locked_once(sql, data):
+            executed.append(sql)
+            if len(executed) == 2:
+                raise sqlite3.OperationalError("database is locked")
+            return cursor.execute(sql, data)
+
+        mock_cursor = mock.Mock()
+        mock_cursor.execute.side_effect = execute_locked_once
+        with mock.patch("db.common_functions.time.sleep") as sleep:
+            spin_on_database_lock_transaction(
+                conn=conn, cursor=mock_cursor, statements=statements, interval=0
+            )
+
+        # The first attempt was stopped at the second statement and rolled
+        # back, then both statements were executed again
+        self.assertEqual(4, len(executed))
+        sleep.assert_called_once_with(0)
+        self.assertListEqual(
+            [(1, 1), (2, 2)],
+            conn.execute(
+                "SELECT DISTINCT scenario_id, flag FROM results ORDER BY scenario_id;"
+            ).fetchall(),
+        )
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
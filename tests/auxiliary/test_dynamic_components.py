@@ -0,0 +1,102 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import pandas as pd
+
+from gridpath.auxiliary.dynamic_components import ResultsFrame
+
+
+def create_frame():
+    return ResultsFrame(
+        columns=["project", "timepoint", "period", "technology"],
+        data=[
+            ["Wind", 2, 2020, "wind"],
+            ["Gas", 1, 2020, "gas"],
+            ["Wind", 1, 2020, "wind"],
+        ],
+        index_columns=["project", "timepoint"],
+    )
+
+
+class TestResultsFrame(unittest.TestCase):
+    """ """
+
+    def test_update(self):
+        """
+        Rows are sorted by index, values are written to the rows in the
+        frame, and missing values don't overwrite existing values
+        """
+        frame = create_frame()
+        self.assertListEqual([("Gas", 1), ("Wind", 1), ("Wind", 2)], frame.index)
+        self.assertEqual(3, len(frame))
+
+        frame.update(
+            columns=["power_mw", "curtailment_mw"],
+            data=[
+                ["Wind", 1, 10.0, 1.0],
+                ["Wind", 2, 20.0, None],
+                # Not in the frame
+                ["Solar", 1, 5.0, 0.0],
+            ],
+        )
+        frame.update(
+            columns=["curtailment_mw"],
+            data=[["Wind", 1, float("nan")], ["Wind", 2, 2.0]],
+        )
+
+        self.assertIn("power_mw", frame)
+        self.assertNotIn("availability_derate", frame)
+        self.assertListEqual([None, 10.0, 20.0], frame.get_column("power_mw"))
+        self.assertListEqual([None, 1.0, 2.0], frame.get_column("curtailment_mw"))
+
+        frame.set_column("power_mw", [0.0, 0.0, 0.0])
+        self.assertListEqual([0.0, 0.0, 0.0], frame.get_column("power_mw"))
+
+    def test_to_df(self):
+        """
+        The frame is converted to a DataFrame indexed by the index columns;
+        results columns are objects
+        """
+        frame = create_frame()
+        frame.update(columns=["power_mw"], data=[["Gas", 1, 5]])
+        df = frame.to_df()
+
+        expected_df = pd.DataFrame(
+            columns=["project", "timepoint", "period", "technology"],
+            data=[
+                ["Gas", 1, 2020, "gas"],
+                ["Wind", 1, 2020, "wind"],
+                ["Wind", 2, 2020, "wind"],
+            ],
+        ).set_index(["project", "timepoint"])
+        expected_df["power_mw"] = pd.Series(
+            [5, None, None], index=expected_df.index, dtype=object
+        )
+
+        pd.testing.assert_frame_equal(expected_df, df)
+
+        # Frames without rows keep their columns
+        empty_df = ResultsFrame(
+            columns=["zone", "period", "discount_factor"],
+            data=[],
+            index_columns=["zone", "period"],
+        ).to_df()
+        self.assertListEqual(["zone", "period"], list(empty_df.index.names))
+        self.assertListEqual(["discount_factor"], list(empty_df.columns))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from pyomo.environ import (
+    Binary,
+    ConcreteModel,
+    Constraint,
+    NonNegativeReals,
+    Objective,
+    Param,
+    Set,
+    SolverFactory,
+    Suffix,
+    TerminationCondition,
+    Var,
+    value,
+)
+
+import gridpath.auxiliary.horizon_decomposition as module_to_test
+from gridpath.auxiliary.dynamic_components import DynamicComponents, capacity_variables
+
+
+def create_instance(link_horizons=False, boundary="circular"):
+    """
+    Two daily horizons with two timepoints each, existing capacity, a
+    committed unit, and ramp limits within each horizon; optionally, a
+    constraint on total generation across both horizons
+    """
+    m = ConcreteModel()
+    m.TMPS = Set(initialize=[1, 2, 3, 4], ordered=True)
+    m.BLN_TYPES = Set(initialize=["day", "year"], ordered=True)
+    m.BLN_TYPE_HRZS = Set(
+        dimen=2, initialize=[("day", 1), ("day", 2), ("year", 2020)], ordered=True
+    )
+    m.HRZS_BY_BLN_TYPE = Set(
+        m.BLN_TYPES, initialize={"day": [1, 2], "year": [2020]}, ordered=True
+    )
+    m.horizon = Param(
+        m.TMPS,
+        m.BLN_TYPES,
+        initialize={
+            (tmp, bt): (2020 if bt == "year" else (1 if tmp <= 2 else 2))
+            for tmp in [1, 2, 3, 4]
+            for bt in ["day", "year"]
+        },
+    )
+    m.boundary = Param(m.BLN_TYPE_HRZS, initialize=lambda mod, bt, h: boundary)
+    m.load_mw = Param(m.TMPS, initialize={1: 20, 2: 35, 3: 15, 4: 30})
+
+    m.Capacity_MW = Var(within=NonNegativeReals)
+    m.Capacity_MW.fix(40)
+    m.Commit = Var(m.TMPS, within=Binary)
+    m.Peaker_MW = Var(m.TMPS, within=NonNegativeReals)
+    m.Power_MW = Var(m.TMPS, within=NonNegativeReals)
+
+    m.Max_Power_Constraint = Constraint(
+        m.TMPS, rule=lambda mod, tmp: mod.Power_MW[tmp] <= mod.Capacity_MW
+    )
+    m.Max_Peaker_Constraint = Constraint(
+        m.TMPS, rule=lambda mod, tmp: mod.Peaker_MW[tmp] <= 20 * mod.Commit[tmp]
+    )
+    m.Ramp_Constraint = Constraint(
+        m.TMPS,
+        rule=lambda mod, tmp: mod.Power_MW[tmp]
+        - mod.Power_MW[tmp - 1 if tmp in [2, 4] else tmp + 1]
+        <= 10,
+    )
+    m.Meet_Load_Constraint = Constraint(
+        m.TMPS,
+        rule=lambda mod, tmp: mod.Power_MW[tmp] + mod.Peaker_MW[tmp]
+        == mod.load_mw[tmp],
+    )
+    if link_horizons:
+        m.Energy_Limit_Constraint = Constraint(
+            expr=sum(m.Power_MW[tmp] for tmp in m.TMPS) <= 70
+        )
+    m.Total_Cost = Objective(
+        expr=sum(
+            m.Power_MW[tmp] + 5 * m.Peaker_MW[tmp] + 3 * m.Commit[tmp] for tmp in m.TMPS
+        )
+    )
+    m.dual = Suffix(direction=Suffix.IMPORT)
+
+    d = DynamicComponents()
+    getattr(d, capacity_variables).append("Capacity_MW")
+
+    return m, d
+
+
+class TestHorizonDecomposition(unittest.TestCase):
+    """ """
+
+    def test_get_coupling_reason(self):
+        """
+        Period-level policy modules, investment decisions, and linked
+        horizons prevent solving the horizons independently
+        """
+        m, d = create_instance()
+        self.assertIsNone(
+            module_to_test.get_coupling_reason(
+                instance=m, dynamic_components=d, modules_to_use=["temporal"]
+            )
+        )
+        self.assertIsNotNone(
+            module_to_test.get_coupling_reason(
+                instance=m,
+                dynamic_components=d,
+                modules_to_use=["system.policy.carbon_cap.carbon_cap"],
+            )
+        )
+
+        m.Capacity_MW.unfix()
+        self.assertIsNotNone(
+            module_to_test.get_coupling_reason(
+                instance=m, dynamic_components=d, modules_to_use=[]
+            )
+        )
+
+        m, d = create_instance(boundary="linked")
+        self.assertIsNotNone(
+            module_to_test.get_coupling_reason(
+                instance=m, dynamic_components=d, modules_to_use=[]
+            )
+        )
+
+    def test_decompose_by_horizon(self):
+        """
+        The problem is split into one problem per day; if a constraint links
+        the days, it can't be split
+        """
+        m, d = create_instance()
+        decomposition = module_to_test.decompose_by_horizon(instance=m)
+
+        self.assertEqual("day", decomposition.balancing_type)
+        self.assertListEqual(
+            ["1", "2"], [sp["name"] for sp in decomposition.subproblems]
+        )
+        self.assertListEqual(
+            [8, 8], [len(sp["constraints"]) for sp in decomposition.subproblems]
+        )
+        self.assertListEqual(
+            [2, 2],
+            [len(sp["data"]["integer_vars"]) for sp in decomposition.subproblems],
+        )
+
+        m, d = create_instance(link_horizons=True)
+        self.assertIsNone(module_to_test.decompose_by_horizon(instance=m))
+
+    def test_solve_horizons(self):
+        """
+        Solving the horizons independently finds the solution of the
+        monolithic problem
+        """
+        m, d = create_instance()
+        SolverFactory("cbc").solve(m)
+        expected_cost = value(m.Total_Cost)
+        expected_commit = [m.Commit[tmp].value for tmp in m.TMPS]
+
+        m, d = create_instance()
+        (
+            solver_status,
+            termination_condition,
+        ) = module_to_test.solve_horizons(
+            instance=m,
+            dynamic_components=d,
+            modules_to_use=[],
+            solver_name="cbc",
+            solver_options={},
+            quiet=True,
+        )
+
+        self.assertEqual(TerminationCondition.optimal, termination_condition)
+        self.assertAlmostEqual(expected_cost, value(m.Total_Cost), places=4)
+        self.assertListEqual(
+            expected_commit, [round(m.Commit[tmp].value) for tmp in m.TMPS]
+        )
+
+        # Horizons that can't be solved independently are not solved
+        m, d = create_instance(link_horizons=True)
+        self.assertIsNone(
+            module_to_test.solve_horizons(
+                instance=m,
+                dynamic_components=d,
+                modules_to_use=[],
+                solver_name="cbc",
+                solver_options={},
+                quiet=True,
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
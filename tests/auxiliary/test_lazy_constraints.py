@@ -0,0 +1,160 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from pyomo.environ import (
+    ConcreteModel,
+    Constraint,
+    NonNegativeReals,
+    Objective,
+    Param,
+    Set,
+    SolverFactory,
+    Suffix,
+    TerminationCondition,
+    Var,
+    value,
+)
+
+import gridpath.auxiliary.lazy_constraints as lazy_constraints_module_to_test
+from gridpath.auxiliary.dynamic_components import DynamicComponents, lazy_constraints
+
+
+def create_instance(allow_exports=False):
+    """
+    Cheap imports over a line limited to 5 MW serve part of the load in
+    each timepoint; the limit only binds when the load exceeds it. If
+    exports are allowed, imports can be re-exported at a profit, so the
+    problem is unbounded without the line limit.
+    """
+    m = ConcreteModel()
+    m.TMPS = Set(initialize=[1, 2, 3, 4], ordered=True)
+    m.load_mw = Param(m.TMPS, initialize={1: 2, 2: 8, 3: 4, 4: 10})
+
+    m.Import_MW = Var(m.TMPS, within=NonNegativeReals)
+    m.Local_MW = Var(m.TMPS, within=NonNegativeReals)
+
+    m.Export_MW = Var(m.TMPS, within=NonNegativeReals)
+    if not allow_exports:
+        m.Export_MW.fix(0)
+
+    m.Meet_Load_Constraint = Constraint(
+        m.TMPS,
+        rule=lambda mod, tmp: mod.Import_MW[tmp] + mod.Local_MW[tmp]
+        == mod.load_mw[tmp] + mod.Export_MW[tmp],
+    )
+    m.Max_Transmit_Constraint = Constraint(
+        m.TMPS, rule=lambda mod, tmp: mod.Import_MW[tmp] <= 5
+    )
+    m.Cost = Objective(
+        expr=sum(
+            m.Import_MW[tmp] + 10 * m.Local_MW[tmp] - 2 * m.Export_MW[tmp]
+            for tmp in m.TMPS
+        )
+    )
+    m.dual = Suffix(direction=Suffix.IMPORT)
+
+    d = DynamicComponents()
+    getattr(d, lazy_constraints).append("Max_Transmit_Constraint")
+
+    return m, d
+
+
+def solve(instance, parsed_arguments, warmstart=False):
+    return SolverFactory("cbc").solve(instance)
+
+
+class TestLazyConstraints(unittest.TestCase):
+    """ """
+
+    def test_solve_with_lazy_constraints(self):
+        """
+        Only the violated limits are added, the solution matches the full
+        problem, and the binding limits are saved for the next solve
+        """
+        m, d = create_instance()
+        solve(m, None)
+        expected_cost = value(m.Cost)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            binding_constraints_file = os.path.join(tmp_dir, "binding.csv")
+            for expected_initial in [set(), {"Max_Transmit_Constraint[2]"}]:
+                m, d = create_instance()
+                self.assertSetEqual(
+                    expected_initial,
+                    lazy_constraints_module_to_test.read_binding_constraints(
+                        binding_constraints_file
+                    ),
+                )
+                results = lazy_constraints_module_to_test.solve_with_lazy_constraints(
+                    instance=m,
+                    dynamic_components=d,
+                    solve_function=solve,
+                    parsed_arguments=None,
+                    binding_constraints_file=binding_constraints_file,
+                    quiet=True,
+                )
+
+                self.assertEqual(
+                    TerminationCondition.optimal,
+                    results.solver.termination_condition,
+                )
+                self.assertAlmostEqual(expected_cost, value(m.Cost))
+                # All constraints are active again; unused ones have no dual
+                self.assertTrue(
+                    all(c.active for c in m.Max_Transmit_Constraint.values())
+                )
+                self.assertEqual(0, m.dual[m.Max_Transmit_Constraint[1]])
+                self.assertSetEqual(
+                    {"Max_Transmit_Constraint[2]", "Max_Transmit_Constraint[4]"},
+                    lazy_constraints_module_to_test.read_binding_constraints(
+                        binding_constraints_file
+                    ),
+                )
+                # Keep only one constraint to check the initial screen
+                lazy_constraints_module_to_test.write_binding_constraints(
+                    binding_constraints_file=binding_constraints_file,
+                    constraint_names=["Max_Transmit_Constraint[2]"],
+                )
+
+    def test_solve_with_lazy_constraints_unbounded_relaxation(self):
+        """
+        If the problem without the lazy constraints is unbounded, the full
+        problem is solved
+        """
+        m, d = create_instance(allow_exports=True)
+        solve(m, None)
+        expected_cost = value(m.Cost)
+
+        m, d = create_instance(allow_exports=True)
+        results = lazy_constraints_module_to_test.solve_with_lazy_constraints(
+            instance=m,
+            dynamic_components=d,
+            solve_function=solve,
+            parsed_arguments=None,
+            quiet=True,
+        )
+
+        self.assertEqual(
+            TerminationCondition.optimal, results.solver.termination_condition
+        )
+        self.assertAlmostEqual(expected_cost, value(m.Cost))
+        self.assertTrue(all(c.active for c in m.Max_Transmit_Constraint.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
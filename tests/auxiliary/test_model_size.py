@@ -0,0 +1,209 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import sqlite3
+import tempfile
+import unittest
+
+from pyomo.environ import (
+    Binary,
+    ConcreteModel,
+    Constraint,
+    NonNegativeReals,
+    Set,
+    Suffix,
+    Var,
+)
+
+from db.create_database import create_database_schema
+import gridpath.auxiliary.model_size as model_size_module_to_test
+
+
+def create_instance():
+    m = ConcreteModel()
+    m.TMPS = Set(initialize=[1, 2, 3])
+    m.Power_MW = Var(m.TMPS, within=NonNegativeReals)
+    m.Commit = Var(m.TMPS, within=Binary)
+    m.Max_Power_Constraint = Constraint(
+        m.TMPS,
+        rule=lambda mod, tmp: mod.Power_MW[tmp] <= 10 * mod.Commit[tmp]
+        if tmp != 3
+        else Constraint.Skip,
+    )
+    m.Total_Power_Constraint = Constraint(expr=sum(m.Power_MW.values()) >= 5)
+    # Not passed to the solver
+    m.Unbounded_Constraint = Constraint(expr=(None, m.Power_MW[1], None))
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    m.Commit[3].fix(0)
+
+    component_modules = {
+        "TMPS": "temporal",
+        "Power_MW": "project.operations",
+        "Commit": "project.operations",
+        "Max_Power_Constraint": "project.operations",
+        "Total_Power_Constraint": "system.load_balance",
+    }
+
+    return m, component_modules
+
+
+class TestModelSize(unittest.TestCase):
+    """ """
+
+    def test_get_model_size(self):
+        """
+        Check the counts per component and per module
+        """
+        m, component_modules = create_instance()
+        records = model_size_module_to_test.get_model_size(
+            instance=m, component_modules=component_modules
+        )
+        self.assertListEqual(
+            [
+                [
+                    "project.operations",
+                    "Power_MW",
+                    "Var",
+                    "TMPS",
+                    3,
+                    3,
+                    3,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0,
+                ],
+                ["project.operations", "Commit", "Var", "TMPS", 3, 3, 0, 2, 0, 1, 0, 0],
+                [
+                    "project.operations",
+                    "Max_Power_Constraint",
+                    "Constraint",
+                    "TMPS",
+                    3,
+                    2,
+                    0,
+                    0,
+                    0,
+                    0,
+                    2,
+                    4,
+                ],
+                [
+                    "system.load_balance",
+                    "Total_Power_Constraint",
+                    "Constraint",
+                    None,
+                    1,
+                    1,
+                    0,
+                    0,
+                    0,
+                    0,
+                    1,
+                    3,
+                ],
+                [
+                    "(other)",
+                    "Unbounded_Constraint",
+                    "Constraint",
+                    None,
+                    1,
+                    1,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0,
+                ],
+            ],
+            [
+                [r[c] for c in model_size_module_to_test.COMPONENT_COLUMNS]
+                for r in records
+            ],
+        )
+
+        module_totals = model_size_module_to_test.get_module_totals(records)
+        self.assertListEqual(
+            [
+                ("project.operations", 3, 5, 2, 4),
+                ("system.load_balance", 1, 0, 1, 3),
+                ("(other)", 1, 0, 0, 0),
+            ],
+            [
+                (
+                    r["module"],
+                    r["n_components"],
+                    r["n_variables"],
+                    r["n_constraints"],
+                    r["n_nonzeros"],
+                )
+                for r in module_totals
+            ],
+        )
+
+    def test_import_model_size_into_database(self):
+        """
+        Check that the component-level report can be imported (and
+        re-imported) into the database
+        """
+        m, component_modules = create_instance()
+        with tempfile.TemporaryDirectory() as results_directory:
+            model_size_module_to_test.write_model_size_report(
+                instance=m,
+                component_modules=component_modules,
+                results_directory=results_directory,
+            )
+
+            conn = sqlite3.connect(":memory:")
+            create_database_schema(
+                conn=conn,
+                parsed_arguments=argparse.Namespace(db_schema="db_schema.sql"),
+            )
+            for _ in range(2):
+                model_size_module_to_test.import_model_size_into_database(
+                    conn=conn,
+                    scenario_id=1,
+                    subproblem=1,
+                    stage=1,
+                    results_directory=results_directory,
+                )
+            self.assertListEqual(
+                conn.execute(
+                    """SELECT gridpath_module, SUM(n_binary), SUM(n_constraints),
+                    SUM(n_nonzeros)
+                    FROM results_model_size
+                    WHERE scenario_id = 1
+                    GROUP BY gridpath_module
+                    ORDER BY gridpath_module;"""
+                ).fetchall(),
+                [
+                    ("(other)", 0, 0, 0),
+                    ("project.operations", 2, 2, 4),
+                    ("system.load_balance", 0, 1, 3),
+                ],
+            )
+            self.assertIsNone(
+                conn.execute(
+                    """SELECT index_set FROM results_model_size
+                    WHERE component = 'Total_Power_Constraint';"""
+                ).fetchone()[0]
+            )
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
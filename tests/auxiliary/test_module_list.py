@@ -0,0 +1,119 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import gridpath.auxiliary.module_list as module_list_module_to_test
+
+
+class TestModuleList(unittest.TestCase):
+    """ """
+
+    def test_module_registry(self):
+        """
+        The registry is built once per scenario and rebuilt when the
+        features or the subproblem/stage structure (scanned once per run)
+        change
+        """
+        with tempfile.TemporaryDirectory() as scenario_directory:
+            features_file = os.path.join(scenario_directory, "features.csv")
+            with open(features_file, "w") as f:
+                f.write("features\n")
+
+            registry = module_list_module_to_test.get_module_registry(
+                scenario_directory=scenario_directory
+            )
+            self.assertIs(
+                registry,
+                module_list_module_to_test.get_module_registry(
+                    scenario_directory=scenario_directory
+                ),
+            )
+            self.assertListEqual(
+                registry.modules_to_use,
+                module_list_module_to_test.determine_modules(
+                    features=[], multi_stage=False
+                ),
+            )
+
+            hook_modules = registry.modules_with("export_results")
+            self.assertListEqual(
+                [name for name, m in hook_modules],
+                [
+                    name
+                    for name, m in zip(registry.modules_to_use, registry.loaded_modules)
+                    if hasattr(m, "export_results")
+                ],
+            )
+            self.assertIs(hook_modules, registry.modules_with("export_results"))
+
+            # Rewriting the features file results in a new registry
+            with open(features_file, "w") as f:
+                f.write("features\ntransmission\n")
+            stat = os.stat(features_file)
+            os.utime(features_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            new_registry = module_list_module_to_test.get_module_registry(
+                scenario_directory=scenario_directory
+            )
+            self.assertIsNot(registry, new_registry)
+            self.assertIn("transmission", new_registry.modules_to_use)
+            self.assertNotIn(
+                "project.operations.fix_commitment", new_registry.modules_to_use
+            )
+
+            # Directories created during a run don't change the structure
+            os.makedirs(os.path.join(scenario_directory, "results"))
+            self.assertIs(
+                new_registry,
+                module_list_module_to_test.get_module_registry(
+                    scenario_directory=scenario_directory
+                ),
+            )
+
+            # Stages added between runs result in a new registry with the
+            # modules that fix variables across stages once the structure is
+            # refreshed at the start of the next run
+            os.makedirs(os.path.join(scenario_directory, "1", "2"))
+            self.assertIs(
+                new_registry,
+                module_list_module_to_test.get_module_registry(
+                    scenario_directory=scenario_directory
+                ),
+            )
+            self.assertTupleEqual(
+                (("1", ("2",)),),
+                module_list_module_to_test.refresh_scenario_structure(
+                    scenario_directory=scenario_directory
+                ),
+            )
+            stage_registry = module_list_module_to_test.get_module_registry(
+                scenario_directory=scenario_directory
+            )
+            self.assertIsNot(new_registry, stage_registry)
+            self.assertIn(
+                "project.operations.fix_commitment", stage_registry.modules_to_use
+            )
+            os.makedirs(os.path.join(scenario_directory, "1", "results"))
+            self.assertIs(
+                stage_registry,
+                module_list_module_to_test.get_module_registry(
+                    scenario_directory=scenario_directory
+                ),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import json
+import os.path
+import tempfile
+import unittest
+
+from pyomo.environ import ConcreteModel, Constraint, Objective, Var
+
+import gridpath.auxiliary.problem_snapshot as problem_snapshot_module_to_test
+
+
+def build_instance():
+    m = ConcreteModel()
+    m.x = Var([("a", 1), ("b", 2)])
+    m.y = Var()
+    m.C = Constraint(
+        ["a", "b"], rule=lambda mod, z: mod.x[z, 1 if z == "a" else 2] >= 0
+    )
+    m.D = Constraint(expr=m.x["a", 1] + m.y <= 10)
+    m.Obj = Objective(expr=m.x["a", 1] + m.x["b", 2] + m.y)
+    return m
+
+
+class TestProblemSnapshot(unittest.TestCase):
+    """ """
+
+    def test_problem_snapshot(self):
+        """
+        Write a problem file and its snapshot and check that the symbols are
+        resolved to the components of a rebuilt instance
+        """
+        instance = build_instance()
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertFalse(
+                problem_snapshot_module_to_test.problem_snapshot_exists(directory)
+            )
+            _, smap_id = instance.write(
+                os.path.join(directory, "problem_file.lp"),
+                io_options={"symbolic_solver_labels": True},
+            )
+            problem_snapshot_module_to_test.write_problem_snapshot(
+                prob_sol_files_directory=directory,
+                instance=instance,
+                symbol_map=instance.solutions.symbol_map[smap_id],
+            )
+            self.assertTrue(
+                problem_snapshot_module_to_test.problem_snapshot_exists(directory)
+            )
+            snapshot = problem_snapshot_module_to_test.read_problem_snapshot(directory)
+
+            rebuilt_instance = build_instance()
+            problem_snapshot_module_to_test.check_instance_structure(
+                instance=rebuilt_instance, snapshot=snapshot
+            )
+            symbol_components = (
+                problem_snapshot_module_to_test.SnapshotSymbolComponents(
+                    instance=rebuilt_instance, snapshot=snapshot
+                )
+            )
+            self.assertIs(symbol_components.get("x(a_1)"), rebuilt_instance.x["a", 1])
+            self.assertIs(symbol_components.get("y"), rebuilt_instance.y)
+            self.assertIs(symbol_components.get("C(b)"), rebuilt_instance.C["b"])
+            self.assertIsNone(symbol_components.get("ONE_VAR_CONSTANT"))
+
+            # Only resolve symbols of the requested components
+            symbol_components = (
+                problem_snapshot_module_to_test.SnapshotSymbolComponents(
+                    instance=rebuilt_instance,
+                    snapshot=snapshot,
+                    solution_components=["x"],
+                )
+            )
+            self.assertIs(symbol_components.get("x(b_2)"), rebuilt_instance.x["b", 2])
+            self.assertIsNone(symbol_components.get("y"))
+
+            # Changed structure
+            rebuilt_instance.z = Var()
+            with self.assertRaises(ValueError):
+                problem_snapshot_module_to_test.check_instance_structure(
+                    instance=rebuilt_instance, snapshot=snapshot
+                )
+
+            # Unexpected format version
+            snapshot["version"] = 0
+            with gzip.open(
+                os.path.join(
+                    directory, problem_snapshot_module_to_test.SNAPSHOT_FILENAME
+                ),
+                "wt",
+            ) as f:
+                json.dump(snapshot, f)
+            with self.assertRaises(ValueError):
+                problem_snapshot_module_to_test.read_problem_snapshot(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
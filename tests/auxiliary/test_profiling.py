@@ -0,0 +1,102 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import csv
+import os.path
+import tempfile
+import types
+import unittest
+
+from pyomo.environ import AbstractModel, DataPortal, Param, Set, Var
+
+import gridpath.auxiliary.profiling as profiling_module_to_test
+
+
+class TestProfiling(unittest.TestCase):
+    """ """
+
+    def test_construction_profiler(self):
+        """
+        Check that module calls and component construction are recorded and
+        that components are attributed to the module that added them
+        """
+        mod = types.ModuleType("gridpath.test_module")
+        model = AbstractModel()
+        data_portal = DataPortal()
+        profiler = profiling_module_to_test.ConstructionProfiler()
+
+        with profiler.profile_module("add_model_components", mod, model):
+            model.S = Set()
+            model.p = Param(model.S)
+            model.x = Var(model.S)
+
+        with profiler.profile_module(
+            "load_model_data", mod, model, data_portal=data_portal
+        ):
+            data_portal["S"] = [1, 2, 3]
+            data_portal["p"] = {1: 1, 2: 2, 3: 3}
+
+        with profiler.profile_instance_construction():
+            model.create_instance(data_portal)
+
+        self.assertListEqual(
+            [
+                (r["step"], r["module"], r["n_components"], r["n_indices"])
+                for r in profiler.module_records
+            ],
+            [
+                ("add_model_components", "test_module", 3, None),
+                ("load_model_data", "test_module", 0, 6),
+            ],
+        )
+
+        self.assertListEqual(
+            [
+                (r["component"], r["component_type"], r["module"], r["n_indices"])
+                for r in profiler.component_records
+            ],
+            [
+                ("S", "Set", "test_module", 1),
+                ("p", "Param", "test_module", 3),
+                ("x", "Var", "test_module", 3),
+            ],
+        )
+
+        totals = profiler.module_totals()
+        self.assertEqual(len(totals), 1)
+        self.assertEqual(totals[0]["n_components"], 3)
+        self.assertEqual(totals[0]["n_indices"], 7)
+
+        with tempfile.TemporaryDirectory() as logs_directory:
+            profiler.write(logs_directory=logs_directory)
+            with open(
+                os.path.join(
+                    logs_directory, profiling_module_to_test.COMPONENT_PROFILE_FILENAME
+                )
+            ) as f:
+                rows = list(csv.DictReader(f))
+            self.assertSetEqual({r["component"] for r in rows}, {"S", "p", "x"})
+
+    def test_profile_module_without_profiler(self):
+        """
+        No profiling when the profiler is None
+        """
+        with profiling_module_to_test.profile_module(
+            None, "add_model_components", None, None
+        ):
+            pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import os.path
+import tempfile
+import unittest
+
+from pyomo.environ import ConcreteModel, Constraint, Suffix, Var
+
+import gridpath.auxiliary.solution_files as solution_files_module_to_test
+
+CPLEX_XML_SOLUTION = """<?xml version = "1.0" encoding="UTF-8" standalone="yes"?>
+<CPLEXSolution version="1.2">
+ <header
+   problemName="problem_file.lp"
+   solutionStatusValue="1"
+   solutionStatusString="optimal"/>
+ <quality epRHS="1e-06"/>
+ <linearConstraints>
+  <constraint name="c_e_x3_" index="0" slack="0" dual="2.5"/>
+  <constraint name="c_e_ONE_VAR_CONSTANT" index="1" slack="0" dual="0"/>
+ </linearConstraints>
+ <variables>
+  <variable name="x1" index="0" value="1"/>
+  <variable name="x2" index="1" value="3.25"/>
+  <variable name="ONE_VAR_CONSTANT" index="2" value="1"/>
+ </variables>
+</CPLEXSolution>
+"""
+
+GUROBI_JSON_SOLUTION = {
+    "SolutionInfo": {"Status": 2, "ObjVal": 10.0},
+    "Vars": [
+        {"VarName": "x1", "VTag": ["x1"], "X": 1},
+        {"VarName": "x2", "VTag": ["x2"], "X": 3.25},
+        {"VarName": "ONE_VAR_CONSTANT", "VTag": ["ONE_VAR_CONSTANT"], "X": 1},
+    ],
+    "Constrs": [
+        {"ConstrName": "c_e_x3_", "CTag": ["c_e_x3"], "Pi": 2.5},
+        {"ConstrName": "c_e_ONE_VAR_CONSTANT", "CTag": ["c_e_ONE_VAR_CONSTAN"]},
+    ],
+}
+
+EXPECTED_SOLUTION_VALUES = [
+    (solution_files_module_to_test.VARIABLE, "x1", 1.0),
+    (solution_files_module_to_test.VARIABLE, "x2", 3.25),
+    (solution_files_module_to_test.CONSTRAINT, "x3", 2.5),
+]
+
+
+class TestSolutionFiles(unittest.TestCase):
+    """ """
+
+    def test_iter_cplex_xml_solution(self):
+        """
+        Check that the variable values, duals, and header are read
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "cplex_solution.sol")
+            with open(filepath, "w") as f:
+                f.write(CPLEX_XML_SOLUTION)
+
+            header = dict()
+            values = list(
+                solution_files_module_to_test.iter_cplex_xml_solution(
+                    filepath=filepath, header=header
+                )
+            )
+
+        self.assertListEqual(
+            sorted(values, key=lambda v: v[1]), EXPECTED_SOLUTION_VALUES
+        )
+        self.assertEqual(header["solutionStatusString"], "optimal")
+        self.assertEqual(header["solutionStatusValue"], "1")
+
+    def test_iter_gurobi_json_solution(self):
+        """
+        Check that the variable values, duals, and solution info are read,
+        including when values span the chunks in which the file is read
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "gurobi_solution.json")
+            with open(filepath, "w") as f:
+                json.dump(GUROBI_JSON_SOLUTION, f, indent=1)
+
+            solution_info = dict()
+            values = list(
+                solution_files_module_to_test.iter_gurobi_json_solution(
+                    filepath=filepath, solution_info=solution_info
+                )
+            )
+
+        self.assertListEqual(values, EXPECTED_SOLUTION_VALUES)
+        self.assertDictEqual(solution_info, {"Status": 2, "ObjVal": 10.0})
+
+        # Read the file in small chunks
+        for chunk_size in [1, 2, 3, 7]:
+            reader = solution_files_module_to_test._JSONStreamReader(
+                io.StringIO(json.dumps(GUROBI_JSON_SOLUTION)), chunk_size=chunk_size
+            )
+            items = list(reader.iter_top_level_items(array_keys=("Vars", "Constrs")))
+            self.assertListEqual(
+                items,
+                [("SolutionInfo", GUROBI_JSON_SOLUTION["SolutionInfo"])]
+                + [("Vars", v) for v in GUROBI_JSON_SOLUTION["Vars"]]
+                + [("Constrs", c) for c in GUROBI_JSON_SOLUTION["Constrs"]],
+            )
+
+    def test_load_solution_values(self):
+        """
+        Check that values and duals are applied and that symbols not in the
+        symbol-to-component dictionary are skipped
+        """
+        m = ConcreteModel()
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        m.x = Var([1, 2])
+        m.C = Constraint(expr=m.x[1] + m.x[2] >= 1)
+
+        solution_files_module_to_test.load_solution_values(
+            instance=m,
+            symbol_components={"x1": m.x[1], "x3": m.C},
+            solution_values=EXPECTED_SOLUTION_VALUES,
+            batch_size=2,
+        )
+        self.assertEqual(m.x[1].value, 1.0)
+        self.assertIsNone(m.x[2].value)
+        self.assertEqual(m.dual[m.C], 2.5)
+
+        # Skip the duals
+        m.dual.clear()
+        solution_files_module_to_test.load_solution_values(
+            instance=m,
+            symbol_components={"x2": m.x[2], "x3": m.C},
+            solution_values=EXPECTED_SOLUTION_VALUES,
+            load_duals=False,
+        )
+        self.assertEqual(m.x[2].value, 3.25)
+        self.assertEqual(len(m.dual), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
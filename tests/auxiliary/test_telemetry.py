@@ -0,0 +1,178 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import types
+import unittest
+
+from db.create_database import create_database_schema
+import gridpath.auxiliary.telemetry as telemetry_module_to_test
+
+
+class TestTelemetry(unittest.TestCase):
+    """ """
+
+    def tearDown(self):
+        telemetry_module_to_test.disable_telemetry()
+
+    def test_record_phase(self):
+        """
+        Check that phases are written to the telemetry file only when
+        telemetry is enabled and that they can be imported into the database
+        """
+        with tempfile.TemporaryDirectory() as scenario_directory:
+            # Nothing recorded when disabled
+            with telemetry_module_to_test.record_phase("solve"):
+                pass
+            self.assertListEqual(
+                telemetry_module_to_test.read_telemetry(scenario_directory), []
+            )
+
+            telemetry_module_to_test.enable_telemetry(
+                scenario_directory=scenario_directory, process="run_scenario"
+            )
+            with telemetry_module_to_test.record_phase("solve", 2, ""):
+                pass
+            with telemetry_module_to_test.record_phase(
+                "export_results",
+                2,
+                "",
+                module=types.ModuleType("gridpath.project"),
+            ):
+                pass
+
+            # Phases that raise an exception are recorded too
+            with self.assertRaises(RuntimeError):
+                with telemetry_module_to_test.record_phase("process_results"):
+                    raise RuntimeError
+
+            events = telemetry_module_to_test.read_telemetry(scenario_directory)
+            self.assertListEqual(
+                [
+                    (e["process"], e["phase"], e["subproblem"], e["stage"], e["module"])
+                    for e in events
+                ],
+                [
+                    ("run_scenario", "solve", "2", "", None),
+                    ("run_scenario", "export_results", "2", "", "project"),
+                    ("run_scenario", "process_results", "", "", None),
+                ],
+            )
+            self.assertTrue(all(e["wall_time_s"] >= 0 for e in events))
+
+            conn = sqlite3.connect(":memory:")
+            create_database_schema(
+                conn=conn,
+                parsed_arguments=argparse.Namespace(db_schema="db_schema.sql"),
+            )
+            telemetry_module_to_test.import_telemetry_into_database(
+                conn=conn, scenario_id=1, scenario_directory=scenario_directory
+            )
+            # Importing again replaces the scenario's prior events
+            telemetry_module_to_test.import_telemetry_into_database(
+                conn=conn, scenario_id=1, scenario_directory=scenario_directory
+            )
+            self.assertListEqual(
+                conn.execute(
+                    """SELECT scenario_id, subproblem_id, stage_id, phase,
+                    gridpath_module
+                    FROM status_telemetry;"""
+                ).fetchall(),
+                [
+                    (1, 2, None, "solve", None),
+                    (1, 2, None, "export_results", "project"),
+                    (1, None, None, "process_results", None),
+                ],
+            )
+            conn.close()
+
+    def test_rerun(self):
+        """
+        Check that re-running a scenario only imports the events of the
+        latest run and that telemetry settings are restored after each step
+        """
+        with tempfile.TemporaryDirectory() as scenario_directory:
+            conn = sqlite3.connect(":memory:")
+            create_database_schema(
+                conn=conn,
+                parsed_arguments=argparse.Namespace(db_schema="db_schema.sql"),
+            )
+
+            run_ids = []
+            for run in range(2):
+                # The end-to-end run records the events of all steps for
+                # the same run
+                e2e_settings = telemetry_module_to_test.enable_telemetry(
+                    scenario_directory=scenario_directory, process="run_end_to_end"
+                )
+                run_ids.append(
+                    os.environ[telemetry_module_to_test.TELEMETRY_RUN_ID_ENV_VAR]
+                )
+                for process, new_run, phase in [
+                    ("run_scenario", True, "solve"),
+                    ("import_scenario_results", False, "import_results"),
+                ]:
+                    settings = telemetry_module_to_test.enable_telemetry(
+                        scenario_directory=scenario_directory,
+                        process=process,
+                        new_run=new_run,
+                    )
+                    with telemetry_module_to_test.record_phase(phase, 1, ""):
+                        pass
+                    telemetry_module_to_test.disable_telemetry(prior_settings=settings)
+                    self.assertEqual(
+                        "run_end_to_end",
+                        os.environ[telemetry_module_to_test.TELEMETRY_PROCESS_ENV_VAR],
+                    )
+                telemetry_module_to_test.import_telemetry_into_database(
+                    conn=conn, scenario_id=1, scenario_directory=scenario_directory
+                )
+                telemetry_module_to_test.disable_telemetry(prior_settings=e2e_settings)
+                self.assertFalse(telemetry_module_to_test.telemetry_enabled())
+
+                self.assertEqual(
+                    2,
+                    conn.execute("SELECT COUNT(*) FROM status_telemetry;").fetchone()[
+                        0
+                    ],
+                )
+
+            self.assertNotEqual(run_ids[0], run_ids[1])
+            self.assertEqual(
+                4, len(telemetry_module_to_test.read_telemetry(scenario_directory))
+            )
+
+            # A step run on its own continues the latest run
+            settings = telemetry_module_to_test.enable_telemetry(
+                scenario_directory=scenario_directory,
+                process="process_results",
+                new_run=False,
+            )
+            with telemetry_module_to_test.record_phase("process_results"):
+                pass
+            telemetry_module_to_test.import_telemetry_into_database(
+                conn=conn, scenario_id=1, scenario_directory=scenario_directory
+            )
+            telemetry_module_to_test.disable_telemetry(prior_settings=settings)
+            self.assertEqual(
+                3, conn.execute("SELECT COUNT(*) FROM status_telemetry;").fetchone()[0]
+            )
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os.path
+import pandas as pd
+import tempfile
+import unittest
+
+import gridpath.auxiliary.unit_aggregation as unit_aggregation_module_to_test
+
+
+def write_tab(directory, filename, rows, columns):
+    pd.DataFrame(rows, columns=columns).to_csv(
+        os.path.join(directory, filename), sep="\t", index=False
+    )
+
+
+def write_inputs(inputs_directory):
+    os.makedirs(inputs_directory)
+    write_tab(
+        inputs_directory,
+        "projects.tab",
+        [
+            ["CT1", "gen_spec", "exogenous", "gen_commit_bin", "0.4", "."],
+            ["CT2", "gen_spec", "exogenous", "gen_commit_bin", "0.4", "."],
+            ["CT3", "gen_spec", "exogenous", "gen_commit_bin", "0.4", "."],
+            # Different min stable level
+            ["CT4", "gen_spec", "exogenous", "gen_commit_bin", "0.5", "."],
+            # Allows startup/shutdown power
+            ["CT5", "gen_spec", "exogenous", "gen_commit_bin", "0.4", "1"],
+            ["CC1", "gen_spec", "exogenous", "gen_commit_lin", "0.4", "."],
+            ["CC2", "gen_spec", "exogenous", "gen_commit_lin", "0.4", "."],
+            ["Coal", "gen_spec", "exogenous", "gen_commit_cap", "0.4", "."],
+        ],
+        [
+            "project",
+            "capacity_type",
+            "availability_type",
+            "operational_type",
+            "min_stable_level_fraction",
+            "allow_startup_shutdown_power",
+        ],
+    )
+    write_tab(
+        inputs_directory,
+        "spec_capacity_period_params.tab",
+        [
+            [prj, "2030", "50", "1000"]
+            for prj in ["CT1", "CT2", "CT3", "CT4", "CT5", "CC1", "CC2", "Coal"]
+        ],
+        ["project", "period", "specified_capacity_mw", "fixed_cost_per_mw_yr"],
+    )
+    write_tab(
+        inputs_directory,
+        "heat_rate_curves.tab",
+        [
+            [prj, "0", "1", "10"]
+            for prj in ["CT1", "CT2", "CT3", "CT4", "CT5", "CC1", "CC2", "Coal"]
+        ],
+        ["project", "period", "load_point_fraction", "average_heat_rate_mmbtu_per_mwh"],
+    )
+    # CC2 is the supplemental firing project of Coal
+    write_tab(
+        inputs_directory,
+        "supplemental_firing.tab",
+        [["Coal", "CC2"]],
+        ["project", "supplemental_firing_project"],
+    )
+
+
+class TestUnitAggregation(unittest.TestCase):
+    """ """
+
+    def test_aggregate_and_disaggregate(self):
+        """
+        Identical projects are aggregated into clusters in the inputs and
+        the results of the clusters are split among their projects
+        """
+        with tempfile.TemporaryDirectory() as scenario_directory:
+            inputs_directory = os.path.join(scenario_directory, "inputs")
+            write_inputs(inputs_directory)
+
+            groups = unit_aggregation_module_to_test.aggregate_identical_units(
+                scenario_directory=scenario_directory, quiet=True
+            )
+            self.assertListEqual([["CT1", "CT2", "CT3"]], groups)
+
+            prj_df = pd.read_csv(
+                os.path.join(inputs_directory, "projects.tab"), sep="\t"
+            ).set_index("project")
+            self.assertListEqual(
+                ["CT1_cluster", "CT4", "CT5", "CC1", "CC2", "Coal"],
+                prj_df.index.tolist(),
+            )
+            self.assertEqual(
+                "gen_commit_cap", prj_df.loc["CT1_cluster", "operational_type"]
+            )
+            self.assertEqual(50, float(prj_df.loc["CT1_cluster", "unit_size_mw"]))
+
+            cap_df = pd.read_csv(
+                os.path.join(inputs_directory, "spec_capacity_period_params.tab"),
+                sep="\t",
+            ).set_index("project")
+            self.assertEqual(150, cap_df.loc["CT1_cluster", "specified_capacity_mw"])
+            self.assertEqual(1000, cap_df.loc["CT1_cluster", "fixed_cost_per_mw_yr"])
+            self.assertEqual(50, cap_df.loc["CT4", "specified_capacity_mw"])
+
+            self.assertListEqual(
+                ["CT1_cluster"],
+                pd.read_csv(
+                    os.path.join(
+                        inputs_directory,
+                        unit_aggregation_module_to_test.INTEGER_PROJECTS_FILENAME,
+                    ),
+                    sep="\t",
+                )["project"].tolist(),
+            )
+
+            # Results
+            results_directory = os.path.join(scenario_directory, "results")
+            os.makedirs(results_directory)
+            pd.DataFrame(
+                [
+                    ["CT1_cluster", 1, 0.5, 90.0, 3.0, 12.0],
+                    ["CT4", 1, 0.5, 10.0, 0.0, 5.0],
+                ],
+                columns=[
+                    "project",
+                    "timepoint",
+                    "availability_derate",
+                    "power_mw",
+                    "committed_units",
+                    "ramp_up_dual",
+                ],
+            ).to_csv(
+                os.path.join(results_directory, "project_timepoint.csv"), index=False
+            )
+
+            unit_aggregation_module_to_test.disaggregate_results(
+                scenario_directory=scenario_directory, subproblem="", stage=""
+            )
+
+            results_df = pd.read_csv(
+                os.path.join(results_directory, "project_timepoint.csv")
+            )
+            self.assertListEqual(
+                [
+                    ["CT1", 1, 0.5, 30.0, 1.0, 12.0],
+                    ["CT2", 1, 0.5, 30.0, 1.0, 12.0],
+                    ["CT3", 1, 0.5, 30.0, 1.0, 12.0],
+                    ["CT4", 1, 0.5, 10.0, 0.0, 5.0],
+                ],
+                results_df.values.tolist(),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
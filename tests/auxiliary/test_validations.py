@@ -1062,6 +1062,88 @@ class TestValidations(unittest.TestCase):
             )
             self.assertListEqual(expected_list, actual_list)
 
+    def test_validate_rules(self):
+        """
+        :return:
+        """
+        df = pd.DataFrame(
+            columns=["project", "min_mw", "max_mw", "ramp_rate"],
+            data=[
+                ["gas_ct", 10, 20, 0.5],
+                ["coal", 30, 20, 1.5],
+                ["nuclear", 30, 20, None],
+            ],
+        )
+        rules = [
+            module_to_test.ValidationRule(
+                "min_mw > max_mw", "project(s) '{idxs}': min_mw exceeds max_mw"
+            ),
+            module_to_test.ValidationRule(
+                "ramp_rate < 0 or ramp_rate > 1",
+                "project(s) '{idxs}': Expected 0 <= 'ramp_rate' <= 1",
+            ),
+            module_to_test.ValidationRule(
+                lambda x: x["project"].isin(["hydro"]),
+                "project(s) '{idxs}': not allowed",
+            ),
+        ]
+
+        self.assertListEqual(
+            module_to_test.validate_rules(df=df, rules=rules),
+            [
+                "project(s) 'coal, nuclear': min_mw exceeds max_mw",
+                "project(s) 'coal': Expected 0 <= 'ramp_rate' <= 1",
+            ],
+        )
+        self.assertListEqual(
+            module_to_test.validate_rules(df=df.iloc[0:0], rules=rules), []
+        )
+
+    def test_collect_validations(self):
+        """
+        Check that findings are inserted when the collect_validations block
+        exits
+        """
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            """CREATE TABLE status_validation (scenario_id, subproblem_id,
+            stage_id, gridpath_module, db_table, severity, description,
+            time_stamp);"""
+        )
+
+        def count_findings():
+            return conn.execute("SELECT COUNT(*) FROM status_validation;").fetchone()[0]
+
+        with module_to_test.collect_validations(conn=conn):
+            for subproblem in [1, 2]:
+                module_to_test.write_validation_to_database(
+                    conn=conn,
+                    scenario_id=1,
+                    subproblem_id=subproblem,
+                    stage_id=1,
+                    gridpath_module="module",
+                    db_table="table",
+                    severity="High",
+                    errors=["error 1", "error 2"],
+                )
+            self.assertEqual(count_findings(), 0)
+        self.assertEqual(count_findings(), 4)
+
+        # Findings are inserted right away outside of a collect_validations
+        # block
+        module_to_test.write_validation_to_database(
+            conn=conn,
+            scenario_id=1,
+            subproblem_id=1,
+            stage_id=1,
+            gridpath_module="module",
+            db_table="table",
+            severity="Low",
+            errors=["error 3"],
+        )
+        self.assertEqual(count_findings(), 5)
+        conn.close()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -178,6 +178,31 @@ class TestGenCommitBin(unittest.TestCase):
             actual_operational_timepoints_by_project,
         )
 
+        # Sets: GEN_COMMIT_BIN_{VIOL_TYPE}_VIOL_OPR_TMPS; the violation
+        # variables are only defined where violations are allowed
+        expected_viol_prjs = {
+            "RAMP_UP": ["Disp_Binary_Commit"],
+            "RAMP_DOWN": [],
+            "MIN_UP_TIME": ["Disp_Binary_Commit"],
+            "MIN_DOWN_TIME": [],
+        }
+        for viol_type, var_name in [
+            ("RAMP_UP", "GenCommitBin_Ramp_Up_Violation_MW"),
+            ("RAMP_DOWN", "GenCommitBin_Ramp_Down_Violation_MW"),
+            ("MIN_UP_TIME", "GenCommitBin_Min_Up_Time_Violation"),
+            ("MIN_DOWN_TIME", "GenCommitBin_Min_Down_Time_Violation"),
+        ]:
+            expected_viol_opr_tmps = sorted(
+                get_project_operational_timepoints(expected_viol_prjs[viol_type])
+            )
+            actual_viol_opr_tmps = sorted(
+                getattr(instance, "GEN_COMMIT_BIN_{}_VIOL_OPR_TMPS".format(viol_type))
+            )
+            self.assertListEqual(expected_viol_opr_tmps, actual_viol_opr_tmps)
+            self.assertEqual(
+                len(expected_viol_opr_tmps), len(getattr(instance, var_name))
+            )
+
         # Set: GEN_COMMIT_BIN_OPR_TMPS_STR_TYPES
         expected_opr_tmps_str_types = sorted(
             [
@@ -149,6 +149,17 @@ class TestGenCommitCap(unittest.TestCase):
             actual_operational_timepoints_by_project,
         )
 
+        # Set: GEN_COMMIT_CAP_INTEGER
+        self.assertListEqual(
+            ["Gas_CT"], [prj for prj in instance.GEN_COMMIT_CAP_INTEGER]
+        )
+
+        # Set: GEN_COMMIT_CAP_INTEGER_OPR_TMPS
+        self.assertListEqual(
+            sorted(get_project_operational_timepoints(["Gas_CT"])),
+            sorted([(g, tmp) for (g, tmp) in instance.GEN_COMMIT_CAP_INTEGER_OPR_TMPS]),
+        )
+
         # Param: gen_commit_cap_unit_size_mw
         expected_unit_size = {
             "Gas_CCGT": 6,
@@ -183,6 +183,28 @@ class TestGenCommitLin(unittest.TestCase):
             actual_operational_timepoints_by_project,
         )
 
+        # Sets: GEN_COMMIT_LIN_{VIOL_TYPE}_VIOL_OPR_TMPS; the violation
+        # variables are only defined where violations are allowed
+        expected_viol_opr_tmps = sorted(
+            get_project_operational_timepoints(["Disp_Cont_Commit"])
+        )
+        self.assertLess(
+            len(expected_viol_opr_tmps), len(expected_operational_timepoints_by_project)
+        )
+        for viol_type, var_name in [
+            ("RAMP_UP", "GenCommitLin_Ramp_Up_Violation_MW"),
+            ("RAMP_DOWN", "GenCommitLin_Ramp_Down_Violation_MW"),
+            ("MIN_UP_TIME", "GenCommitLin_Min_Up_Time_Violation"),
+            ("MIN_DOWN_TIME", "GenCommitLin_Min_Down_Time_Violation"),
+        ]:
+            actual_viol_opr_tmps = sorted(
+                getattr(instance, "GEN_COMMIT_LIN_{}_VIOL_OPR_TMPS".format(viol_type))
+            )
+            self.assertListEqual(expected_viol_opr_tmps, actual_viol_opr_tmps)
+            self.assertEqual(
+                len(expected_viol_opr_tmps), len(getattr(instance, var_name))
+            )
+
         # Set: GEN_COMMIT_LIN_OPR_TMPS_STR_TYPES
         expected_str_by_prj = {
             "Disp_Cont_Commit": [1.0, 2.0],
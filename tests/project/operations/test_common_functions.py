@@ -0,0 +1,99 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os.path
+import unittest
+
+import gridpath.project.operations.common_functions as module_to_test
+import gridpath.project.operations.operational_types as op_type_init
+from gridpath.project.operations.operational_types import (
+    gen_commit_bin,
+    gen_simple,
+    stor,
+)
+
+OPERATIONAL_TYPES = sorted(
+    f[: -len(".py")]
+    for f in os.listdir(os.path.dirname(op_type_init.__file__))
+    if f.endswith(".py")
+    and f not in ["__init__.py", "common_functions.py", "gen_commit_unit_common.py"]
+)
+
+RULE_NAMES = [
+    "power_provision_rule",
+    "rec_provision_rule",
+    "scheduled_curtailment_rule",
+    "subhourly_energy_delivered_rule",
+    "subhourly_curtailment_rule",
+    "fuel_burn_rule",
+    "startup_fuel_burn_rule",
+    "fuel_contribution_rule",
+    "fuel_burn_by_ll_rule",
+    "variable_om_cost_by_ll_rule",
+    "variable_om_cost_rule",
+    "startup_cost_simple_rule",
+    "startup_cost_by_st_rule",
+    "shutdown_cost_rule",
+    "operational_violation_cost_rule",
+    "curtailment_cost_rule",
+    "soc_penalty_cost_rule",
+    "soc_last_tmp_penalty_cost_rule",
+]
+
+
+class TestOperationsCommonFunctions(unittest.TestCase):
+    """ """
+
+    def test_get_operational_type_rules(self):
+        """
+        Each operational type gets the same rule function as when the
+        operational type module was checked for the rule on each call, i.e.
+        the module's own rule if it has one and the default in the
+        operational_types package otherwise
+        """
+        imported_operational_modules = module_to_test.load_operational_type_modules(
+            OPERATIONAL_TYPES
+        )
+        self.assertListEqual(
+            OPERATIONAL_TYPES, sorted(imported_operational_modules.keys())
+        )
+
+        for rule_name in RULE_NAMES:
+            rules = module_to_test.get_operational_type_rules(
+                imported_operational_modules, rule_name
+            )
+            self.assertListEqual(OPERATIONAL_TYPES, sorted(rules.keys()))
+            for op_type, op_m in imported_operational_modules.items():
+                expected_rule = (
+                    getattr(op_m, rule_name)
+                    if hasattr(op_m, rule_name)
+                    else getattr(op_type_init, rule_name)
+                )
+                self.assertIs(expected_rule, rules[op_type], (rule_name, op_type))
+
+        # Spot-check the dispatch of a few rules
+        rules = module_to_test.get_operational_type_rules(
+            imported_operational_modules, "startup_cost_simple_rule"
+        )
+        self.assertIs(gen_commit_bin.startup_cost_simple_rule, rules["gen_commit_bin"])
+        self.assertIs(op_type_init.startup_cost_simple_rule, rules["gen_simple"])
+        rules = module_to_test.get_operational_type_rules(
+            imported_operational_modules, "power_provision_rule"
+        )
+        self.assertIs(gen_simple.power_provision_rule, rules["gen_simple"])
+        self.assertIs(stor.power_provision_rule, rules["stor"])
+
+
+if __name__ == "__main__":
+    unittest.main()
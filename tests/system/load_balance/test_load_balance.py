@@ -86,6 +86,23 @@ class TestLoadBalance(unittest.TestCase):
         )
         instance = m.create_instance(data)
 
+        # Overgeneration and unserved energy are allowed in all zones, so
+        # the penalty variables are defined in all zones and timepoints
+        expected_zones = sorted(["Zone1", "Zone2", "Zone3"])
+        self.assertListEqual(
+            expected_zones, sorted(instance.LOAD_ZONES_WITH_OVERGENERATION_ALLOWED)
+        )
+        self.assertListEqual(
+            expected_zones, sorted(instance.LOAD_ZONES_WITH_UNSERVED_ENERGY_ALLOWED)
+        )
+        self.assertEqual(
+            len(expected_zones) * len(instance.TMPS), len(instance.Overgeneration_MW)
+        )
+        self.assertEqual(
+            len(expected_zones) * len(instance.TMPS),
+            len(instance.Unserved_Energy_MW),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -115,6 +115,13 @@ class TestCarbonBalance(unittest.TestCase):
         )
         instance = m.create_instance(data)
 
+        # Violations are not allowed in any zone, so there are no violation
+        # variables
+        self.assertEqual(
+            0, len(instance.CARBON_CAP_ZONE_PERIODS_WITH_VIOLATION_ALLOWED)
+        )
+        self.assertEqual(0, len(instance.Carbon_Cap_Overage))
+
 
 if __name__ == "__main__":
     unittest.main()
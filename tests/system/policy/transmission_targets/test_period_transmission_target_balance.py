@@ -107,6 +107,25 @@ class TestTxTargetBalance(unittest.TestCase):
         )
         instance = m.create_instance(data)
 
+        # Violation variables are only created in zones allowing violations
+        expected_zone_periods = sorted(
+            [("Tx_Target_Zone2", 2020), ("Tx_Target_Zone2", 2030)]
+        )
+        actual_zone_periods = sorted(
+            [
+                (z, p)
+                for (
+                    z,
+                    p,
+                ) in instance.TRANSMISSION_TARGET_ZONE_PERIODS_WITH_VIOLATION_ALLOWED
+            ]
+        )
+        self.assertListEqual(expected_zone_periods, actual_zone_periods)
+        self.assertListEqual(
+            expected_zone_periods,
+            sorted(instance.Period_Transmission_Target_Shortage_Pos_Dir_MWh.keys()),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -71,15 +71,26 @@ class TestExamples(unittest.TestCase):
             else:
                 self.assertAlmostEqual(d1[key], d2[key], places=places, msg=msg)
 
-    def check_validation(self, test):
+    def check_validation(self, test, parallel=1):
         """
         Check that validate inputs runs without errors, and that there
         are no validation issues recorded in the status_validation table
+        :param parallel: int, set to a number > 1 to test parallel validation
         :return:
         """
 
         # Check that test validation runs without errors
-        validate_inputs.main(["--database", DB_PATH, "--scenario", test, "--quiet"])
+        validate_inputs.main(
+            [
+                "--database",
+                DB_PATH,
+                "--scenario",
+                test,
+                "--quiet",
+                "--n_parallel_validation",
+                str(parallel),
+            ]
+        )
 
         # Check that no validation issues are recorded in the db for the test
         expected_validations = []
@@ -489,6 +500,14 @@ class TestExamples(unittest.TestCase):
             scenario_name=scenario_name, literal=True
         )
 
+    def test_example_multi_stage_prod_cost_parallel_validation(self):
+        """
+        Check validation of the "multi_stage_prod_cost" example when
+        validating in parallel
+        :return:
+        """
+        self.check_validation("multi_stage_prod_cost", parallel=2)
+
     def test_example_single_stage_prod_cost_cycle_select(self):
         """
         Check validation and objective function values of
@@ -0,0 +1,88 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import gridpath.process_results as module_to_test
+
+
+class TestProcessResults(unittest.TestCase):
+    """ """
+
+    def setUp(self):
+        """
+        A database with a scenario whose results have been processed
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "test.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(
+            """
+            CREATE TABLE scenarios (scenario_id, scenario_name);
+            INSERT INTO scenarios VALUES (1, 'test');
+            CREATE TABLE results_scenario_aggregates (
+            scenario_id PRIMARY KEY, aggregates_timestamp);
+            INSERT INTO results_scenario_aggregates VALUES (1, 'timestamp');
+            """
+        )
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_results_aggregates_exist(self):
+        """
+        Importing results deletes the scenario's results aggregates row
+        """
+        conn = sqlite3.connect(self.db_path)
+        c = conn.cursor()
+        self.assertTrue(module_to_test.results_aggregates_exist(c, 1))
+        self.assertFalse(module_to_test.results_aggregates_exist(c, 2))
+        conn.close()
+
+    def test_skip_unchanged_results(self):
+        """
+        Results that have not been re-imported since they were last
+        processed are not processed again unless --force_process_results is
+        specified
+        """
+        args = ["--database", self.db_path, "--scenario_id", "1", "--quiet"]
+        with mock.patch.object(
+            module_to_test, "determine_scenario_directory"
+        ) as determine_scenario_directory, mock.patch.object(
+            module_to_test, "get_module_registry"
+        ) as get_module_registry, mock.patch.object(
+            module_to_test, "refresh_scenario_structure"
+        ), mock.patch.object(
+            module_to_test, "SubScenarios"
+        ), mock.patch.object(
+            module_to_test, "process_results"
+        ) as process_results:
+            get_module_registry.return_value.loaded_modules = []
+
+            module_to_test.main(args=args)
+            determine_scenario_directory.assert_not_called()
+            process_results.assert_not_called()
+
+            module_to_test.main(args=args + ["--force_process_results"])
+            process_results.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import unittest
+
+import db.utilities.representative_periods as representative_periods_module_to_test
+
+
+def get_full_temporal_data():
+    """
+    Six 2-hour days in a single period, with high-load days 1, 2, and 6
+    and low-load days 3, 4, and 5
+    """
+    days = [1, 2, 3, 4, 5, 6]
+    loads = {1: [10, 12], 2: [10, 13], 3: [2, 3], 4: [2, 2], 5: [3, 3], 6: [11, 12]}
+    timepoints = [d * 100 + h for d in days for h in [1, 2]]
+
+    timepoints_df = pd.DataFrame(
+        {
+            "subproblem_id": 1,
+            "stage_id": 1,
+            "timepoint": timepoints,
+            "period": 2030,
+            "number_of_hours_in_timepoint": 1,
+            "timepoint_weight": 10.0,
+            "previous_stage_timepoint_map": None,
+            "spinup_or_lookahead": 0,
+            "linked_timepoint": None,
+            "month": 1,
+            "hour_of_day": [1, 2] * len(days),
+            "timestamp": None,
+        }
+    )
+    horizon_timepoints_df = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "balancing_type_horizon": "day",
+                    "horizon": [t // 100 for t in timepoints],
+                    "timepoint": timepoints,
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "balancing_type_horizon": "year",
+                    "horizon": 2030,
+                    "timepoint": timepoints,
+                }
+            ),
+        ]
+    )
+    horizons_df = pd.DataFrame(
+        {
+            "subproblem_id": 1,
+            "balancing_type_horizon": ["day"] * len(days) + ["year"],
+            "horizon": days + [2030],
+            "boundary": ["circular"] * len(days) + ["linear"],
+        }
+    )
+    profiles_df = pd.DataFrame(
+        {("load_zone", "Zone1"): [l for d in days for l in loads[d]]},
+        index=timepoints,
+    )
+
+    return timepoints_df, horizon_timepoints_df, horizons_df, profiles_df
+
+
+class TestRepresentativePeriods(unittest.TestCase):
+    """ """
+
+    def test_cluster_horizons(self):
+        """
+        Both methods find the two groups of days and represent them with
+        their medoids (days 1 and 3)
+        """
+        features = np.array([[10, 12], [10, 13], [2, 3], [2, 2], [3, 3], [11, 12]])
+        for method in ["kmedoids", "hierarchical"]:
+            assignment = representative_periods_module_to_test.cluster_horizons(
+                features=features[:, :, None], n_clusters=2, method=method
+            )
+            self.assertListEqual([0, 0, 2, 2, 2, 0], assignment.tolist())
+
+        with self.assertRaises(ValueError):
+            representative_periods_module_to_test.cluster_horizons(
+                features=features[:, :, None], n_clusters=2, method="kmeans"
+            )
+
+    def test_create_representative_periods(self):
+        """
+        Representative days keep their timepoints, their weights represent
+        all days in their cluster, and the year horizon links them
+        """
+        (
+            timepoints_df,
+            horizon_timepoints_df,
+            horizons_df,
+            profiles_df,
+        ) = get_full_temporal_data()
+
+        (
+            structure_df,
+            horizon_params_df,
+            horizon_timepoints_out_df,
+            map_df,
+            error_df,
+        ) = representative_periods_module_to_test.create_representative_periods(
+            timepoints_df=timepoints_df,
+            horizon_timepoints_df=horizon_timepoints_df,
+            horizons_df=horizons_df,
+            profiles_df=profiles_df,
+            balancing_type="day",
+            n_representative_periods=2,
+            method="kmedoids",
+        )
+
+        self.assertListEqual([101, 102, 301, 302], structure_df["timepoint"].tolist())
+        self.assertListEqual(
+            [30.0, 30.0, 30.0, 30.0], structure_df["timepoint_weight"].tolist()
+        )
+        # Total hours are preserved
+        self.assertEqual(
+            (timepoints_df["timepoint_weight"]).sum(),
+            structure_df["timepoint_weight"].sum(),
+        )
+
+        self.assertListEqual(
+            [["day", 1, "circular"], ["day", 3, "circular"], ["year", 2030, "linear"]],
+            horizon_params_df[
+                ["balancing_type_horizon", "horizon", "boundary"]
+            ].values.tolist(),
+        )
+        self.assertListEqual(
+            [
+                ["day", 1, 101, 102],
+                ["day", 3, 301, 302],
+                ["year", 2030, 101, 102],
+                ["year", 2030, 301, 302],
+            ],
+            horizon_timepoints_out_df[
+                ["balancing_type_horizon", "horizon", "tmp_start", "tmp_end"]
+            ].values.tolist(),
+        )
+        self.assertListEqual(
+            [1, 1, 3, 3, 3, 1], map_df["representative_horizon"].tolist()
+        )
+
+        # Days 2 and 6 are represented by day 1 and days 4 and 5 by day 3
+        self.assertAlmostEqual(
+            np.sqrt(4 / 12) / 11,
+            error_df.loc[0, "nrmse"],
+        )
+        self.assertAlmostEqual(
+            (3 * 22 + 3 * 5 - 83) / 83, error_df.loc[0, "energy_error_fraction"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT_DIRECTORY = os.path.join(os.path.dirname(__file__), "..")
+
+
+class TestRunScenario(unittest.TestCase):
+    def test_entry_points_import_lazily(self):
+        """
+        Importing the command-line entry points and parsing their arguments
+        should not load Pyomo, pandas, dill, or networkx
+        """
+        script = """
+import sys
+from gridpath import (
+    get_scenario_inputs,
+    import_scenario_results,
+    process_results,
+    run_end_to_end,
+    run_scenario,
+)
+run_scenario.parse_arguments(["--scenario", "test"])
+heavy = ["pyomo", "pandas", "dill", "networkx"]
+print(",".join(m for m in heavy if m in sys.modules))
+"""
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=ROOT_DIRECTORY,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(output.stdout.strip(), "")
+
+    def test_conflicting_solve_methods(self):
+        """
+        Only one of the alternative solve methods can be requested
+        """
+        from gridpath import run_scenario
+
+        parsed_args = run_scenario.parse_arguments(
+            ["--scenario", "test", "--lazy_constraints"]
+        )
+        self.assertTrue(parsed_args.lazy_constraints)
+
+        for conflicting_args in [
+            ["--benders", "--lazy_constraints"],
+            ["--benders", "--n_parallel_horizons", "2"],
+            ["--lazy_constraints", "--n_parallel_horizons", "2"],
+        ]:
+            with self.assertRaises(SystemExit):
+                with contextlib.redirect_stderr(io.StringIO()):
+                    run_scenario.parse_arguments(
+                        ["--scenario", "test"] + conflicting_args
+                    )
+
+    def test_default_solution_components(self):
+        """
+        By default, all variables and the duals of the constraints the
+        modules export are loaded from a solution file
+        """
+        from pyomo.environ import Var
+        from gridpath import run_scenario
+
+        scenario_directory = os.path.join(ROOT_DIRECTORY, "examples", "test")
+        parsed_args = run_scenario.parse_arguments(
+            [
+                "--scenario",
+                "test",
+                "--scenario_location",
+                os.path.join(ROOT_DIRECTORY, "examples"),
+                "--quiet",
+                "--mute_solver_output",
+            ]
+        )
+        dynamic_components, instance = run_scenario.create_problem(
+            scenario_directory=scenario_directory,
+            subproblem="",
+            stage="",
+            parsed_arguments=parsed_args,
+        )
+        solution_components = run_scenario.get_default_solution_components(
+            scenario_directory=scenario_directory,
+            subproblem="",
+            stage="",
+            instance=instance,
+            dynamic_components=dynamic_components,
+        )
+
+        self.assertTrue(
+            set(var.local_name for var in instance.component_objects(Var))
+            <= set(solution_components)
+        )
+        self.assertIn("Meet_Load_Constraint", solution_components)
+        self.assertIn("Meet_Regulation_Up_Constraint", solution_components)
+        self.assertNotIn("GenCommitCap_Max_Power_Constraint", solution_components)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sqlite3
+import types
+import unittest
+
+import gridpath.validate_inputs as module_to_test
+from gridpath.auxiliary.validations import write_validation_to_database
+
+
+class SubProblems(object):
+    def __init__(self):
+        self.SUBPROBLEM_STAGES = {1: [1]}
+
+
+def create_module(name, severity, n_findings, validated):
+    """
+    A module whose validate_inputs function records n_findings findings of
+    the given severity and the module name in the validated list
+    """
+    m = types.ModuleType(name)
+
+    def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
+        validated.append(name)
+        write_validation_to_database(
+            conn=conn,
+            scenario_id=scenario_id,
+            subproblem_id=subproblem,
+            stage_id=stage,
+            gridpath_module=name,
+            db_table="table",
+            severity=severity,
+            errors=["{} error {}".format(name, i) for i in range(n_findings)],
+        )
+
+    m.validate_inputs = validate_inputs
+
+    return m
+
+
+def create_database():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        """CREATE TABLE status_validation (scenario_id, subproblem_id,
+        stage_id, gridpath_module, db_table, severity, description,
+        time_stamp);"""
+    )
+    return conn
+
+
+class TestValidateInputs(unittest.TestCase):
+    """ """
+
+    def test_max_validation_errors(self):
+        """
+        Validation stops once the maximum number of errors has been found;
+        'Low'-severity findings don't count toward the maximum
+        """
+        conn = create_database()
+        validated = []
+        completed = module_to_test.validate_inputs(
+            subproblems=SubProblems(),
+            loaded_modules=[
+                create_module("module_{}".format(i), "High", 2, validated)
+                for i in range(3)
+            ],
+            scenario_id=1,
+            subscenarios=None,
+            conn=conn,
+            max_validation_errors=3,
+        )
+
+        self.assertFalse(completed)
+        self.assertListEqual(["module_0", "module_1"], validated)
+        # The findings of the validated modules and the note that validation
+        # was stopped
+        self.assertListEqual(
+            [("High", 4), ("Low", 1)],
+            conn.execute(
+                """SELECT severity, COUNT(*) FROM status_validation
+                GROUP BY severity ORDER BY severity;"""
+            ).fetchall(),
+        )
+        conn.close()
+
+        conn = create_database()
+        validated = []
+        completed = module_to_test.validate_inputs(
+            subproblems=SubProblems(),
+            loaded_modules=[
+                create_module("module_{}".format(i), "Low", 2, validated)
+                for i in range(3)
+            ],
+            scenario_id=1,
+            subscenarios=None,
+            conn=conn,
+            max_validation_errors=3,
+        )
+
+        self.assertTrue(completed)
+        self.assertListEqual(["module_0", "module_1", "module_2"], validated)
+        self.assertEqual(
+            6, conn.execute("SELECT COUNT(*) FROM status_validation;").fetchone()[0]
+        )
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
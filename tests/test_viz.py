@@ -14,10 +14,12 @@
 
 import logging
 import os
+import tempfile
 import unittest
 
 from gridpath import run_end_to_end
 from db import create_database
+from db.common_functions import connect_to_database
 from db.utilities import port_csvs_to_db, scenario
 from viz import (
     capacity_factor_plot,
@@ -34,7 +36,9 @@ from viz import (
     energy_plot,
     energy_target_plot,
     project_operations_plot,
+    render_plots,
 )
+from viz.results_cache import ResultsCache
 
 
 # Change directory to 'gridpath' directory, as that's what run_scenario.py
@@ -309,6 +313,23 @@ class TestExamples(unittest.TestCase):
             ]
         )
 
+    def test_dispatch_plot_downsampled(self):
+        dispatch_plot.main(
+            [
+                "--database",
+                DB_PATH,
+                "--scenario",
+                "2horizons_w_hydro",
+                "--load_zone",
+                "Zone1",
+                "--downsample_timepoints",
+                "4",
+                "--downsample_method",
+                "max",
+                # "--show",
+            ]
+        )
+
     def test_energy_plot(self):
         energy_plot.main(
             [
@@ -350,6 +371,107 @@ class TestExamples(unittest.TestCase):
             ]
         )
 
+    def test_render_plots(self):
+        """
+        Render plots from a manifest and skip them when re-rendering unless
+        the results have changed
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            manifest = os.path.join(directory, "manifest.csv")
+            with open(manifest, "w") as f:
+                f.write(
+                    "plot,scenario,load_zone,stage\n"
+                    "energy_plot,test,Zone1,\n"
+                    "dispatch_plot,test,Zone1,1\n"
+                )
+            arguments = [
+                "--database",
+                DB_PATH,
+                "--manifest",
+                manifest,
+                "--plot_write_directory",
+                directory,
+                "--n_parallel_render",
+                "2",
+                "--quiet",
+            ]
+
+            rendered = render_plots.main(arguments)
+            self.assertListEqual(
+                sorted(os.path.basename(f) for f in rendered),
+                [
+                    "dispatch_plot-load_zone=Zone1-stage=1.html",
+                    "energy_plot-load_zone=Zone1.html",
+                ],
+            )
+            for f in rendered:
+                self.assertTrue(os.path.exists(f))
+
+            self.assertListEqual(render_plots.main(arguments), [])
+            self.assertEqual(len(render_plots.main(arguments + ["--force"])), 2)
+
+            # Plots with different arguments get different names and plots
+            # that would be saved to the same file are rejected
+            self.assertNotEqual(
+                render_plots.get_plot_name("dispatch_plot", {"period": "2020"}),
+                render_plots.get_plot_name("dispatch_plot", {"stage": "2020"}),
+            )
+            with open(manifest, "a") as f:
+                f.write("energy_plot,test,Zone1,\n")
+            with self.assertRaises(ValueError):
+                render_plots.main(arguments)
+
+    def test_results_cache(self):
+        """
+        Cached values are reused until the scenario's results are processed
+        again
+        """
+        conn = connect_to_database(db_path=DB_PATH)
+        c = conn.cursor()
+        scenario_id = c.execute(
+            "SELECT scenario_id FROM scenarios WHERE scenario_name = 'test';"
+        ).fetchone()[0]
+        cache = ResultsCache()
+        computed = []
+
+        def compute():
+            computed.append(1)
+            return len(computed)
+
+        self.assertEqual(cache.get_or_compute(c, [scenario_id], "key", compute), 1)
+        self.assertEqual(cache.get_or_compute(c, [scenario_id], "key", compute), 1)
+
+        c.execute(
+            """UPDATE results_scenario_aggregates
+            SET aggregates_timestamp = 'new'
+            WHERE scenario_id = ?;""",
+            (scenario_id,),
+        )
+        self.assertEqual(cache.get_or_compute(c, [scenario_id], "key", compute), 2)
+
+        # Without a results version, values are computed each time unless
+        # the caller keeps them
+        c.execute(
+            "DELETE FROM results_scenario_aggregates WHERE scenario_id = ?;",
+            (scenario_id,),
+        )
+        self.assertEqual(cache.get_or_compute(c, [scenario_id], "key", compute), 3)
+        self.assertEqual(cache.get_or_compute(c, [scenario_id], "key", compute), 4)
+        unversioned_values = dict()
+        for _ in range(2):
+            self.assertEqual(
+                cache.get_or_compute(
+                    c,
+                    [scenario_id],
+                    "key",
+                    compute,
+                    unversioned_values=unversioned_values,
+                ),
+                5,
+            )
+        conn.rollback()
+        conn.close()
+
     @classmethod
     def tearDownClass(cls):
         os.remove(DB_PATH)
@@ -12,11 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from flask import request
 from flask_restful import Resource
 import importlib
 
 from db.common_functions import connect_to_database
-from ui.server.api.view_data import get_table_data
+from ui.server.api.view_data import (
+    get_table_data,
+    parse_table_data_request_arguments,
+    stream_table_data,
+)
+from viz.results_cache import results_cache
 
 
 class ScenarioResultsOptions(Resource):
@@ -257,12 +263,27 @@ class ScenarioResultsPlot(Resource):
             filter_arguments.append("--project")
             filter_arguments.append(commit_project)
 
-        if ymax == "default":
-            plot_api["plotJSON"] = plot_module.main(base_arguments + filter_arguments)
-        else:
-            plot_api["plotJSON"] = plot_module.main(
-                base_arguments + filter_arguments + ["--ylimit", ymax]
-            )
+        # Optional downsampling of long timepoint windows in the dispatch plot
+        if plot_module.__name__ == "viz.dispatch_plot":
+            for downsample_arg in ["downsample_timepoints", "downsample_method"]:
+                if downsample_arg in request.args:
+                    filter_arguments.append("--{}".format(downsample_arg))
+                    filter_arguments.append(request.args[downsample_arg])
+
+        plot_arguments = base_arguments + filter_arguments
+        if not ymax == "default":
+            plot_arguments += ["--ylimit", ymax]
+
+        # Plots are only recomputed if the scenario's results have been
+        # processed again since the plot was cached
+        conn = connect_to_database(db_path=self.db_path)
+        plot_api["plotJSON"] = results_cache.get_or_compute(
+            c=conn.cursor(),
+            scenario_ids=[scenario_id],
+            key=(self.db_path, plot, tuple(plot_arguments)),
+            compute=lambda: plot_module.main(plot_arguments),
+        )
+        conn.close()
 
         return plot_api
 
@@ -347,7 +368,10 @@ class ScenarioResultsTable(Resource):
             return None
         else:
             return create_data_table_api(
-                db_path=self.db_path, table=table, scenario_id=scenario_id
+                db_path=self.db_path,
+                table=table,
+                scenario_id=scenario_id,
+                **parse_table_data_request_arguments(request_arguments=request.args),
             )
 
 
@@ -379,38 +403,48 @@ class ScenarioResultsIncludedTables(Resource):
         return included_tables_api
 
 
-def create_data_table_api(db_path, table, scenario_id):
+def create_data_table_api(db_path, table, scenario_id, page=None, **kwargs):
     """
     :param db_path:
     :param table:
     :param scenario_id:
+    :param page: the page of rows to return; if None, all rows are streamed
+    :param kwargs: the other table data arguments (column selection,
+        filters, sorting, and page size; see *get_table_data*)
     :return:
     """
     conn = connect_to_database(db_path=db_path)
     c = conn.cursor()
 
-    data_table_api = dict()
-    data_table_api["table"] = table
-
-    data_table_api["caption"] = c.execute(
+    caption = c.execute(
         """SELECT caption FROM ui_scenario_results_table_metadata
-        WHERE results_table = '{}';""".format(
-            table.replace("-", "_")
-        )
+        WHERE results_table = ?;""",
+        (table.replace("-", "_"),),
     ).fetchone()[0]
+    conn.close()
+
+    if page is None:
+        return stream_table_data(
+            db_path=db_path,
+            table=table.replace("-", "_"),
+            scenario_id=scenario_id,
+            other_scenarios=[],
+            other_fields={"table": table, "caption": caption},
+            **kwargs,
+        )
 
-    data_table_api["columns"] = get_table_data(
-        db_path=db_path,
-        table=table.replace("-", "_"),
-        scenario_id=scenario_id,
-        other_scenarios=[],
-    )["columns"]
-
-    data_table_api["rowsData"] = get_table_data(
-        db_path=db_path,
-        table=table.replace("-", "_"),
-        scenario_id=scenario_id,
-        other_scenarios=[],
-    )["rowsData"]
+    data_table_api = dict()
+    data_table_api["table"] = table
+    data_table_api["caption"] = caption
+    data_table_api.update(
+        get_table_data(
+            db_path=db_path,
+            table=table.replace("-", "_"),
+            scenario_id=scenario_id,
+            other_scenarios=[],
+            page=page,
+            **kwargs,
+        )
+    )
 
     return data_table_api
@@ -12,10 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+
+from flask import request, Response, stream_with_context
 from flask_restful import Resource
 
 from db.common_functions import connect_to_database
 
+# Number of rows to fetch from the database at a time when streaming a table
+TABLE_DATA_CHUNK_SIZE = 10000
+
 
 class ViewDataAPI(Resource):
     """ """
@@ -27,69 +33,274 @@ class ViewDataAPI(Resource):
         """
 
         :return:
+
+        See *parse_table_data_request_arguments* for the query parameters
+        for column selection, filtering, sorting, and pagination. If a page
+        is requested, only that page is returned; otherwise, the table is
+        streamed.
         """
         print(scenario_id, table)
 
-        return get_table_data(
-            scenario_id=scenario_id,
-            other_scenarios=[],  # todo: does this break anything
-            table=table,
-            db_path=self.db_path,
+        table_data_arguments = parse_table_data_request_arguments(
+            request_arguments=request.args
         )
 
+        if table_data_arguments["page"] is not None:
+            return get_table_data(
+                scenario_id=scenario_id,
+                other_scenarios=[],  # todo: does this break anything
+                table=table,
+                db_path=self.db_path,
+                **table_data_arguments,
+            )
+        else:
+            return stream_table_data(
+                scenario_id=scenario_id,
+                other_scenarios=[],
+                table=table,
+                db_path=self.db_path,
+                **table_data_arguments,
+            )
+
+
+def parse_table_data_request_arguments(request_arguments):
+    """
+    :param request_arguments: the request query parameters
+    :return: dictionary of the table data keyword arguments
 
-def get_table_data(scenario_id, other_scenarios, table, db_path):
+    The supported query parameters are:
+        * columns: comma-separated list of the columns to return
+        * filter_<column>: only return rows where <column> equals the value
+        * sort_by: the column to sort by
+        * sort_order: 'asc' (default) or 'desc'
+        * page: the page to return (starting from 1)
+        * page_size: the number of rows per page (defaults to 100)
+    """
+    columns = request_arguments.get("columns")
+    page = request_arguments.get("page", type=int)
+
+    return {
+        "columns": None if columns is None else columns.split(","),
+        "filters": {
+            argument[len("filter_") :]: value
+            for argument, value in request_arguments.items()
+            if argument.startswith("filter_")
+        },
+        "sort_by": request_arguments.get("sort_by"),
+        "sort_order": request_arguments.get("sort_order", "asc"),
+        "page": page,
+        "page_size": request_arguments.get("page_size", 100, type=int),
+    }
+
+
+def get_table_data(
+    scenario_id,
+    other_scenarios,
+    table,
+    db_path,
+    columns=None,
+    filters=None,
+    sort_by=None,
+    sort_order="asc",
+    page=None,
+    page_size=100,
+):
     """
 
     :param scenario_id:
     :param other_scenarios:
     :param table:
     :param db_path:
+    :param columns: list of the columns to return; all if None
+    :param filters: dictionary of the values to filter the rows on by column
+    :param sort_by: the column to sort the rows by
+    :param sort_order: 'asc' or 'desc'
+    :param page: the page of rows to return (starting from 1); all rows are
+        returned if None
+    :param page_size: the number of rows per page
     :return:
+
+    If a page is requested, the total number of (filtered) rows is returned
+    as well.
     """
 
     conn = connect_to_database(db_path=db_path)
     c = conn.cursor()
 
-    query_for_column_names = c.execute("""SELECT * FROM {} LIMIT 1;""".format(table))
+    column_names, table_data_sql, table_data_parameters = get_table_data_query(
+        c=c,
+        scenario_id=scenario_id,
+        other_scenarios=other_scenarios,
+        table=table,
+        columns=columns,
+        filters=filters,
+        sort_by=sort_by,
+        sort_order=sort_order,
+    )
 
-    column_names = [s[0] for s in query_for_column_names.description]
+    data_table_api = {"columns": column_names}
 
-    for index, value in enumerate(column_names):
-        if value == "scenario_id":
-            column_names[index] = "scenario_name"
+    if page is not None:
+        data_table_api["totalRows"] = c.execute(
+            "SELECT COUNT(*) FROM ({});".format(table_data_sql),
+            table_data_parameters,
+        ).fetchone()[0]
+        data_table_api["page"] = page
+        data_table_api["pageSize"] = page_size
+        table_data_sql += " LIMIT ? OFFSET ?"
+        table_data_parameters += [page_size, (max(page, 1) - 1) * page_size]
 
-    columns_for_query = str()
-    n = 1
-    for column in column_names:
-        if n < len(column_names):
-            columns_for_query += "{}, ".format(column)
-        else:
-            columns_for_query += "{}".format(column)
-        n += 1
+    table_data_query = c.execute(table_data_sql, table_data_parameters)
 
-    other_scenarios_string = str()
-    if len(other_scenarios) > 0:
-        for scenario in other_scenarios:
-            other_scenarios_string += ", {}".format(scenario)
+    data_table_api["rowsData"] = [
+        dict(zip(column_names, row)) for row in table_data_query.fetchall()
+    ]
 
-    table_data_query = c.execute(
-        """
-      SELECT {}
-      FROM {}
-      JOIN scenarios USING (scenario_id)
-      WHERE scenario_id in ({}{});
-      """.format(
-            columns_for_query, table, scenario_id, other_scenarios_string
-        )
+    conn.close()
+
+    return data_table_api
+
+
+def stream_table_data(
+    scenario_id,
+    other_scenarios,
+    table,
+    db_path,
+    other_fields=None,
+    columns=None,
+    filters=None,
+    sort_by=None,
+    sort_order="asc",
+    **kwargs,
+):
+    """
+    :param scenario_id:
+    :param other_scenarios:
+    :param table:
+    :param db_path:
+    :param other_fields: dictionary of other fields to include in the
+        response
+    :param columns: list of the columns to return; all if None
+    :param filters: dictionary of the values to filter the rows on by column
+    :param sort_by: the column to sort the rows by
+    :param sort_order: 'asc' or 'desc'
+    :param kwargs: other table data arguments (ignored)
+    :return: a streamed JSON response with the same structure as the
+        *get_table_data* dictionary
+
+    The rows are fetched and serialized TABLE_DATA_CHUNK_SIZE rows at a
+    time, so the full table is never held in memory.
+    """
+    conn = connect_to_database(db_path=db_path)
+    c = conn.cursor()
+
+    # Build the query (and check the table and columns) before starting the
+    # response, so that errors are raised here
+    column_names, table_data_sql, table_data_parameters = get_table_data_query(
+        c=c,
+        scenario_id=scenario_id,
+        other_scenarios=other_scenarios,
+        table=table,
+        columns=columns,
+        filters=filters,
+        sort_by=sort_by,
+        sort_order=sort_order,
     )
 
-    rows_data = []
-    for row in table_data_query.fetchall():
-        row_values = list(row)
-        row_dict = dict(zip(column_names, row_values))
-        rows_data.append(row_dict)
+    def generate():
+        try:
+            table_data_query = c.execute(table_data_sql, table_data_parameters)
+            yield "{"
+            for field, value in (other_fields or {}).items():
+                yield "{}: {}, ".format(json.dumps(field), json.dumps(value))
+            yield '"columns": {}, "rowsData": ['.format(json.dumps(column_names))
+            separator = ""
+            while True:
+                rows = table_data_query.fetchmany(TABLE_DATA_CHUNK_SIZE)
+                if not rows:
+                    break
+                yield separator + ", ".join(
+                    json.dumps(dict(zip(column_names, row))) for row in rows
+                )
+                separator = ", "
+            yield "]}"
+        finally:
+            conn.close()
 
-    data_table_api = {"columns": column_names, "rowsData": rows_data}
+    return Response(stream_with_context(generate()), mimetype="application/json")
 
-    return data_table_api
+
+def get_table_data_query(
+    c,
+    scenario_id,
+    other_scenarios,
+    table,
+    columns=None,
+    filters=None,
+    sort_by=None,
+    sort_order="asc",
+):
+    """
+    :param c: the database cursor
+    :param scenario_id:
+    :param other_scenarios:
+    :param table:
+    :param columns: list of the columns to return; all if None
+    :param filters: dictionary of the values to filter the rows on by column
+    :param sort_by: the column to sort the rows by
+    :param sort_order: 'asc' or 'desc'
+    :return: the names of the columns returned, the SQL query, and the list
+        of query parameters
+
+    The table's scenario_id column is replaced with the scenario_name. The
+    table and column names are checked against the database, so that they
+    can be safely included in the query.
+    """
+    if (
+        c.execute(
+            """SELECT COUNT(*) FROM sqlite_master
+            WHERE type IN ('table', 'view') AND name = ?;""",
+            (table,),
+        ).fetchone()[0]
+        == 0
+    ):
+        raise ValueError("Table {} not found.".format(table))
+
+    table_column_names = [
+        column[1] for column in c.execute("PRAGMA table_info({});".format(table))
+    ]
+
+    for index, value in enumerate(table_column_names):
+        if value == "scenario_id":
+            table_column_names[index] = "scenario_name"
+
+    def check_column(column):
+        if column not in table_column_names:
+            raise ValueError("Column {} not found in table {}.".format(column, table))
+        return column
+
+    if columns is None:
+        column_names = table_column_names
+    else:
+        column_names = [check_column(column) for column in columns]
+
+    scenario_ids = [scenario_id] + list(other_scenarios)
+    parameters = list(scenario_ids)
+    where_clauses = ["scenario_id IN ({})".format(", ".join("?" for _ in scenario_ids))]
+    for column, value in (filters or {}).items():
+        where_clauses.append("{} = ?".format(check_column(column)))
+        parameters.append(value)
+
+    sql = """SELECT {}
+        FROM {}
+        JOIN scenarios USING (scenario_id)
+        WHERE {}""".format(
+        ", ".join(column_names), table, " AND ".join(where_clauses)
+    )
+
+    if sort_by is not None:
+        sql += " ORDER BY {} {}".format(
+            check_column(sort_by), "DESC" if sort_order == "desc" else "ASC"
+        )
+
+    return column_names, sql, parameters
@@ -1,7 +1,9 @@
 from argparse import ArgumentParser
 import os
+import psutil
 import socketio
 import sys
+import threading
 import time
 
 from db.common_functions import connect_to_database, spin_on_database_lock
@@ -23,107 +25,144 @@ def exit_gracefully():
     spin_on_database_lock(conn=conn, cursor=c, sql=sql, data=(), many=False)
 
 
-def manage_queue(db_path):
-    while True:
-        try:
-            # Check if server is running
-            sio = socketio.Client()
-            sio.connect("http://127.0.0.1:8080")
-            print("Connection to server established")
+# How long to wait for a wake-up event from the server before checking the
+# queue anyway (e.g. if a run process exited without the server noticing)
+FALLBACK_CHECK_INTERVAL_SECONDS = 60
 
-            conn = connect_to_database(db_path=db_path)
-            c = conn.cursor()
+# How long a launched scenario can take to update its status to 'running'
+# before we stop counting it against the run slots
+LAUNCH_TIMEOUT_SECONDS = 600
 
+
+def manage_queue(db_path, run_slots, memory_per_run_gb=None):
+    """
+    :param db_path: the database file path
+    :param run_slots: the maximum number of scenarios to run concurrently
+    :param memory_per_run_gb: the memory (in GB) to require to be available
+        before launching each scenario; the available memory is not checked
+        if None
+
+    Launch the queued scenarios in queue order, running up to *run_slots*
+    scenarios at a time. Rather than polling, we wait for the server to
+    tell us that the queue changed or that a scenario process exited (with
+    a fallback check every FALLBACK_CHECK_INTERVAL_SECONDS). The connections
+    to the server and to the database are kept open for the life of the
+    queue manager. We exit when the queue is empty or the server stops
+    responding.
+
+    A launched scenario holds a run slot until it updates its status to
+    'running'. If its process exits before then (e.g. it crashes at
+    startup), the scenario is removed from the queue with an error status
+    and its slot is released; if it takes longer than
+    LAUNCH_TIMEOUT_SECONDS, its slot is released but it is not launched
+    again.
+    """
+    wake_up = threading.Event()
+    exited_scenarios = set()
+    exited_scenarios_lock = threading.Lock()
+
+    sio = socketio.Client()
+
+    @sio.on("queue_updated")
+    def on_queue_updated(*args):
+        wake_up.set()
+
+    @sio.on("scenario_process_exited")
+    def on_scenario_process_exited(message=None, *args):
+        if isinstance(message, dict) and "scenario_id" in message:
+            with exited_scenarios_lock:
+                exited_scenarios.add(message["scenario_id"])
+        wake_up.set()
+
+    @sio.on("disconnect")
+    def on_disconnect():
+        wake_up.set()
+
+    try:
+        sio.connect("http://127.0.0.1:8080")
+        print("Connection to server established")
+        print("Running up to {} scenarios at a time".format(run_slots))
+
+        conn = connect_to_database(db_path=db_path)
+        c = conn.cursor()
+
+        # Scenarios we have asked the server to launch that have not yet
+        # updated their status to 'running' (with their launch times), and
+        # those that have taken too long to do so
+        launched_scenarios = dict()
+        stalled_scenarios = set()
+
+        while sio.connected:
             scenarios_in_queue = get_scenarios_in_queue(c=c)
-            running_scenarios = get_running_scenarios(c=c)
-
-            # If there are scenarios in the queue and none of them are running,
-            # get the next scenarios to run and launch it
-            if scenarios_in_queue:  # there are scenarios in the queue
-                if not running_scenarios:  # none of them is 'running'
-                    next_scenario_to_run = c.execute(
-                        """
-                        SELECT scenario_id, MIN(queue_order_id)
-                        FROM scenarios
-                        WHERE queue_order_id IS NOT NULL
-                        GROUP BY scenario_id
-                    """
-                    ).fetchone()
-
-                    # Get the requested solver
-                    solver_options_id = c.execute(
-                        """
-                        SELECT solver_options_id
-                            FROM scenarios
-                            WHERE scenario_id = {}
-                    """.format(
-                            next_scenario_to_run[0]
-                        )
-                    ).fetchone()[0]
-
-                    if solver_options_id is None:
-                        # TODO: we should specify the default solver as a
-                        #  global variable somewhere
-                        solver = "cbc"
-                    else:
-                        solver_query = c.execute(
-                            """
-                              SELECT DISTINCT solver_name
-                              FROM inputs_options_solver
-                              WHERE solver_options_id = {};
-                              """.format(
-                                solver_options_id
-                            )
-                        ).fetchone()
-                        # Check that there's only one solver specified for the
-                        # solver_options_id
-                        one_solver_check = c.execute(
-                            """
-                              SELECT COUNT()
-                              FROM (
-                                  SELECT DISTINCT solver_name
-                                  FROM inputs_options_solver
-                                  WHERE solver_options_id = {}
-                                  )
-                              ;
-                              """.format(
-                                solver_options_id
-                            )
-                        ).fetchone()[0]
-                        if one_solver_check > 1:
-                            raise ValueError(
-                                """
-                              Only one solver name can be specified per
-                              solver_options_id. Check the solver_options_id {}
-                              in the the inputs_options_solver table.
-                            """.format(
-                                    solver_options_id
-                                )
-                            )
-                        else:
-                            solver = solver_query[0]
-                    sio.emit(
-                        "launch_scenario_process",
-                        {
-                            "scenario": next_scenario_to_run[0],
-                            "solver": solver,
-                            "skipWarnings": False,
-                        },
-                    )
+
             # If there are no scenarios in the queue, tell the server to
             # reset the queue manager PID and exit the loop
             # TODO: is keeping track of the queue manager PID still needed
             #  now that the queue manager exits when it does not get a
             #  response from the server?
-            else:
+            if not scenarios_in_queue:
                 sio.emit("reset_queue_manager_pid")
                 break
 
-        except socketio.exceptions.ConnectionError:
+            running_scenarios = [
+                scenario_id
+                for (scenario_id, _, _, run_status_id) in scenarios_in_queue
+                if run_status_id == 1
+            ]
+            with exited_scenarios_lock:
+                exited = set(exited_scenarios)
+                exited_scenarios.clear()
+            (
+                launched_scenarios,
+                stalled_scenarios,
+                failed_scenarios,
+            ) = update_launched_scenarios(
+                launched_scenarios=launched_scenarios,
+                stalled_scenarios=stalled_scenarios,
+                scenarios_in_queue=scenarios_in_queue,
+                exited_scenarios=exited,
+                now=time.monotonic(),
+            )
+            for scenario_id in failed_scenarios:
+                print(
+                    "Scenario {} exited before it started running; removing "
+                    "it from the queue".format(scenario_id)
+                )
+                remove_failed_scenario_from_queue(
+                    conn=conn, c=c, scenario_id=scenario_id
+                )
+            if failed_scenarios:
+                continue
+
+            for scenario_id in get_next_scenarios_to_run(
+                scenarios_in_queue=scenarios_in_queue,
+                exclude_scenarios=set(launched_scenarios) | stalled_scenarios,
+                n_scenarios=get_number_of_free_run_slots(
+                    run_slots=run_slots,
+                    n_runs_in_progress=len(running_scenarios) + len(launched_scenarios),
+                    memory_per_run_gb=memory_per_run_gb,
+                ),
+            ):
+                sio.emit(
+                    "launch_scenario_process",
+                    {
+                        "scenario": scenario_id,
+                        "solver": get_scenario_solver(c=c, scenario_id=scenario_id),
+                        "skipWarnings": False,
+                    },
+                )
+                launched_scenarios[scenario_id] = time.monotonic()
+
+            wake_up.wait(timeout=FALLBACK_CHECK_INTERVAL_SECONDS)
+            wake_up.clear()
+        else:
             print("Server not responding, exiting")
-            break
 
-        time.sleep(5)
+        sio.disconnect()
+        conn.close()
+
+    except socketio.exceptions.ConnectionError:
+        print("Server not responding, exiting")
 
     # Need os._exit(0) to exit process, not just thread (sys.exit exits only
     # current thread)
@@ -134,6 +173,175 @@ def manage_queue(db_path):
     os._exit(0)
 
 
+def update_launched_scenarios(
+    launched_scenarios,
+    stalled_scenarios,
+    scenarios_in_queue,
+    exited_scenarios,
+    now,
+    launch_timeout=LAUNCH_TIMEOUT_SECONDS,
+):
+    """
+    :param launched_scenarios: dictionary of the launch time of the
+        scenarios we launched that have not yet started running
+    :param stalled_scenarios: set of the launched scenarios that did not
+        start running within the launch timeout
+    :param scenarios_in_queue: list of (scenario_id, scenario_name,
+        queue_order_id, run_status_id) tuples
+    :param exited_scenarios: set of the scenarios whose process exited
+        since the last check
+    :param now: the current time (in seconds, on the launch times' clock)
+    :param launch_timeout: how long (in seconds) a launched scenario holds
+        its run slot before it starts running
+    :return: the updated launched scenarios dictionary, the updated stalled
+        scenarios set, and the set of the launched scenarios whose process
+        exited before they started running
+
+    Scenarios that started running or have left the queue are no longer
+    tracked.
+    """
+    run_status_by_scenario = {
+        scenario_id: run_status_id
+        for (scenario_id, _, _, run_status_id) in scenarios_in_queue
+    }
+
+    updated_launched_scenarios = dict()
+    updated_stalled_scenarios = set()
+    failed_scenarios = set()
+    for scenario_id, launch_time in list(launched_scenarios.items()) + [
+        (scenario_id, None) for scenario_id in stalled_scenarios
+    ]:
+        if run_status_by_scenario.get(scenario_id, 1) == 1:
+            continue
+        if scenario_id in exited_scenarios:
+            failed_scenarios.add(scenario_id)
+        elif launch_time is None or now - launch_time > launch_timeout:
+            updated_stalled_scenarios.add(scenario_id)
+        else:
+            updated_launched_scenarios[scenario_id] = launch_time
+
+    return updated_launched_scenarios, updated_stalled_scenarios, failed_scenarios
+
+
+def remove_failed_scenario_from_queue(conn, c, scenario_id):
+    """
+    :param conn: the database connection
+    :param c: the database cursor
+    :param scenario_id: the scenario_id
+
+    Remove a scenario whose process exited before it started running from
+    the queue and set its run status to 'run error', so that we don't
+    launch it again.
+    """
+    sql = """
+        UPDATE scenarios
+        SET queue_order_id = NULL,
+        run_status_id = 3
+        WHERE scenario_id = ?;
+    """
+
+    spin_on_database_lock(conn=conn, cursor=c, sql=sql, data=(scenario_id,), many=False)
+
+
+def get_number_of_run_slots(max_concurrent_runs=None, cores_per_run=1):
+    """
+    :param max_concurrent_runs: the user-specified number of run slots
+    :param cores_per_run: the number of cores to reserve for each run
+    :return: the maximum number of scenarios to run concurrently
+
+    If the number of slots is not specified, we use one slot per
+    *cores_per_run* cores.
+    """
+    if max_concurrent_runs is not None:
+        return max(1, max_concurrent_runs)
+
+    return max(1, (os.cpu_count() or 1) // max(1, cores_per_run))
+
+
+def get_number_of_free_run_slots(run_slots, n_runs_in_progress, memory_per_run_gb):
+    """
+    :param run_slots: the maximum number of scenarios to run concurrently
+    :param n_runs_in_progress: the number of scenarios running or launching
+    :param memory_per_run_gb: the memory (in GB) to require to be available
+        for each new run; the available memory is not checked if None
+    :return: the number of scenarios we can launch now
+
+    The memory check uses the memory currently available, which already
+    excludes the memory used by the runs in progress.
+    """
+    free_slots = max(0, run_slots - n_runs_in_progress)
+    if memory_per_run_gb:
+        available_memory_gb = psutil.virtual_memory().available / 1024**3
+        free_slots = min(free_slots, int(available_memory_gb // memory_per_run_gb))
+
+    return free_slots
+
+
+def get_next_scenarios_to_run(scenarios_in_queue, exclude_scenarios, n_scenarios):
+    """
+    :param scenarios_in_queue: list of (scenario_id, scenario_name,
+        queue_order_id, run_status_id) tuples
+    :param exclude_scenarios: set of scenario IDs not to launch (e.g.
+        because we have already launched them)
+    :param n_scenarios: the number of scenarios to get
+    :return: list of the IDs of the next scenarios to run in queue order
+    """
+    if n_scenarios <= 0:
+        return []
+
+    return [
+        scenario_id
+        for (scenario_id, _, _, run_status_id) in sorted(
+            scenarios_in_queue, key=lambda scenario: scenario[2]
+        )
+        if run_status_id != 1 and scenario_id not in exclude_scenarios
+    ][:n_scenarios]
+
+
+def get_scenario_solver(c, scenario_id):
+    """
+    :param c: the database cursor
+    :param scenario_id: the scenario_id
+    :return: the name of the solver requested for the scenario
+    """
+    solver_options_id = c.execute(
+        """
+        SELECT solver_options_id
+        FROM scenarios
+        WHERE scenario_id = ?
+        """,
+        (scenario_id,),
+    ).fetchone()[0]
+
+    if solver_options_id is None:
+        # TODO: we should specify the default solver as a
+        #  global variable somewhere
+        return "cbc"
+
+    solvers = c.execute(
+        """
+        SELECT DISTINCT solver_name
+        FROM inputs_options_solver
+        WHERE solver_options_id = ?;
+        """,
+        (solver_options_id,),
+    ).fetchall()
+    # Check that there's only one solver specified for the
+    # solver_options_id
+    if len(solvers) > 1:
+        raise ValueError(
+            """
+          Only one solver name can be specified per
+          solver_options_id. Check the solver_options_id {}
+          in the the inputs_options_solver table.
+        """.format(
+                solver_options_id
+            )
+        )
+
+    return solvers[0][0]
+
+
 def get_scenarios_in_queue(c):
     # Check if there are any scenarios in the queue
     scenarios_in_queue = c.execute(
@@ -222,6 +430,25 @@ def parse_arguments(args):
         default="../db/io.db",
         help="The database file path. Defaults to ../db/io.db " "if not specified",
     )
+    parser.add_argument(
+        "--max_concurrent_runs",
+        type=int,
+        help="The maximum number of scenarios to run at the same time. "
+        "Defaults to the number of cores divided by --cores_per_run.",
+    )
+    parser.add_argument(
+        "--cores_per_run",
+        type=int,
+        default=1,
+        help="The number of cores to reserve for each scenario run when "
+        "--max_concurrent_runs is not specified. Defaults to 1.",
+    )
+    parser.add_argument(
+        "--memory_per_run_gb",
+        type=float,
+        help="Only launch a scenario if at least this much memory (in GB) "
+        "is available. The available memory is not checked if not specified.",
+    )
 
     parsed_arguments = parser.parse_args(args=args)
 
@@ -234,7 +461,14 @@ def main(args=None):
 
     parsed_args = parse_arguments(args)
 
-    manage_queue(db_path=parsed_args.database)
+    manage_queue(
+        db_path=parsed_args.database,
+        run_slots=get_number_of_run_slots(
+            max_concurrent_runs=parsed_args.max_concurrent_runs,
+            cores_per_run=parsed_args.cores_per_run,
+        ),
+        memory_per_run_gb=parsed_args.memory_per_run_gb,
+    )
 
 
 if __name__ == "__main__":
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import atexit
+from eventlet import tpool
 from flask import Flask
 from flask_restful import Api
 from flask_socketio import SocketIO, emit
@@ -90,6 +91,10 @@ SOLVERS = {
     SOLVER3_NAME: SOLVER3_EXECUTABLE,
 }
 RUN_QUEUE_MANAGER_PID = None
+# Optional run slot settings for the queue manager (see
+# ui.server.run_queue_manager)
+MAX_CONCURRENT_RUNS = os.environ.get("GRIDPATH_MAX_CONCURRENT_RUNS")
+MEMORY_PER_RUN_GB = os.environ.get("GRIDPATH_MEMORY_PER_RUN_GB")
 
 
 # TODO: not sure we'll need this
@@ -172,10 +177,29 @@ def socket_launch_scenario_process(client_message):
         SCENARIO_STATUS[scenario_id]["scenario_name"] = scenario_name
         SCENARIO_STATUS[scenario_id]["process_id"] = p.pid
 
+        # Let the queue manager know when the process exits
+        socketio.start_background_task(
+            notify_on_scenario_process_exit, p=p, scenario_id=scenario_id
+        )
+
         # Tell the client the process launched
         emit("scenario_process_launched")
 
 
+def notify_on_scenario_process_exit(p, scenario_id):
+    """
+    :param p: the scenario process
+    :param scenario_id:
+    :return:
+
+    Wait for the scenario process to exit (in a native thread, so that we
+    don't block the server) and tell the clients (including the queue
+    manager, which can then launch the next queued scenario).
+    """
+    tpool.execute(p.wait)
+    socketio.emit("scenario_process_exited", {"scenario_id": scenario_id})
+
+
 def warn_user(scenario_id):
     """
     :param scenario_id:
@@ -257,9 +281,12 @@ def socket_add_scenario_to_queue(client_message):
     """
     add_scenario_to_queue(db_path=DATABASE_PATH, scenario_id=client_message["scenario"])
 
-    # Start the run queue manager if we don't have a process currently
+    # Start the run queue manager if we don't have a process currently;
+    # otherwise, wake it up
     if RUN_QUEUE_MANAGER_PID is None:
         start_run_queue_manager()
+    else:
+        emit("queue_updated", broadcast=True)
 
 
 @socketio.on("remove_scenario_from_queue")
@@ -271,6 +298,7 @@ def socket_remove_scenario_from_queue(client_message):
     remove_scenario_from_queue(
         db_path=DATABASE_PATH, scenario_id=client_message["scenario"]
     )
+    emit("queue_updated", broadcast=True)
 
 
 @socketio.on("reset_queue_manager_pid")
@@ -286,8 +314,14 @@ def start_run_queue_manager():
         script_name="gridpath_run_queue_manager"
     )
 
+    run_queue_manager_args = [run_queue_manager_executable, "--database", DATABASE_PATH]
+    if MAX_CONCURRENT_RUNS is not None:
+        run_queue_manager_args += ["--max_concurrent_runs", MAX_CONCURRENT_RUNS]
+    if MEMORY_PER_RUN_GB is not None:
+        run_queue_manager_args += ["--memory_per_run_gb", MEMORY_PER_RUN_GB]
+
     p = subprocess.Popen(
-        [run_queue_manager_executable, "--database", DATABASE_PATH],
+        run_queue_manager_args,
         shell=False,
     )
     print("Queue manager PID: ,", p.pid)
@@ -38,6 +38,16 @@ export class ScenarioResultsComponent implements OnInit {
   // Which results table to show (by running showResultsTable)
   // with tableToShow as argument)
   tableToShow: string;
+  // The table rows are requested from the server one page at a time;
+  // sorting, filtering, and column selection are also done by the server
+  pageSize = 100;
+  currentPage: number;
+  loadingRows = false;
+  sortBy: string;
+  sortOrder = 'asc';
+  filters: {[column: string]: string} = {};
+  allColumns: string[];
+  selectedColumns: {[column: string]: boolean} = {};
 
   // //// Plots //// //
   // All plot forms
@@ -87,15 +97,99 @@ export class ScenarioResultsComponent implements OnInit {
   }
 
   showResultsTable(scenarioID, table): void {
-    this.scenarioResultsService.getResultsTable(scenarioID, table)
-      .subscribe(inputTableRows => {
+    // Start with all columns, no filters, and the default sort order when
+    // switching to another table
+    if (table !== this.tableToShow) {
+      this.sortBy = undefined;
+      this.sortOrder = 'asc';
+      this.filters = {};
+      this.allColumns = undefined;
+      this.selectedColumns = {};
+    }
+    this.scenarioResultsService.getResultsTable(
+      scenarioID, table, this.getTableParams(1)
+    ).subscribe(inputTableRows => {
+        // The first response has all columns; keep them for column selection
+        if (this.allColumns === undefined) {
+          this.allColumns = inputTableRows.columns;
+          for (const column of this.allColumns) {
+            this.selectedColumns[column] = true;
+          }
+        }
         this.resultsTable = inputTableRows;
+        this.currentPage = 1;
         // Set the values needed to display the table after ngOnInit
         this.tableToShow = table;
         this.resultsToShow = this.tableToShow;
       });
   }
 
+  // Get the query parameters for a page of the results table
+  getTableParams(page: number): {[param: string]: string} {
+    const params: {[param: string]: string} = {
+      page: String(page),
+      page_size: String(this.pageSize)
+    };
+    if (this.sortBy !== undefined) {
+      params.sort_by = this.sortBy;
+      params.sort_order = this.sortOrder;
+    }
+    if (this.allColumns !== undefined) {
+      const columns = this.allColumns.filter(
+        column => this.selectedColumns[column]
+      );
+      if (columns.length > 0 && columns.length < this.allColumns.length) {
+        params.columns = columns.join(',');
+      }
+    }
+    for (const column of Object.keys(this.filters)) {
+      if (this.filters[column] !== null && this.filters[column] !== '') {
+        params[`filter_${column}`] = this.filters[column];
+      }
+    }
+    return params;
+  }
+
+  hasMoreRows(): boolean {
+    return this.resultsTable !== undefined
+      && this.resultsTable.totalRows !== undefined
+      && this.resultsTable.rowsData.length < this.resultsTable.totalRows;
+  }
+
+  // Append the next page of rows to the results table
+  loadNextPage(): void {
+    if (this.loadingRows || !this.hasMoreRows()) { return; }
+    this.loadingRows = true;
+    this.scenarioResultsService.getResultsTable(
+      this.scenarioID, this.tableToShow,
+      this.getTableParams(this.currentPage + 1)
+    ).subscribe(inputTableRows => {
+        this.resultsTable.rowsData = this.resultsTable.rowsData.concat(
+          inputTableRows.rowsData
+        );
+        this.resultsTable.totalRows = inputTableRows.totalRows;
+        this.currentPage = inputTableRows.page;
+        this.loadingRows = false;
+      }, () => { this.loadingRows = false; });
+  }
+
+  // Sort by the column (or reverse the order if already sorted by it) and
+  // get the first page again
+  sortResultsTable(column: string): void {
+    if (this.sortBy === column) {
+      this.sortOrder = (this.sortOrder === 'asc') ? 'desc' : 'asc';
+    } else {
+      this.sortBy = column;
+      this.sortOrder = 'asc';
+    }
+    this.showResultsTable(this.scenarioID, this.tableToShow);
+  }
+
+  // Get the first page again after the filters or columns change
+  updateResultsTable(): void {
+    this.showResultsTable(this.scenarioID, this.tableToShow);
+  }
+
   downloadTableData(table): void {
     electron.remote.dialog.showSaveDialog(
         { title: 'untitled.csv', defaultPath: 'table.csv',
@@ -52,9 +52,16 @@ export class ScenarioResultsService {
     );
   }
 
-  getResultsTable(scenarioID: number, table: string): Observable<ScenarioResultsTable> {
+  // Optional params: columns, filter_<column>, sort_by, sort_order, page,
+  // and page_size
+  getResultsTable(
+    scenarioID: number,
+    table: string,
+    params?: {[param: string]: string}
+  ): Observable<ScenarioResultsTable> {
     return this.http.get<ScenarioResultsTable>(
-      `${this.scenariosBaseURL}${scenarioID}/results/${table}`
+      `${this.scenariosBaseURL}${scenarioID}/results/${table}`,
+      {params}
     );
   }
 
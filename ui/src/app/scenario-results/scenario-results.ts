@@ -3,8 +3,12 @@
 export class ScenarioResultsTable {
   table: string;
   caption: string;
-  columns: [];
-  rowsData: [];
+  columns: string[];
+  rowsData: {}[];
+  // Only included when a page of the table is requested
+  totalRows?: number;
+  page?: number;
+  pageSize?: number;
 }
 
 // TODO: what is the json plot's type?
@@ -26,6 +26,17 @@ export class ViewDataComponent implements OnInit {
   // TODO: add type
   tableToShow: ViewDataTable;
 
+  // The table rows are requested from the server one page at a time;
+  // sorting, filtering, and column selection are also done by the server
+  pageSize = 100;
+  currentPage: number;
+  loadingRows = false;
+  sortBy: string;
+  sortOrder = 'asc';
+  filters: {[column: string]: string} = {};
+  allColumns: string[];
+  selectedColumns: {[column: string]: boolean} = {};
+
   constructor(
     private route: ActivatedRoute,
     private location: Location,
@@ -55,12 +66,86 @@ export class ViewDataComponent implements OnInit {
   }
 
   getData(scenarioID, table): void {
-    this.viewDataService.getTable(scenarioID, table)
-      .subscribe(inputTableRows => {
+    this.viewDataService.getTable(
+      scenarioID, table, this.getTableParams(1)
+    ).subscribe(inputTableRows => {
+        // The first response has all columns; keep them for column selection
+        if (this.allColumns === undefined) {
+          this.allColumns = inputTableRows.columns;
+          for (const column of this.allColumns) {
+            this.selectedColumns[column] = true;
+          }
+        }
         this.tableToShow = inputTableRows;
+        this.currentPage = 1;
       });
   }
 
+  // Get the query parameters for a page of the table
+  getTableParams(page: number): {[param: string]: string} {
+    const params: {[param: string]: string} = {
+      page: String(page),
+      page_size: String(this.pageSize)
+    };
+    if (this.sortBy !== undefined) {
+      params.sort_by = this.sortBy;
+      params.sort_order = this.sortOrder;
+    }
+    if (this.allColumns !== undefined) {
+      const columns = this.allColumns.filter(
+        column => this.selectedColumns[column]
+      );
+      if (columns.length > 0 && columns.length < this.allColumns.length) {
+        params.columns = columns.join(',');
+      }
+    }
+    for (const column of Object.keys(this.filters)) {
+      if (this.filters[column] !== null && this.filters[column] !== '') {
+        params[`filter_${column}`] = this.filters[column];
+      }
+    }
+    return params;
+  }
+
+  hasMoreRows(): boolean {
+    return this.tableToShow.rowsData !== undefined
+      && this.tableToShow.totalRows !== undefined
+      && this.tableToShow.rowsData.length < this.tableToShow.totalRows;
+  }
+
+  // Append the next page of rows to the table
+  loadNextPage(): void {
+    if (this.loadingRows || !this.hasMoreRows()) { return; }
+    this.loadingRows = true;
+    this.viewDataService.getTable(
+      this.scenarioID, this.table, this.getTableParams(this.currentPage + 1)
+    ).subscribe(inputTableRows => {
+        this.tableToShow.rowsData = this.tableToShow.rowsData.concat(
+          inputTableRows.rowsData
+        );
+        this.tableToShow.totalRows = inputTableRows.totalRows;
+        this.currentPage = inputTableRows.page;
+        this.loadingRows = false;
+      }, () => { this.loadingRows = false; });
+  }
+
+  // Sort by the column (or reverse the order if already sorted by it) and
+  // get the first page again
+  sortTable(column: string): void {
+    if (this.sortBy === column) {
+      this.sortOrder = (this.sortOrder === 'asc') ? 'desc' : 'asc';
+    } else {
+      this.sortBy = column;
+      this.sortOrder = 'asc';
+    }
+    this.getData(this.scenarioID, this.table);
+  }
+
+  // Get the first page again after the filters or columns change
+  updateTable(): void {
+    this.getData(this.scenarioID, this.table);
+  }
+
   getScenarioName(scenarioID): void {
     this.scenarioDetailService.getScenarioDetailAPI(scenarioID)
       .subscribe(scenarioDetailAPI => {
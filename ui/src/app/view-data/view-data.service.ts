@@ -12,9 +12,16 @@ export class ViewDataService {
 
   constructor(private http: HttpClient) { }
 
-  getTable(scenarioID: number, table: string): Observable<ViewDataTable> {
+  // Optional params: columns, filter_<column>, sort_by, sort_order, page,
+  // and page_size
+  getTable(
+    scenarioID: number,
+    table: string,
+    params?: {[param: string]: string}
+  ): Observable<ViewDataTable> {
     return this.http.get<ViewDataTable>(
-      `${this.viewDataBaseURL}${scenarioID}/${table}`
+      `${this.viewDataBaseURL}${scenarioID}/${table}`,
+      {params}
     );
   }
 
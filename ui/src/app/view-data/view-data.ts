@@ -1,4 +1,8 @@
 export class ViewDataTable {
-  columns: [];
-  rowsData: [];
+  columns: string[];
+  rowsData: {}[];
+  // Only included when a page of the table is requested
+  totalRows?: number;
+  page?: number;
+  pageSize?: number;
 }
@@ -131,6 +131,30 @@ def get_parent_parser():
     return parser
 
 
+# Lookup tables that can be loaded once per process (e.g. by the batch plot
+# renderer, see viz.render_plots) instead of being queried for every plot
+PRELOADED_LOOKUPS = dict()
+
+
+def preload_lookups(c):
+    """
+    Load the technology colors, technology plotting order, and units of
+    measurement, so that get_tech_colors, get_tech_plotting_order, and
+    get_unit don't query the database.
+
+    :param c:
+    :return:
+    """
+    PRELOADED_LOOKUPS.clear()
+    tech_colors = get_tech_colors(c)
+    tech_plotting_order = get_tech_plotting_order(c)
+    units = dict(c.execute("SELECT metric, unit FROM mod_units;").fetchall())
+
+    PRELOADED_LOOKUPS["tech_colors"] = tech_colors
+    PRELOADED_LOOKUPS["tech_plotting_order"] = tech_plotting_order
+    PRELOADED_LOOKUPS["units"] = units
+
+
 def get_tech_colors(c):
     """
     Get the colors by technology as specified in the viz_technologies db
@@ -139,6 +163,10 @@ def get_tech_colors(c):
     :param c:
     :return:
     """
+    # Return a copy, as plots may modify the dictionary
+    if "tech_colors" in PRELOADED_LOOKUPS:
+        return dict(PRELOADED_LOOKUPS["tech_colors"])
+
     colors = c.execute(
         """
         SELECT technology, color
@@ -158,6 +186,9 @@ def get_tech_plotting_order(c):
     :param c:
     :return:
     """
+    # Return a copy, as plots may modify the dictionary
+    if "tech_plotting_order" in PRELOADED_LOOKUPS:
+        return dict(PRELOADED_LOOKUPS["tech_plotting_order"])
 
     order = c.execute(
         """
@@ -178,6 +209,8 @@ def get_unit(c, metric):
     :param metric: str, the metric for which we want the unit of measurement
     :return:
     """
+    if metric in PRELOADED_LOOKUPS.get("units", {}):
+        return PRELOADED_LOOKUPS["units"][metric]
 
     unit = c.execute("SELECT unit FROM mod_units WHERE metric=?", (metric,))
 
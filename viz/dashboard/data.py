@@ -16,14 +16,18 @@ import pandas as pd
 from bokeh.models import ColumnDataSource
 
 from viz.common_functions import order_cols_by_nunique
+from viz.results_cache import results_cache
 
 
 class DataProvider(object):
     def __init__(self, conn):
+        self.conn = conn
+        self.db_path = conn.execute("PRAGMA database_list;").fetchone()[2]
         self.objective_metrics = get_objective_metrics(conn)
 
         # Get drop down options
         self.scenario_options = get_scenario_options(conn)
+        self.scenario_ids = get_scenario_ids(conn, self.scenario_options)
         self.period_options = get_period_options(conn, self.scenario_options)
         self.stage_options = get_stage_options(conn, self.scenario_options)
         self.zone_options = get_zone_options(conn, self.scenario_options)
@@ -36,12 +40,46 @@ class DataProvider(object):
         ]
         # TODO: ideally dynamically update zone_options based on selected scenarios
 
-        # Load data for all scenarios into a set of pandas DataFrames
-        self.summary = get_all_summary_data(conn, self.scenario_options)
-        self.objective = get_objective_cost_data(conn, self.scenario_options)
-        self.cost = get_all_cost_data(conn, self.scenario_options)
-        self.energy = get_all_energy_data(conn, self.scenario_options)
-        self.capacity = get_all_capacity_data(conn, self.scenario_options)
+        # Data of scenarios without a results version (see
+        # viz.results_cache), which are loaded once per provider
+        self.unversioned_data = dict()
+
+    # Data for all scenarios are loaded into pandas DataFrames when first
+    # needed and shared across dashboard sessions until the scenarios'
+    # results are processed again; if any of the scenarios' results have not
+    # been processed, the data are kept by this provider only
+    @property
+    def summary(self):
+        return self._get_data(get_all_summary_data)
+
+    @property
+    def objective(self):
+        return self._get_data(get_objective_cost_data)
+
+    @property
+    def cost(self):
+        return self._get_data(get_all_cost_data)
+
+    @property
+    def energy(self):
+        return self._get_data(get_all_energy_data)
+
+    @property
+    def capacity(self):
+        return self._get_data(get_all_capacity_data)
+
+    def _get_data(self, get_data_function):
+        return results_cache.get_or_compute(
+            c=self.conn.cursor(),
+            scenario_ids=self.scenario_ids,
+            key=(
+                self.db_path,
+                get_data_function.__name__,
+                tuple(self.scenario_options),
+            ),
+            compute=lambda: get_data_function(self.conn, self.scenario_options),
+            unversioned_values=self.unversioned_data,
+        )
 
     def get_objective_src(self, scenario, stage):
         scenario = scenario if isinstance(scenario, list) else [scenario]
@@ -219,6 +257,21 @@ def get_scenario_options(conn):
     return scenario_options
 
 
+def get_scenario_ids(conn, scenarios):
+    scenarios = scenarios if isinstance(scenarios, list) else [scenarios]
+    scenario_ids = [
+        sc[0]
+        for sc in conn.execute(
+            """SELECT scenario_id FROM scenarios
+        WHERE scenario_name in ({});""".format(
+                ",".join("?" * len(scenarios))
+            ),
+            scenarios,
+        ).fetchall()
+    ]
+    return scenario_ids
+
+
 def get_zone_options(conn, scenarios):
     scenarios = scenarios if isinstance(scenarios, list) else [scenarios]
     # TODO: refactor with ui.server.api.scenario_results
@@ -459,12 +512,10 @@ def get_all_summary_data(conn, scenarios):
 
     INNER JOIN 
     (SELECT scenario_id, stage_id, period, load_zone, 
-    SUM(timepoint_weight * number_of_hours_in_timepoint * load_mw) AS load,
-    SUM(timepoint_weight * number_of_hours_in_timepoint * overgeneration_mw) 
-    AS overgeneration,
-    SUM(timepoint_weight * number_of_hours_in_timepoint * unserved_energy_mw) 
-    AS unserved_energy
-    FROM results_system_load_zone_timepoint
+    SUM(static_load_mwh) AS load,
+    SUM(overgeneration_mwh) AS overgeneration,
+    SUM(unserved_energy_mwh) AS unserved_energy
+    FROM results_system_load_zone_period
     WHERE spinup_or_lookahead = 0
     GROUP BY scenario_id, stage_id, period, load_zone
     ) AS load_table
@@ -472,7 +523,7 @@ def get_all_summary_data(conn, scenarios):
 
     INNER JOIN
     (SELECT scenario_id, stage_id, period, load_zone,
-    SUM(carbon_emission_tons) AS carbon_emissions
+    SUM(carbon_emissions_tons) AS carbon_emissions
     FROM results_project_carbon_emissions_by_technology_period
     WHERE spinup_or_lookahead = 0
     GROUP BY scenario_id, stage_id, period, load_zone
@@ -81,6 +81,20 @@ def create_parser():
     parser.add_argument(
         "--stage", default=1, type=int, help="The stage ID. Defaults to 1."
     )
+    parser.add_argument(
+        "--downsample_timepoints",
+        default=None,
+        type=int,
+        help="Aggregate this many consecutive timepoints into each plotted "
+        "point. Useful for plotting long windows, e.g. a full year. "
+        "Defaults to None (plot every timepoint).",
+    )
+    parser.add_argument(
+        "--downsample_method",
+        default="mean",
+        choices=["mean", "min", "max"],
+        help="How to aggregate the downsampled timepoints. Defaults to mean.",
+    )
 
     return parser
 
@@ -96,230 +110,168 @@ def parse_arguments(arguments):
     return parsed_arguments
 
 
-def get_timepoints(conn, scenario_id, starting_tmp=None, ending_tmp=None, stage_id=1):
+def get_timepoint_range_query(column, starting_tmp=None, ending_tmp=None):
     """
-    Note: assumes timepoints are ordered!
-    :param conn:
-    :param scenario_id:
-    :param starting_tmp:
-    :param ending_tmp:
-    :param stage_id:
-    :return:
-    """
-
-    if starting_tmp is None:
-        start_query = ""
-    else:
-        start_query = "AND timepoint >= {}".format(starting_tmp)
-
-    if ending_tmp is None:
-        end_query = ""
-    else:
-        end_query = "AND timepoint <= {}".format(ending_tmp)
-
-    query = """SELECT timepoint
-        FROM inputs_temporal
-        INNER JOIN
-        (SELECT temporal_scenario_id FROM scenarios WHERE scenario_id = {})
-        USING (temporal_scenario_id)
-        WHERE stage_id = {}
-        {}
-        {}
-        ;""".format(
-        scenario_id, stage_id, start_query, end_query
-    )
-
-    tmps = [i[0] for i in conn.execute(query).fetchall()]
+    :param column: the timepoint column to filter on
+    :param starting_tmp: the starting timepoint; no lower bound if None
+    :param ending_tmp: the ending timepoint; no upper bound if None
+    :return: the SQL predicate (starting with 'AND') and its parameters
 
-    return tmps
-
-
-def get_power_by_tech_results(conn, scenario_id, load_zone, stage, timepoints):
-    """
-    Get results for power by technology for a given load_zone and set of
-    points.
-    :param conn:
-    :param scenario_id:
-    :param load_zone:
-    :param stage:
-    :param timepoints
-    :return:
+    Filter on a range of timepoints rather than on a list of them, so that
+    the number of query parameters does not grow with the number of
+    timepoints.
     """
+    query = ""
+    params = []
+    if starting_tmp is not None:
+        query += " AND {} >= ?".format(column)
+        params.append(starting_tmp)
+    if ending_tmp is not None:
+        query += " AND {} <= ?".format(column)
+        params.append(ending_tmp)
 
-    # Power by technology
-    query = """SELECT timepoint, technology, power_mw
-        FROM results_project_dispatch_by_technology
-        WHERE scenario_id = {}
-        AND load_zone = '{}'
-        AND stage_id = {}
-        AND timepoint IN ({})
-        ;""".format(
-        scenario_id, load_zone, stage, ",".join(["?"] * len(timepoints))
-    )
-
-    df = pd.read_sql(query, conn, params=timepoints)
-    if not df.empty:
-        df = df.pivot(index="timepoint", columns="technology")["power_mw"]
-        return df
-    # If the dataframe was empty, we still need to send the timepoint index
-    # downstream
-    else:
-        index_only_df = pd.DataFrame(index=timepoints)
-        return index_only_df
+    return query, params
 
 
-def get_variable_curtailment_results(c, scenario_id, load_zone, stage, timepoints):
+def get_technologies(c, scenario_id, load_zone, stage):
     """
-    Get variable generator curtailment for a given load_zone and set of
-    timepoints.
+    Get the technologies with dispatch results in a given load_zone.
     :param c:
     :param scenario_id:
     :param load_zone:
     :param stage:
-    :param timepoints:
     :return:
     """
-    query = """SELECT scheduled_curtailment_mw
-            FROM results_project_curtailment_variable_periodagg
-            WHERE scenario_id = {}
-            AND load_zone = '{}'
-            AND stage_id = {}
-            AND timepoint IN ({})
-            ;""".format(
-        scenario_id, load_zone, stage, ",".join(["?"] * len(timepoints))
-    )
-
-    curtailment = [i[0] for i in c.execute(query, timepoints).fetchall()]
+    technologies = [
+        t[0]
+        for t in c.execute(
+            """SELECT DISTINCT technology
+            FROM results_project_dispatch_by_technology
+            WHERE scenario_id = ?
+            AND load_zone = ?
+            AND stage_id = ?
+            ORDER BY technology;""",
+            (scenario_id, load_zone, stage),
+        ).fetchall()
+    ]
 
-    return curtailment
+    return technologies
 
 
-def get_hydro_curtailment_results(c, scenario_id, load_zone, stage, timepoints):
+def get_dispatch_results(
+    conn, scenario_id, load_zone, stage, technologies, starting_tmp, ending_tmp
+):
     """
-    Get conventional hydro curtailment for a given load_zone and set of
-    timepoints.
+    Get power by technology, curtailment, imports/exports, market
+    participation, load, and unserved energy for a given load_zone and
+    range of timepoints in a single query. Power is pivoted to a column per
+    technology in the query.
+    :param conn:
     :param scenario_id:
     :param load_zone:
     :param stage:
-    :param timepoints:
+    :param technologies:
+    :param starting_tmp:
+    :param ending_tmp:
     :return:
     """
-    query = """SELECT scheduled_curtailment_mw
-            FROM results_project_curtailment_hydro_periodagg
-            WHERE scenario_id = {}
-            AND load_zone = '{}'
-            AND stage_id = {}
-            AND timepoint IN ({});""".format(
-        scenario_id, load_zone, stage, ",".join(["?"] * len(timepoints))
+    tech_columns = "".join(
+        ",\n            SUM(CASE WHEN technology = ? THEN power_mw END) "
+        "AS tech_{}".format(i)
+        for i in range(len(technologies))
     )
-
-    curtailment = [i[0] for i in c.execute(query, timepoints).fetchall()]
-
-    return curtailment
-
-
-def get_imports_exports_results(c, scenario_id, load_zone, stage, timepoints):
-    """
-    Get imports/exports results for a given load_zone and set of timepoints.
-    :param c:
-    :param scenario_id:
-    :param load_zone:
-    :param stage:
-    :param timepoints:
-    :return:
-    """
-    query = """SELECT net_imports_mw
-        FROM results_system_load_zone_timepoint
-        WHERE scenario_id = {}
-        AND load_zone = '{}'
-        AND stage_id = {}
-        AND timepoint IN ({})
-        ;""".format(
-        scenario_id, load_zone, stage, ",".join(["?"] * len(timepoints))
+    power_range_query, power_range_params = get_timepoint_range_query(
+        "timepoint", starting_tmp, ending_tmp
+    )
+    lz_range_query, lz_range_params = get_timepoint_range_query(
+        "lz.timepoint", starting_tmp, ending_tmp
     )
 
-    net_imports = c.execute(query, timepoints).fetchall()
-
-    # None values should only happen if the transmission feature was not
-    # included
-    imports = [0 if i[0] is None else i[0] if i[0] > 0 else 0 for i in net_imports]
-    exports = [0 if e[0] is None else -e[0] if e[0] < 0 else 0 for e in net_imports]
-
-    return imports, exports
-
-
-def get_market_participation_results(c, scenario_id, load_zone, stage, timepoints):
-    """
-    Get market participation results for a given load_zone and set of timepoints.
-    :param c:
-    :param scenario_id:
-    :param load_zone:
-    :param stage:
-    :param timepoints:
-    :return:
-    """
-    query = """SELECT net_market_purchases_mw
-        FROM results_system_load_zone_timepoint
-        WHERE scenario_id = {}
-        AND load_zone = '{}'
-        AND stage_id = {}
-        AND timepoint IN ({})
+    query = """SELECT lz.timepoint AS timepoint{}
+        curt_var.scheduled_curtailment_mw AS Curtailment_Variable,
+        curt_hydro.scheduled_curtailment_mw AS Curtailment_Hydro,
+        lz.net_imports_mw AS net_imports_mw,
+        lz.net_market_purchases_mw AS net_market_purchases_mw,
+        lz.static_load_mw AS Load,
+        lz.unserved_energy_mw AS Unserved_Energy
+        FROM results_system_load_zone_timepoint AS lz
+        LEFT OUTER JOIN (
+            SELECT subproblem_id, timepoint{}
+            FROM results_project_dispatch_by_technology
+            WHERE scenario_id = ?
+            AND load_zone = ?
+            AND stage_id = ?{}
+            GROUP BY subproblem_id, timepoint
+        ) AS power
+        ON (power.subproblem_id = lz.subproblem_id
+            AND power.timepoint = lz.timepoint)
+        LEFT OUTER JOIN results_project_curtailment_variable_periodagg AS curt_var
+        ON (curt_var.scenario_id = lz.scenario_id
+            AND curt_var.subproblem_id = lz.subproblem_id
+            AND curt_var.stage_id = lz.stage_id
+            AND curt_var.timepoint = lz.timepoint
+            AND curt_var.load_zone = lz.load_zone)
+        LEFT OUTER JOIN results_project_curtailment_hydro_periodagg AS curt_hydro
+        ON (curt_hydro.scenario_id = lz.scenario_id
+            AND curt_hydro.subproblem_id = lz.subproblem_id
+            AND curt_hydro.stage_id = lz.stage_id
+            AND curt_hydro.timepoint = lz.timepoint
+            AND curt_hydro.load_zone = lz.load_zone)
+        WHERE lz.scenario_id = ?
+        AND lz.load_zone = ?
+        AND lz.stage_id = ?{}
+        ORDER BY lz.subproblem_id, lz.timepoint
         ;""".format(
-        scenario_id, load_zone, stage, ",".join(["?"] * len(timepoints))
+        "".join(",\n        power.tech_{}".format(i) for i in range(len(technologies)))
+        + ",",
+        tech_columns,
+        power_range_query,
+        lz_range_query,
+    )
+    params = (
+        technologies
+        + [scenario_id, load_zone, stage]
+        + power_range_params
+        + [scenario_id, load_zone, stage]
+        + lz_range_params
     )
 
-    market_participation = c.execute(query, timepoints).fetchall()
-
-    sales = []
-    purchases = []
-    for i in market_participation:
-        if i[0] is None:  # markets feature not included
-            sales.append(0)
-            purchases.append(0)
-        else:
-            if i[0] < 0:
-                sales.append(-i[0])
-                purchases.append(0)
-            elif i[0] > 0:
-                sales.append(0)
-                purchases.append(i[0])
-            else:
-                sales.append(0)
-                purchases.append(0)
+    df = pd.read_sql(query, conn, params=params).set_index("timepoint")
+    df = df.rename(
+        columns={"tech_{}".format(i): tech for i, tech in enumerate(technologies)}
+    )
 
-    return sales, purchases
+    return df
 
 
-def get_load(c, scenario_id, load_zone, stage, timepoints):
+def downsample(df, timepoints_per_point, method="mean"):
     """
-
-    :param c:
-    :param scenario_id:
-    :param load_zone:
-    :param stage:
-    :param timepoints
-    :return:
+    :param df: dataframe with a row per timepoint
+    :param timepoints_per_point: the number of consecutive timepoints to
+        aggregate into each point
+    :param method: how to aggregate the timepoints: "mean", "min", or "max"
+    :return: dataframe with a row per group of timepoints, indexed by the
+        first timepoint in each group
+
+    Downsample the plotting data for long windows.
     """
+    groups = [i // timepoints_per_point for i in range(len(df))]
+    downsampled_df = df.groupby(groups).agg(method)
+    downsampled_df.index = df.index[::timepoints_per_point]
 
-    query = """SELECT static_load_mw, unserved_energy_mw
-        FROM results_system_load_zone_timepoint
-        WHERE scenario_id = {}
-        AND load_zone = '{}'
-        AND stage_id = {}
-        AND timepoint IN ({});""".format(
-        scenario_id, load_zone, stage, ",".join(["?"] * len(timepoints))
-    )
-
-    load_balance = c.execute(query, timepoints).fetchall()
-
-    load = [i[0] for i in load_balance]
-    unserved_energy = [i[1] for i in load_balance]
-
-    return load, unserved_energy
+    return downsampled_df
 
 
 def get_plotting_data(
-    conn, scenario_id, load_zone, starting_tmp, ending_tmp, stage, **kwargs
+    conn,
+    scenario_id,
+    load_zone,
+    starting_tmp,
+    ending_tmp,
+    stage,
+    downsample_timepoints=None,
+    downsample_method="mean",
+    **kwargs
 ):
     """
     Get the dispatch data by timepoint and technology for a given
@@ -334,28 +286,31 @@ def get_plotting_data(
     :param starting_tmp:
     :param ending_tmp:
     :param stage:
+    :param downsample_timepoints: if specified, aggregate this many
+        consecutive timepoints into each plotted point
+    :param downsample_method: how to aggregate the downsampled timepoints
+        ("mean", "min", or "max")
     :return:
     """
 
     c = conn.cursor()
 
-    # Get the relevant timepoints
-    timepoints = get_timepoints(conn, scenario_id, starting_tmp, ending_tmp, stage)
-
-    # Get dispatch by technology
+    # Get dispatch by technology along with the other series
     # TODO: Let tech order depend on specified order in database table.
     #  Storage might be tricky because we manipulate it!
-    df = get_power_by_tech_results(
+    technologies = get_technologies(
+        c=c, scenario_id=scenario_id, load_zone=load_zone, stage=stage
+    )
+    results_df = get_dispatch_results(
         conn=conn,
         scenario_id=scenario_id,
         load_zone=load_zone,
         stage=stage,
-        timepoints=timepoints,
+        technologies=technologies,
+        starting_tmp=starting_tmp,
+        ending_tmp=ending_tmp,
     )
-
-    # Add x axis
-    # TODO: assumes hourly timepoints for now, make it flexible instead
-    df["x"] = range(0, len(df))
+    df = results_df[technologies].copy()
 
     # Split storage into charging and discharging and aggregate storage charging
     # Assume any dispatch that is negative is storage charging
@@ -365,64 +320,39 @@ def get_plotting_data(
         df["Storage_Charging"] += -df[tech].clip(upper=0)
         df[tech] = df[tech].clip(lower=0)
 
-    # Add variable curtailment (if any)
-    curtailment_variable = get_variable_curtailment_results(
-        c=c,
-        scenario_id=scenario_id,
-        load_zone=load_zone,
-        stage=stage,
-        timepoints=timepoints,
-    )
-    if curtailment_variable:
-        df["Curtailment_Variable"] = curtailment_variable
-
-    # Add hydro curtailment (if any)
-    curtailment_hydro = get_hydro_curtailment_results(
-        c=c,
-        scenario_id=scenario_id,
-        load_zone=load_zone,
-        stage=stage,
-        timepoints=timepoints,
-    )
-    if curtailment_hydro:
-        df["Curtailment_Hydro"] = curtailment_hydro
+    # Add variable and hydro curtailment (if any)
+    for curtailment_col in ["Curtailment_Variable", "Curtailment_Hydro"]:
+        if results_df[curtailment_col].notna().any():
+            df[curtailment_col] = results_df[curtailment_col].fillna(0)
 
-    # Add imports and exports (if any)
-    imports, exports = get_imports_exports_results(
-        c=c,
-        scenario_id=scenario_id,
-        load_zone=load_zone,
-        stage=stage,
-        timepoints=timepoints,
-    )
-    if imports:
-        df["Imports"] = imports
-    if exports:
-        df["Exports"] = exports
+    # Add imports and exports
+    # None values should only happen if the transmission feature was not
+    # included
+    net_imports = results_df["net_imports_mw"].fillna(0)
+    df["Imports"] = net_imports.clip(lower=0)
+    df["Exports"] = -net_imports.clip(upper=0)
 
-    # Add market participation (if any)
-    market_sales, market_purchases = get_market_participation_results(
-        c=c,
-        scenario_id=scenario_id,
-        load_zone=load_zone,
-        stage=stage,
-        timepoints=timepoints,
-    )
-    if market_sales:
-        df["Market_Sales"] = market_sales
-    if market_purchases:
-        df["Market_Purchases"] = market_purchases
+    # Add market participation
+    # None values should only happen if the markets feature was not included
+    net_market_purchases = results_df["net_market_purchases_mw"].fillna(0)
+    df["Market_Sales"] = -net_market_purchases.clip(upper=0)
+    df["Market_Purchases"] = net_market_purchases.clip(lower=0)
 
     # Add load
-    load_balance = get_load(
-        c=c,
-        scenario_id=scenario_id,
-        load_zone=load_zone,
-        stage=stage,
-        timepoints=timepoints,
-    )
-    df["Load"] = load_balance[0]
-    df["Unserved_Energy"] = load_balance[1]
+    df["Load"] = results_df["Load"]
+    df["Unserved_Energy"] = results_df["Unserved_Energy"]
+
+    # Add x axis
+    # TODO: assumes hourly timepoints for now, make it flexible instead
+    if downsample_timepoints is not None and downsample_timepoints > 1:
+        df = downsample(
+            df=df,
+            timepoints_per_point=downsample_timepoints,
+            method=downsample_method,
+        )
+        df["x"] = range(0, len(df) * downsample_timepoints, downsample_timepoints)
+    else:
+        df["x"] = range(0, len(df))
 
     # Dataframe for testing without database
     # df = pd.DataFrame(
@@ -709,6 +639,8 @@ def main(args=None):
         starting_tmp=parsed_args.starting_tmp,
         ending_tmp=parsed_args.ending_tmp,
         stage=parsed_args.stage,
+        downsample_timepoints=parsed_args.downsample_timepoints,
+        downsample_method=parsed_args.downsample_method,
     )
 
     plot = create_plot(
@@ -0,0 +1,373 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Render a batch of plots to HTML files as specified in a manifest CSV file.
+
+The manifest has a row per plot and must have a 'plot' column with the
+name of the plot module (e.g. 'dispatch_plot'). The other columns are
+the plot arguments without the leading dashes (e.g. 'scenario',
+'load_zone', 'period', 'starting_tmp'); leave a cell empty to not
+specify the argument for that plot.
+
+Plots are saved in the same locations as with the plot scripts' *--show*
+option, i.e. in the "scenario/results/figures" subfolder of the plot
+write directory, or in its "scenario_comparison/figures" subfolder for
+plots without a scenario.
+
+The plots are rendered in a pool of worker processes, each of which loads
+the technology colors, plotting order, and units once. The results
+version (see *viz.results_cache*) of the scenario each plot was rendered
+for is recorded in the plot write directory, and plots are skipped if
+their file exists and the scenario's results have not been processed
+again since.
+"""
+
+from argparse import ArgumentParser
+import csv
+import importlib
+import json
+from multiprocessing import get_context
+import os.path
+import sys
+
+from db.common_functions import connect_to_database
+from gridpath.common_functions import create_directory_if_not_exists
+from viz.common_functions import PRELOADED_LOOKUPS, preload_lookups
+from viz.results_cache import get_results_version
+
+RENDER_STATE_FILENAME = "render_plots_state.json"
+
+PLOT_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+{resources}
+</head>
+<body>
+<div id="{target}"></div>
+<script type="text/javascript">
+Bokeh.embed.embed_item({plot_json}, "{target}");
+</script>
+</body>
+</html>
+"""
+
+
+def parse_arguments(args):
+    """
+    :param args: the script arguments specified by the user
+    :return: the parsed known argument values (<class 'argparse.Namespace'>
+    Python object)
+    """
+    parser = ArgumentParser(add_help=True)
+    parser.add_argument(
+        "--database",
+        default="../db/io.db",
+        help="The database file path relative to the current working "
+        "directory. Defaults to ../db/io.db",
+    )
+    parser.add_argument(
+        "--manifest", required=True, help="Path to the plot manifest CSV file."
+    )
+    parser.add_argument(
+        "--plot_write_directory",
+        default="../scenarios",
+        help="The path to the base directory in which to save the plot html "
+        "files. Defaults to ../scenarios",
+    )
+    parser.add_argument(
+        "--n_parallel_render",
+        default=1,
+        type=int,
+        help="Render n plots in parallel. Defaults to 1.",
+    )
+    parser.add_argument(
+        "--force",
+        default=False,
+        action="store_true",
+        help="Render all plots, including those whose results have not "
+        "changed since they were last rendered.",
+    )
+    parser.add_argument(
+        "--quiet", default=False, action="store_true", help="Don't print output."
+    )
+
+    parsed_arguments = parser.parse_args(args=args)
+
+    return parsed_arguments
+
+
+def read_manifest(manifest):
+    """
+    :param manifest: path to the plot manifest CSV file
+    :return: list of (plot, dictionary of plot arguments) tuples
+    """
+    plots = []
+    with open(manifest, "r", newline="") as f:
+        reader = csv.DictReader(f)
+        if "plot" not in reader.fieldnames:
+            raise ValueError(
+                "The plot manifest {} must have a 'plot' column.".format(manifest)
+            )
+        for row in reader:
+            plot = row.pop("plot").strip()
+            if not plot:
+                continue
+            plot_arguments = {
+                argument: value.strip()
+                for argument, value in row.items()
+                if value is not None and value.strip() != ""
+            }
+            plots.append((plot, plot_arguments))
+
+    return plots
+
+
+def get_plot_name(plot, plot_arguments):
+    """
+    :param plot: the name of the plot module
+    :param plot_arguments: dictionary of the plot arguments
+    :return: the name of the plot file (without extension)
+
+    The name includes each argument's name and value (except the scenario,
+    which determines the plot directory), so plots with different arguments
+    get different names.
+    """
+    return "-".join(
+        [plot]
+        + [
+            "{}={}".format(argument, str(value).replace(os.sep, "_"))
+            for argument, value in sorted(plot_arguments.items())
+            if argument != "scenario"
+        ]
+    )
+
+
+def get_plot_jobs(c, plots, database, plot_write_directory):
+    """
+    :param c: database cursor
+    :param plots: list of (plot, dictionary of plot arguments) tuples
+    :param database: the database file path
+    :param plot_write_directory: the base directory for the plot files
+    :return: list of (plot, plot script arguments, file path, results
+        version) tuples
+
+    The results version is None for plots without a scenario and for
+    scenarios whose results have not been processed.
+    """
+    scenario_ids = dict(
+        c.execute("SELECT scenario_name, scenario_id FROM scenarios;").fetchall()
+    )
+
+    jobs = []
+    plots_by_file_path = dict()
+    for plot, plot_arguments in plots:
+        scenario = plot_arguments.get("scenario")
+        if scenario is None:
+            plot_write_subdir = os.path.join(
+                plot_write_directory, "scenario_comparison", "figures"
+            )
+            version = None
+        else:
+            if scenario not in scenario_ids:
+                raise ValueError(
+                    "Scenario {} in the plot manifest is not in the "
+                    "database.".format(scenario)
+                )
+            plot_write_subdir = os.path.join(
+                plot_write_directory, scenario, "results", "figures"
+            )
+            version = get_results_version(c=c, scenario_ids=[scenario_ids[scenario]])
+
+        script_arguments = ["--database", database, "--return_json"]
+        for argument, value in plot_arguments.items():
+            script_arguments += ["--{}".format(argument), value]
+
+        file_path = os.path.join(
+            plot_write_subdir, get_plot_name(plot, plot_arguments) + ".html"
+        )
+        if file_path in plots_by_file_path:
+            raise ValueError(
+                "Plots {} and {} in the plot manifest would both be saved "
+                "to {}.".format(
+                    plots_by_file_path[file_path], (plot, plot_arguments), file_path
+                )
+            )
+        plots_by_file_path[file_path] = (plot, plot_arguments)
+        jobs.append(
+            (
+                plot,
+                script_arguments,
+                file_path,
+                None if version is None else list(version),
+            )
+        )
+
+    return jobs
+
+
+def read_render_state(plot_write_directory):
+    """
+    :param plot_write_directory: the base directory for the plot files
+    :return: dictionary of the results version each plot file was rendered
+        for
+    """
+    state_file = os.path.join(plot_write_directory, RENDER_STATE_FILENAME)
+    if not os.path.exists(state_file):
+        return dict()
+    with open(state_file, "r") as f:
+        return json.load(f)
+
+
+def write_render_state(plot_write_directory, render_state):
+    """
+    :param plot_write_directory: the base directory for the plot files
+    :param render_state: dictionary of the results version each plot file
+        was rendered for
+    """
+    create_directory_if_not_exists(plot_write_directory)
+    with open(os.path.join(plot_write_directory, RENDER_STATE_FILENAME), "w") as f:
+        json.dump(render_state, f, indent=1, sort_keys=True)
+
+
+def is_up_to_date(file_path, version, render_state):
+    """
+    :param file_path: the plot file path
+    :param version: the results version of the plot's scenario
+    :param render_state: dictionary of the results version each plot file
+        was rendered for
+    :return: boolean; whether the plot file can be kept as is
+    """
+    return (
+        version is not None
+        and os.path.exists(file_path)
+        and render_state.get(file_path) == version
+    )
+
+
+def initialize_worker(database):
+    """
+    :param database: the database file path
+
+    Load the lookup tables once per worker process.
+    """
+    conn = connect_to_database(db_path=database)
+    preload_lookups(conn.cursor())
+    conn.close()
+
+
+def render_plot(job):
+    """
+    :param job: (plot, plot script arguments, file path, results version)
+        tuple
+    :return: the job
+
+    Render the plot and save it as an HTML file.
+    """
+    from bokeh.resources import CDN
+
+    plot, script_arguments, file_path, _ = job
+    plot_module = importlib.import_module("viz." + plot)
+    plot_json = plot_module.main(script_arguments)
+
+    create_directory_if_not_exists(os.path.dirname(file_path))
+    with open(file_path, "w") as f:
+        f.write(
+            PLOT_HTML_TEMPLATE.format(
+                title=os.path.splitext(os.path.basename(file_path))[0],
+                resources=CDN.render(),
+                target=plot_json["target_id"],
+                plot_json=json.dumps(plot_json),
+            )
+        )
+
+    return job
+
+
+def main(args=None):
+    """
+    Read the manifest, determine which plots need to be rendered, and
+    render them.
+
+    :return: list of the paths of the rendered plot files
+    """
+    if args is None:
+        args = sys.argv[1:]
+    parsed_args = parse_arguments(args=args)
+
+    plots = read_manifest(manifest=parsed_args.manifest)
+
+    conn = connect_to_database(db_path=parsed_args.database)
+    jobs = get_plot_jobs(
+        c=conn.cursor(),
+        plots=plots,
+        database=parsed_args.database,
+        plot_write_directory=parsed_args.plot_write_directory,
+    )
+    conn.close()
+
+    render_state = read_render_state(parsed_args.plot_write_directory)
+    if not parsed_args.force:
+        jobs_to_render = [
+            job for job in jobs if not is_up_to_date(job[2], job[3], render_state)
+        ]
+    else:
+        jobs_to_render = jobs
+
+    if not parsed_args.quiet:
+        print(
+            "Rendering {} plots ({} up to date)...".format(
+                len(jobs_to_render), len(jobs) - len(jobs_to_render)
+            )
+        )
+
+    if parsed_args.n_parallel_render > 1 and len(jobs_to_render) > 1:
+        # Pool must use spawn to work properly on Linux
+        pool = get_context("spawn").Pool(
+            parsed_args.n_parallel_render,
+            initializer=initialize_worker,
+            initargs=(parsed_args.database,),
+        )
+        rendered_jobs = pool.imap_unordered(render_plot, jobs_to_render)
+    else:
+        pool = None
+        initialize_worker(parsed_args.database)
+        rendered_jobs = map(render_plot, jobs_to_render)
+
+    rendered_files = []
+    try:
+        for plot, _, file_path, version in rendered_jobs:
+            rendered_files.append(file_path)
+            if version is None:
+                render_state.pop(file_path, None)
+            else:
+                render_state[file_path] = version
+            if not parsed_args.quiet:
+                print("... {}".format(file_path))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        else:
+            PRELOADED_LOOKUPS.clear()
+        # Record what was rendered even if a plot failed
+        write_render_state(parsed_args.plot_write_directory, render_state)
+
+    return rendered_files
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-memory cache of results queries (data frames and plot JSON) for the UI
+server and the dashboard.
+
+Cached values are keyed on the results version of the scenarios they were
+computed for, i.e. the time the scenarios' results aggregates were last
+built by *process_results* (see the *results_scenario_aggregates* table).
+Re-importing a scenario's results deletes its version, so nothing is
+cached for the scenario until its results have been processed again, and
+values computed for the old version are no longer looked up. Callers that
+hold on to their values anyway (e.g. a dashboard data provider) can pass
+their own dictionary to keep the values computed without a version.
+"""
+
+from collections import OrderedDict
+import threading
+
+RESULTS_CACHE_SIZE = 256
+
+
+def get_results_version(c, scenario_ids):
+    """
+    :param c: database cursor
+    :param scenario_ids: list of scenario IDs
+    :return: tuple of the scenarios' results aggregates timestamps, or None
+        if the results of any of the scenarios have not been processed
+
+    The results version of a set of scenarios.
+    """
+    scenario_ids = sorted(set(int(s) for s in scenario_ids))
+    timestamps = dict(
+        c.execute(
+            """SELECT scenario_id, aggregates_timestamp
+            FROM results_scenario_aggregates
+            WHERE scenario_id in ({});""".format(
+                ",".join(["?"] * len(scenario_ids))
+            ),
+            scenario_ids,
+        ).fetchall()
+    )
+    if len(timestamps) < len(scenario_ids):
+        return None
+
+    return tuple(timestamps[s] for s in scenario_ids)
+
+
+class ResultsCache(object):
+    """
+    Least-recently-used cache of values computed from the results of a set
+    of scenarios.
+    """
+
+    def __init__(self, max_entries=RESULTS_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_or_compute(self, c, scenario_ids, key, compute, unversioned_values=None):
+        """
+        :param c: database cursor
+        :param scenario_ids: list of the IDs of the scenarios whose results
+            the value is computed from
+        :param key: hashable key of the value, e.g. the database path and
+            the query or plot arguments
+        :param compute: function with no arguments that computes the value
+        :param unversioned_values: dictionary in which to keep the values by
+            key if the results of any of the scenarios have not been
+            processed (e.g. scenarios run before results versions were
+            recorded or whose results processing failed); if None, these
+            values are computed each time
+        :return: the cached value if there is one for the current results
+            version of the scenarios; otherwise, the computed value
+        """
+        version = get_results_version(c=c, scenario_ids=scenario_ids)
+        if version is None:
+            if unversioned_values is None:
+                return compute()
+            if key not in unversioned_values:
+                unversioned_values[key] = compute()
+            return unversioned_values[key]
+
+        cache_key = (key, version)
+        with self.lock:
+            if cache_key in self.entries:
+                self.entries.move_to_end(cache_key)
+                return self.entries[cache_key]
+
+        value = compute()
+
+        with self.lock:
+            self.entries[cache_key] = value
+            self.entries.move_to_end(cache_key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+results_cache = ResultsCache()